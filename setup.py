@@ -49,6 +49,7 @@ setup(
     data_files=DATA_FILES,
     packages=['org',
               'org.pyut',
+              'org.pyut.batch',
               'org.pyut.commands',
               'org.pyut.dialogs',
               'org.pyut.enums',
@@ -61,14 +62,18 @@ setup(
               'org.pyut.ogl', 'org.pyut.ogl.sd',
               'org.pyut.persistence', 'org.pyut.persistence.converters',
               'org.pyut.plugins',
+              'org.pyut.plugins.ascii',
               'org.pyut.plugins.base',
               'org.pyut.plugins.common',
               'org.pyut.plugins.dtd',
               'org.pyut.plugins.fastedit',
               'org.pyut.plugins.gml',
-              'org.pyut.plugins.io',
+              'org.pyut.plugins.image',
+              'org.pyut.plugins.incremental',
+              'org.pyut.plugins.io', 'org.pyut.plugins.io.pyumlsupport',
               'org.pyut.plugins.iopythonsupport',
               'org.pyut.plugins.orthogonal',
+              'org.pyut.plugins.routing',
               'org.pyut.plugins.sugiyama',
               'org.pyut.plugins.tools',
               'org.pyut.plugins.xmi',
@@ -86,5 +91,5 @@ setup(
     description='The Python UML Tool',
     options={},
     setup_requires=['py2app'],
-    install_requires=['wxPython', 'xmlschema', 'html-testRunner', 'pygmlparser', 'pyumldiagrams']
+    install_requires=['wxPython', 'xmlschema', 'html-testRunner', 'pygmlparser', 'pyumldiagrams', 'fpdf2', 'pypdf']
 )
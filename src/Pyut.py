@@ -3,6 +3,8 @@ from os import chdir
 from os import getcwd
 from sys import path as sysPath
 from sys import argv
+from sys import exit as sysExit
+from sys import stderr
 
 from logging import Logger
 from logging import getLogger
@@ -11,14 +13,13 @@ import logging.config
 
 from json import load as jsonLoad
 
+from typing import List
+
 from org.pyut.PyutUtils import PyutUtils
 from org.pyut.PyutPreferences import PyutPreferences
 
-from org.pyut.ui.PyutApp import PyutApp
-
 from org.pyut.enums.ResourceTextType import ResourceTextType
 
-from org.pyut.general.Lang import Lang
 from org.pyut.general.PyutVersion import PyutVersion
 
 
@@ -75,6 +76,10 @@ class Pyut:
         logging.logThreads   = False
 
     def startApp(self):
+        # The UI modules are imported here so that a batch conversion never loads wx
+        from org.pyut.ui.PyutApp import PyutApp
+        from org.pyut.general.Lang import Lang
+
         self._setOurSysPath()
         self._updateOurDirectoryPreferences()
         self._displayIntro()
@@ -166,12 +171,82 @@ class Pyut:
             self.cmdLineArgsHandled = True
             return
 
+        formats:         List[str] = []
+        outputDirectory: str       = self._userPath
+        workers:         int       = None
+        fileNames:       List[str] = []
         for param in argv[1:]:
             if param[:18] == "--start_directory=":
                 print(f'Starting with default directory: {param[18:]}')
                 self.userPath = param[18:]
+            elif param[:10] == "--convert=":
+                formats = [formatName for formatName in param[10:].split(',') if formatName != '']
+            elif param[:19] == "--output_directory=":
+                outputDirectory = param[19:]
+            elif param[:10] == "--workers=":
+                workers = self._parseWorkers(param[10:])
+            elif param[:2] != "--":
+                fileNames.append(param)
+
+        if len(formats) > 0:
+            self._checkFormats(formats)
+            self.convertFiles(fileNames=fileNames, formats=formats, outputDirectory=outputDirectory, workers=workers)
+            self.cmdLineArgsHandled = True
+            return
         self.cmdLineArgsHandled = False
 
+    def _parseWorkers(self, value: str) -> int:
+        """
+        Args:
+            value:  The value of the --workers option
+
+        Returns:  The number of worker processes;  Exits with a usage error if it is not a positive integer
+        """
+        try:
+            workers: int = int(value)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            self._usageError(f'--workers must be a positive integer, not "{value}"')
+        return workers
+
+    def _checkFormats(self, formats: List[str]):
+        """
+        Exits with a usage error if a --convert format is unknown
+        """
+        from org.pyut.batch.BatchExporters import BatchExporters
+
+        unknownFormats: List[str] = [formatName for formatName in formats if formatName not in BatchExporters.FORMATS]
+        if len(unknownFormats) > 0:
+            self._usageError(f'Unknown --convert formats: {", ".join(unknownFormats)};  Use {", ".join(BatchExporters.FORMATS)}')
+
+    def _usageError(self, message: str):
+
+        print(f'pyut: {message}', file=stderr)
+        print('Use pyut --help for the syntax', file=stderr)
+        sysExit(2)
+
+    def convertFiles(self, fileNames: List[str], formats: List[str], outputDirectory: str, workers: int = None):
+        """
+        Headless batch conversion;  Prints one report line per file and exits with status 1 when no
+        file was given or a file could not be converted
+
+        Args:
+            fileNames:          The project files
+            formats:            Export formats
+            outputDirectory:    Where the outputs are written
+            workers:            Number of worker processes
+        """
+        from org.pyut.batch.BatchConverter import BatchConverter
+        from org.pyut.batch.BatchConverter import ConversionResults
+
+        BatchConverter.setupHeadless()
+        converter: BatchConverter    = BatchConverter(formats=formats, outputDirectory=outputDirectory, workers=workers)
+        results:   ConversionResults = converter.convert(fileNames)
+        print(BatchConverter.report(results))
+        if len(results) == 0 or not all(result.succeeded for result in results):
+            sysExit(1)
+
 
 if __name__ == "__main__":
 
@@ -0,0 +1,59 @@
+graph [
+	directed 1
+	version  1.0
+	label "GML for DefaultGraphName"
+	comment "Generated by Pyut Version 6.0.0"
+	node [
+		id 42
+		label "ClassName_0"
+		graphics [
+			x 100.0
+			y 100.0
+			z 0
+			w 50.0
+			h 50.0
+			d 0
+			type "rectangle"
+			width 0.12
+			fill "#ff0000"
+			outline "#000000"
+		]
+	]
+	node [
+		id 47
+		label "ClassName_1"
+		graphics [
+			x 175.0
+			y 200.0
+			z 0
+			w 50.0
+			h 50.0
+			d 0
+			type "rectangle"
+			width 0.12
+			fill "#ff0000"
+			outline "#000000"
+		]
+	]
+	edge [
+		id 1024
+		source 42
+		target 47
+		graphics [
+			type "line"
+			arrow "last"
+			Line [
+				point [
+					x <MagicMock name='mock.sourceAnchor.GetPosition().__getitem__()' id='139788973510544'>
+					y <MagicMock name='mock.sourceAnchor.GetPosition().__getitem__()' id='139788973510544'>
+					z 0.0
+				]
+				point [
+					x <MagicMock name='mock.destinationAnchor.GetPosition().__getitem__()' id='139788973413776'>
+					y <MagicMock name='mock.destinationAnchor.GetPosition().__getitem__()' id='139788973413776'>
+					z 0.0
+				]
+			]
+		]
+	]
+]
\ No newline at end of file
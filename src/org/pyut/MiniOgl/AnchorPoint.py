@@ -11,6 +11,10 @@ class AnchorPoint(LinePoint):
     This is a point which begins or ends a line.
     It is often anchored to a parent shape, but that's not mandatory.
     """
+    __slots__ = ('_stayInside', '_stayOnBorder')
+
+    clsLogger: Logger = getLogger(__name__)
+
     def __init__(self, x: float, y: float, parent: Shape = None):
         """
 
@@ -21,9 +25,7 @@ class AnchorPoint(LinePoint):
         """
         super().__init__(x, y, parent)
 
-        self.logger: Logger = getLogger(__name__)
-
-        self.logger.debug(f'AnchorPoint __init__  x: {x}, y: {y} parent: {parent}')
+        self.clsLogger.debug(f'AnchorPoint __init__  x: {x}, y: {y} parent: {parent}')
         self._protected:    bool = True  # protected by default
         self._stayInside:   bool = True
         self._stayOnBorder: bool = True
@@ -69,7 +71,7 @@ class AnchorPoint(LinePoint):
             y:
         """
 
-        self.logger.debug(
+        self.clsLogger.debug(
             (
                 f'x,y: ({x},{y}) '
                 f'parent: {self._parent} '
@@ -86,7 +88,7 @@ class AnchorPoint(LinePoint):
                 width, height      = self._parent.GetSize()
                 width  = abs(width) - 1
                 height = abs(height) - 1
-                self.logger.debug(f'topLeftX,topLeftY ({topLeftX},{topLeftY}) width,height ({width},{height})')
+                self.clsLogger.debug(f'topLeftX,topLeftY ({topLeftX},{topLeftY}) width,height ({width},{height})')
                 if self._stayInside or self._stayOnBorder:
                     x = self.stayInside(topLeftX, width, x)
                     y = self.stayInside(topLeftY, height, y)
@@ -94,10 +96,12 @@ class AnchorPoint(LinePoint):
                         x, y = self.stickToBorder(topLeftX, topLeftY, width, height, x, y)
                 self._x, self._y = self.ConvertCoordToRelative(x, y)
 
-                self.logger.debug(f'Final Position: ({self._x}, {self._y})')
+                self.clsLogger.debug(f'Final Position: ({self._x}, {self._y})')
 
+            if self._diagram is not None:
+                self._diagram.InvalidateBounds(self)
             if self.HasDiagramFrame():
-                self.UpdateModel()
+                self._diagram.UpdateShapeModel(self)
 
     def stayInside(self, low, length, value):
         """
@@ -142,7 +146,7 @@ class AnchorPoint(LinePoint):
             down: lambda xDown, yDown: (x, oy + height),
         }
         lesser = min(left, right, up, down)
-        self.logger.debug(f'lesser: {lesser}')
+        self.clsLogger.debug(f'lesser: {lesser}')
         return choice[lesser](x, y)
 
     def Detach(self):
@@ -9,6 +9,8 @@ class ControlPoint(LinePoint):
     If you remove the last line of a control point, the control point will
     be automatically erased.
     """
+    __slots__ = ()
+
     def __init__(self, x: float, y: float, parent=None):
         """
 
@@ -1,9 +1,19 @@
 
+from typing import Dict
+from typing import List
+
 from logging import Logger
 from logging import getLogger
 
+from contextlib import contextmanager
+
 from org.pyut.MiniOgl import Shape
 from org.pyut.MiniOgl import SizerShape
+from org.pyut.MiniOgl.LinePoint import LinePoint
+from org.pyut.MiniOgl.LineShape import LineShape
+from org.pyut.MiniOgl.PointShape import PointShape
+from org.pyut.MiniOgl.RectangleShape import RectangleShape
+from org.pyut.MiniOgl.SpatialIndex import SpatialIndex
 
 
 class Diagram:
@@ -13,6 +23,13 @@ class Diagram:
     A diagram contains shapes and is responsible to manage them.
     It can be saved to a file, and loaded back. It knows every shapes that
     can be clicked (selected, moved...).
+
+    Many edits can be made in a batch;  The models of the moved shapes
+    are updated, and the panel is refreshed, once at the end of the batch.
+
+    The first level shapes are kept in a spatial index, updated lazily from
+    the shapes that moved since the last query, and the diagram keeps the
+    selected shapes as they are selected.
     """
     def __init__(self, panel):
         """
@@ -24,6 +41,16 @@ class Diagram:
         self._shapes = []        # all selectable shapes
         self._parentShapes = []  # all first level shapes
 
+        self._batchDepth:          int              = 0
+        self._pendingModelUpdates: Dict[int, Shape] = {}    # id(shape) -> shape whose model update is deferred
+        self._refreshPending:      bool             = False
+
+        self._index:       SpatialIndex     = SpatialIndex()
+        self._indexed:     Dict[int, Shape] = {}    # id(shape) -> first level shape in the index
+        self._unindexed:   Dict[int, Shape] = {}    # first level shapes placed by other shapes;  Always checked
+        self._staleBounds: Dict[int, Shape] = {}    # shapes to (re)index before the next query
+        self._selected:    Dict[int, Shape] = {}    # in selection order
+
     def AddShape(self, shape, withModelUpdate: bool = True):
         """
         Add a shape to the diagram.
@@ -40,12 +67,117 @@ class Diagram:
 
         self.clsLogger.debug(f'.AddShape before shape.Attach()=> {shape} withModelUpdate {withModelUpdate}')
         shape.Attach(self)
+        self.InvalidateBounds(shape)
+        if shape.IsSelected():
+            self._selected[id(shape)] = shape
+        if self._panel is not None:
+            self._panel.OnShapeAdded(shape)
 
         # makes the shape's model (MVC pattern) have the right values depending on
         # the diagram frame state.
         if withModelUpdate:
+            self.UpdateShapeModel(shape)
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer the model updates and the panel refreshes until the end of the
+        outermost batch;  Each shape model is then updated once
+        """
+        self._batchDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+            if self._batchDepth == 0:
+                self._endBatch()
+
+    def IsBatching(self) -> bool:
+        """
+        Returns:
+            `True` inside a batch
+        """
+        return self._batchDepth > 0
+
+    def UpdateShapeModel(self, shape):
+        """
+        Update the model of a shape now, or at the end of the batch
+
+        Args:
+            shape:  A shape of this diagram
+        """
+        if self._batchDepth > 0:
+            self._pendingModelUpdates[id(shape)] = shape
+        else:
             shape.UpdateModel()
 
+    def DeferRefresh(self) -> bool:
+        """
+        Called by the panel before it redraws
+
+        Returns:
+            `True` if the refresh is deferred to the end of the batch
+        """
+        if self._batchDepth > 0:
+            self._refreshPending = True
+            return True
+        return False
+
+    def InvalidateBounds(self, shape):
+        """
+        A shape moved or was resized;  It and the lines that follow it are indexed again before the next query
+
+        Args:
+            shape:  A shape of this diagram
+        """
+        if shape.GetParent() is None:
+            self._staleBounds[id(shape)] = shape
+        points: List[LinePoint] = shape.GetAnchors()
+        if isinstance(shape, LinePoint):
+            points = points + [shape]
+        for point in points:
+            for line in point.GetLines():
+                self._staleBounds[id(line)] = line
+
+    def FindShapesInBox(self, x: float, y: float, width: float, height: float) -> List[Shape]:
+        """
+        Find the first level shapes whose box intersects a rectangle;  Only the shapes
+        near the rectangle are visited
+
+        Args:
+            x:      Left of the rectangle
+            y:      Top of the rectangle
+            width:  Width of the rectangle
+            height: Height of the rectangle
+
+        Returns:  The candidate shapes
+        """
+        self._updateIndex()
+        found: List[Shape] = [self._indexed[key] for key in self._index.query(x, y, width, height)]
+
+        return found + list(self._unindexed.values())
+
+    def SelectionChanged(self, shape):
+        """
+        Called by a shape when it is selected or deselected
+
+        Args:
+            shape:  A shape of this diagram
+        """
+        if shape.IsSelected():
+            self._selected[id(shape)] = shape
+        else:
+            self._selected.pop(id(shape), None)
+
+    def GetSelectedShapes(self) -> List[Shape]:
+        """
+        Return the selected shapes, without looking at all the shapes.
+        It is a copy of the original.
+
+        @return Shape []
+        """
+        return list(self._selected.values())
+
     def DeleteAllShapes(self):
         """
         Delete all shapes in the diagram.
@@ -54,6 +186,11 @@ class Diagram:
             self._shapes[0].Detach()
         self._shapes = []
         self._parentShapes = []
+        self._index.clear()
+        self._indexed     = {}
+        self._unindexed   = {}
+        self._staleBounds = {}
+        self._selected    = {}
 
     def RemoveShape(self, shape: SizerShape):
         """
@@ -66,6 +203,14 @@ class Diagram:
             self._shapes.remove(shape)
         if shape in self._parentShapes:
             self._parentShapes.remove(shape)
+        self._pendingModelUpdates.pop(id(shape), None)
+        self._staleBounds.pop(id(shape), None)
+        self._selected.pop(id(shape), None)
+        self._unindexed.pop(id(shape), None)
+        if self._indexed.pop(id(shape), None) is not None:
+            self._index.remove(id(shape))
+        if self._panel is not None:
+            self._panel.OnShapeRemoved(shape)
 
     def GetShapes(self):
         """
@@ -118,3 +263,34 @@ class Diagram:
         for s in shapes:
             self._shapes.remove(s)
         self._shapes = shapes + self._shapes
+
+    def _endBatch(self):
+
+        pendingModelUpdates: Dict[int, Shape] = self._pendingModelUpdates
+        self._pendingModelUpdates = {}
+        for shape in pendingModelUpdates.values():
+            if shape.HasDiagramFrame():
+                shape.UpdateModel()
+
+        if self._refreshPending is True:
+            self._refreshPending = False
+            if self._panel is not None:
+                self._panel.Refresh()
+
+    def _updateIndex(self):
+        """
+        Index the shapes that moved;  Lines and points carry their own coordinates,
+        the other shapes that are not rectangles (lollipops, ...) are placed by other shapes
+        """
+        staleBounds: Dict[int, Shape] = self._staleBounds
+        self._staleBounds = {}
+        for key, shape in staleBounds.items():
+            if shape.GetDiagram() is not self or shape.GetParent() is not None:
+                continue
+            if isinstance(shape, (RectangleShape, LineShape, PointShape)):
+                x, y = shape.GetTopLeft()
+                w, h = shape.GetSize()
+                self._index.insert(key, x, y, abs(w), abs(h))     # Its top left is already the smallest corner
+                self._indexed[key] = shape
+            else:
+                self._unindexed[key] = shape
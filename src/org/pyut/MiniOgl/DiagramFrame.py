@@ -1,4 +1,5 @@
 
+from typing import Dict
 from typing import cast
 from typing import List
 
@@ -40,14 +41,18 @@ from wx import MouseEvent
 from wx import NullBitmap
 from wx import Font
 from wx import Window
-from wx import __version__
+from wx import CallLater
 
 from org.pyut.MiniOgl import Shape
 from org.pyut.MiniOgl.Diagram import Diagram
+from org.pyut.MiniOgl.DragSprite import DragSprite
+from org.pyut.MiniOgl.PointShape import PointShape
 from org.pyut.MiniOgl.ShapeEventHandler import ShapeEventHandler
 from org.pyut.MiniOgl.SizerShape import SizerShape
 from org.pyut.MiniOgl.ControlPoint import ControlPoint
 from org.pyut.MiniOgl.RectangleShape import RectangleShape
+from org.pyut.MiniOgl.ViewTransform import ViewTransform
+from org.pyut.MiniOgl.ViewTransform import deviceCoordinates
 
 from org.pyut.PyutPreferences import PyutPreferences
 from org.pyut.dialogs.DlgDebugDiagramFrame import DlgDebugDiagramFrame
@@ -64,6 +69,9 @@ class DiagramFrame(ScrolledWindow):
 
     clsLogger: Logger = getLogger(__name__)
 
+    SPRITE_DRAG_THRESHOLD:   int = 10      # Dragging this many shapes or more moves a sprite instead of the shapes
+    DRAG_FRAME_MILLISECONDS: int = 16      # About one frame per display refresh
+
     """
     A frame to draw simulation diagrams.
     This frame also manage all mouse events.
@@ -85,9 +93,10 @@ class DiagramFrame(ScrolledWindow):
         self._selector          = None      # rectangle selector shape
         self._clickedShape      = None      # last clicked shape
         self._moving            = False     # a drag has been initiated
+        self._dragSprite:  DragSprite = cast(DragSprite, None)    # the dragged shapes when many shapes are dragged
+        self._dragFramePending: bool  = False
 
-        self._xOffset = 0.0     # abscissa offset between the view and the model
-        self._yOffset = 0.0     # ordinate offset between the view and the model
+        self._viewTransform: ViewTransform = ViewTransform()   # zoom and offsets between the view and the model
         self._zoomStack = []    # store all zoom factors applied
 
         self._zoomLevel = 0             # number of zoom factors applied
@@ -190,21 +199,22 @@ class DiagramFrame(ScrolledWindow):
 
         realShape: Shape = cast(Shape, shape)
         if not event.ControlDown() and not realShape.IsSelected():
-            shapes = self._diagram.GetShapes()
-            shapes.remove(shape)
+            kept: List[Shape] = [shape]
             if isinstance(shape, SizerShape):
                 # don't deselect the parent of a sizer
                 # or its sizer's would be detached
-                shapes.remove(shape.GetParent())
+                kept.append(shape.GetParent())
             elif isinstance(shape, ControlPoint):
                 # don't deselect the line of a control point
                 self.clsLogger.debug(f'{shape=}')
-                for line in shape.GetLines():
-                    shapes.remove(line)
+                kept.extend(shape.GetLines())
             # don't call DeselectAllShapes, because we must ensure that
             # the sizer won't be deselected (because they are detached when they are deselected)
             # deselect all other shapes
-            for s in shapes:
+            keptIds = {id(keptShape) for keptShape in kept}
+            for s in self._GetSelectedAndMoving():
+                if id(s) in keptIds:
+                    continue
                 s.SetSelected(False)
                 s.SetMoving(False)
 
@@ -222,13 +232,17 @@ class DiagramFrame(ScrolledWindow):
 
         @param event
         """
+        if self._dragSprite is not None:
+            self._EndSpriteDrag()
+
         # manage the selector box
         if self._selector is not None:
             self.Bind(EVT_MOTION, self._NullCallback)
             rect = self._selector
-            # x, y = rect.GetPosition()     Not used
-            # w, h = rect.GetSize()         Not used
-            for shape in self._diagram.GetShapes():
+            x, y = rect.GetTopLeft()
+            w, h = rect.GetSize()
+            # only the shapes near the selector can be inside it
+            for shape in self._diagram.FindShapesInBox(x, y, abs(w), abs(h)):
                 x0, y0 = shape.GetTopLeft()
                 w0, h0 = shape.GetSize()
                 if shape.GetParent() is None and \
@@ -275,7 +289,8 @@ class DiagramFrame(ScrolledWindow):
             event:
         """
         x, y = event.GetX(), event.GetY()
-        if not self._moving:
+        starting: bool = not self._moving
+        if starting:
             self.PrepareBackground()
         self._moving = True
         clicked = self._clickedShape
@@ -284,12 +299,19 @@ class DiagramFrame(ScrolledWindow):
             clicked.SetSelected(True)
             clicked.SetMoving(True)
         self._clickedShape = None
-        for shape in self._selectedShapes:
-            parent = shape.GetParent()
-            if parent is not None and parent.IsSelected() and not isinstance(shape, SizerShape):
-                continue
-            ox, oy = self._lastMousePosition
-            dx, dy = x - ox, y - oy
+        if starting:
+            self._BeginSpriteDrag()
+
+        if self._dragSprite is not None:
+            self._dragSprite.MoveTo(x, y)
+            if not self._dragFramePending:
+                self._dragFramePending = True
+                CallLater(DiagramFrame.DRAG_FRAME_MILLISECONDS, self._DrawDragFrame)
+            return
+
+        ox, oy = self._lastMousePosition
+        dx, dy = x - ox, y - oy
+        for shape in self._GetDraggedShapes():
             sx, sy = shape.GetPosition()
             shape.SetPosition(sx + dx, sy + dy)
 
@@ -373,6 +395,14 @@ class DiagramFrame(ScrolledWindow):
         """
         return self._diagram
 
+    def GetDefaultFont(self) -> Font:
+        """
+        Return the font the shapes are drawn with.
+
+        @return Font
+        """
+        return self._defaultFont
+
     def SetDiagram(self, diagram):
         """
         Set a new diagram for this panel.
@@ -381,6 +411,22 @@ class DiagramFrame(ScrolledWindow):
         """
         self._diagram = diagram
 
+    def OnShapeAdded(self, shape):
+        """
+        Called by the diagram when a shape is added;  The subclasses index their shapes here
+
+        @param shape
+        """
+        pass
+
+    def OnShapeRemoved(self, shape):
+        """
+        Called by the diagram when a shape is removed
+
+        @param shape
+        """
+        pass
+
     from org.pyut.MiniOgl.Shape import Shape
 
     def FindShape(self, x: int, y: int):
@@ -409,11 +455,24 @@ class DiagramFrame(ScrolledWindow):
         """
         Deselect all shapes in the frame.
         """
-        for shape in self._diagram.GetShapes():
+        for shape in self._GetSelectedAndMoving():
             shape.SetSelected(False)
             shape.SetMoving(False)
         self._selectedShapes = []
 
+    def _GetSelectedAndMoving(self) -> List[Shape]:
+        """
+        The diagram keeps its selected shapes;  The frame's own list holds the
+        shapes that are moving, which are usually the same ones
+
+        Returns:  The shapes to deselect, each one once
+        """
+        shapes: Dict[int, Shape] = {}
+        for shape in self._diagram.GetSelectedShapes() + self._selectedShapes:
+            shapes[id(shape)] = shape
+
+        return list(shapes.values())
+
     def GetSelectedShapes(self):
         """
         Get the selected shapes.
@@ -450,6 +509,8 @@ class DiagramFrame(ScrolledWindow):
         @param bool eraseBackground : if False, the stored background is used
         @param Rect rect : not used
         """
+        if self._diagram.DeferRefresh():
+            return
         if eraseBackground:
             self.Redraw()
         else:
@@ -468,10 +529,7 @@ class DiagramFrame(ScrolledWindow):
         mem = MemoryDC()
         mem.SelectObject(bb)
 
-        if __version__ > "2.3.2":
-            x, y = self.CalcUnscrolledPosition(0, 0)
-            mem.Blit(0, 0, w, h, dc, x, y)
-        else:
+        with deviceCoordinates(dc):
             mem.Blit(0, 0, w, h, dc, 0, 0)
         mem.SelectObject(NullBitmap)
 
@@ -526,6 +584,7 @@ class DiagramFrame(ScrolledWindow):
             dc.SetBackground(Brush(self.GetBackgroundColour()))
             dc.Clear()
         self.PrepareDC(dc)
+        self._viewTransform.Apply(dc)
 
         return dc
 
@@ -590,14 +649,21 @@ class DiagramFrame(ScrolledWindow):
                 shape.DrawAnchors(dc)
 
         if needBlit:
-            #  MODIFIED BY C.DUTOIT : Added Python test
-            client = ClientDC(self)
+            self._BlitToClient(dc, w, h)
 
-            if __version__ > "2.3.2":
-                x, y = self.CalcUnscrolledPosition(0, 0)
-                client.Blit(0, 0, w, h, dc, x, y)
-            else:
-                client.Blit(0, 0, w, h, dc, 0, 0)
+    def _BlitToClient(self, dc: DC, w: int, h: int):
+        """
+        Copy a double buffered dc to the screen
+
+        Args:
+            dc: The dc that was drawn on
+            w:  width of the frame
+            h:  height of the frame
+        """
+        client = ClientDC(self)
+
+        with deviceCoordinates(dc):
+            client.Blit(0, 0, w, h, dc, 0, 0)
 
     # noinspection PyUnusedLocal
     def OnPaint(self, event: PaintEvent):
@@ -614,49 +680,43 @@ class DiagramFrame(ScrolledWindow):
         mem.Clear()
         self.Redraw(mem)
 
-        if __version__ > "2.3.2":
-            x, y = self.CalcUnscrolledPosition(0, 0)
-            dc.Blit(0, 0, w, h, mem, x, y)
-        else:
+        with deviceCoordinates(mem):
             dc.Blit(0, 0, w, h, mem, 0, 0)
 
     def GetCurrentZoom(self):
         """
         added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (11.11.2005)
-        @return the global current zoom factor.
+        @return the global current zoom factor, applied by the dc when drawing.
         """
-        zoom = 1.0
-        for z in self._zoomStack:
-            zoom *= z
-        return zoom
+        return self._viewTransform.zoom
 
     def GetXOffset(self):
         """
         added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (11.11.2005)
         @return the x offset between the model an the view of the shapes (MVC)
         """
-        return self._xOffset
+        return self._viewTransform.xOffset
 
     def GetYOffset(self):
         """
         added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (11.11.2005)
         @return the y offset between the model an the view of the shapes (MVC)
         """
-        return self._yOffset
+        return self._viewTransform.yOffset
 
     def SetXOffset(self, offset):
         """
         added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (11.11.2005)
         Set the x offset between the model an the view of the shapes (MVC)
         """
-        self._xOffset = offset
+        self._viewTransform.xOffset = offset
 
     def SetYOffset(self, offset):
         """
         added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (11.11.2005)
         Set the y offset between the model an the view of the shapes (MVC)
         """
-        self._yOffset = offset
+        self._viewTransform.yOffset = offset
 
     def SetDefaultZoomFactor(self, factor):
         """
@@ -727,10 +787,6 @@ class DiagramFrame(ScrolledWindow):
         # number of pixels per unit of scrolling
         xUnit, yUnit = self.GetScrollPixelsPerUnit()
 
-        # position of the upper left corner of the client area
-        # (work area that is visible) in scroll units.
-        viewStartX, viewStartY = self.GetViewStart()
-
         # Get the client and virtual size of the work area, where
         # the client size is the size of the work area that is
         # visible and the virtual is the whole work area's size.
@@ -741,15 +797,11 @@ class DiagramFrame(ScrolledWindow):
         # maxZoomFactor = self.GetMaxLevelZoom() * self.GetDefaultZoomFactor()
         maxZoomFactor = self.GetMaxZoomFactor()
 
-        # transform event coordinates to get them relative to the upper left corner of
-        # the virtual screen (avoid the case where that corner is on a shape and
-        # get its coordinates relative to the client view).
-        if ax >= viewStartX * xUnit and ay >= viewStartY * yUnit:
-            x = ax
-            y = ay
-        else:
-            x = ax + viewStartX * xUnit
-            y = ay + viewStartY * yUnit
+        # the point and the selected area are in diagram coordinates;
+        # get them in the virtual screen.
+        x, y   = self._viewTransform.ToVirtual(ax, ay)
+        width  = width * self.GetCurrentZoom()
+        height = height * self.GetCurrentZoom()
 
         # to get the upper left corner of the zoom selected area in the
         # case where we select first the bottom right corner.
@@ -838,10 +890,9 @@ class DiagramFrame(ScrolledWindow):
         self.SetXOffset((self.GetXOffset() + dx) * zoomFactor)
         self.SetYOffset((self.GetYOffset() + dy) * zoomFactor)
 
-        # updates the shapes (view) position and dimensions from
-        # their models in the light of the new zoom factor and offsets.
-        for shape in self.GetDiagram().GetShapes():
-            shape.UpdateFromModel()
+        # the shapes keep their coordinates;  the dc applies the new
+        # zoom factor and offsets when they are drawn.
+        self._UpdateZoom()
 
         # resize the virtual screen in order to match with the zoom
         virtualWidth  = virtualWidth * zoomFactor
@@ -870,25 +921,14 @@ class DiagramFrame(ScrolledWindow):
         # number of pixels per unit of scrolling
         xUnit, yUnit = self.GetScrollPixelsPerUnit()
 
-        # position of the upper left corner of the client area
-        # (work area that is visible) in scroll units.
-        viewStartX, viewStartY = self.GetViewStart()
-
         # Get the client and virtual size of the work area, where
         # the client size is the size of the work area that is
         # visible and the virtual is the whole work area's size.
         clientWidth, clientHeight = self.GetClientSize()
         virtualWidth, virtualHeight = self.GetVirtualSize()
 
-        # transform event coordinates to get them relative to the upper left corner of
-        # the virtual screen (avoid the case where that corner is on a shape and
-        # get its coordinates relative to the shape).
-        if ax >= viewStartX * xUnit and ay >= viewStartY * yUnit:
-            x = ax
-            y = ay
-        else:
-            x = ax + viewStartX * xUnit
-            y = ay + viewStartY * yUnit
+        # the clicked point is in diagram coordinates;  get it in the virtual screen.
+        x, y = self._viewTransform.ToVirtual(ax, ay)
 
         # calculation of the upper-left corner of a zoom area whose
         # size is the half of the diagram frame and which is centred
@@ -924,10 +964,9 @@ class DiagramFrame(ScrolledWindow):
         self.SetXOffset((self.GetXOffset() + dx) * zoomFactor)
         self.SetYOffset((self.GetYOffset() + dy) * zoomFactor)
 
-        # updates the shapes (view) position and dimensions from
-        # their model in the light of the new zoom factor and offsets.
-        for shape in self.GetDiagram().GetShapes():
-            shape.UpdateFromModel()
+        # the shapes keep their coordinates;  the dc applies the new
+        # zoom factor and offsets when they are drawn.
+        self._UpdateZoom()
 
         # resize the virtual screen in order to match with the zoom
         virtualWidth  = virtualWidth * zoomFactor
@@ -1023,10 +1062,74 @@ class DiagramFrame(ScrolledWindow):
             self._selector.SetSize(x - x0, y - y0)
             self.Refresh(False)
 
+    def _GetDraggedShapes(self) -> List[Shape]:
+        """
+        The selected shapes without the children of selected shapes;  They move with their parent
+        """
+        draggedShapes: List[Shape] = []
+        for shape in self._selectedShapes:
+            parent = shape.GetParent()
+            if parent is not None and parent.IsSelected() and not isinstance(shape, SizerShape):
+                continue
+            draggedShapes.append(shape)
+        return draggedShapes
+
+    def _BeginSpriteDrag(self):
+        """
+        Draw the dragged shapes in a sprite when there are many of them;  Points and
+        sizers are always dragged directly, as they reshape lines and rectangles
+        """
+        draggedShapes: List[Shape] = self._GetDraggedShapes()
+        if len(draggedShapes) < DiagramFrame.SPRITE_DRAG_THRESHOLD or any(isinstance(shape, PointShape) for shape in draggedShapes):
+            return
+        x, y = self._lastMousePosition
+        self._dragSprite = DragSprite(draggedShapes, self._diagram.GetShapes(), x, y)
+        self._dragSprite.Render(self._defaultFont, self.GetCurrentZoom())
+
+    def _DrawDragFrame(self):
+        """
+        Draw the sprite at the last mouse position over the background;  At most once per display refresh
+        """
+        self._dragFramePending = False
+        if self._dragSprite is None:
+            return
+        w, h = self.GetSize()
+        dc = self.CreateDC(True, w, h)
+        dc.SetFont(self._defaultFont)
+        self._dragSprite.Draw(dc)
+        self._BlitToClient(dc, w, h)
+
+    def _EndSpriteDrag(self):
+        """
+        Move the dragged shapes where the sprite was dropped;  Each model is updated once
+        """
+        dragSprite: DragSprite = self._dragSprite
+        self._dragSprite = cast(DragSprite, None)
+
+        dx, dy = dragSprite.offset
+        with self._diagram.batch():
+            for shape in dragSprite.draggedShapes:
+                sx, sy = shape.GetPosition()
+                shape.SetPosition(sx + dx, sy + dy)
+            self.Refresh()
+        x, y = self._lastMousePosition
+        self._lastMousePosition = (x + dx, y + dy)
+
+    def _UpdateZoom(self):
+        """
+        The zoom of the view is the product of the zoom factors applied
+        """
+        zoom = 1.0
+        for z in self._zoomStack:
+            zoom *= z
+        self._viewTransform.zoom = zoom
+
     def _NullCallback(self, evt):
         pass
 
     def _ConvertEventCoordinates(self, event):
         xView, yView = self.GetViewStart()
         xDelta, yDelta = self.GetScrollPixelsPerUnit()
-        return event.GetX() + (xView * xDelta), event.GetY() + (yView * yDelta)
+        x, y = self._viewTransform.ToDiagram(event.GetX() + (xView * xDelta), event.GetY() + (yView * yDelta))
+        # Written back into the int members of wx events, which reject floats
+        return round(x), round(y)
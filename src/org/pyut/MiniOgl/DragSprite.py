@@ -0,0 +1,186 @@
+
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from wx import Bitmap
+from wx import Brush
+from wx import Colour
+from wx import DC
+from wx import Font
+from wx import Mask
+from wx import MemoryDC
+from wx import NullBitmap
+
+from org.pyut.MiniOgl.LinePoint import LinePoint
+from org.pyut.MiniOgl.LineShape import LineShape
+from org.pyut.MiniOgl.RectangleShape import RectangleShape
+from org.pyut.MiniOgl.Shape import Shape
+from org.pyut.MiniOgl.ViewTransform import deviceCoordinates
+
+Bounds = Tuple[int, int, int, int]      # left, top, right, bottom
+
+
+class DragSprite:
+    """
+    The moving shapes of a drag, drawn once in a bitmap.  During the drag the
+    bitmap is blitted at the mouse offset over the saved background;  The shapes
+    themselves are only moved when the drag ends.
+
+    The lines with a moving end and a still end stretch;  They are not in the
+    bitmap but drawn as plain polylines on each frame, with their moving
+    points offset.  The labels of the stretching lines stay in place.
+    """
+    MARGIN:      int                   = 8      # Room for the pens and the sizers
+    MASK_COLOUR: Tuple[int, int, int] = (1, 2, 3)
+
+    def __init__(self, draggedShapes: List[Shape], diagramShapes: List[Shape], mouseX: float, mouseY: float):
+        """
+
+        Args:
+            draggedShapes:  The shapes to move when the drag ends
+            diagramShapes:  All the shapes of the diagram, in drawing order
+            mouseX:         Where the drag started
+            mouseY:         Where the drag started
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._draggedShapes: List[Shape] = draggedShapes
+        self._originX:       float = mouseX
+        self._originY:       float = mouseY
+        self._dx:            float = 0
+        self._dy:            float = 0
+
+        self._rigidShapes, self._elasticLines, self._stillShapes = DragSprite.classify(diagramShapes)
+
+        self._bounds: Bounds = DragSprite.bounds(self._rigidShapes, DragSprite.MARGIN)
+        self._bitmap: Bitmap = cast(Bitmap, None)
+
+    @property
+    def draggedShapes(self) -> List[Shape]:
+        return self._draggedShapes
+
+    @property
+    def offset(self) -> Tuple[float, float]:
+        """
+        Returns:  How far the mouse moved since the drag started
+        """
+        return self._dx, self._dy
+
+    def Render(self, font: Font, zoom: float = 1.0):
+        """
+        Draw the rigid moving shapes in the sprite bitmap;  Called once, when the drag starts
+
+        Args:
+            font:   The default font of the diagram frame
+            zoom:   The zoom of the diagram frame;  The bitmap holds the pixels as shown
+        """
+        left, top, right, bottom = self._bounds
+        self._bitmap = Bitmap(max(1, round((right - left) * zoom)), max(1, round((bottom - top) * zoom)))
+
+        dc: MemoryDC = MemoryDC()
+        dc.SelectObject(self._bitmap)
+        dc.SetBackground(Brush(Colour(*DragSprite.MASK_COLOUR)))
+        dc.Clear()
+        dc.SetFont(font)
+        dc.SetUserScale(zoom, zoom)
+        dc.SetDeviceOrigin(round(-left * zoom), round(-top * zoom))
+        for shape in self._rigidShapes:
+            shape.Draw(dc)
+        dc.SelectObject(NullBitmap)
+
+        self._bitmap.SetMask(Mask(self._bitmap, Colour(*DragSprite.MASK_COLOUR)))
+
+    def MoveTo(self, mouseX: float, mouseY: float):
+        self._dx = mouseX - self._originX
+        self._dy = mouseY - self._originY
+
+    def Draw(self, dc: DC):
+        """
+        Draw the sprite at the current offset, then the stretching lines
+
+        Args:
+            dc: A dc holding the background, in diagram coordinates
+        """
+        left, top, right, bottom = self._bounds
+        x: int = dc.LogicalToDeviceX(round(left + self._dx))
+        y: int = dc.LogicalToDeviceY(round(top + self._dy))
+
+        memory: MemoryDC = MemoryDC()
+        memory.SelectObject(self._bitmap)
+        with deviceCoordinates(dc):
+            dc.Blit(x, y, self._bitmap.GetWidth(), self._bitmap.GetHeight(), memory, 0, 0, useMask=True)
+        memory.SelectObject(NullBitmap)
+
+        for line in self._elasticLines:
+            dc.SetPen(line.GetPen())
+            dc.DrawLines([self._shifted(point) for point in DragSprite.linePoints(line)])
+        for shape in self._stillShapes:
+            shape.Draw(dc)
+
+    @classmethod
+    def classify(cls, diagramShapes: List[Shape]) -> Tuple[List[Shape], List[LineShape], List[Shape]]:
+        """
+        Split the moving shapes
+
+        Args:
+            diagramShapes:  The shapes of the diagram
+
+        Returns:  The shapes that move as a block, the lines that stretch and the children of the stretching lines
+        """
+        movingShapes: List[Shape]     = [shape for shape in diagramShapes if shape.IsMoving()]
+        elasticLines: List[LineShape] = [shape for shape in movingShapes
+                                         if isinstance(shape, LineShape) and not all(point.IsMoving() for point in cls.linePoints(shape))]
+        elasticIds:   Set[int]        = {id(line) for line in elasticLines}     # Some shapes redefine __eq__ and __hash__
+        rigidShapes:  List[Shape]     = []
+        stillShapes:  List[Shape]     = []
+        for shape in movingShapes:
+            if id(shape) in elasticIds:
+                continue
+            if id(shape.GetParent()) in elasticIds:
+                stillShapes.append(shape)
+            else:
+                rigidShapes.append(shape)
+
+        return rigidShapes, elasticLines, stillShapes
+
+    @classmethod
+    def bounds(cls, shapes: List[Shape], margin: int) -> Bounds:
+        """
+        Returns:  The integer box around the shapes, grown by `margin`
+        """
+        xs: List[float] = []
+        ys: List[float] = []
+        for shape in shapes:
+            if isinstance(shape, LineShape):
+                for x, y in shape.GetSegments():
+                    xs.append(x)
+                    ys.append(y)
+            else:
+                x, y = shape.GetTopLeft()
+                w, h = shape.GetSize()
+                if isinstance(shape, RectangleShape):
+                    w, h = abs(w), abs(h)       # Its top left is already the smallest corner
+                xs.extend((x, x + w))
+                ys.extend((y, y + h))
+        if len(xs) == 0:
+            return 0, 0, 0, 0
+
+        return int(min(xs)) - margin, int(min(ys)) - margin, int(max(xs)) + margin + 1, int(max(ys)) + margin + 1
+
+    @classmethod
+    def linePoints(cls, line: LineShape) -> List[LinePoint]:
+        return [line.GetSource()] + line.GetControlPoints() + [line.GetDestination()]
+
+    def _shifted(self, point: LinePoint) -> Tuple[int, int]:
+
+        x, y = point.GetPosition()
+        if point.IsMoving():
+            x += self._dx
+            y += self._dy
+
+        return round(x), round(y)
@@ -10,6 +10,8 @@ class LinePoint(PointShape):
 
     @author Laurent Burgbacher <lb@alawa.ch>
     """
+    __slots__ = ('_lines', )
+
     def __init__(self, x, y, parent=None):
         """
         Constructor.
@@ -318,9 +318,12 @@ class LineShape(Shape):
     def RemoveAllControlPoints(self):
         """
         Remove all the control points of the line.
+        A control point that no longer belongs to any line is detached from the diagram.
         """
         while self._controls:
-            self._RemoveControl(self._controls[0])
+            control = self._controls[0]
+            self._RemoveControl(control)
+            control.RemoveLine(self)
 
     def Remove(self, point):
         """
@@ -9,6 +9,8 @@ from org.pyut.MiniOgl.Shape import Shape
 
 class PointShape(Shape):
 
+    __slots__ = ('_selectZone', '_visibleWhenSelected', '__penSaveColor')
+
     SELECTION_ZONE: int = 8     # Make it bigger than in legacy;  It was 5 then
     """
     A point, which is drawn as a little square (3 pixels wide).
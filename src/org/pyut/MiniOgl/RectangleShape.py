@@ -15,6 +15,9 @@ class RectangleShape(Shape):
 
     @author Laurent Burgbacher <lb@alawa.ch>
     """
+    __slots__ = ('_width', '_height', '_drawFrame', '_resizable',
+                 '_topLeftSizer', '_topRightSizer', '_botLeftSizer', '_botRightSizer')
+
     def __init__(self, x=0.0, y=0.0, width=0, height=0, parent=None):
         """
         Constructor.
@@ -35,8 +38,12 @@ class RectangleShape(Shape):
         self._topRightSizer = None
         self._botLeftSizer  = None
         self._botRightSizer = None
-        # set the model of the shape (MVC pattern)
-        self._model = RectangleShapeModel(self)
+
+    def _CreateModel(self) -> RectangleShapeModel:
+        """
+        Returns:  The model of the shape (MVC pattern)
+        """
+        return RectangleShapeModel(self)
 
     def SetResizable(self, state: bool):
         """
@@ -219,8 +226,10 @@ class RectangleShape(Shape):
         """
         self._width, self._height = width, height
 
+        if self._diagram is not None:
+            self._diagram.InvalidateBounds(self)
         if self.HasDiagramFrame():
-            self.UpdateModel()
+            self._diagram.UpdateShapeModel(self)
 
         for anchor in self._anchors:
             ax, ay = anchor.GetPosition()
@@ -280,21 +289,16 @@ class RectangleShape(Shape):
         """
         Added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (12.11.2005)
 
-        Updates the shape position and size from the model in the light of a
-        change of state of the diagram frame (here it's only for the zoom)
+        Updates the shape position and size from the model;  They share the
+        diagram coordinates, the zoom is applied by the dc
         """
 
         #  change the position of the shape from the model
         Shape.UpdateFromModel(self)
 
-        #  get the model size
-        width, height = self.GetModel().GetSize()
-
-        #  get the diagram frame ratio between the shape and the model
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-
-        # set the new size to the shape.
-        self._width, self._height = width * ratio, height * ratio
+        # set the model size to the shape.
+        self._width, self._height = self.GetModel().GetSize()
+        self._diagram.InvalidateBounds(self)
 
     def UpdateModel(self):
         """
@@ -305,12 +309,6 @@ class RectangleShape(Shape):
         #  change the coordinates of model
         Shape.UpdateModel(self)
 
-        #  get the size of the shape (view)
+        #  set the size of the shape (view) to the model.
         width, height = self.GetSize()
-
-        # get the ratio between the model and the shape (view) from
-        # the diagram frame where the shape is displayed.
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-
-        # set the new size to the model.
-        self.GetModel().SetSize(width/ratio, height/ratio)
+        self.GetModel().SetSize(width, height)
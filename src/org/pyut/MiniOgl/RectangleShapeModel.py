@@ -6,6 +6,8 @@ class RectangleShapeModel(ShapeModel):
     """
     This class is the model of a RectangleShape ('view' in an MVC pattern).
     """
+    __slots__ = ('_width', '_height')
+
     def __init__(self, viewShape=None):
         """
         Used when the model is created first without any view.
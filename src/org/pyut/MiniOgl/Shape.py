@@ -1,6 +1,7 @@
 
 from typing import Union
 from typing import Tuple
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
@@ -22,11 +23,20 @@ class Shape:
     """
     Shape is the basic graphical block. It is also the view in
     a MVC pattern, so it has has a relative model (ShapeModel).
+
+    Diagrams hold many thousands of shapes (anchors, control points, sizers,
+    labels), so the MiniOgl shapes declare their attributes in `__slots__`;
+    A subclass that does not declare `__slots__` gets a `__dict__` as usual.
     """
+    __slots__ = ('_x', '_y', '_ox', '_oy', '_parent',
+                 '_selected', '_anchors', '_visible', '_draggable', '_moving', '_diagram', '_protected',
+                 '_children', '_privateChildren', '_pen', '_brush', '_model', '_id')
 
     ID = 0  # internal ID number
     clsLogger: Logger = getLogger(__name__)
 
+    clsDebugBasicShape: bool = cast(bool, None)     # read from the preferences by the first shape
+
     def __init__(self, x: float = 0.0, y: float = 0.0, parent=None):
         """
         If a parent is given, the position is relative to the parent's origin.
@@ -55,11 +65,13 @@ class Shape:
         self._pen:   Pen   = BLACK_PEN    # pen to use
         self._brush: Brush = WHITE_BRUSH  # brush to use
 
-        self._model = ShapeModel(self)  # model of the shape (MVC pattern)
+        self._model = self._CreateModel()   # model of the shape (MVC pattern)
 
         self._id = Shape.ID     # unique ID number
         Shape.ID += 1
-        if PyutPreferences().debugBasicShape is True:
+        if Shape.clsDebugBasicShape is None:
+            Shape.clsDebugBasicShape = PyutPreferences().debugBasicShape
+        if Shape.clsDebugBasicShape is True:
             from org.pyut.MiniOgl.TextShape import TextShape
             from org.pyut.MiniOgl.LineShape import LineShape
             if not isinstance(self, (TextShape, LineShape)):
@@ -504,6 +516,8 @@ class Shape:
         @param state
         """
         self._selected = state
+        if self._diagram is not None:
+            self._diagram.SelectionChanged(self)
 
     def IsMoving(self):
         """
@@ -549,11 +563,13 @@ class Shape:
                 self.clsLogger.debug(f'New Position: ({self._x},{self._y})')
             else:
                 self._x, self._y = self.ConvertCoordToRelative(x, y)
+            if self._diagram is not None:
+                self._diagram.InvalidateBounds(self)
             #  if the shape is attached to a diagramFrame, it means that
             #  the model will be initialized correctly.
             # (Avoid a null pointer error).
             if self.HasDiagramFrame():
-                self.UpdateModel()
+                self._diagram.UpdateShapeModel(self)
 
     def SetRelativePosition(self, x: float, y: float):
         """
@@ -566,6 +582,8 @@ class Shape:
         if self._draggable:
             self._x = x
             self._y = y
+            if self._diagram is not None:
+                self._diagram.InvalidateBounds(self)
 
     def SetProtected(self, newValue: bool):
         """
@@ -604,23 +622,13 @@ class Shape:
         """
         Added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (12.11.2005)
 
-        Updates the shape position from the model in the light of a
-        change of state of the diagram frame (here it's only for the zoom)
+        Updates the shape position from the model.  The shape and its model
+        share the diagram coordinates;  The zoom and the offsets of the
+        diagram frame are applied by the dc when the shape is drawn.
         """
 
         # Get the coordinates of the model (ShapeModel)
-        mx, my = self.GetModel().GetPosition()
-
-        # Get the offsets and the ratio between the shape (view) and the
-        # shape model (ShapeModel) given by the frame where the shape
-        # is displayed.
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-        dx = self.GetDiagram().GetPanel().GetXOffset()
-        dy = self.GetDiagram().GetPanel().GetYOffset()
-
-        # calculation of the shape (view) coordinates in the light of the offsets and ratio
-        x = (ratio * mx) + dx
-        y = (ratio * my) + dy
+        x, y = self.GetModel().GetPosition()
 
         # assign the new coordinates to the shape (view). DON'T USE SetPosition(),
         # because there is a call to UpdateModel() in that method.
@@ -629,6 +637,7 @@ class Shape:
         else:
             self._x = x
             self._y = y
+        self._diagram.InvalidateBounds(self)
 
     def UpdateModel(self):
         """
@@ -640,30 +649,22 @@ class Shape:
         #  get the associated model (ShapeModel)
         model = self.GetModel()
 
-        # Get the offsets and the ratio between the shape (view) and the
-        # shape model (ShapeModel) given by the frame where the shape
-        # is displayed.
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-        dx = self.GetDiagram().GetPanel().GetXOffset()
-        dy = self.GetDiagram().GetPanel().GetYOffset()
-
-        #  get the coordinates of this shape
+        #  the model has the coordinates of this shape
         x, y = self.GetPosition()
-
-        # calculation of the model coordinates in the light of the
-        # offsets and ratio and assignment.
-        mx = (x - dx)/ratio
-        my = (y - dy)/ratio
-        model.SetPosition(mx, my)
+        model.SetPosition(x, y)
 
         # change also the position of the model of the children,
         # because when we move the parent children set position is not called
         # and so their update model is not called
         for child in self._anchors:
             cx, cy = child.GetPosition()
-            cmx = (cx - dx) / ratio
-            cmy = (cy - dy) / ratio
-            child.GetModel().SetPosition(cmx, cmy)
+            child.GetModel().SetPosition(cx, cy)
+
+    def _CreateModel(self) -> ShapeModel:
+        """
+        Returns:  A new model for this shape;  Subclasses return their own kind of model
+        """
+        return ShapeModel(self)
 
     def GetModel(self):
         """
@@ -3,6 +3,7 @@ class ShapeModel(object):
     """
     This class is the model of a shape ('view' in a MVC pattern).
     """
+    __slots__ = ('_views', '_x', '_y')
 
     def __init__(self, viewShape=None):
         """
@@ -7,6 +7,8 @@ class SizerShape(PointShape):
     A sizer, to resize other shapes.
 
     """
+    __slots__ = ()
+
     def __init__(self, x, y, parent):
         """
         Constructor.
@@ -0,0 +1,246 @@
+
+from typing import Dict
+from typing import Hashable
+from typing import Iterator
+from typing import List
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from math import floor
+
+Bounds     = Tuple[float, float, float, float]     # left, top, right, bottom
+CellKey    = Tuple[int, int]
+IndexKeys  = List[Hashable]
+
+DEFAULT_CELL_SIZE: int = 100
+MAX_ENTRY_CELLS:   int = 256
+
+
+class SpatialIndex:
+    """
+    A uniform grid (spatial hash) over axis aligned bounding boxes.
+
+    Each entry is stored in every cell its bounding box touches, so
+    inserting, removing and querying an entry only visits the cells under
+    its box;  The cost does not depend on the number of entries in the index.
+
+    The cell walks are capped so that a huge rectangle does not cost more
+    than a linear scan:  Entries covering more than `MAX_ENTRY_CELLS` cells are
+    kept out of the grid and checked by every query, and a query covering
+    more cells than there are entries scans the entries instead.
+
+    Entries are identified by any hashable key (usually the shape itself).
+    The index knows nothing about wx so it can be used by the layout and
+    export code as well as by the diagram frame.
+    """
+    def __init__(self, cellSize: int = DEFAULT_CELL_SIZE):
+        """
+
+        Args:
+            cellSize:  The width and height of a grid cell in diagram units
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cellSize:  int                         = cellSize
+        self._cells:     Dict[CellKey, Set[Hashable]] = {}
+        self._bounds:    Dict[Hashable, Bounds]       = {}
+        self._oversized: Set[Hashable]                = set()
+
+    @property
+    def cellSize(self) -> int:
+        return self._cellSize
+
+    def insert(self, key: Hashable, x: float, y: float, width: float, height: float):
+        """
+        Add an entry to the index.  If the key is already indexed it is moved.
+
+        Args:
+            key:    The entry identifier
+            x:      Left of the bounding box
+            y:      Top of the bounding box
+            width:  Width of the bounding box;  May be negative
+            height: Height of the bounding box;  May be negative
+        """
+        if key in self._bounds:
+            self.remove(key)
+
+        bounds: Bounds = SpatialIndex.toBounds(x, y, width, height)
+        self._bounds[key] = bounds
+        self._place(key, bounds)
+
+    def update(self, key: Hashable, x: float, y: float, width: float, height: float):
+        """
+        Move or resize an entry.  Cells are only touched when the box crosses a cell boundary
+
+        Args:
+            key:    The entry identifier
+            x:      New left of the bounding box
+            y:      New top of the bounding box
+            width:  New width
+            height: New height
+        """
+        newBounds: Bounds = SpatialIndex.toBounds(x, y, width, height)
+        oldBounds: Bounds = self._bounds.get(key)
+        if oldBounds is None:
+            self.insert(key, x, y, width, height)
+            return
+
+        self._bounds[key] = newBounds
+        if self._cellRange(oldBounds) == self._cellRange(newBounds):
+            return
+        if key in self._oversized and self._cellCount(newBounds) > MAX_ENTRY_CELLS:
+            return
+        self._unplace(key, oldBounds)
+        self._place(key, newBounds)
+
+    def remove(self, key: Hashable):
+        """
+        Remove an entry;  Removing an unknown key is not an error
+
+        Args:
+            key: The entry identifier
+        """
+        bounds: Bounds = self._bounds.pop(key, None)
+        if bounds is None:
+            return
+        self._unplace(key, bounds)
+
+    def clear(self):
+        self._cells     = {}
+        self._bounds    = {}
+        self._oversized = set()
+
+    def keys(self) -> IndexKeys:
+        """
+        Returns:  The keys of all the entries
+        """
+        return list(self._bounds.keys())
+
+    def getBounds(self, key: Hashable) -> Bounds:
+        """
+        Args:
+            key: The entry identifier
+
+        Returns:  The indexed (left, top, right, bottom) of the entry or None
+        """
+        return self._bounds.get(key)
+
+    def query(self, x: float, y: float, width: float, height: float) -> IndexKeys:
+        """
+        Find the entries whose bounding box intersects the given rectangle
+
+        Returns:  The keys of the intersecting entries
+        """
+        left, top, right, bottom = SpatialIndex.toBounds(x, y, width, height)
+        found:   IndexKeys     = []
+        visited: Set[Hashable] = set()
+        for key in self._candidates((left, top, right, bottom)):
+            if key in visited:
+                continue
+            visited.add(key)
+            kLeft, kTop, kRight, kBottom = self._bounds[key]
+            if kLeft <= right and left <= kRight and kTop <= bottom and top <= kBottom:
+                found.append(key)
+        return found
+
+    def isFree(self, x: float, y: float, width: float, height: float, ignore: Set[Hashable] = None) -> bool:
+        """
+        Check that no entry intersects the given rectangle
+
+        Args:
+            x:      Left
+            y:      Top
+            width:  Width
+            height: Height
+            ignore: Keys that do not count as obstacles
+
+        Returns:  `True` if the rectangle is unoccupied
+        """
+        left, top, right, bottom = SpatialIndex.toBounds(x, y, width, height)
+        for key in self._candidates((left, top, right, bottom)):
+            if ignore is not None and key in ignore:
+                continue
+            kLeft, kTop, kRight, kBottom = self._bounds[key]
+            if kLeft <= right and left <= kRight and kTop <= bottom and top <= kBottom:
+                return False
+        return True
+
+    @staticmethod
+    def toBounds(x: float, y: float, width: float, height: float) -> Bounds:
+        """
+        Normalize a rectangle that may have a negative width or height (MiniOgl allows it)
+
+        Returns: (left, top, right, bottom)
+        """
+        if width < 0:
+            x, width = x + width, -width
+        if height < 0:
+            y, height = y + height, -height
+        return x, y, x + width, y + height
+
+    def _cellRange(self, bounds: Bounds) -> Tuple[int, int, int, int]:
+
+        cellSize: int = self._cellSize
+        left, top, right, bottom = bounds
+
+        return floor(left / cellSize), floor(top / cellSize), floor(right / cellSize), floor(bottom / cellSize)
+
+    def _cellCount(self, bounds: Bounds) -> int:
+
+        minCol, minRow, maxCol, maxRow = self._cellRange(bounds)
+
+        return (maxCol - minCol + 1) * (maxRow - minRow + 1)
+
+    def _candidates(self, bounds: Bounds) -> Iterator[Hashable]:
+        """
+        The keys that may intersect the bounds;  A key may come up more than once
+
+        Args:
+            bounds: The (left, top, right, bottom) of the searched rectangle
+        """
+        if self._cellCount(bounds) > len(self._bounds):
+            yield from self._bounds.keys()
+            return
+        yield from self._oversized
+        for cellKey in self._cellsFor(bounds):
+            yield from self._cells.get(cellKey, ())
+
+    def _place(self, key: Hashable, bounds: Bounds):
+
+        if self._cellCount(bounds) > MAX_ENTRY_CELLS:
+            self._oversized.add(key)
+            return
+        for cellKey in self._cellsFor(bounds):
+            self._cells.setdefault(cellKey, set()).add(key)
+
+    def _unplace(self, key: Hashable, bounds: Bounds):
+
+        if key in self._oversized:
+            self._oversized.discard(key)
+            return
+        for cellKey in self._cellsFor(bounds):
+            self._discard(cellKey, key)
+
+    def _cellsFor(self, bounds: Bounds) -> Iterator[CellKey]:
+
+        minCol, minRow, maxCol, maxRow = self._cellRange(bounds)
+        for col in range(minCol, maxCol + 1):
+            for row in range(minRow, maxRow + 1):
+                yield col, row
+
+    def _discard(self, cellKey: CellKey, key: Hashable):
+
+        cell: Set[Hashable] = self._cells.get(cellKey)
+        if cell is not None:
+            cell.discard(key)
+            if len(cell) == 0:
+                del self._cells[cellKey]
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._bounds
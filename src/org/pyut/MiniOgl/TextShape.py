@@ -24,6 +24,10 @@ class TextShape(RectangleShape):
     A text shape that can be attached to another shape standalone).
 
     """
+    __slots__ = ('_text', '_color', '_textBack', '_font')
+
+    clsLogger: Logger = getLogger(__name__)
+
     def __init__(self, x: float, y: float, text: str, parent=None, font: Font = None):
         """
 
@@ -36,7 +40,6 @@ class TextShape(RectangleShape):
         """
         super().__init__(x, y, 0, 0, parent)
 
-        self.logger: Logger = getLogger(__name__)
         self._text:  str    = cast(str, None)
         self._color: Colour = BLACK
         self.SetText(text)
@@ -45,10 +48,15 @@ class TextShape(RectangleShape):
         self._resizable: bool = False
         self._textBack:  Colour = WHITE    # text background colour
 
-        self._model: TextShapeModel = TextShapeModel(self)
         self._font:  Font = font
 
-        self.logger.debug(f'Initial Text Shape font: {font}')
+        self.clsLogger.debug(f'Initial Text Shape font: {font}')
+
+    def _CreateModel(self) -> TextShapeModel:
+        """
+        Returns:  The model of the shape (MVC pattern)
+        """
+        return TextShapeModel(self)
 
     def Attach(self, diagram):
         """
@@ -155,22 +163,17 @@ class TextShape(RectangleShape):
 
     def UpdateFromModel(self):
         """
-        Updates the shape position and size from the model in light of a
-        change of state of the diagram frame.  Here it is only for the zoom
+        Updates the shape position, size and font size from the model.  The
+        dc scales the font with the zoom of the diagram frame
         """
 
         # change the position and size of the shape from the model
         # RectangleShape.UpdateFromModel(self)
         super().UpdateFromModel()
-        # get the diagram frame ratio between the shape and the model
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-
-        fontSize = self.GetModel().GetFontSize() * ratio
-        self.logger.debug(f'UpdateFromModel - ratio: {ratio}')
 
         # set the new font size
         if self._font is not None:
-            self._font.SetPointSize(fontSize)
+            self._font.SetPointSize(self.GetModel().GetFontSize())
 
     def UpdateModel(self):
         """
@@ -180,14 +183,8 @@ class TextShape(RectangleShape):
         # RectangleShape.UpdateModel(self)
         super().UpdateModel()
 
-        # get the ratio between the model and the shape (view) from
-        # the diagram frame where the shape is displayed.
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-
-        self.logger.debug(f'UpdateModel - ratio: {ratio}')
         if self.GetFont() is not None:
-            fontSize = self.GetFont().GetPointSize() / ratio
-            self.GetModel().SetFontSize(fontSize)
+            self.GetModel().SetFontSize(self.GetFont().GetPointSize())
 
     def GetFont(self) -> Font:
         """
@@ -0,0 +1,106 @@
+
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from wx import DC
+
+
+class ViewTransform:
+    """
+    Maps the diagram coordinates to the pixels of the virtual work area:
+
+        pixel = zoom * diagram + offset
+
+    The shapes and their models only know diagram coordinates;  The transform
+    is applied by the DC when drawing and reversed on the mouse events, so a
+    zoom step only changes this object and never touches the shapes.
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._zoom:    float = 1.0
+        self._xOffset: float = 0.0
+        self._yOffset: float = 0.0
+
+    @property
+    def zoom(self) -> float:
+        return self._zoom
+
+    @zoom.setter
+    def zoom(self, newValue: float):
+        self._zoom = newValue
+
+    @property
+    def xOffset(self) -> float:
+        return self._xOffset
+
+    @xOffset.setter
+    def xOffset(self, newValue: float):
+        self._xOffset = newValue
+
+    @property
+    def yOffset(self) -> float:
+        return self._yOffset
+
+    @yOffset.setter
+    def yOffset(self, newValue: float):
+        self._yOffset = newValue
+
+    def Apply(self, dc: DC):
+        """
+        Draw in diagram coordinates on the dc.  Call it after the scrolling was
+        applied (`ScrolledWindow.PrepareDC`);  The offsets are added to the scroll origin
+
+        Args:
+            dc: The dc the shapes are about to be drawn on
+        """
+        originX, originY = dc.GetDeviceOrigin()
+
+        dc.SetUserScale(self._zoom, self._zoom)
+        dc.SetDeviceOrigin(round(originX + self._xOffset), round(originY + self._yOffset))
+
+    def ToDiagram(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Args:
+            x:  Abscissa in the virtual work area
+            y:  Ordinate in the virtual work area
+
+        Returns:  The diagram coordinates of the point
+        """
+        return (x - self._xOffset) / self._zoom, (y - self._yOffset) / self._zoom
+
+    def ToVirtual(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Args:
+            x:  Abscissa in the diagram
+            y:  Ordinate in the diagram
+
+        Returns:  The coordinates of the point in the virtual work area
+        """
+        return self._zoom * x + self._xOffset, self._zoom * y + self._yOffset
+
+
+@contextmanager
+def deviceCoordinates(dc: DC):
+    """
+    Temporarily address the pixels of the dc directly, e.g. to blit a bitmap
+    drawn in diagram coordinates
+
+    Args:
+        dc: A dc on which a transform may be applied
+    """
+    scaleX, scaleY = dc.GetUserScale()
+    originX, originY = dc.GetDeviceOrigin()
+
+    dc.SetUserScale(1.0, 1.0)
+    dc.SetDeviceOrigin(0, 0)
+    try:
+        yield dc
+    finally:
+        dc.SetUserScale(scaleX, scaleY)
+        dc.SetDeviceOrigin(originX, originY)
@@ -9,8 +9,6 @@ from os import path as osPath
 
 from pkg_resources import resource_filename
 
-from wx import NewIdRef as wxNewIdRef
-
 from org.pyut.PyutPreferences import PyutPreferences
 from org.pyut.enums.ResourceTextType import ResourceTextType
 
@@ -132,7 +130,7 @@ class PyutUtils:
             eLog.error(errMsg)
 
     @staticmethod
-    def assignID(numberOfIds: int) -> List[wxNewIdRef]:
+    def assignID(numberOfIds: int) -> List['wxNewIdRef']:
         """
         Assign and return numberOfIds
 
@@ -143,6 +141,8 @@ class PyutUtils:
 
         Returns:  List of numbers which contain <numberOfIds> unique IDs
         """
+        from wx import NewIdRef as wxNewIdRef   # Keep this module usable without a display
+
         retList: List[wxNewIdRef] = []
         x: int = 0
         while x < numberOfIds:
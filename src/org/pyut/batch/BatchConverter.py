@@ -0,0 +1,156 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from os import cpu_count
+from os import path as osPath
+
+from pickle import PicklingError
+
+from time import perf_counter
+
+from org.pyut.PyutPreferences import PyutPreferences
+
+from org.pyut.errorcontroller.ErrorManager import ErrorManager
+from org.pyut.errorcontroller.ErrorViewTypes import ErrorViewTypes
+
+from org.pyut.persistence.DocumentModel import ProjectModel
+from org.pyut.persistence.ProjectReader import ProjectReader
+
+from org.pyut.batch.BatchExporters import BatchExporters
+
+
+@dataclass
+class ConversionResult:
+    """
+    What happened to one project file
+    """
+    fileName:  str   = ''
+    succeeded: bool  = False
+    seconds:   float = 0.0
+    outputs:   List[str] = field(default_factory=list)
+    message:   str   = ''
+
+
+ConversionResults = List[ConversionResult]
+
+
+class BatchConverter:
+    """
+    Converts Pyut project files to the requested export formats without starting the UI.
+    The files are converted concurrently in a process pool;  One failing file does not
+    stop the others, its error is reported in its `ConversionResult`.
+
+    Usage::
+        converter: BatchConverter = BatchConverter(formats=['pdf', 'gml'], outputDirectory='/tmp/diagrams')
+        results:   ConversionResults = converter.convert(['a.put', 'b.put'])
+        print(BatchConverter.report(results))
+    """
+    clsLogger: Logger = getLogger(__name__)
+
+    def __init__(self, formats: List[str], outputDirectory: str, workers: int = None):
+        """
+        Args:
+            formats:            Export formats;  See `BatchExporters.FORMATS`
+            outputDirectory:    Where the outputs are written
+            workers:            Number of worker processes;  `None` uses one per CPU and 1 converts in this process
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        unknownFormats: List[str] = [formatName for formatName in formats if formatName not in BatchExporters.FORMATS]
+        if len(unknownFormats) > 0:
+            raise ValueError(f'Unknown export formats: {unknownFormats};  Use {BatchExporters.FORMATS}')
+
+        self._formats:         List[str] = formats
+        self._outputDirectory: str       = outputDirectory
+        self._workers:         int       = workers if workers is not None else cpu_count() or 1
+
+    def convert(self, fileNames: List[str]) -> ConversionResults:
+        """
+        Args:
+            fileNames:  The project files
+
+        Returns:  One result per file, in the order of `fileNames`
+        """
+        formatsArgs:   List[List[str]] = [self._formats] * len(fileNames)
+        directoryArgs: List[str]       = [self._outputDirectory] * len(fileNames)
+
+        workers: int = min(self._workers, len(fileNames))
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(BatchConverter.convertFile, fileNames, formatsArgs, directoryArgs))
+            except (BrokenProcessPool, PicklingError, OSError) as e:
+                self.logger.warning(f'Process pool not usable, converting sequentially: {e}')
+
+        return [BatchConverter.convertFile(fileName, self._formats, self._outputDirectory) for fileName in fileNames]
+
+    @staticmethod
+    def convertFile(fileName: str, formats: List[str], outputDirectory: str) -> ConversionResult:
+        """
+        Read one project and write it in every requested format;  Runs in a worker process
+
+        Args:
+            fileName:           A '.put' or '.xml' project file
+            formats:            Export formats
+            outputDirectory:    Where the outputs are written
+
+        Returns:  The result of the conversion
+        """
+        BatchConverter.setupHeadless()
+
+        result:    ConversionResult = ConversionResult(fileName=fileName)
+        startTime: float = perf_counter()
+        try:
+            projectModel: ProjectModel   = ProjectReader().read(fileName)
+            exporters:    BatchExporters = BatchExporters(outputDirectory)
+            for formatName in formats:
+                result.outputs.extend(exporters.export(projectModel, formatName))
+            result.succeeded = True
+        except (ValueError, Exception) as e:
+            BatchConverter.clsLogger.error(f'{fileName}: {e}')
+            result.message = f'{e}'
+
+        result.seconds = perf_counter() - startTime
+
+        return result
+
+    @staticmethod
+    def setupHeadless():
+        """
+        Errors are logged instead of shown in dialogs and the preferences singleton can be created
+        """
+        ErrorManager(view=ErrorViewTypes.TEXT_ERROR_VIEW)
+        if PyutPreferences.preferencesFileLocationAndName is None:
+            PyutPreferences.determinePreferencesLocation()
+
+    @staticmethod
+    def report(results: ConversionResults) -> str:
+        """
+        Returns:  One line per file with its status, time and number of outputs, then a summary line
+        """
+        lines:  List[str] = []
+        failed: int       = 0
+        for result in results:
+            if result.succeeded:
+                status: str = 'OK'
+            else:
+                status = 'FAILED'
+                failed += 1
+            line: str = f'{status:6} {result.seconds:8.3f}s  {len(result.outputs):3} output(s)  {osPath.basename(result.fileName)}'
+            if result.message != '':
+                line = f'{line}  {result.message}'
+            lines.append(line)
+
+        totalSeconds: float = sum(result.seconds for result in results)
+        lines.append(f'{len(results)} file(s), {failed} failed, {totalSeconds:.3f}s of conversion time')
+
+        return '\n'.join(lines)
@@ -0,0 +1,207 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from os import makedirs
+from os import path as osPath
+
+from re import sub as regExSub
+
+from org.pyut.enums.DiagramType import DiagramType
+
+from org.pyut.general.PyutVersion import PyutVersion
+
+from org.pyut.model.PyutClass import PyutClass
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import ProjectModel
+
+from org.pyut.plugins.ascii.AsciiRenderer import AsciiRenderer
+from org.pyut.plugins.gml.GMLWriter import GMLWriter
+from org.pyut.plugins.iopythonsupport.PyutToPython import PyutToPython
+from org.pyut.plugins.xmi.PyutXmi import PyutXmi
+
+from org.pyut.batch.ProjectPdfExporter import ProjectPdfExporter
+
+OutputFileNames = List[str]
+
+
+class BatchExporters:
+    """
+    Writes the documents of a project read without UI in one of the export formats.
+    Every format uses the same code as the matching IO plugin, minus the dialogs.
+
+    A project with several documents gets one output per document;  Its title is
+    appended to the project name.
+    """
+    FORMAT_PDF:    str = 'pdf'
+    FORMAT_PNG:    str = 'png'
+    FORMAT_XMI:    str = 'xmi'
+    FORMAT_GML:    str = 'gml'
+    FORMAT_PYTHON: str = 'python'
+    FORMAT_ASCII:  str = 'ascii'
+
+    FORMAT_PROJECT_PDF: str = 'project-pdf'
+
+    FORMATS: List[str] = [FORMAT_PDF, FORMAT_PNG, FORMAT_XMI, FORMAT_GML, FORMAT_PYTHON, FORMAT_ASCII, FORMAT_PROJECT_PDF]
+
+    PROJECT_PDF_SUFFIX: str = '-project'
+
+    PDF_DPI: int = 75
+
+    def __init__(self, outputDirectory: str):
+        """
+        Args:
+            outputDirectory:    Where the outputs are written;  Created if needed
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._outputDirectory: str = outputDirectory
+
+        self._exporters: Dict[str, Callable[[ProjectModel], OutputFileNames]] = {
+            BatchExporters.FORMAT_PDF:    self.exportPdf,
+            BatchExporters.FORMAT_PNG:    self.exportPng,
+            BatchExporters.FORMAT_XMI:    self.exportXmi,
+            BatchExporters.FORMAT_GML:    self.exportGml,
+            BatchExporters.FORMAT_PYTHON: self.exportPython,
+            BatchExporters.FORMAT_ASCII:  self.exportAscii,
+
+            BatchExporters.FORMAT_PROJECT_PDF: self.exportProjectPdf,
+        }
+
+    def export(self, projectModel: ProjectModel, formatName: str) -> OutputFileNames:
+        """
+        Args:
+            projectModel:   The project to export
+            formatName:     One of `FORMATS`
+
+        Returns:  The names of the written files
+        """
+        if formatName not in self._exporters:
+            raise ValueError(f'Unknown export format: {formatName}')
+
+        makedirs(self._outputDirectory, exist_ok=True)
+
+        return self._exporters[formatName](projectModel)
+
+    def exportPdf(self, projectModel: ProjectModel) -> OutputFileNames:
+        return self._exportPyUml(projectModel, BatchExporters.FORMAT_PDF)
+
+    def exportPng(self, projectModel: ProjectModel) -> OutputFileNames:
+        return self._exportPyUml(projectModel, BatchExporters.FORMAT_PNG)
+
+    def exportProjectPdf(self, projectModel: ProjectModel) -> OutputFileNames:
+        """
+        All the class diagrams in one PDF;  The batch already converts its files in parallel, so
+        the documents are rendered in the current process
+        """
+        if len(self._documents(projectModel, ProjectPdfExporter.DIAGRAM_TYPES)) == 0:
+            return []
+
+        baseName: str = self._baseName(projectModel)
+        fileName: str = osPath.join(self._outputDirectory, f'{baseName}{BatchExporters.PROJECT_PDF_SUFFIX}.{BatchExporters.FORMAT_PDF}')
+        ProjectPdfExporter(workers=1).export(projectModel, fileName, title=baseName)
+
+        return [fileName]
+
+    def exportXmi(self, projectModel: ProjectModel) -> OutputFileNames:
+
+        outputs: OutputFileNames = []
+        for documentModel in self._documents(projectModel, [DiagramType.CLASS_DIAGRAM]):
+            fileName: str = self._outputFileName(projectModel, documentModel, BatchExporters.FORMAT_XMI)
+            xmlText:  str = PyutXmi().saveDocument(documentModel).toprettyxml()
+            with open(fileName, 'w') as writer:
+                writer.write(xmlText)
+            outputs.append(fileName)
+
+        return outputs
+
+    def exportGml(self, projectModel: ProjectModel) -> OutputFileNames:
+
+        outputs: OutputFileNames = []
+        for documentModel in self._documents(projectModel, [DiagramType.CLASS_DIAGRAM, DiagramType.USECASE_DIAGRAM]):
+            fileName:  str       = self._outputFileName(projectModel, documentModel, BatchExporters.FORMAT_GML)
+            gmlWriter: GMLWriter = GMLWriter()
+            with open(fileName, 'w') as writer:
+                gmlWriter.translateDocument(documentModel, writer=writer)
+            outputs.append(fileName)
+
+        return outputs
+
+    def exportPython(self, projectModel: ProjectModel) -> OutputFileNames:
+        """
+        Same layout as the Python IO plugin:  One file per class, named after the class, in
+        a directory named after the project
+        """
+        pyutToPython: PyutToPython = PyutToPython()
+        directory:    str          = osPath.join(self._outputDirectory, self._baseName(projectModel))
+        makedirs(directory, exist_ok=True)
+
+        topCode: List[str] = pyutToPython.generateTopCode()
+        outputs: OutputFileNames = []
+        for documentModel in self._documents(projectModel, [DiagramType.CLASS_DIAGRAM]):
+            for shape in documentModel.shapes.values():
+                if not isinstance(shape.pyutObject, PyutClass):
+                    continue
+                pyutClass: PyutClass = shape.pyutObject
+                fileName:  str       = osPath.join(directory, f'{pyutClass.getName()}.py')
+                with open(fileName, 'w') as writer:
+                    writer.writelines(topCode)
+                    writer.writelines(pyutToPython.generateClassCode(pyutClass))
+                outputs.append(fileName)
+
+        return outputs
+
+    def exportAscii(self, projectModel: ProjectModel) -> OutputFileNames:
+
+        outputs:       OutputFileNames = []
+        asciiRenderer: AsciiRenderer   = AsciiRenderer()
+        for documentModel in self._documents(projectModel, [DiagramType.CLASS_DIAGRAM, DiagramType.USECASE_DIAGRAM]):
+            fileName: str = self._outputFileName(projectModel, documentModel, AsciiRenderer.EXTENSION)
+            asciiRenderer.writeDocument(documentModel, fileName)
+            outputs.append(fileName)
+
+        return outputs
+
+    def _exportPyUml(self, projectModel: ProjectModel, formatName: str) -> OutputFileNames:
+
+        # pyumldiagrams is only loaded when a PDF or an image is requested
+        from org.pyut.plugins.io.pyumlsupport.ImageFormat import ImageFormat
+        from org.pyut.plugins.io.pyumlsupport.ImageOptions import ImageOptions
+        from org.pyut.plugins.io.pyumlsupport.PyUmlDefinitionWriter import PyUmlDefinitionWriter
+
+        outputs: OutputFileNames = []
+        for documentModel in self._documents(projectModel, [DiagramType.CLASS_DIAGRAM]):
+
+            imageOptions: ImageOptions = ImageOptions()
+            imageOptions.outputFileName = self._outputFileName(projectModel, documentModel, formatName)
+            imageOptions.imageFormat    = ImageFormat.PDF if formatName == BatchExporters.FORMAT_PDF else ImageFormat.PNG
+
+            writer: PyUmlDefinitionWriter = PyUmlDefinitionWriter(imageOptions=imageOptions,
+                                                                  dpi=BatchExporters.PDF_DPI,
+                                                                  pyutVersion=PyutVersion.getPyUtVersion())
+            writer.drawDocument(documentModel)
+            writer.write()
+            outputs.append(imageOptions.outputFileName)
+
+        return outputs
+
+    def _documents(self, projectModel: ProjectModel, diagramTypes: List[DiagramType]) -> List[DocumentModel]:
+        return [documentModel for documentModel in projectModel.documents if documentModel.diagramType in diagramTypes]
+
+    def _outputFileName(self, projectModel: ProjectModel, documentModel: DocumentModel, extension: str) -> str:
+
+        baseName: str = self._baseName(projectModel)
+        if len(projectModel.documents) > 1:
+            index:     int = projectModel.documents.index(documentModel)
+            safeTitle: str = regExSub(r'[^\w.-]+', '_', documentModel.title)
+            baseName = f'{baseName}-{index}-{safeTitle}'
+
+        return osPath.join(self._outputDirectory, f'{baseName}.{extension}')
+
+    def _baseName(self, projectModel: ProjectModel) -> str:
+        return osPath.splitext(osPath.basename(projectModel.fileName))[0]
@@ -0,0 +1,171 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from os import cpu_count
+from os import path as osPath
+
+from pickle import PicklingError
+
+from tempfile import TemporaryDirectory
+
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import Document
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import Element
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import parseString
+
+from org.pyut.enums.DiagramType import DiagramType
+
+from org.pyut.general.PyutVersion import PyutVersion
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import ProjectModel
+
+from org.pyut.persistence.converters.MiniDomToModelV10 import MiniDomToModel
+
+from org.pyut.plugins.io.pyumlsupport.PdfMerger import PdfMerger
+
+
+@dataclass
+class DocumentSnapshot:
+    """
+    A document as a stand alone project;  Plain text, so it is cheap to send to a worker process
+    """
+    title: str = ''
+    xml:   str = ''
+
+
+DocumentSnapshots = List[DocumentSnapshot]
+
+
+class ProjectPdfExporter:
+    """
+    Exports every class diagram of a project in a single PDF.  Each document is
+    rendered to its own PDF in a worker process, from a snapshot of its XML, then
+    the PDFs are merged after a table of contents.
+
+    The snapshots are taken from the XML elements of the documents, so the UI
+    must first save the project to a DOM and no UI object crosses a process
+    boundary.
+
+    Usage::
+        projectModel: ProjectModel = MiniDomToModel().getProject(dom, withContents=False)
+        ProjectPdfExporter().export(projectModel, 'Project.pdf', title='Project')
+    """
+    DIAGRAM_TYPES: List[DiagramType] = [DiagramType.CLASS_DIAGRAM]
+
+    PDF_DPI: int = 75
+
+    clsLogger: Logger = getLogger(__name__)
+
+    def __init__(self, workers: int = None):
+        """
+        Args:
+            workers:    Number of worker processes;  `None` uses one per CPU and 1 renders in this process
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._workers: int = workers if workers is not None else cpu_count() or 1
+
+    def export(self, projectModel: ProjectModel, outputFileName: str, title: str = '') -> int:
+        """
+        Args:
+            projectModel:   A project read with or without its contents;  Its documents must have their XML element
+            outputFileName: The merged PDF
+            title:          The PDF title
+
+        Returns:
+            The number of merged pages, without the table of contents
+        """
+        snapshots: DocumentSnapshots = self.snapshots(projectModel)
+
+        with TemporaryDirectory() as directory:
+            pdfFileNames: List[str] = [osPath.join(directory, f'{idx}.pdf') for idx in range(len(snapshots))]
+            xmlArgs:      List[str] = [snapshot.xml for snapshot in snapshots]
+
+            rendered: bool = False
+            workers:  int  = min(self._workers, len(snapshots))
+            if workers > 1:
+                try:
+                    with ProcessPoolExecutor(max_workers=workers) as executor:
+                        list(executor.map(ProjectPdfExporter.renderSnapshot, xmlArgs, pdfFileNames))
+                    rendered = True
+                except (BrokenProcessPool, PicklingError, OSError) as e:
+                    self.logger.warning(f'Process pool not usable, rendering sequentially: {e}')
+            if rendered is False:
+                for xml, pdfFileName in zip(xmlArgs, pdfFileNames):
+                    ProjectPdfExporter.renderSnapshot(xml, pdfFileName)
+
+            pdfMerger: PdfMerger = PdfMerger()
+            for snapshot, pdfFileName in zip(snapshots, pdfFileNames):
+                pdfMerger.addFile(pdfFileName, title=snapshot.title)
+            with open(outputFileName, 'wb') as stream:
+                pdfMerger.write(stream, title=title, producer=f'Pyut {PyutVersion.getPyUtVersion()}')
+
+        return pdfMerger.pageCount
+
+    def snapshots(self, projectModel: ProjectModel) -> DocumentSnapshots:
+        """
+        Returns:
+            One snapshot per class diagram, in project order
+        """
+        snapshots: DocumentSnapshots = []
+        for documentModel in projectModel.documents:
+            if documentModel.diagramType in ProjectPdfExporter.DIAGRAM_TYPES:
+                snapshots.append(DocumentSnapshot(title=documentModel.title, xml=self._toStandAloneXml(documentModel.documentNode)))
+
+        return snapshots
+
+    @staticmethod
+    def renderSnapshot(xml: str, pdfFileName: str) -> str:
+        """
+        Render the document of a snapshot;  Runs in a worker process
+
+        Args:
+            xml:            The snapshot XML
+            pdfFileName:    Where the PDF is written
+
+        Returns:
+            The PDF file name
+        """
+        # pyumldiagrams is only loaded by the processes that draw
+        from org.pyut.batch.BatchConverter import BatchConverter
+        from org.pyut.plugins.io.pyumlsupport.ImageFormat import ImageFormat
+        from org.pyut.plugins.io.pyumlsupport.ImageOptions import ImageOptions
+        from org.pyut.plugins.io.pyumlsupport.PyUmlDefinitionWriter import PyUmlDefinitionWriter
+
+        BatchConverter.setupHeadless()
+
+        documentModel: DocumentModel = MiniDomToModel().getProject(parseString(xml)).documents[0]
+
+        imageOptions: ImageOptions = ImageOptions()
+        imageOptions.outputFileName = pdfFileName
+        imageOptions.imageFormat    = ImageFormat.PDF
+
+        writer: PyUmlDefinitionWriter = PyUmlDefinitionWriter(imageOptions=imageOptions,
+                                                              dpi=ProjectPdfExporter.PDF_DPI,
+                                                              pyutVersion=PyutVersion.getPyUtVersion())
+        writer.drawDocument(documentModel)
+        writer.write()
+
+        return pdfFileName
+
+    def _toStandAloneXml(self, documentNode: Element) -> str:
+        """
+        The project element, without its other documents, around the document element
+        """
+        xmlDoc:  Document = Document()
+        project: Element  = xmlDoc.importNode(documentNode.parentNode, False)
+        project.appendChild(xmlDoc.importNode(documentNode, True))
+        xmlDoc.appendChild(project)
+
+        return xmlDoc.toxml()
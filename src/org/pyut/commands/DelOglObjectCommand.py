@@ -117,12 +117,10 @@ class DelOglObjectCommand(Command):
         shape = self._shape
         if isinstance(shape, OglClass):
             # need to check if the class has children, and remove the
-            # refs in the children
+            # refs in the children;  They are at the source of its links
             pyutClass = shape.getPyutObject()
-            # TODO: Fix this inscrutable piece of code
-            for klass in [s.getPyutObject()
-                          for s in umlFrame.getUmlObjects()
-                          if isinstance(s, OglClass)]:
+            for link in shape.getLinks():
+                klass = link.getSourceShape().getPyutObject()
                 if pyutClass in klass.getParents():
                     klass.getParents().remove(pyutClass)
         shape.Detach()
@@ -1,18 +1,21 @@
-from wx import Frame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wx import Frame
 
 
 class AbstractErrorView:
     """
     Prototypical abstract class
     """
-    def newFatalError(self, msg: str, title: str = None, parent: Frame = None):
+    def newFatalError(self, msg: str, title: str = None, parent: 'Frame' = None):
         pass
 
-    def newWarning(self, msg: str, title: str = None, parent: Frame = None):
+    def newWarning(self, msg: str, title: str = None, parent: 'Frame' = None):
         pass
 
-    def newInformation(self, msg: str, title: str = None, parent: Frame = None):
+    def newInformation(self, msg: str, title: str = None, parent: 'Frame' = None):
         pass
 
-    def displayInformation(self, msg: str, title: str = None, parent: Frame = None):
+    def displayInformation(self, msg: str, title: str = None, parent: 'Frame' = None):
         pass
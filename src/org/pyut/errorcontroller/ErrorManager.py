@@ -5,7 +5,6 @@ from sys import exc_info
 
 from traceback import extract_tb
 
-from org.pyut.errorcontroller.GraphicErrorView import GraphicErrorView
 from org.pyut.errorcontroller.TextErrorView import TextErrorView
 from org.pyut.errorcontroller.RaiseErrorView import RaiseErrorView
 
@@ -34,13 +33,14 @@ class ErrorManager(Singleton):
 
     def changeType(self, view: ErrorViewTypes):
 
-        if view == ErrorViewTypes.GRAPHIC_ERROR_VIEW:
-            self._view = GraphicErrorView()
-        elif view == ErrorViewTypes.TEXT_ERROR_VIEW:
+        if view == ErrorViewTypes.TEXT_ERROR_VIEW:
             self._view = TextErrorView()
         elif view == ErrorViewTypes.RAISE_ERROR_VIEW:
             self._view = RaiseErrorView()
         else:
+            # Imported here so that the text and raise views work without a display
+            from org.pyut.errorcontroller.GraphicErrorView import GraphicErrorView
+
             self._view = GraphicErrorView()
 
     def newFatalError(self, msg=None, title=None, parent=None):
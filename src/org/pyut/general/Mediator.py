@@ -648,10 +648,12 @@ class Mediator(Singleton):
             pyutObject = diagramShape.getPyutObject()
             dlg = DlgEditNote(umlFrame, -1, pyutObject)
             dlg.Destroy()
+            self.autoResize(diagramShape)
         elif isinstance(diagramShape, OglUseCase):
             pyutObject = diagramShape.getPyutObject()
             dlg = DlgEditUseCase(umlFrame, -1, pyutObject)
             dlg.Destroy()
+            self.autoResize(diagramShape)
         elif isinstance(diagramShape, OglActor):
             pyutObject = diagramShape.getPyutObject()
             dlg = TextEntryDialog(umlFrame, "Actor name", "Enter actor name", pyutObject.getName(), OK | CANCEL | CENTRE)
@@ -690,6 +692,19 @@ class Mediator(Singleton):
         else:
             return []
 
+    def getUmlObjectById(self, objectId: int):
+        """
+        Return the UML object of the current diagram with the given id,
+        or None if there is none.
+        """
+        if self._fileHandling is None:
+            return None
+        umlFrame = self._fileHandling.getCurrentFrame()
+        if umlFrame is not None:
+            return umlFrame.getUmlObjectById(objectId)
+        else:
+            return None
+
     def getSelectedShapes(self):
         """
         Return the list of selected OglObjects in the diagram.
@@ -697,14 +712,11 @@ class Mediator(Singleton):
         @since 1.12
         @author L. Burgbacher <lb@alawa.ch>
         """
-        umlObjects = self.getUmlObjects()
-        if umlObjects is not None:
-            selectedObjects = []
-            for obj in self.getUmlObjects():
-                if obj.IsSelected():
-                    selectedObjects.append(obj)
-
-            return selectedObjects
+        if self._fileHandling is None:
+            return []
+        umlFrame = self._fileHandling.getCurrentFrame()
+        if umlFrame is not None:
+            return umlFrame.getSelectedUmlObjects()
         else:
             return []
 
@@ -858,7 +870,8 @@ class Mediator(Singleton):
 
         if cmdGroupInit:
             umlFrame.getHistory().addCommandGroup(cmdGroup)
-            umlFrame.getHistory().execute()
+            with umlFrame.batch():
+                umlFrame.getHistory().execute()
 
     def insertSelectedShape(self):
         umlFrame = self._fileHandling.getCurrentFrame()
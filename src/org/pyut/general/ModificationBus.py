@@ -0,0 +1,141 @@
+
+from typing import Callable
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from dataclasses import dataclass
+
+from org.pyut.general.Singleton import Singleton
+
+
+@dataclass
+class ModificationBatch:
+    """
+    What happened since the subscribers were last notified
+    """
+    notifications: int  = 0
+    modified:      bool = False
+
+
+Subscriber = Callable[[ModificationBatch], None]
+Scheduler  = Callable[[Callable[[], None]], None]
+
+
+def getModificationBus() -> 'ModificationBus':
+    """
+    Get the modification bus
+    """
+    return ModificationBus()
+
+
+class ModificationBus(Singleton):
+    """
+    Coalesces the change notifications of the diagrams.  Shapes and projects
+    notify as often as they like;  The subscribers (window title, project tree, ...)
+    are notified once per event loop tick, or once at the end of a transaction.
+
+    The flags themselves (e.g. the project modified flag) must still be set
+    by the caller;  Only the views that reflect them are deferred.
+
+    Sample use:
+        getModificationBus().subscribe(self._onModifications)
+        getModificationBus().notify(modified=True)
+
+        with getModificationBus().transaction():
+            for oglObject in oglObjects:
+                oglObject.SetPosition(x, y)
+    """
+    def init(self):
+        """
+        Singleton constructor
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._subscribers: List[Subscriber] = []
+        self._batch:       ModificationBatch = ModificationBatch()
+        self._depth:       int  = 0
+        self._scheduled:   bool = False
+        self._scheduler:   Scheduler = cast(Scheduler, None)
+
+    def subscribe(self, subscriber: Subscriber):
+        if subscriber not in self._subscribers:
+            self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber):
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    def setScheduler(self, scheduler: Scheduler):
+        """
+        Args:
+            scheduler:  Runs its argument once the current event is handled;  `None` uses `wx.CallAfter`
+        """
+        self._scheduler = scheduler
+
+    def notify(self, modified: bool = True):
+        """
+        Record a change;  The subscribers are notified later
+
+        Args:
+            modified:   `True` when a document changed, `False` when only a view must be refreshed
+        """
+        self._batch.notifications += 1
+        self._batch.modified = self._batch.modified or modified
+
+        if self._depth == 0 and self._scheduled is False:
+            self._scheduled = True
+            self._schedule(self._onScheduled)
+
+    @contextmanager
+    def transaction(self):
+        """
+        The subscribers are notified once, when the outermost transaction ends
+        """
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.flush()
+
+    def flush(self):
+        """
+        Notify the subscribers now, if anything happened
+        """
+        if self._batch.notifications == 0:
+            return
+        batch: ModificationBatch = self._batch
+        self._batch = ModificationBatch()
+
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber(batch)
+            except (ValueError, Exception) as e:
+                self.logger.error(f'Modification subscriber {subscriber} failed: {e}')
+
+    def _onScheduled(self):
+
+        self._scheduled = False
+        if self._depth == 0:
+            self.flush()
+
+    def _schedule(self, callback: Callable[[], None]):
+
+        if self._scheduler is not None:
+            self._scheduler(callback)
+            return
+
+        # Keep the module usable without a display
+        from wx import CallAfter
+        from wx import GetApp
+
+        if GetApp() is None:
+            callback()
+        else:
+            CallAfter(callback)
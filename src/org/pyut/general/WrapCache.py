@@ -0,0 +1,89 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import cast
+
+FontKey = Tuple[int, int, int, int, str]    # point size, family, style, weight, face name
+WrapKey = Tuple[str, FontKey, float]        # text, font, width
+WordWidths = Dict[str, int]
+
+
+class WrapCache:
+    """
+    The word wrapped lines of a shape's text.  The lines are kept for the last
+    (text, font, width) key, so editing the text or resizing the shape
+    invalidates them;  Painting again with the same key does not measure anything.
+
+    The measured word widths are shared by all the shapes, per font.
+
+    Wraps like `LineSplitter`;  It is shared by the `Draw()` and the `autoResize()`
+    of the shapes that wrap their text.
+
+    Sample use:
+        self._wrapCache: WrapCache = WrapCache()
+        lines: List[str] = self._wrapCache.lines(pyutNote.content, dc, font, textWidth)
+    """
+    MAX_WORDS_PER_FONT: int = 10000
+
+    clsWordWidths: Dict[FontKey, WordWidths] = {}
+
+    def __init__(self):
+
+        self._key:   WrapKey   = cast(WrapKey, None)
+        self._lines: List[str] = []
+
+    def lines(self, text: str, dc, font, textWidth: float) -> List[str]:
+        """
+        Args:
+            text:       The text to wrap
+            dc:         Measures the words;  Its font must be `font`
+            font:       The font the text is drawn with
+            textWidth:  The width of the text in pixels
+
+        Returns:
+            The lines no wider than `textWidth`;  Do not modify them
+        """
+        key: WrapKey = (text, WrapCache.fontKey(font), textWidth)
+        if key != self._key:
+            self._lines = self._wrap(text, dc, key[1], textWidth)
+            self._key   = key
+
+        return self._lines
+
+    def invalidate(self):
+        self._key = cast(WrapKey, None)
+
+    @classmethod
+    def fontKey(cls, font) -> FontKey:
+        return font.GetPointSize(), font.GetFamily(), font.GetStyle(), font.GetWeight(), font.GetFaceName()
+
+    @classmethod
+    def clearWordWidths(cls):
+        cls.clsWordWidths.clear()
+
+    def _wrap(self, text: str, dc, fontKey: FontKey, textWidth: float) -> List[str]:
+
+        wordWidths: WordWidths = WrapCache.clsWordWidths.setdefault(fontKey, {})
+        if len(wordWidths) > WrapCache.MAX_WORDS_PER_FONT:
+            wordWidths.clear()
+
+        wrappedLines: List[str] = []
+        for line in text.splitlines():
+            words:     List[str] = []
+            lineWidth: int       = 0
+            for word in line.split():
+                wordWidth: int = wordWidths.get(word)
+                if wordWidth is None:
+                    wordWidth = dc.GetTextExtent(f'{word} ')[0]     # Measured with its trailing space
+                    wordWidths[word] = wordWidth
+                if lineWidth + wordWidth <= textWidth:
+                    words.append(word)
+                    lineWidth += wordWidth
+                else:
+                    wrappedLines.append(' '.join(words))
+                    words     = [word]
+                    lineWidth = wordWidth
+            wrappedLines.append(' '.join(words))
+
+        return wrappedLines
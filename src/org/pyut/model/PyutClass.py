@@ -111,7 +111,7 @@ class PyutClass(PyutClassCommon, PyutLinkedObject):
         """
         aDict = self.__dict__.copy()
         aDict["_fathers"]    = []
-        return aDict
+        return aDict, self._slotState()
 
     def __str__(self):
         """
@@ -17,6 +17,7 @@ class PyutField(PyutParam):
         or
         yourField = PyutField('anotherField', 'str', '', PyutVisibilityEnum.private)
     """
+    __slots__ = ('_visibility',)
 
     def __init__(self, name: str = "", theFieldType: PyutType = PyutType(''), defaultValue: str = None,
                  visibility: PyutVisibilityEnum = PyutVisibilityEnum.PRIVATE):
@@ -47,6 +48,7 @@ class PyutField(PyutParam):
         @param visibility
         """
         self._visibility = visibility
+        self._invalidateDisplay()
 
     @property
     def visibility(self) -> PyutVisibilityEnum:
@@ -55,15 +57,15 @@ class PyutField(PyutParam):
     @visibility.setter
     def visibility(self, theNewValue: PyutVisibilityEnum):
         self._visibility = theNewValue
+        self._invalidateDisplay()
 
-    def __str__(self):
+    def _displayString(self) -> str:
         """
         Get method, used to know the name and visibility.
 
         @return string field
         """
-        # return str(self._visibility) + PyutParam.__str__(self)
-        return f'{self._visibility}{PyutParam.__str__(self)}'
+        return f'{self._visibility}{PyutParam._displayString(self)}'
 
     def __repr__(self):
         return self.__str__()
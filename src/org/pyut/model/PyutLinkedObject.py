@@ -97,4 +97,4 @@ class PyutLinkedObject(PyutObject):
         """
         stateDict = self.__dict__.copy()
         stateDict["_links"] = []
-        return stateDict
+        return stateDict, self._slotState()
@@ -1,6 +1,7 @@
 
 from typing import cast
 from typing import List
+from typing import Tuple
 
 from logging import Logger
 from logging import getLogger
@@ -44,7 +45,13 @@ class PyutMethod(PyutObject):
 
     You can change it with the `setStringMode` class method. This means the
     change will be done for each `PyutMethod` instance.
+
+    The string is computed once and kept until the method, its parameters or
+    the string mode change.
     """
+    clsLogger: Logger = getLogger(__name__)
+
+    __slots__ = ('_visibility', '_modifiers', '_sourceCode', '_params', '_returns', '_display', '_displayKey')
 
     # define class flag to avoid PyCharm warning in get/set string mode
     __selectedStringMode = None
@@ -59,8 +66,6 @@ class PyutMethod(PyutObject):
         """
         super().__init__(name)
 
-        self.logger: Logger = getLogger(__name__)
-
         self._visibility: PyutVisibilityEnum = visibility
         self._modifiers:  PyutMethod.PyutModifiers  = cast(PyutMethod.PyutModifiers, [])
         self._sourceCode: PyutMethod.SourceCodeType = cast(PyutMethod.SourceCodeType, [])
@@ -68,11 +73,15 @@ class PyutMethod(PyutObject):
         self._params:  PyutMethod.PyutParameters = []
         self._returns: PyutType                  = returns
 
-        prefs = PyutPreferences()
-        if prefs.showParameters is True:
-            PyutMethod.setStringMode(WITH_PARAMS)
-        else:
-            PyutMethod.setStringMode(WITHOUT_PARAMS)
+        self._display:    str   = cast(str, None)
+        self._displayKey: Tuple = cast(Tuple, None)
+
+        if PyutMethod.__selectedStringMode is None:
+            prefs = PyutPreferences()
+            if prefs.showParameters is True:
+                PyutMethod.setStringMode(WITH_PARAMS)
+            else:
+                PyutMethod.setStringMode(WITHOUT_PARAMS)
 
     @property
     def sourceCode(self) -> SourceCodeType:
@@ -115,6 +124,7 @@ class PyutMethod(PyutObject):
     @visibility.setter
     def visibility(self, theNewValue: PyutVisibilityEnum):
         self._visibility = theNewValue
+        self._invalidateDisplay()
 
     @property
     def returnType(self) -> PyutType:
@@ -123,6 +133,7 @@ class PyutMethod(PyutObject):
     @returnType.setter
     def returnType(self, theNewValue: PyutType):
         self._returns = theNewValue
+        self._invalidateDisplay()
 
     @property
     def parameters(self) -> PyutParameters:
@@ -145,6 +156,7 @@ class PyutMethod(PyutObject):
         Set the visibility of the method.
         """
         self._visibility = visibility
+        self._invalidateDisplay()
 
     def getModifiers(self) -> PyutModifiers:
         """
@@ -227,9 +239,10 @@ class PyutMethod(PyutObject):
         pyutType: PyutType = returnType
         if type(returnType) is str:
             pyutType = PyutType(returnType)
-            self.logger.warning(f'Setting return type as string is deprecated.  use PyutType')
+            PyutMethod.clsLogger.warning(f'Setting return type as string is deprecated.  use PyutType')
 
         self._returns = pyutType
+        self._invalidateDisplay()
 
     def __stringWithoutParams(self):
         """
@@ -271,8 +284,16 @@ class PyutMethod(PyutObject):
         @since 1.0
         @author Laurent Burgbacher <lb@alawa.ch>
         """
-        try:
-            return self.__selectedStringMode()
-        except (ValueError, Exception) as e:
-            self.logger.error(f'{e}')
-            return ""
+        displayKey: Tuple = (PyutMethod.__selectedStringMode, *[str(param) for param in self._params])
+        if displayKey != self._displayKey:
+            try:
+                self._display = self.__selectedStringMode()
+            except (ValueError, Exception) as e:
+                PyutMethod.clsLogger.error(f'{e}')
+                return ""
+            self._displayKey = displayKey
+
+        return self._display
+
+    def _invalidateDisplay(self):
+        self._displayKey = None
@@ -1,3 +1,11 @@
+from typing import Callable
+from typing import List
+
+from sys import modules
+
+from weakref import WeakMethod
+
+MEDIATOR_MODULE_NAME: str = 'org.pyut.general.Mediator'
 
 
 class PyutObject:
@@ -7,6 +15,12 @@ class PyutObject:
     """
     nextId: int = 0
 
+    # Told the object and its previous id when an id changes;  The frames keep their objects by id.
+    # Weak so that a frame closed without cleanUp() is not kept alive;  See addIdObserver()
+    idObservers: List[WeakMethod] = []
+
+    __slots__ = ('_id', '_name', '_fileName')
+
     def __init__(self, name=""):
         """
         Args:
@@ -42,14 +56,13 @@ class PyutObject:
         Returns:
             `True` if `idToCheck` is in use, else `False`
         """
+        # Without the UI (batch conversion) the mediator is never loaded and no diagram can hold the id
+        if MEDIATOR_MODULE_NAME not in modules:
+            return False
         from org.pyut.general import Mediator
         ctrl = Mediator.getMediator()
-        #
-        # TODO:  This seems compute heavy;  I wonder if we should have a lookup map
-        for obj in [el for el in ctrl.getUmlObjects() if isinstance(el, PyutObject)]:
-            if obj.getId() == idToCheck:
-                return True
-        return False
+
+        return ctrl.getUmlObjectById(idToCheck) is not None
 
     def getName(self) -> str:
         """
@@ -71,6 +84,7 @@ class PyutObject:
             theName:
         """
         self._name = theName
+        self._invalidateDisplay()
 
     def setId(self, theId: int):
         """
@@ -78,7 +92,34 @@ class PyutObject:
         Args:
             theId:  the id (doh!)
         """
+        previousId: int = self._id
         self._id = theId
+        collected: bool = False
+        for reference in PyutObject.idObservers:
+            observer = reference()
+            if observer is None:
+                collected = True
+            else:
+                observer(self, previousId)
+        if collected:
+            PyutObject.idObservers[:] = [reference for reference in PyutObject.idObservers if reference() is not None]
+
+    @classmethod
+    def addIdObserver(cls, observer: Callable[['PyutObject', int], None]):
+        """
+        Args:
+            observer:   A bound method told the object and its previous id when an id changes;  Only
+                        weakly referenced
+        """
+        PyutObject.idObservers.append(WeakMethod(observer))
+
+    @classmethod
+    def removeIdObserver(cls, observer: Callable[['PyutObject', int], None]):
+        """
+        Args:
+            observer:   A bound method given to `addIdObserver()`;  Removing an unknown observer is not an error
+        """
+        PyutObject.idObservers[:] = [reference for reference in PyutObject.idObservers if reference() not in (None, observer)]
 
     def getId(self) -> int:
         """
@@ -115,6 +156,7 @@ class PyutObject:
     @name.setter
     def name(self, theNewName: str):
         self._name = theNewName
+        self._invalidateDisplay()
 
     @property
     def fileName(self) -> str:
@@ -123,3 +165,19 @@ class PyutObject:
     @fileName.setter
     def fileName(self, theNewName: str):
         self._fileName = theNewName
+
+    def _invalidateDisplay(self):
+        """
+        Called when the name changes;  The members that cache their display string
+        forget it
+        """
+        pass
+
+    def _slotState(self):
+        """
+        The subclasses that override `__getstate__` return `(stateDict, self._slotState())`
+        so that copy and deepcopy restore the slotted fields
+
+        Returns:  The slotted fields
+        """
+        return {'_id': self._id, '_name': self._name, '_fileName': self._fileName}
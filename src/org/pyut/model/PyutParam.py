@@ -1,5 +1,6 @@
 
 from typing import Any
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
@@ -12,6 +13,10 @@ class PyutParam(PyutObject):
 
     DEFAULT_PARAMETER_NAME: str = 'param'
 
+    clsLogger: Logger = getLogger(__name__)
+
+    __slots__ = ('_type', '_defaultValue', '_display')
+
     def __init__(self, name: str = DEFAULT_PARAMETER_NAME, theParameterType: PyutType = PyutType(""), defaultValue: Any = None):
         """
 
@@ -22,10 +27,9 @@ class PyutParam(PyutObject):
         """
         super().__init__(name)
 
-        self.logger: Logger = getLogger(__name__)
-
         self._type:         PyutType = theParameterType
         self._defaultValue: Any      = defaultValue
+        self._display:      str      = cast(str, None)
 
     def getType(self) -> PyutType:
         return self._type
@@ -38,11 +42,12 @@ class PyutParam(PyutObject):
             theType:
         """
         if type(theType) is str:
-            self.logger.warning(f'Setting return type as string is deprecated.  use PyutType')
+            PyutParam.clsLogger.warning(f'Setting return type as string is deprecated.  use PyutType')
             theType = PyutType(theType)
 
-        self.logger.debug(f'theType: `{theType}`')
+        PyutParam.clsLogger.debug(f'theType: `{theType}`')
         self._type = theType
+        self._invalidateDisplay()
 
     def getDefaultValue(self) -> Any:
         """
@@ -51,6 +56,7 @@ class PyutParam(PyutObject):
 
     def setDefaultValue(self, defaultValue: Any):
         self._defaultValue = defaultValue
+        self._invalidateDisplay()
 
     @property
     def type(self) -> PyutType:
@@ -59,11 +65,12 @@ class PyutParam(PyutObject):
     @type.setter
     def type(self, theType: PyutType):
         if type(theType) is str:
-            self.logger.warning(f'Setting return type as string is deprecated.  use PyutType')
+            PyutParam.clsLogger.warning(f'Setting return type as string is deprecated.  use PyutType')
             theType = PyutType(theType)
 
-        self.logger.debug(f'theType: `{theType}`')
+        PyutParam.clsLogger.debug(f'theType: `{theType}`')
         self._type = theType
+        self._invalidateDisplay()
 
     @property
     def defaultValue(self) -> Any:
@@ -72,12 +79,23 @@ class PyutParam(PyutObject):
     @defaultValue.setter
     def defaultValue(self, theNewValue: Any):
         self._defaultValue = theNewValue
+        self._invalidateDisplay()
 
     def __str__(self) -> str:
         """
 
-        Returns:  String version of a PyutParm
+        Returns:  String version of a PyutParm;  Computed once, until the parameter changes
         """
+        if self._display is None:
+            self._display = self._displayString()
+
+        return self._display
+
+    def _invalidateDisplay(self):
+        self._display = None
+
+    def _displayString(self) -> str:
+
         s = self.getName()
 
         if str(self._type) != "":
@@ -1,10 +1,27 @@
 
+from typing import Dict
+
+
 class PyutType:
     """
     Type of a field or the return type for a method
+
+    The types are read-only, so they are interned:  All the `int` fields of a
+    model share the same PyutType
     """
-    def __init__(self, value=''):
-        self._value = value
+    __slots__ = ('_value',)
+
+    _interned: Dict[str, 'PyutType'] = {}
+
+    def __new__(cls, value=''):
+
+        pyutType: PyutType = cls._interned.get(value)
+        if pyutType is None:
+            pyutType = super().__new__(cls)
+            pyutType._value = value
+            cls._interned[value] = pyutType
+
+        return pyutType
 
     @property
     def value(self) -> str:
@@ -31,3 +48,15 @@ class PyutType:
                 return False
         else:
             return False
+
+    def __hash__(self):
+        return hash(self._value)
+
+    def __copy__(self) -> 'PyutType':
+        return self
+
+    def __deepcopy__(self, memo) -> 'PyutType':
+        return self
+
+    def __reduce__(self):
+        return PyutType, (self._value,)
@@ -1,4 +1,5 @@
 
+from typing import Dict
 from typing import List
 
 from enum import Enum
@@ -35,18 +36,19 @@ class PyutVisibilityEnum(Enum):
         Returns:  The visibility enumeration
         """
         canonicalStr: str = strValue.lower().strip(' ')
-        if canonicalStr == 'public':
-            return PyutVisibilityEnum.PUBLIC
-        elif canonicalStr == 'private':
-            return PyutVisibilityEnum.PRIVATE
-        elif canonicalStr == 'protected':
-            return PyutVisibilityEnum.PROTECTED
-        elif canonicalStr == '+':
-            return PyutVisibilityEnum.PUBLIC
-        elif canonicalStr == '-':
-            return PyutVisibilityEnum.PRIVATE
-        elif canonicalStr == '#':
-            return PyutVisibilityEnum.PROTECTED
-        else:
+        try:
+            return VISIBILITIES[canonicalStr]
+        except KeyError:
             print(f'Warning: did not recognize this visibility type: {canonicalStr}')
             return PyutVisibilityEnum.PUBLIC
+
+
+# The members are singletons;  The readers look them up rather than build them
+VISIBILITIES: Dict[str, PyutVisibilityEnum] = {
+    'public':    PyutVisibilityEnum.PUBLIC,
+    'private':   PyutVisibilityEnum.PRIVATE,
+    'protected': PyutVisibilityEnum.PROTECTED,
+    '+':         PyutVisibilityEnum.PUBLIC,
+    '-':         PyutVisibilityEnum.PRIVATE,
+    '#':         PyutVisibilityEnum.PROTECTED,
+}
@@ -1,4 +1,5 @@
 
+from typing import List
 from typing import Tuple
 
 from logging import Logger
@@ -207,14 +208,8 @@ class OglLink(LineShape, ShapeEventHandler):
             self._dstAnchor.SetProtected(False)
             self._srcAnchor.Detach()
             self._dstAnchor.Detach()
-            try:
-                self.getSourceShape().getLinks().remove(self)
-            except ValueError:
-                pass
-            try:
-                self.getDestinationShape().getLinks().remove(self)
-            except ValueError:
-                pass
+            self.getSourceShape().removeLink(self)
+            self.getDestinationShape().removeLink(self)
             try:
                 self._link.getSource().getLinks().remove(self._link)
             except ValueError:
@@ -247,6 +242,24 @@ class OglLink(LineShape, ShapeEventHandler):
         srcAnchor.SetPosition(optimalSrcX, optimalSrcY)
         dstAnchor.SetPosition(optimalDstX, optimalDstY)
 
+    def setRoute(self, srcPosition: Tuple[float, float], dstPosition: Tuple[float, float], bends: List[Tuple[float, float]]):
+        """
+        Move the anchors and replace the control points of the link by the given bends
+
+        Args:
+            srcPosition:    New absolute position of the source anchor
+            dstPosition:    New absolute position of the destination anchor
+            bends:          Absolute positions of the bend points from source to destination
+        """
+        srcAnchor: AnchorPoint = self.GetSource()
+        dstAnchor: AnchorPoint = self.GetDestination()
+        srcAnchor.SetPosition(srcPosition[0], srcPosition[1])
+        dstAnchor.SetPosition(dstPosition[0], dstPosition[1])
+
+        self.RemoveAllControlPoints()
+        for x, y in bends:
+            self.AddControl(ControlPoint(x, y))
+
     # noinspection PyUnusedLocal
     def OnRightDown(self, event: MouseEvent):
         """
@@ -0,0 +1,113 @@
+
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import cast
+
+from org.pyut.enums.LinkType import LinkType
+
+if TYPE_CHECKING:
+    from org.pyut.ogl.OglLink import OglLink
+
+LinkKey = Tuple[int, int, LinkType]     # source id, destination id, link type
+
+
+class OglLinkIndex:
+    """
+    The links connected to an Ogl object, in the order they were added.
+
+    They are also grouped by (source id, destination id, link type), the ids
+    being those of the Pyut objects when the link was added;  Adding, removing
+    and finding a link does not look at the other links.
+    """
+    def __init__(self):
+
+        self._links: Dict[int, 'OglLink']                 = {}    # id(link) -> link
+        self._keys:  Dict[int, LinkKey]                   = {}    # id(link) -> the key it is filed under
+        self._byKey: Dict[LinkKey, Dict[int, 'OglLink']] = {}
+
+    @classmethod
+    def linkKey(cls, oglLink: 'OglLink') -> LinkKey:
+        """
+        Args:
+            oglLink:    A link between two Ogl objects
+
+        Returns:  The key of the link
+        """
+        pyutLink = oglLink.getPyutObject()
+        linkType: LinkType = cast(LinkType, None) if pyutLink is None else pyutLink.getType()
+
+        return _pyutId(oglLink.getSourceShape()), _pyutId(oglLink.getDestinationShape()), linkType
+
+    def add(self, oglLink: 'OglLink'):
+        """
+        Args:
+            oglLink:    The link to add;  Added once
+        """
+        if id(oglLink) in self._links:
+            return
+        linkKey: LinkKey = OglLinkIndex.linkKey(oglLink)
+
+        self._links[id(oglLink)] = oglLink
+        self._keys[id(oglLink)]  = linkKey
+        self._byKey.setdefault(linkKey, {})[id(oglLink)] = oglLink
+
+    def remove(self, oglLink: 'OglLink') -> bool:
+        """
+        Args:
+            oglLink:    The link to remove
+
+        Returns:  `True` if the link was in the index, else `False`
+        """
+        if self._links.pop(id(oglLink), None) is None:
+            return False
+
+        linkKey: LinkKey = self._keys.pop(id(oglLink))
+        links:   Dict[int, 'OglLink'] = self._byKey[linkKey]
+        del links[id(oglLink)]
+        if len(links) == 0:
+            del self._byKey[linkKey]
+
+        return True
+
+    def find(self, sourceId: int, destinationId: int, linkType: LinkType) -> List['OglLink']:
+        """
+        Returns:  The links between the two objects with this type, in the order they were added
+        """
+        return list(self._byKey.get((sourceId, destinationId, linkType), {}).values())
+
+    def groups(self) -> List[List['OglLink']]:
+        """
+        Returns:  The links with the same source, destination and type, group by group
+        """
+        return [list(links.values()) for links in self._byKey.values()]
+
+    def links(self) -> List['OglLink']:
+        """
+        Returns:  A copy of the links, in the order they were added
+        """
+        return list(self._links.values())
+
+    def __iter__(self) -> Iterator['OglLink']:
+        """
+        Go over the links in the order they were added without copying them;  The index must
+        not change meanwhile
+        """
+        return iter(self._links.values())
+
+    def __contains__(self, oglLink: 'OglLink') -> bool:
+        return id(oglLink) in self._links
+
+    def __len__(self) -> int:
+        return len(self._links)
+
+
+def _pyutId(oglObject) -> int:
+
+    pyutObject = oglObject.getPyutObject()
+    if pyutObject is None:
+        return cast(int, None)
+
+    return pyutObject.getId()
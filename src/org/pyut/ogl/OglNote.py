@@ -1,14 +1,17 @@
 
+from typing import List
+
 from logging import Logger
 from logging import getLogger
 
 from wx import Brush
+from wx import ClientDC
 from wx import Colour
 from wx import DC
 
 from org.pyut.ogl.OglObject import OglObject
 from org.pyut.model.PyutNote import PyutNote
-from org.pyut.general.LineSplitter import LineSplitter
+from org.pyut.general.WrapCache import WrapCache
 
 
 class OglNote(OglObject):
@@ -43,6 +46,8 @@ class OglNote(OglObject):
         self.logger: Logger = getLogger(__name__)
         self.SetBrush(Brush(Colour(255, 255, 230)))
 
+        self._wrapCache: WrapCache = WrapCache()
+
     def Draw(self, dc: DC, withChildren: bool = False):
         """
         Paint handler, draws the content of the shape.
@@ -57,10 +62,7 @@ class OglNote(OglObject):
         w, h = self.GetSize()
 
         try:
-            # lines = LineSplitter().split(self.getPyutObject().getName(), dc, w - 2 * MARGIN)
-            # noteName = self.getPyutObject().getName()
-            noteContent = self.getPyutObject().content
-            lines = LineSplitter().split(noteContent, dc, w - 2 * OglNote.MARGIN)
+            lines: List[str] = self._wrapLines(dc)
         except (ValueError, Exception) as e:
             self.logger.error(f"Unable to display note - {e}")
             return
@@ -79,6 +81,24 @@ class OglNote(OglObject):
 
         dc.DestroyClippingRegion()
 
+    def autoResize(self):
+        """
+        Grow the note so that its wrapped text fits;  The width is kept
+        """
+        dc: ClientDC = ClientDC(self.GetDiagram().GetPanel())
+        dc.SetFont(self._defaultFont)
+
+        w, h = self.GetSize()
+        textHeight: float = len(self._wrapLines(dc)) * (dc.GetCharHeight() + 5)
+        self.SetSize(w, max(h, textHeight + 2 * OglNote.MARGIN))
+
+    def _wrapLines(self, dc: DC) -> List[str]:
+        """
+        Shared by `Draw()` and `autoResize()`;  The lines are only wrapped again when the text, the font or the width change
+        """
+        w, h = self.GetSize()
+        return self._wrapCache.lines(self.getPyutObject().content, dc, self._defaultFont, w - 2 * OglNote.MARGIN)
+
     def __repr__(self):
         pyutNote: PyutNote = self.getPyutObject()
         if pyutNote is None:
@@ -12,6 +12,8 @@ from wx import FONTWEIGHT_NORMAL
 from org.pyut.MiniOgl.RectangleShape import RectangleShape
 from org.pyut.MiniOgl.ShapeEventHandler import ShapeEventHandler
 
+from org.pyut.ogl.OglLinkIndex import OglLinkIndex
+
 DEFAULT_FONT_SIZE = 10
 
 
@@ -48,7 +50,7 @@ class OglObject(RectangleShape, ShapeEventHandler):
         self._defaultFont: Font = Font(DEFAULT_FONT_SIZE, FONTFAMILY_SWISS, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
 
         # Connected links
-        self._oglLinks = []
+        self._oglLinks: OglLinkIndex = OglLinkIndex()
         # added by P.Dabrowski 20051202 : it's the command to undo/redo a modification on this object.
         self._modifyCommand = None
 
@@ -80,16 +82,33 @@ class OglObject(RectangleShape, ShapeEventHandler):
         @since 1.0
         @author Philippe Waelti <pwaelti@eivd.ch>
         """
-        self._oglLinks.append(link)
+        self._oglLinks.add(link)
+
+    def removeLink(self, link) -> bool:
+        """
+        Remove a link from an ogl object;  The other links are not visited
+
+        Args:
+            link:   The link to remove
+
+        Returns:  `True` if the link was connected to this object
+        """
+        return self._oglLinks.remove(link)
 
     def getLinks(self):
         """
-        Return the links.
+        Return a copy of the links, in the order they were added.
 
         @return OglLink[] : Links connected to object
         @since 1.0
         @author Philippe Waelti <pwaelti@eivd.ch>
         """
+        return self._oglLinks.links()
+
+    def getLinkIndex(self) -> OglLinkIndex:
+        """
+        Returns:  The connected links, also grouped by source, destination and type
+        """
         return self._oglLinks
 
     def OnLeftDown(self, event: MouseEvent):
@@ -1,9 +1,12 @@
 
+from typing import List
+
+from wx import ClientDC
 from wx import DC
 
 from org.pyut.ogl.OglObject import OglObject
 from org.pyut.model.PyutUseCase import PyutUseCase
-from org.pyut.general.LineSplitter import LineSplitter
+from org.pyut.general.WrapCache import WrapCache
 
 
 class OglUseCase(OglObject):
@@ -21,6 +24,8 @@ class OglUseCase(OglObject):
     :author: Philippe Waelti
     :contact: pwaelti@eivd.ch
     """
+    TEXT_AREA_RATIO: float = 0.6
+
     def __init__(self, pyutUseCase=None, w: float = 100.0, h: float = 60.0):
         """
         Constructor.
@@ -41,6 +46,8 @@ class OglUseCase(OglObject):
         # Should not draw border
         self._drawFrame = False
 
+        self._wrapCache: WrapCache = WrapCache()
+
     def Draw(self, dc: DC, withChildren=False):
         """
         Draw the actor.
@@ -65,14 +72,14 @@ class OglUseCase(OglObject):
         # Draw text
         x += 0.25 * width
         y += 0.25 * height
-        textWidth = 0.6 * width             # Text aera width
+        textWidth = OglUseCase.TEXT_AREA_RATIO * width      # Text aera width
         space = 1.1 * dc.GetCharHeight()    # Space between lines
 
         # Drawing is restricted in the specified region of the device
-        dc.SetClippingRegion(x, y, textWidth, 0.6 * height)
+        dc.SetClippingRegion(x, y, textWidth, OglUseCase.TEXT_AREA_RATIO * height)
 
         # Split lines
-        lines = LineSplitter().split(self.getPyutObject().getName(), dc, textWidth)
+        lines: List[str] = self._wrapLines(dc)
 
         # Draw text
         for line in lines:
@@ -80,3 +87,21 @@ class OglUseCase(OglObject):
             y += space
 
         dc.DestroyClippingRegion()
+
+    def autoResize(self):
+        """
+        Grow the use case so that its wrapped name fits in the text area;  The width is kept
+        """
+        dc: ClientDC = ClientDC(self.GetDiagram().GetPanel())
+        dc.SetFont(self._defaultFont)
+
+        width, height = self.GetSize()
+        textHeight: float = len(self._wrapLines(dc)) * 1.1 * dc.GetCharHeight()
+        self.SetSize(width, max(height, textHeight / OglUseCase.TEXT_AREA_RATIO))
+
+    def _wrapLines(self, dc: DC) -> List[str]:
+        """
+        Shared by `Draw()` and `autoResize()`;  The lines are only wrapped again when the name, the font or the width change
+        """
+        width, height = self.GetSize()
+        return self._wrapCache.lines(self.getPyutObject().getName(), dc, self._defaultFont, OglUseCase.TEXT_AREA_RATIO * width)
@@ -115,7 +115,7 @@ class OglSDInstance(OglObject):
         lineDst.SetDraggable(False)
 
         # Update all links positions
-        for link in self._oglLinks:
+        for link in self.getLinkIndex():
             try:
                 link.updatePositions()
             except (ValueError, Exception) as e:
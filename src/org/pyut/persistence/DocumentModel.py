@@ -0,0 +1,84 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from dataclasses import dataclass
+from dataclasses import field
+
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import Element
+
+from org.pyut.enums.DiagramType import DiagramType
+
+from org.pyut.model.PyutLink import PyutLink
+from org.pyut.model.PyutObject import PyutObject
+
+RecordPoint  = Tuple[float, float]
+RecordPoints = List[RecordPoint]
+
+
+@dataclass
+class ShapeRecord:
+    """
+    A diagram shape without its UI:  The data model object and where it is drawn
+    """
+    pyutObject: PyutObject = None
+    x:          float = 0.0
+    y:          float = 0.0
+    width:      float = 0.0
+    height:     float = 0.0
+
+
+@dataclass
+class LinkRecord:
+    """
+    A diagram link without its UI:  The data model link, the ids of the shapes it joins and its geometry
+    """
+    pyutLink:          PyutLink = None
+    sourceId:          int = 0
+    destinationId:     int = 0
+    sourceAnchor:      RecordPoint = (0.0, 0.0)
+    destinationAnchor: RecordPoint = (0.0, 0.0)
+    controlPoints:     RecordPoints = field(default_factory=list)
+    spline:            bool = False
+    labels:            Dict[str, RecordPoint] = field(default_factory=dict)
+    """
+    Association label positions keyed by their element name;  e.g. 'LabelCenter'
+    """
+
+
+ShapeRecords = Dict[int, ShapeRecord]
+LinkRecords  = List[LinkRecord]
+
+
+@dataclass
+class DocumentModel:
+    """
+    The contents of a `PyutDocument` element as Pyut and geometry records.
+
+    Class and use case diagrams are converted;  Sequence diagrams only keep
+    their `documentNode`, because their instances need a diagram frame to be built.
+    """
+    diagramType:     DiagramType = DiagramType.UNKNOWN_DIAGRAM
+    title:           str = ''
+    scrollPositionX: int = 0
+    scrollPositionY: int = 0
+    pixelsPerUnitX:  int = 0
+    pixelsPerUnitY:  int = 0
+    shapes:          ShapeRecords = field(default_factory=dict)
+    links:           LinkRecords  = field(default_factory=list)
+    documentNode:    Element = None
+
+
+DocumentModels = List[DocumentModel]
+
+
+@dataclass
+class ProjectModel:
+    """
+    A Pyut project file read without creating any UI
+    """
+    fileName:  str = ''
+    codePath:  str = ''
+    documents: DocumentModels = field(default_factory=list)
@@ -0,0 +1,56 @@
+
+from logging import Logger
+from logging import getLogger
+
+import zlib
+
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import Document
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import parseString
+
+from org.pyut.errorcontroller.PyutException import PyutException
+
+from org.pyut.persistence.DocumentModel import ProjectModel
+
+from org.pyut.persistence.converters.MiniDomToModelV10 import MiniDomToModel
+
+
+class ProjectReader:
+    """
+    Reads a Pyut project file into a `ProjectModel`.  Unlike `IoFile.open` it needs no
+    mediator, no language setup and no UI;  Only version 10 files are supported.
+
+    Example::
+        projectModel: ProjectModel = ProjectReader().read('myProject.put')
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+    def read(self, fileName: str) -> ProjectModel:
+        """
+        Args:
+            fileName:   A compressed '.put' file or a plain '.xml' file
+
+        Returns:  The project as records
+        """
+        return MiniDomToModel().getProject(self.readDom(fileName), fileName=fileName)
+
+    def readDom(self, fileName: str) -> Document:
+        """
+        Args:
+            fileName:   A compressed '.put' file or a plain '.xml' file
+
+        Returns:  The parsed document
+        """
+        if fileName.endswith('.put'):
+            with open(fileName, 'rb') as dataFile:
+                xmlString: str = zlib.decompress(dataFile.read()).decode()
+        elif fileName.endswith('.xml'):
+            with open(fileName, 'r') as dataFile:
+                xmlString = dataFile.read()
+        else:
+            raise PyutException(f"Can't open the unidentified file : {fileName}")
+
+        return parseString(xmlString)
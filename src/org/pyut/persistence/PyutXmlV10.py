@@ -10,6 +10,8 @@ from logging import getLogger
 from xml.dom.minidom import Document
 # noinspection PyUnresolvedReferences
 from xml.dom.minidom import Element
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import NodeList
 
 from wx import Dialog
 from wx import Gauge
@@ -35,20 +37,22 @@ from org.pyut.ogl.OglUseCase import OglUseCase
 from org.pyut.ogl.sd.OglSDInstance import OglSDInstance
 from org.pyut.ogl.sd.OglSDMessage import OglSDMessage
 
-from org.pyut.PyutConstants import PyutConstants
 from org.pyut.PyutUtils import PyutUtils
 
-from org.pyut.persistence.converters.MiniDomToOglV10 import OglActors
 from org.pyut.persistence.converters.MiniDomToOglV10 import OglObjects
 from org.pyut.persistence.converters.MiniDomToOglV10 import OglSDInstances
 from org.pyut.persistence.converters.MiniDomToOglV10 import OglSDMessages
-from org.pyut.persistence.converters.MiniDomToOglV10 import OglUseCases
 from org.pyut.persistence.converters.MiniDomToOglV10 import OglLinks
 from org.pyut.persistence.converters.MiniDomToOglV10 import OglClasses
 from org.pyut.persistence.converters.MiniDomToOglV10 import OglNotes
 from org.pyut.persistence.converters.MiniDomToOglV10 import OglInterfaces
 
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import ProjectModel
+
+from org.pyut.persistence.converters.MiniDomToModelV10 import MiniDomToModel
 from org.pyut.persistence.converters.MiniDomToOglV10 import MiniDomToOgl as MiniDomToOglV10
+from org.pyut.persistence.converters.ModelToOglV10 import ModelToOgl
 from org.pyut.persistence.converters.OglToMiniDomV10 import OglToMiniDom as OglToMiniDomV10
 
 from org.pyut.persistence.converters.PyutXmlConstants import PyutXmlConstants
@@ -57,7 +61,6 @@ from org.pyut.ui.PyutDocument import PyutDocument
 from org.pyut.ui.PyutProject import PyutProject
 from org.pyut.ui.UmlDiagramsFrame import UmlDiagramsFrame
 
-from org.pyut.general.Mediator import getMediator
 from org.pyut.general.Globals import _
 
 
@@ -86,7 +89,6 @@ class PyutXml:
         Constructor
         """
         self.logger: Logger = getLogger(__name__)
-        self._dlgGauge: Dialog = cast(Dialog, None)
 
     def save(self, project: PyutProject) -> Document:
         """
@@ -122,6 +124,9 @@ class PyutXml:
             for document in project.getDocuments():
 
                 document:     PyutDocument = cast(PyutDocument, document)
+                if document.isMaterialized() is False:
+                    top.appendChild(self.__unopenedDocumentToPyutXml(xmlDoc=xmlDoc, pyutDocument=document))
+                    continue
                 documentNode: Element      = self.__pyutDocumentToPyutXml(xmlDoc=xmlDoc, pyutDocument=document)
 
                 top.appendChild(documentNode)
@@ -175,52 +180,47 @@ class PyutXml:
 
     def open(self, dom: Document, project: PyutProject):
         """
-        Open a file and create a diagram.
+        Open a file and create its documents.
+
+        Only the document headers are read here;  Each document keeps its XML element until
+        its frame is first shown.  See `PyutDocument.materialize()` and `renderDocument()`
 
         Args:
             dom:        The minidom document
             project:    The UI Project to fill out
         """
-        self.__setupProgressDialog()
-        umlFrame: UmlDiagramsFrame = cast(UmlDiagramsFrame, None)  # avoid Pycharm warning
-        root = self.__validateXmlVersion(dom)
         try:
-            project.setCodePath(root.getAttribute("CodePath"))
-            self.__updateProgressDialog(newMessage='Reading elements...', newGaugeValue=1)
-            wxYield()
-            toOgl: MiniDomToOglV10 = MiniDomToOglV10()
-            for documentNode in dom.getElementsByTagName(PyutXmlConstants.ELEMENT_DOCUMENT):
+            projectModel: ProjectModel = MiniDomToModel().getProject(dom, fileName=project.getFilename(), withContents=False)
+            project.setCodePath(projectModel.codePath)
+            for documentModel in projectModel.documents:
 
-                documentNode: Element = cast(Element, documentNode)
-                docTypeStr:   str     = documentNode.getAttribute(PyutXmlConstants.ATTR_TYPE)
-                self.__updateProgressDialog(newMessage=f'Determine Title for document type: {docTypeStr}', newGaugeValue=2)
-                wxYield()
+                document: PyutDocument = project.newDocument(documentModel.diagramType)
+                document.title = documentModel.title
+                document.attachModel(documentModel)
 
-                docType:  DiagramType  = PyutConstants.diagramTypeFromString(docTypeStr)
-                document: PyutDocument = project.newDocument(docType)
-                document.title = self.__determineDocumentTitle(documentNode)
-
-                umlFrame: UmlDiagramsFrame = self.__showAppropriateUmlFrame(document)
-                self.__positionAndSetupDiagramFrame(umlFrame=umlFrame, documentNode=documentNode)
-
-                self.__updateProgressDialog(newMessage='Start Conversion...', newGaugeValue=3)
+        except (ValueError, Exception) as e:
+            PyutUtils.displayError(_(f"Can not load file {e}"))
 
-                if docType == DiagramType.CLASS_DIAGRAM:
-                    self.__renderClassDiagram(documentNode, toOgl, umlFrame)
-                elif docType == DiagramType.USECASE_DIAGRAM:
-                    self.__renderUseCaseDiagram(documentNode, toOgl, umlFrame)
-                elif docType == DiagramType.SEQUENCE_DIAGRAM:
-                    self.__renderSequenceDiagram(documentNode, toOgl, umlFrame)
+    def renderDocument(self, documentModel: DocumentModel, umlFrame: UmlDiagramsFrame):
+        """
+        Convert the XML element of a document read by `open()` and place its OGL objects on its frame
 
-                self.__updateProgressDialog(newMessage='Conversion Complete...', newGaugeValue=4)
+        Args:
+            documentModel:  The document header
+            umlFrame:       Where to render
+        """
+        MiniDomToModel().readContents(documentModel)
+        self.__positionAndSetupDiagramFrame(umlFrame=umlFrame, documentModel=documentModel)
 
-        except (ValueError, Exception) as e:
-            self._dlgGauge.Destroy()
-            PyutUtils.displayError(_(f"Can not load file {e}"))
-            umlFrame.Refresh()
-            return
+        toOgl: ModelToOgl = ModelToOgl()
+        if documentModel.diagramType == DiagramType.CLASS_DIAGRAM:
+            self.__renderClassDiagram(documentModel, toOgl, umlFrame)
+        elif documentModel.diagramType == DiagramType.USECASE_DIAGRAM:
+            self.__renderUseCaseDiagram(documentModel, toOgl, umlFrame)
+        elif documentModel.diagramType == DiagramType.SEQUENCE_DIAGRAM:
+            self.__renderSequenceDiagram(documentModel.documentNode, MiniDomToOglV10(), umlFrame)
 
-        self.__cleanupProgressDialog(umlFrame)
+        umlFrame.Refresh()
 
     def __pyutDocumentToPyutXml(self, xmlDoc: Document, pyutDocument: PyutDocument) -> Element:
 
@@ -243,51 +243,56 @@ class PyutXml:
 
         return documentNode
 
-    def __renderClassDiagram(self, documentNode: Element, toOgl: MiniDomToOglV10, umlFrame: UmlDiagramsFrame):
+    def __unopenedDocumentToPyutXml(self, xmlDoc: Document, pyutDocument: PyutDocument) -> Element:
         """
+        A document that was never shown is written back as it was read;  Only its title may have been edited
 
         Args:
-            documentNode:   A minidom document element
+            xmlDoc:         The document being saved
+            pyutDocument:   A document that is not materialized
+
+        Returns:  A copy of the element the document was read from
+        """
+        documentNode: Element = xmlDoc.importNode(pyutDocument.getDocumentModel().documentNode, True)
+        documentNode.setAttribute(PyutXmlConstants.ATTR_TITLE, pyutDocument.title)
+
+        return documentNode
+
+    def __renderClassDiagram(self, documentModel: DocumentModel, toOgl: ModelToOgl, umlFrame: UmlDiagramsFrame):
+        """
+
+        Args:
+            documentModel:  The document contents
             toOgl:          The converter class
             umlFrame:       Where to render
         """
-        oglClasses:    OglClasses    = toOgl.getOglClasses(documentNode.getElementsByTagName(PyutXmlConstants.ELEMENT_GRAPHIC_CLASS))
-        oglNotes:      OglNotes      = toOgl.getOglNotes(documentNode.getElementsByTagName(PyutXmlConstants.ELEMENT_GRAPHIC_NOTE))
-        oglInterfaces: OglInterfaces = toOgl.getOglInterfaces(documentNode.getElementsByTagName(PyutXmlConstants.ELEMENT_GRAPHIC_LOLLIPOP))
+        oglObjects: OglObjects = toOgl.getOglObjects(documentModel.shapes)
+        oglClasses: OglClasses = cast(OglClasses, {pyutId: oglObject for pyutId, oglObject in oglObjects.items() if isinstance(oglObject, OglClass)})
+        oglNotes:   OglNotes   = cast(OglNotes,   {pyutId: oglObject for pyutId, oglObject in oglObjects.items() if isinstance(oglObject, OglNote)})
 
-        mergedOglObjects: OglObjects = cast(OglObjects, oglClasses.copy())
-        mergedOglObjects.update(oglNotes)
+        # Lollipops are not part of the model;  They are still read from the document element
+        xmlInterfaces: NodeList      = documentModel.documentNode.getElementsByTagName(PyutXmlConstants.ELEMENT_GRAPHIC_LOLLIPOP)
+        oglInterfaces: OglInterfaces = MiniDomToOglV10().getOglInterfaces(xmlInterfaces)
 
         self.__displayTheClasses(oglClasses, umlFrame)
-        oglLinks: OglLinks = toOgl.getOglLinks(documentNode.getElementsByTagName(PyutXmlConstants.ELEMENT_GRAPHIC_LINK), mergedOglObjects)
+        oglLinks: OglLinks = toOgl.getOglLinks(documentModel.links, oglObjects)
         self.__displayTheLinks(oglLinks, umlFrame)
         self.__displayTheNotes(oglNotes, umlFrame)
         self.__displayTheInterfaces(oglInterfaces, umlFrame)
 
-    def __renderUseCaseDiagram(self, documentNode: Element, toOgl: MiniDomToOglV10, umlFrame: UmlDiagramsFrame):
+    def __renderUseCaseDiagram(self, documentModel: DocumentModel, toOgl: ModelToOgl, umlFrame: UmlDiagramsFrame):
         """
 
         Args:
-            documentNode:   A minidom document element
+            documentModel:  The document contents
             toOgl:          The converter class
             umlFrame:       Where to render
         """
-        oglObjects: OglObjects = cast(OglObjects, {})
-
-        oglActors:   OglActors   = toOgl.getOglActors(documentNode.getElementsByTagName('GraphicActor'))
-        oglUseCases: OglUseCases = toOgl.getOglUseCases(documentNode.getElementsByTagName('GraphicUseCase'))
-        oglNotes:    OglNotes    = toOgl.getOglNotes(documentNode.getElementsByTagName('GraphicNote'))
-
-        self.__displayTheActors(oglActors, umlFrame)
-        self.__displayTheUseCases(oglUseCases, umlFrame)
-        self.__displayTheNotes(oglNotes, umlFrame)
-
-        mergedOglObjects: OglObjects = cast(OglObjects, oglObjects.copy())
-        mergedOglObjects.update(oglActors)
-        mergedOglObjects.update(oglNotes)
-        mergedOglObjects.update(oglUseCases)
+        oglObjects: OglObjects = toOgl.getOglObjects(documentModel.shapes)
+        for oglObject in oglObjects.values():
+            self.__displayAnOglObject(oglObject, umlFrame)
 
-        oglLinks: OglLinks = toOgl.getOglLinks(documentNode.getElementsByTagName("GraphicLink"), mergedOglObjects)
+        oglLinks: OglLinks = toOgl.getOglLinks(documentModel.links, oglObjects)
         self.__displayTheLinks(oglLinks, umlFrame)
 
     def __renderSequenceDiagram(self, documentNode, toOgl, umlFrame):
@@ -341,14 +346,6 @@ class PyutXml:
         for oglNote in oglNotes.values():
             self.__displayAnOglObject(oglNote, umlFrame)
 
-    def __displayTheActors(self, oglActors: OglActors, umlFrame: UmlDiagramsFrame):
-        for oglActor in oglActors.values():
-            self.__displayAnOglObject(oglActor, umlFrame)
-
-    def __displayTheUseCases(self, oglUseCases: OglUseCases, umlFrame: UmlDiagramsFrame):
-        for oglUseCase in oglUseCases.values():
-            self.__displayAnOglObject(oglUseCase, umlFrame)
-
     def __displayTheSDMessages(self, oglSDMessages: OglSDMessages, umlFrame: UmlDiagramsFrame):
         for oglSDMessage in oglSDMessages.values():
             oglSDMessage: OglSDMessage = cast(OglSDMessage, oglSDMessage)
@@ -358,81 +355,12 @@ class PyutXml:
         x, y = oglObject.GetPosition()
         umlFrame.addShape(oglObject, x, y)
 
-    def __setupProgressDialog(self):
-
-        self._dlgGauge = Dialog(None, ID_ANY, "Loading...", style=STAY_ON_TOP | ICON_INFORMATION | RESIZE_BORDER, size=Size(250, 70))
-        self._gauge: Gauge = Gauge(self._dlgGauge, ID_ANY, 5, pos=Point(2, 5), size=Size(200, 30))
-        self._dlgGauge.Show(True)
-        wxYield()
-
-    def __updateProgressDialog(self, newMessage: str, newGaugeValue: int):
-
-        self._dlgGauge.SetTitle(newMessage)
-        self._gauge.SetValue(newGaugeValue)
-        wxYield()
-
-    def __cleanupProgressDialog(self, umlFrame: UmlDiagramsFrame):
-
-        umlFrame.Refresh()
-        self._gauge.SetValue(5)
-        wxYield()
-        self._dlgGauge.Destroy()
-
-    def __validateXmlVersion(self, dom: Document) -> Element:
-        """
-
-        Args:
-            dom: The minidom Document
-
-        Returns:
-            The root element unless the XML version is incorrect
-        """
-        root: Element = dom.getElementsByTagName(PyutXmlConstants.TOP_LEVEL_ELEMENT)[0]
-        if root.hasAttribute(PyutXmlConstants.ATTR_VERSION):
-            version = int(root.getAttribute(PyutXmlConstants.ATTR_VERSION))
-        else:
-            version = 1
-        if version != PyutXml.VERSION:
-            self.logger.error("Wrong version of the file loader")
-            eMsg: str = f'This is version {PyutXml.VERSION} and the file version is {version}'
-            self.logger.error(eMsg)
-            raise Exception(f'VERSION_ERROR:  {eMsg}')
-
-        return root
-
-    def __determineDocumentTitle(self, documentNode) -> str:
-
-        docTitle:   str = documentNode.getAttribute(PyutXmlConstants.ATTR_TITLE)
-        docTypeStr: str = documentNode.getAttribute(PyutXmlConstants.ATTR_TYPE)
-
-        if docTitle == '' or docTitle is None:
-            return docTypeStr
-        else:
-            return docTitle
-
-    def __showAppropriateUmlFrame(self, document) -> UmlDiagramsFrame:
-
-        umlFrame: UmlDiagramsFrame = document.getFrame()
-        ctrl = getMediator()
-        ctrl.getFileHandling().showFrame(umlFrame)
-
-        return umlFrame
-
-    def __positionAndSetupDiagramFrame(self, umlFrame: UmlDiagramsFrame, documentNode: Element, ):
-
-        xStr: str = documentNode.getAttribute(PyutXmlConstants.ATTR_SCROLL_POSITION_X)
-        yStr: str = documentNode.getAttribute(PyutXmlConstants.ATTR_SCROLL_POSITION_Y)
-
-        scrollPosX: int = PyutUtils.secureInteger(xStr)
-        scrollPosY: int = PyutUtils.secureInteger(yStr)
-
-        umlFrame.Scroll(scrollPosX, scrollPosY)
+    def __positionAndSetupDiagramFrame(self, umlFrame: UmlDiagramsFrame, documentModel: DocumentModel):
 
-        xPerUnitStr: str = documentNode.getAttribute(PyutXmlConstants.ATTR_PIXELS_PER_UNIT_X)
-        yPerUnitStr: str = documentNode.getAttribute(PyutXmlConstants.ATTR_PIXELS_PER_UNIT_Y)
+        umlFrame.Scroll(documentModel.scrollPositionX, documentModel.scrollPositionY)
 
-        pixelsPerUnitX: int = PyutUtils.secureInteger(xPerUnitStr)
-        pixelsPerUnitY: int = PyutUtils.secureInteger(yPerUnitStr)
+        pixelsPerUnitX: int = documentModel.pixelsPerUnitX
+        pixelsPerUnitY: int = documentModel.pixelsPerUnitY
         if pixelsPerUnitX != 0 and pixelsPerUnitY != 0:
             umlFrame.SetScrollRate(xstep=pixelsPerUnitX, ystep=pixelsPerUnitY)
 
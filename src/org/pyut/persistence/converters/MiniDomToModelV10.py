@@ -0,0 +1,493 @@
+
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import Document
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import Element
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import NodeList
+
+from org.pyut.enums.DiagramType import DiagramType
+from org.pyut.enums.LinkType import LinkType
+
+from org.pyut.model.PyutActor import PyutActor
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutField import PyutField
+from org.pyut.model.PyutInterface import PyutInterface
+from org.pyut.model.PyutLink import PyutLink
+from org.pyut.model.PyutLinkedObject import PyutLinkedObject
+from org.pyut.model.PyutMethod import PyutMethod
+from org.pyut.model.PyutModifier import PyutModifier
+from org.pyut.model.PyutNote import PyutNote
+from org.pyut.model.PyutObject import PyutObject
+from org.pyut.model.PyutParam import PyutParam
+from org.pyut.model.PyutStereotype import getPyutStereotype
+from org.pyut.model.PyutType import PyutType
+from org.pyut.model.PyutUseCase import PyutUseCase
+from org.pyut.model.PyutVisibilityEnum import PyutVisibilityEnum
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import LinkRecord
+from org.pyut.persistence.DocumentModel import LinkRecords
+from org.pyut.persistence.DocumentModel import ProjectModel
+from org.pyut.persistence.DocumentModel import RecordPoint
+from org.pyut.persistence.DocumentModel import RecordPoints
+from org.pyut.persistence.DocumentModel import ShapeRecord
+from org.pyut.persistence.DocumentModel import ShapeRecords
+
+from org.pyut.persistence.converters.PyutXmlConstants import PyutXmlConstants
+
+from org.pyut.PyutConstants import PyutConstants
+from org.pyut.PyutUtils import PyutUtils
+
+PyutMethods = NewType('PyutMethods', List[PyutMethod])
+PyutFields  = NewType('PyutFields',  List[PyutField])
+
+ModelParser = Callable[[Element], PyutObject]
+
+
+class MiniDomToModel:
+    """
+    Converts a version 10 Pyut XML document to the Pyut data model and plain geometry
+    records.  Nothing here touches wx;  So a project can be read in tests, batch jobs or
+    before any diagram frame exists.  `MiniDomToOgl` builds on this class to create the
+    visual OGL objects.
+    """
+    VERSION: int = 10
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+    def getProject(self, dom: Document, fileName: str = '', withContents: bool = True) -> ProjectModel:
+        """
+        Args:
+            dom:            The minidom document of a Pyut project
+            fileName:       Where the document was read from
+            withContents:   If `False` only the document headers are read;  See `readContents()`
+
+        Returns:  All the documents of the project
+        """
+        root: Element = self._validateXmlVersion(dom)
+
+        projectModel: ProjectModel = ProjectModel(fileName=fileName, codePath=root.getAttribute(PyutXmlConstants.ATTR_CODE_PATH))
+        for documentNode in dom.getElementsByTagName(PyutXmlConstants.ELEMENT_DOCUMENT):
+            documentModel: DocumentModel = self.getDocumentHeader(cast(Element, documentNode))
+            if withContents is True:
+                self.readContents(documentModel)
+            projectModel.documents.append(documentModel)
+
+        return projectModel
+
+    def getDocument(self, documentNode: Element) -> DocumentModel:
+        """
+        Args:
+            documentNode:   A 'PyutDocument' element
+
+        Returns:  The document as records
+        """
+        documentModel: DocumentModel = self.getDocumentHeader(documentNode)
+        self.readContents(documentModel)
+
+        return documentModel
+
+    def getDocumentHeader(self, documentNode: Element) -> DocumentModel:
+        """
+        Only reads the attributes of the document element;  Its shapes and links are left in `documentNode`
+
+        Args:
+            documentNode:   A 'PyutDocument' element
+
+        Returns:  A document without shapes and links
+        """
+        docTypeStr: str = documentNode.getAttribute(PyutXmlConstants.ATTR_TYPE)
+        title:      str = documentNode.getAttribute(PyutXmlConstants.ATTR_TITLE)
+
+        documentModel: DocumentModel = DocumentModel(
+            diagramType=PyutConstants.diagramTypeFromString(docTypeStr),
+            title=docTypeStr if title == '' else title,
+            scrollPositionX=PyutUtils.secureInteger(documentNode.getAttribute(PyutXmlConstants.ATTR_SCROLL_POSITION_X)),
+            scrollPositionY=PyutUtils.secureInteger(documentNode.getAttribute(PyutXmlConstants.ATTR_SCROLL_POSITION_Y)),
+            pixelsPerUnitX=PyutUtils.secureInteger(documentNode.getAttribute(PyutXmlConstants.ATTR_PIXELS_PER_UNIT_X)),
+            pixelsPerUnitY=PyutUtils.secureInteger(documentNode.getAttribute(PyutXmlConstants.ATTR_PIXELS_PER_UNIT_Y)),
+            documentNode=documentNode
+        )
+        return documentModel
+
+    def readContents(self, documentModel: DocumentModel):
+        """
+        Convert the shapes and links of a document read by `getDocumentHeader()`
+
+        Args:
+            documentModel:  Updated in place
+        """
+        documentNode: Element      = documentModel.documentNode
+        shapes:       ShapeRecords = documentModel.shapes
+        if documentModel.diagramType == DiagramType.CLASS_DIAGRAM:
+            shapes.update(self.getShapeRecords(documentNode, PyutXmlConstants.ELEMENT_GRAPHIC_CLASS, self._getPyutClass))
+            shapes.update(self.getShapeRecords(documentNode, PyutXmlConstants.ELEMENT_GRAPHIC_NOTE,  self._getPyutNote))
+        elif documentModel.diagramType == DiagramType.USECASE_DIAGRAM:
+            shapes.update(self.getShapeRecords(documentNode, PyutXmlConstants.ELEMENT_GRAPHIC_ACTOR,    self._getPyutActor))
+            shapes.update(self.getShapeRecords(documentNode, PyutXmlConstants.ELEMENT_GRAPHIC_USE_CASE, self._getPyutUseCase))
+            shapes.update(self.getShapeRecords(documentNode, PyutXmlConstants.ELEMENT_GRAPHIC_NOTE,     self._getPyutNote))
+        else:
+            return
+
+        documentModel.links = self.getLinkRecords(documentNode.getElementsByTagName(PyutXmlConstants.ELEMENT_GRAPHIC_LINK), shapes)
+
+    def getShapeRecords(self, documentNode: Element, graphicTag: str, toPyut: ModelParser) -> ShapeRecords:
+        """
+        Args:
+            documentNode:   A 'PyutDocument' element
+            graphicTag:     The graphic element to convert;  e.g. 'GraphicClass'
+            toPyut:         Builds the data model object from the graphic element
+
+        Returns:  The shape records keyed by data model id
+        """
+        shapes: ShapeRecords = {}
+        for xmlGraphic in documentNode.getElementsByTagName(graphicTag):
+
+            xmlGraphic: Element    = cast(Element, xmlGraphic)
+            pyutObject: PyutObject = toPyut(xmlGraphic)
+
+            shapes[pyutObject.getId()] = ShapeRecord(pyutObject=pyutObject,
+                                                     x=float(xmlGraphic.getAttribute(PyutXmlConstants.ATTR_X)),
+                                                     y=float(xmlGraphic.getAttribute(PyutXmlConstants.ATTR_Y)),
+                                                     width=float(xmlGraphic.getAttribute(PyutXmlConstants.ATTR_WIDTH)),
+                                                     height=float(xmlGraphic.getAttribute(PyutXmlConstants.ATTR_HEIGHT)))
+        return shapes
+
+    def getLinkRecords(self, xmlLinks: NodeList, shapes: ShapeRecords) -> LinkRecords:
+        """
+        Convert the links and reconstitute the parents and links of the linked data model objects
+
+        Args:
+            xmlLinks:   'GraphicLink' elements
+            shapes:     The shapes the links may join
+
+        Returns:  The link records
+        """
+        links: LinkRecords = []
+        for xmlLink in xmlLinks:
+
+            xmlLink: Element = cast(Element, xmlLink)
+            srcId, dstId, assocPyutLink = self._getPyutLink(xmlLink)
+            if srcId not in shapes or dstId not in shapes:
+                self.logger.error(f'Developer Error -- srcId: {srcId} - dstId: {dstId}  missing shape')
+                continue
+
+            pyutLink: PyutLink = self._linkPyutObjects(assocPyutLink, shapes[srcId].pyutObject, shapes[dstId].pyutObject)
+
+            links.append(LinkRecord(
+                pyutLink=pyutLink,
+                sourceId=srcId,
+                destinationId=dstId,
+                sourceAnchor=(PyutUtils.secureFloat(xmlLink.getAttribute(PyutXmlConstants.ATTR_LINK_SOURCE_ANCHOR_X)),
+                              PyutUtils.secureFloat(xmlLink.getAttribute(PyutXmlConstants.ATTR_LINK_SOURCE_ANCHOR_Y))),
+                destinationAnchor=(PyutUtils.secureFloat(xmlLink.getAttribute(PyutXmlConstants.ATTR_LINK_DESTINATION_ANCHOR_X)),
+                                   PyutUtils.secureFloat(xmlLink.getAttribute(PyutXmlConstants.ATTR_LINK_DESTINATION_ANCHOR_Y))),
+                controlPoints=self._getControlPointPositions(xmlLink),
+                spline=PyutUtils.secureBoolean(xmlLink.getAttribute(PyutXmlConstants.ATTR_SPLINE)),
+                labels=self._getLabelPositions(xmlLink)
+            ))
+
+        return links
+
+    def _validateXmlVersion(self, dom: Document) -> Element:
+        """
+        Args:
+            dom: The minidom Document
+
+        Returns:
+            The root element unless the XML version is incorrect
+        """
+        root: Element = dom.getElementsByTagName(PyutXmlConstants.TOP_LEVEL_ELEMENT)[0]
+        if root.hasAttribute(PyutXmlConstants.ATTR_VERSION):
+            version = int(root.getAttribute(PyutXmlConstants.ATTR_VERSION))
+        else:
+            version = 1
+        if version != MiniDomToModel.VERSION:
+            eMsg: str = f'This is version {MiniDomToModel.VERSION} and the file version is {version}'
+            self.logger.error(eMsg)
+            raise Exception(f'VERSION_ERROR:  {eMsg}')
+
+        return root
+
+    def _getPyutClass(self, xmlOglClass: Element) -> PyutClass:
+        """
+        Args:
+            xmlOglClass:    A 'GraphicClass' element
+
+        Returns:  The class data model
+        """
+        pyutClass: PyutClass = PyutClass()
+        xmlClass:  Element   = xmlOglClass.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_CLASS)[0]
+
+        pyutClass.setId(int(xmlClass.getAttribute(PyutXmlConstants.ATTR_ID)))
+        pyutClass.setName(xmlClass.getAttribute(PyutXmlConstants.ATTR_NAME))
+        pyutClass.description = xmlClass.getAttribute(PyutXmlConstants.ATTR_DESCRIPTION)
+        if xmlClass.hasAttribute(PyutXmlConstants.ATTR_STEREOTYPE):
+            pyutClass.setStereotype(getPyutStereotype(xmlClass.getAttribute(PyutXmlConstants.ATTR_STEREOTYPE)))
+
+        # adding display properties (cd)
+        value = PyutUtils.secureBoolean(xmlClass.getAttribute(PyutXmlConstants.ATTR_SHOW_STEREOTYPE))
+        pyutClass.setShowStereotype(value)
+        value = PyutUtils.secureBoolean(xmlClass.getAttribute(PyutXmlConstants.ATTR_SHOW_METHODS))
+        pyutClass.showMethods = value
+        value = PyutUtils.secureBoolean(xmlClass.getAttribute(PyutXmlConstants.ATTR_SHOW_FIELDS))
+        pyutClass.showFields = value
+
+        pyutClass.setFilename(xmlClass.getAttribute(PyutXmlConstants.ATTR_FILENAME))
+
+        pyutClass.methods = self._getMethods(xmlClass)
+        pyutClass.fields  = self._getFields(xmlClass)
+
+        return pyutClass
+
+    def _getPyutNote(self, xmlOglNote: Element) -> PyutNote:
+        """
+        Args:
+            xmlOglNote: A 'GraphicNote' element
+
+        Returns:  The note data model
+        """
+        pyutNote: PyutNote = PyutNote()
+        xmlNote:  Element  = xmlOglNote.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_NOTE)[0]
+
+        pyutNote.setId(int(xmlNote.getAttribute(PyutXmlConstants.ATTR_ID)))
+
+        content: str = xmlNote.getAttribute(PyutXmlConstants.ATTR_CONTENT)
+        content = content.replace("\\\\\\\\", "\n")
+
+        pyutNote.content = content
+
+        pyutNote.setFilename(xmlNote.getAttribute(PyutXmlConstants.ATTR_FILENAME))
+
+        return pyutNote
+
+    def _getPyutActor(self, xmlOglActor: Element) -> PyutActor:
+        """
+        Args:
+            xmlOglActor:    A 'GraphicActor' element
+
+        Returns:  The actor data model
+        """
+        pyutActor: PyutActor = PyutActor()
+        xmlActor:  Element   = xmlOglActor.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_ACTOR)[0]
+
+        pyutActor.setId(int(xmlActor.getAttribute(PyutXmlConstants.ATTR_ID)))
+        pyutActor.setName(xmlActor.getAttribute(PyutXmlConstants.ATTR_NAME))
+        pyutActor.setFilename(xmlActor.getAttribute(PyutXmlConstants.ATTR_FILENAME))
+
+        return pyutActor
+
+    def _getPyutUseCase(self, xmlOglUseCase: Element) -> PyutUseCase:
+        """
+        Args:
+            xmlOglUseCase:  A 'GraphicUseCase' element
+
+        Returns:  The use case data model
+        """
+        pyutUseCase: PyutUseCase = PyutUseCase()
+        xmlUseCase:  Element     = xmlOglUseCase.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_USE_CASE)[0]
+
+        pyutUseCase.setId(int(xmlUseCase.getAttribute(PyutXmlConstants.ATTR_ID)))
+        pyutUseCase.setName(xmlUseCase.getAttribute(PyutXmlConstants.ATTR_NAME))
+        pyutUseCase.setFilename(xmlUseCase.getAttribute(PyutXmlConstants.ATTR_FILENAME))
+
+        return pyutUseCase
+
+    def _getMethods(self, xmlClass: Element) -> PyutMethods:
+        """
+        Converts XML methods to `PyutMethod`s
+        Args:
+            xmlClass:  A DOM element that is a UML Class
+
+        Returns:
+            A list of `PyutMethod`s associated with the class
+        """
+        allMethods: PyutMethods = cast(PyutMethods, [])
+        for xmlMethod in xmlClass.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_METHOD):
+
+            pyutMethod: PyutMethod = PyutMethod(xmlMethod.getAttribute(PyutXmlConstants.ATTR_NAME))
+
+            strVis: str = xmlMethod.getAttribute(PyutXmlConstants.ATTR_VISIBILITY)
+            vis: PyutVisibilityEnum = PyutVisibilityEnum.toEnum(strVis)
+            pyutMethod.setVisibility(visibility=vis)
+
+            returnElt:  Element  = xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_RETURN)[0]
+            retTypeStr: str      = returnElt.getAttribute(PyutXmlConstants.ATTR_TYPE)
+            retType:    PyutType = PyutType(retTypeStr)
+            pyutMethod.setReturns(retType)
+
+            #
+            #  Code supports multiple modifiers, but the dialog allows input of only one
+            #
+            modifiers: NodeList = xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_MODIFIER)
+            for xmlModifier in modifiers:
+                xmlModifier: Element = cast(Element, xmlModifier)
+                modName:  str        = xmlModifier.getAttribute(PyutXmlConstants.ATTR_NAME)
+
+                pyutModifier: PyutModifier = PyutModifier(modName)
+                pyutMethod.addModifier(pyutModifier)
+
+            methodParameters = []
+            for xmlParam in xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_PARAM):
+                methodParameters.append(self._getParam(xmlParam))
+
+            pyutMethod.setParams(methodParameters)
+
+            allMethods.append(pyutMethod)
+
+        return allMethods
+
+    def _getImplementors(self, xmlClass: Element) -> PyutInterface.Implementors:
+
+        implementors: PyutInterface.Implementors = []
+        for xmlImplementor in xmlClass.getElementsByTagName(PyutXmlConstants.ELEMENT_IMPLEMENTOR):
+            className: PyutInterface.ClassName = xmlImplementor.getAttribute(PyutXmlConstants.ATTR_IMPLEMENTING_CLASS_NAME)
+            implementors.append(className)
+
+        return implementors
+
+    def _getParam(self, domElement: Element) -> PyutParam:
+        """
+
+        Args:
+            domElement:  The xml element tht is a parameter
+
+        Returns:
+            A parameter model object
+        """
+        paramTypeStr: str = domElement.getAttribute(PyutXmlConstants.ATTR_TYPE)
+        paramType:    PyutType = PyutType(paramTypeStr)
+        pyutParam: PyutParam = PyutParam(name=domElement.getAttribute(PyutXmlConstants.ATTR_NAME),
+                                         theParameterType=paramType)
+
+        if domElement.hasAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE):
+            pyutParam.setDefaultValue(domElement.getAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE))
+
+        return pyutParam
+
+    def _getFields(self, xmlClass: Element) -> PyutFields:
+        """
+        Extracts fields from a DOM element that represents a UML class
+
+        Args:
+            xmlClass:
+                The DOM version of a UML class
+
+        Returns:
+            PyutFields
+        """
+        pyutFields: PyutFields = cast(PyutFields, [])
+
+        for xmlField in xmlClass.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_FIELD):
+
+            xmlField:   Element  = cast(Element, xmlField)
+            pyutField: PyutField = PyutField()
+
+            strVis: str                = xmlField.getAttribute(PyutXmlConstants.ATTR_VISIBILITY)
+            vis:    PyutVisibilityEnum = PyutVisibilityEnum.toEnum(strVis)
+
+            pyutField.setVisibility(vis)
+            xmlParam: Element = xmlField.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_PARAM)[0]
+
+            if xmlParam.hasAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE):
+                pyutField.setDefaultValue(xmlParam.getAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE))
+            pyutField.setName(xmlParam.getAttribute(PyutXmlConstants.ATTR_NAME))
+
+            pyutType: PyutType = PyutType(xmlParam.getAttribute(PyutXmlConstants.ATTR_TYPE))
+            pyutField.setType(pyutType)
+
+            pyutFields.append(pyutField)
+
+        return pyutFields
+
+    def _getControlPointPositions(self, link: Element) -> RecordPoints:
+
+        positions: RecordPoints = []
+        for controlPoint in link.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_CONTROL_POINT):
+            x = PyutUtils.secureFloat(controlPoint.getAttribute(PyutXmlConstants.ATTR_X))
+            y = PyutUtils.secureFloat(controlPoint.getAttribute(PyutXmlConstants.ATTR_Y))
+            positions.append((x, y))
+
+        return positions
+
+    def _getLabelPositions(self, link: Element) -> Dict[str, RecordPoint]:
+
+        positions: Dict[str, RecordPoint] = {}
+        for tagName in [PyutXmlConstants.ELEMENT_ASSOC_CENTER_LABEL,
+                        PyutXmlConstants.ELEMENT_ASSOC_SOURCE_LABEL,
+                        PyutXmlConstants.ELEMENT_ASSOC_DESTINATION_LABEL]:
+            labels: NodeList = link.getElementsByTagName(tagName)
+            if len(labels) > 0:
+                label: Element = cast(Element, labels[0])
+                positions[tagName] = (float(label.getAttribute(PyutXmlConstants.ATTR_X)), float(label.getAttribute(PyutXmlConstants.ATTR_Y)))
+
+        return positions
+
+    def _linkPyutObjects(self, assocPyutLink: PyutLink, source: PyutLinkedObject, destination: PyutLinkedObject) -> PyutLink:
+        """
+        Create the link between two data model objects and update one the following lists of the source:
+
+        ._parents   for Inheritance links
+        ._links     for all other link types
+
+        Args:
+            assocPyutLink:  The link as read by `_getPyutLink`
+            source:         The source data model object
+            destination:    The destination data model object
+
+        Returns:  The new link
+        """
+        linkType: LinkType = assocPyutLink.getType()
+        pyutLink: PyutLink = PyutLink(name=assocPyutLink.getName(),
+                                      linkType=linkType,
+                                      cardSrc=assocPyutLink.sourceCardinality,
+                                      cardDest=assocPyutLink.destinationCardinality,
+                                      source=source, destination=destination)
+        if linkType == LinkType.INHERITANCE:
+            source.addParent(destination)
+        else:
+            source.addLink(pyutLink)
+
+        return pyutLink
+
+    def _getPyutLink(self, obj: Element):
+        """
+
+        Args:
+            obj:  The GraphicLink DOM element
+
+        Returns:
+            A tuple of a source ID, destination ID, and a PyutLink object
+        """
+        link: Element = obj.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_LINK)[0]
+
+        pyutLink: PyutLink = PyutLink()
+
+        pyutLink.setBidir(bool(link.getAttribute(PyutXmlConstants.ATTR_BIDIRECTIONAL)))
+
+        pyutLink.destinationCardinality = link.getAttribute(PyutXmlConstants.ATTR_CARDINALITY_DESTINATION)
+        pyutLink.sourceCardinality      = link.getAttribute(PyutXmlConstants.ATTR_CARDINALITY_SOURCE)
+
+        pyutLink.setName(link.getAttribute(PyutXmlConstants.ATTR_NAME))
+
+        strLinkType: str         = link.getAttribute(PyutXmlConstants.ATTR_TYPE)
+        linkType:    LinkType    = LinkType.toEnum(strValue=strLinkType)
+        pyutLink.setType(linkType)
+
+        # source and destination will be reconstructed by getLinkRecords or getOglLinks
+        sourceId = int(link.getAttribute(PyutXmlConstants.ATTR_SOURCE_ID))
+        destId   = int(link.getAttribute(PyutXmlConstants.ATTR_DESTINATION_ID))
+
+        return sourceId, destId, pyutLink
@@ -20,19 +20,12 @@ from org.pyut.enums.AttachmentPoint import AttachmentPoint
 
 from org.pyut.model.PyutActor import PyutActor
 from org.pyut.model.PyutClass import PyutClass
-from org.pyut.model.PyutField import PyutField
 from org.pyut.model.PyutInterface import PyutInterface
 from org.pyut.model.PyutLink import PyutLink
-from org.pyut.model.PyutMethod import PyutMethod
 from org.pyut.model.PyutNote import PyutNote
-from org.pyut.model.PyutParam import PyutParam
 from org.pyut.model.PyutSDInstance import PyutSDInstance
 from org.pyut.model.PyutSDMessage import PyutSDMessage
-from org.pyut.model.PyutType import PyutType
 from org.pyut.model.PyutUseCase import PyutUseCase
-from org.pyut.model.PyutStereotype import getPyutStereotype
-from org.pyut.model.PyutModifier import PyutModifier
-from org.pyut.model.PyutVisibilityEnum import PyutVisibilityEnum
 
 from org.pyut.enums.LinkType import LinkType
 
@@ -52,6 +45,7 @@ from org.pyut.ogl.OglLinkFactory import getOglLinkFactory
 
 from org.pyut.ogl.sd.OglSDMessage import OglSDMessage
 
+from org.pyut.persistence.converters.MiniDomToModelV10 import MiniDomToModel
 from org.pyut.persistence.converters.PyutXmlConstants import PyutXmlConstants
 
 from org.pyut.PyutUtils import PyutUtils
@@ -65,24 +59,24 @@ OglActors      = NewType('OglActors',      Dict[int, OglActor])
 OglUseCases    = NewType('OglUseCases',    Dict[int, OglUseCase])
 OglSDInstances = NewType('OglSDInstances', Dict[int, OglSDInstance])
 OglSDMessages  = NewType('OglSDMessages',  Dict[int, OglSDMessage])
-PyutMethods    = NewType('PyutMethods',    List[PyutMethod])
-PyutFields     = NewType('PyutFields',     List[PyutField])
 ControlPoints  = NewType('ControlPoints',  List[ControlPoint])
 Links          = NewType('Links',          Union[OglLink, OglSDInstance])
 OglLinks       = NewType('OglLinks',       List[Links])
 OglInterfaces  = NewType('OglInterfaces',  List[OglInterface2])
 
 
-class MiniDomToOgl:
+class MiniDomToOgl(MiniDomToModel):
 
     """
     The refactored version of the original methods that were part of the monolithic
      `PyutXml`xxx classes.  This version does NO UI related actions;  It is up to the
     caller to actually place the visual OGL object on the diagram frame
 
+    The data model is read by `MiniDomToModel`;  This class only adds the OGL objects.
     """
     def __init__(self):
 
+        super().__init__()
         self.logger: Logger = getLogger(__name__)
 
     def getOglClasses(self, xmlOglClasses: NodeList) -> OglClasses:
@@ -101,33 +95,12 @@ class MiniDomToOgl:
         for xmlOglClass in xmlOglClasses:
 
             xmlOglClass: Element   = cast(Element, xmlOglClass)
-            pyutClass:   PyutClass = PyutClass()
+            pyutClass:   PyutClass = self._getPyutClass(xmlOglClass)
 
             height: float      = float(xmlOglClass.getAttribute(PyutXmlConstants.ATTR_HEIGHT))
             width:  float      = float(xmlOglClass.getAttribute(PyutXmlConstants.ATTR_WIDTH))
             oglClass: OglClass = OglClass(pyutClass, width, height)
 
-            xmlClass: Element = xmlOglClass.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_CLASS)[0]
-
-            pyutClass.setId(int(xmlClass.getAttribute(PyutXmlConstants.ATTR_ID)))
-            pyutClass.setName(xmlClass.getAttribute(PyutXmlConstants.ATTR_NAME))
-            pyutClass.description = xmlClass.getAttribute(PyutXmlConstants.ATTR_DESCRIPTION)
-            if xmlClass.hasAttribute(PyutXmlConstants.ATTR_STEREOTYPE):
-                pyutClass.setStereotype(getPyutStereotype(xmlClass.getAttribute(PyutXmlConstants.ATTR_STEREOTYPE)))
-
-            # adding display properties (cd)
-            value = PyutUtils.secureBoolean(xmlClass.getAttribute(PyutXmlConstants.ATTR_SHOW_STEREOTYPE))
-            pyutClass.setShowStereotype(value)
-            value = PyutUtils.secureBoolean(xmlClass.getAttribute(PyutXmlConstants.ATTR_SHOW_METHODS))
-            pyutClass.showMethods = value
-            value = PyutUtils.secureBoolean(xmlClass.getAttribute(PyutXmlConstants.ATTR_SHOW_FIELDS))
-            pyutClass.showFields = value
-
-            pyutClass.setFilename(xmlClass.getAttribute(PyutXmlConstants.ATTR_FILENAME))
-
-            pyutClass.methods = self._getMethods(xmlClass)
-            pyutClass.fields  = self._getFields(xmlClass)
-
             # Adding properties necessary to place shape on a diagram frame
             x = float(xmlOglClass.getAttribute(PyutXmlConstants.ATTR_X))
             y = float(xmlOglClass.getAttribute(PyutXmlConstants.ATTR_Y))
@@ -195,11 +168,7 @@ class MiniDomToOgl:
                 continue
 
             linkType: LinkType = assocPyutLink.getType()
-            pyutLink: PyutLink = PyutLink(name=assocPyutLink.getName(),
-                                          linkType=linkType,
-                                          cardSrc=assocPyutLink.sourceCardinality,
-                                          cardDest=assocPyutLink.destinationCardinality,
-                                          source=src.getPyutObject(), destination=dst.getPyutObject())
+            pyutLink: PyutLink = self._linkPyutObjects(assocPyutLink, src.getPyutObject(), dst.getPyutObject())
 
             oglLinkFactory = getOglLinkFactory()
             oglLink = oglLinkFactory.getOglLink(src, pyutLink, dst, linkType)
@@ -231,7 +200,6 @@ class MiniDomToOgl:
 
             if isinstance(oglLink, OglAssociation):
                 self.__furtherCustomizeAssociationLink(xmlLink, oglLink)
-            self._reconstituteLinkDataModel(oglLink)
 
         return oglLinks
 
@@ -248,24 +216,13 @@ class MiniDomToOgl:
         oglNotes: OglNotes = cast(OglNotes, {})
         for xmlOglNote in xmlOglNotes:
 
-            pyutNote: PyutNote = PyutNote()
+            pyutNote: PyutNote = self._getPyutNote(xmlOglNote)
 
             # Building OGL Note
             height: float = float(xmlOglNote.getAttribute(PyutXmlConstants.ATTR_HEIGHT))
             width:  float = float(xmlOglNote.getAttribute(PyutXmlConstants.ATTR_WIDTH))
             oglNote = OglNote(pyutNote, width, height)
 
-            xmlNote: Element = xmlOglNote.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_NOTE)[0]
-
-            pyutNote.setId(int(xmlNote.getAttribute(PyutXmlConstants.ATTR_ID)))
-
-            content: str = xmlNote.getAttribute(PyutXmlConstants.ATTR_CONTENT)
-            content = content.replace("\\\\\\\\", "\n")
-
-            pyutNote.content = content
-
-            pyutNote.setFilename(xmlNote.getAttribute(PyutXmlConstants.ATTR_FILENAME))
-
             # Adding properties necessary to place shape on a diagram frame
             x: float = float(xmlOglNote.getAttribute(PyutXmlConstants.ATTR_X))
             y: float = float(xmlOglNote.getAttribute(PyutXmlConstants.ATTR_Y))
@@ -289,19 +246,13 @@ class MiniDomToOgl:
         oglActors: OglActors = cast(OglActors, {})
 
         for xmlOglActor in xmlOglActors:
-            pyutActor: PyutActor = PyutActor()
+            pyutActor: PyutActor = self._getPyutActor(xmlOglActor)
 
             # Building OGL Actor
             height: float = float(xmlOglActor.getAttribute(PyutXmlConstants.ATTR_HEIGHT))
             width:  float = float(xmlOglActor.getAttribute(PyutXmlConstants.ATTR_WIDTH))
             oglActor: OglActor = OglActor(pyutActor, width, height)
 
-            xmlActor: Element = xmlOglActor.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_ACTOR)[0]
-
-            pyutActor.setId(int(xmlActor.getAttribute(PyutXmlConstants.ATTR_ID)))
-            pyutActor.setName(xmlActor.getAttribute(PyutXmlConstants.ATTR_NAME))
-            pyutActor.setFilename(xmlActor.getAttribute(PyutXmlConstants.ATTR_FILENAME))
-
             # Adding properties necessary to place shape on a diagram frame
             x = float(xmlOglActor.getAttribute(PyutXmlConstants.ATTR_X))
             y = float(xmlOglActor.getAttribute(PyutXmlConstants.ATTR_Y))
@@ -325,19 +276,13 @@ class MiniDomToOgl:
 
         for xmlOglUseCase in xmlOglUseCases:
 
-            pyutUseCase: PyutUseCase = PyutUseCase()
+            pyutUseCase: PyutUseCase = self._getPyutUseCase(xmlOglUseCase)
 
             # Building OGL UseCase
             height = float(xmlOglUseCase.getAttribute(PyutXmlConstants.ATTR_HEIGHT))
             width = float(xmlOglUseCase.getAttribute(PyutXmlConstants.ATTR_WIDTH))
             oglUseCase = OglUseCase(pyutUseCase, width, height)
 
-            xmlUseCase: Element = xmlOglUseCase.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_USE_CASE)[0]
-
-            pyutUseCase.setId(int(xmlUseCase.getAttribute(PyutXmlConstants.ATTR_ID)))
-            pyutUseCase.setName(xmlUseCase.getAttribute(PyutXmlConstants.ATTR_NAME))
-            pyutUseCase.setFilename(xmlUseCase.getAttribute(PyutXmlConstants.ATTR_FILENAME))
-
             x = float(xmlOglUseCase.getAttribute(PyutXmlConstants.ATTR_X))
             y = float(xmlOglUseCase.getAttribute(PyutXmlConstants.ATTR_Y))
             oglUseCase.SetPosition(x, y)
@@ -433,113 +378,6 @@ class MiniDomToOgl:
 
         return oglSDMessages
 
-    def _getMethods(self, xmlClass: Element) -> PyutMethods:
-        """
-        Converts XML methods to `PyutMethod`s
-        Args:
-            xmlClass:  A DOM element that is a UML Class
-
-        Returns:
-            A list of `PyutMethod`s associated with the class
-        """
-        allMethods: PyutMethods = cast(PyutMethods, [])
-        for xmlMethod in xmlClass.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_METHOD):
-
-            pyutMethod: PyutMethod = PyutMethod(xmlMethod.getAttribute(PyutXmlConstants.ATTR_NAME))
-
-            strVis: str = xmlMethod.getAttribute(PyutXmlConstants.ATTR_VISIBILITY)
-            vis: PyutVisibilityEnum = PyutVisibilityEnum.toEnum(strVis)
-            pyutMethod.setVisibility(visibility=vis)
-
-            returnElt:  Element  = xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_RETURN)[0]
-            retTypeStr: str      = returnElt.getAttribute(PyutXmlConstants.ATTR_TYPE)
-            retType:    PyutType = PyutType(retTypeStr)
-            pyutMethod.setReturns(retType)
-
-            #
-            #  Code supports multiple modifiers, but the dialog allows input of only one
-            #
-            modifiers: NodeList = xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_MODIFIER)
-            for xmlModifier in modifiers:
-                xmlModifier: Element = cast(Element, xmlModifier)
-                modName:  str        = xmlModifier.getAttribute(PyutXmlConstants.ATTR_NAME)
-
-                pyutModifier: PyutModifier = PyutModifier(modName)
-                pyutMethod.addModifier(pyutModifier)
-
-            methodParameters = []
-            for xmlParam in xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_PARAM):
-                methodParameters.append(self._getParam(xmlParam))
-
-            pyutMethod.setParams(methodParameters)
-
-            allMethods.append(pyutMethod)
-
-        return allMethods
-
-    def _getImplementors(self, xmlClass: Element) -> PyutInterface.Implementors:
-
-        implementors: PyutInterface.Implementors = []
-        for xmlImplementor in xmlClass.getElementsByTagName(PyutXmlConstants.ELEMENT_IMPLEMENTOR):
-            className: PyutInterface.ClassName = xmlImplementor.getAttribute(PyutXmlConstants.ATTR_IMPLEMENTING_CLASS_NAME)
-            implementors.append(className)
-
-        return implementors
-
-    def _getParam(self, domElement: Element) -> PyutParam:
-        """
-
-        Args:
-            domElement:  The xml element tht is a parameter
-
-        Returns:
-            A parameter model object
-        """
-        paramTypeStr: str = domElement.getAttribute(PyutXmlConstants.ATTR_TYPE)
-        paramType:    PyutType = PyutType(paramTypeStr)
-        pyutParam: PyutParam = PyutParam(name=domElement.getAttribute(PyutXmlConstants.ATTR_NAME),
-                                         theParameterType=paramType)
-
-        if domElement.hasAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE):
-            pyutParam.setDefaultValue(domElement.getAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE))
-
-        return pyutParam
-
-    def _getFields(self, xmlClass: Element) -> PyutFields:
-        """
-        Extracts fields from a DOM element that represents a UML class
-
-        Args:
-            xmlClass:
-                The DOM version of a UML class
-
-        Returns:
-            PyutFields
-        """
-        pyutFields: PyutFields = cast(PyutFields, [])
-
-        for xmlField in xmlClass.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_FIELD):
-
-            xmlField:   Element  = cast(Element, xmlField)
-            pyutField: PyutField = PyutField()
-
-            strVis: str                = xmlField.getAttribute(PyutXmlConstants.ATTR_VISIBILITY)
-            vis:    PyutVisibilityEnum = PyutVisibilityEnum.toEnum(strVis)
-
-            pyutField.setVisibility(vis)
-            xmlParam: Element = xmlField.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_PARAM)[0]
-
-            if xmlParam.hasAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE):
-                pyutField.setDefaultValue(xmlParam.getAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE))
-            pyutField.setName(xmlParam.getAttribute(PyutXmlConstants.ATTR_NAME))
-
-            pyutType: PyutType = PyutType(xmlParam.getAttribute(PyutXmlConstants.ATTR_TYPE))
-            pyutField.setType(pyutType)
-
-            pyutFields.append(pyutField)
-
-        return pyutFields
-
     def _generateControlPoints(self, link: Element) -> ControlPoints:
 
         controlPoints: ControlPoints = cast(ControlPoints, [])
@@ -551,60 +389,6 @@ class MiniDomToOgl:
 
         return controlPoints
 
-    def _reconstituteLinkDataModel(self, oglLink: OglLink):
-        """
-        Updates one the following lists in a PyutLinkedObject:
-
-        ._parents   for Inheritance links
-        ._links     for all other link types
-
-        Args:
-            oglLink:       An OglLink
-        """
-        srcShape:  OglClass = oglLink.getSourceShape()
-        destShape: OglClass = oglLink.getDestinationShape()
-        self.logger.debug(f'source ID: {srcShape.GetID()} - destination ID: {destShape.GetID()}')
-
-        pyutLink:        PyutLink = oglLink.getPyutObject()
-
-        if pyutLink.getType() == LinkType.INHERITANCE:
-            childPyutClass:  PyutClass = srcShape.getPyutObject()
-            parentPyutClass: PyutClass = destShape.getPyutObject()
-            childPyutClass.addParent(parentPyutClass)
-        else:
-            srcPyutClass:  PyutClass = srcShape.getPyutObject()
-            srcPyutClass.addLink(pyutLink)
-
-    def _getPyutLink(self, obj: Element):
-        """
-
-        Args:
-            obj:  The GraphicLink DOM element
-
-        Returns:
-            A tuple of a source ID, destination ID, and a PyutLink object
-        """
-        link: Element = obj.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_LINK)[0]
-
-        pyutLink: PyutLink = PyutLink()
-
-        pyutLink.setBidir(bool(link.getAttribute(PyutXmlConstants.ATTR_BIDIRECTIONAL)))
-
-        pyutLink.destinationCardinality = link.getAttribute(PyutXmlConstants.ATTR_CARDINALITY_DESTINATION)
-        pyutLink.sourceCardinality      = link.getAttribute(PyutXmlConstants.ATTR_CARDINALITY_SOURCE)
-
-        pyutLink.setName(link.getAttribute(PyutXmlConstants.ATTR_NAME))
-
-        strLinkType: str         = link.getAttribute(PyutXmlConstants.ATTR_TYPE)
-        linkType:    LinkType    = LinkType.toEnum(strValue=strLinkType)
-        pyutLink.setType(linkType)
-
-        # source and destination will be reconstructed by _getOglLinks
-        sourceId = int(link.getAttribute(PyutXmlConstants.ATTR_SOURCE_ID))
-        destId   = int(link.getAttribute(PyutXmlConstants.ATTR_DESTINATION_ID))
-
-        return sourceId, destId, pyutLink
-
     def __furtherCustomizeAssociationLink(self, xmlLink: Element, oglLink: OglAssociation):
         """
         Customize the visual aspects of an Association link
@@ -0,0 +1,144 @@
+from typing import cast
+from typing import Dict
+
+from logging import Logger
+from logging import getLogger
+
+from org.pyut.MiniOgl.ControlPoint import ControlPoint
+from org.pyut.MiniOgl.TextShape import TextShape
+
+from org.pyut.model.PyutActor import PyutActor
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutNote import PyutNote
+from org.pyut.model.PyutUseCase import PyutUseCase
+
+from org.pyut.ogl.OglActor import OglActor
+from org.pyut.ogl.OglAssociation import CENTER
+from org.pyut.ogl.OglAssociation import DEST_CARD
+from org.pyut.ogl.OglAssociation import OglAssociation
+from org.pyut.ogl.OglAssociation import SRC_CARD
+from org.pyut.ogl.OglClass import OglClass
+from org.pyut.ogl.OglNote import OglNote
+from org.pyut.ogl.OglObject import OglObject
+from org.pyut.ogl.OglUseCase import OglUseCase
+from org.pyut.ogl.OglLinkFactory import getOglLinkFactory
+
+from org.pyut.persistence.DocumentModel import LinkRecord
+from org.pyut.persistence.DocumentModel import LinkRecords
+from org.pyut.persistence.DocumentModel import ShapeRecord
+from org.pyut.persistence.DocumentModel import ShapeRecords
+
+from org.pyut.persistence.converters.MiniDomToOglV10 import OglLinks
+from org.pyut.persistence.converters.MiniDomToOglV10 import OglObjects
+
+from org.pyut.persistence.converters.PyutXmlConstants import PyutXmlConstants
+
+
+class ModelToOgl:
+    """
+    Builds the OGL objects of a document from the records read by `MiniDomToModel`.
+    Like `MiniDomToOgl` it does NO UI related actions;  It is up to the caller to
+    place the visual OGL objects on the diagram frame.
+    """
+    LABEL_INDICES: Dict[str, int] = {
+        PyutXmlConstants.ELEMENT_ASSOC_CENTER_LABEL:      CENTER,
+        PyutXmlConstants.ELEMENT_ASSOC_SOURCE_LABEL:      SRC_CARD,
+        PyutXmlConstants.ELEMENT_ASSOC_DESTINATION_LABEL: DEST_CARD,
+    }
+
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+    def getOglObjects(self, shapes: ShapeRecords) -> OglObjects:
+        """
+        Args:
+            shapes:     The shape records of a class or use case diagram
+
+        Returns:
+            The OGL shapes keyed by the id of their data model object
+        """
+        oglObjects: OglObjects = cast(OglObjects, {})
+        for pyutId, shape in shapes.items():
+            oglObject: OglObject = self._toOglObject(shape)
+            if oglObject is None:
+                self.logger.warning(f'Unhandled data model object: {shape.pyutObject}')
+                continue
+            oglObject.SetPosition(shape.x, shape.y)
+            oglObjects[pyutId] = oglObject
+
+        return oglObjects
+
+    def getOglLinks(self, links: LinkRecords, oglObjects: OglObjects) -> OglLinks:
+        """
+        The data model objects are already linked by `MiniDomToModel`;  Only the OGL links are built
+
+        Args:
+            links:      The link records
+            oglObjects: The OGL shapes the links join
+
+        Returns:
+            The OglLinks list
+        """
+        oglLinks: OglLinks = cast(OglLinks, [])
+
+        for link in links:
+            try:
+                src: OglObject = oglObjects[link.sourceId]
+                dst: OglObject = oglObjects[link.destinationId]
+            except KeyError as ke:
+                self.logger.error(f'Developer Error -- srcId: {link.sourceId} - dstId: {link.destinationId}  error: {ke}')
+                continue
+
+            oglLink = getOglLinkFactory().getOglLink(src, link.pyutLink, dst, link.pyutLink.getType())
+            src.addLink(oglLink)
+            dst.addLink(oglLink)
+
+            oglLinks.append(oglLink)
+
+            oglLink.SetSpline(link.spline)
+
+            # put the anchors at the right position
+            srcAnchor = oglLink.GetSource()
+            dstAnchor = oglLink.GetDestination()
+            srcAnchor.SetPosition(link.sourceAnchor[0], link.sourceAnchor[1])
+            dstAnchor.SetPosition(link.destinationAnchor[0], link.destinationAnchor[1])
+
+            self._addControlPoints(link, oglLink)
+
+            if isinstance(oglLink, OglAssociation):
+                self._positionLabels(link, oglLink)
+
+        return oglLinks
+
+    def _toOglObject(self, shape: ShapeRecord) -> OglObject:
+
+        pyutObject = shape.pyutObject
+        if isinstance(pyutObject, PyutClass):
+            return OglClass(pyutObject, shape.width, shape.height)
+        elif isinstance(pyutObject, PyutNote):
+            return OglNote(pyutObject, shape.width, shape.height)
+        elif isinstance(pyutObject, PyutActor):
+            return OglActor(pyutObject, shape.width, shape.height)
+        elif isinstance(pyutObject, PyutUseCase):
+            return OglUseCase(pyutObject, shape.width, shape.height)
+        else:
+            return cast(OglObject, None)
+
+    def _addControlPoints(self, link: LinkRecord, oglLink):
+
+        line     = oglLink.GetSource().GetLines()[0]  # only 1 line per anchor in pyut
+        parent   = line.GetSource().GetParent()
+        selfLink = parent is line.GetDestination().GetParent()
+
+        for x, y in link.controlPoints:
+            controlPoint: ControlPoint = ControlPoint(x, y)
+            line.AddControl(controlPoint)
+            if selfLink:
+                controlPoint.SetParent(parent)
+                controlPoint.SetPosition(x, y)
+
+    def _positionLabels(self, link: LinkRecord, oglLink: OglAssociation):
+
+        for tagName, position in link.labels.items():
+            textShape: TextShape = oglLink.getLabels()[ModelToOgl.LABEL_INDICES[tagName]]
+            textShape.SetPosition(position[0], position[1])
@@ -16,7 +16,9 @@ from org.pyut.plugins.io.IoJava import IoJava
 from org.pyut.plugins.io.IoJavaReverse import IoJavaReverse
 from org.pyut.plugins.io.IoJavascript import IoJavascript
 from org.pyut.plugins.io.IoPdf import IoPdf
+from org.pyut.plugins.io.IoProjectPdf import IoProjectPdf
 from org.pyut.plugins.io.IoPython import IoPython
+from org.pyut.plugins.io.IoSvg import IoSvg
 from org.pyut.plugins.io.IoXmi import IoXmi
 from org.pyut.plugins.io.IoXmiOMG import IoXmi_OMG
 from org.pyut.plugins.io.IoXml import IoXml
@@ -26,9 +28,11 @@ from org.pyut.plugins.tools.ToArrangeLinks import ToArrangeLinks
 from org.pyut.plugins.tools.ToAscii import ToAscii
 from org.pyut.plugins.tools.ToCDAutoLayout import ToCDAutoLayout
 from org.pyut.plugins.tools.ToFastEdit import ToFastEdit
+from org.pyut.plugins.tools.ToIncrementalLayout import ToIncrementalLayout
 from org.pyut.plugins.tools.ToLayout import ToLayout
 from org.pyut.plugins.tools.ToLayoutSave import ToLayoutSave
 from org.pyut.plugins.tools.ToOrthogonalLayoutV2 import ToOrthogonalLayoutV2
+from org.pyut.plugins.tools.ToOrthogonalRouteLinks import ToOrthogonalRouteLinks
 from org.pyut.plugins.tools.ToPython import ToPython
 from org.pyut.plugins.tools.ToSugiyama import ToSugiyama
 from org.pyut.plugins.tools.ToTransforms import ToTransforms
@@ -42,10 +46,10 @@ class PluginManager(Singleton):
     PLUGIN_PACKAGE:   str = 'org.pyut.plugins'
 
     IO_PLUGINS: List[type] = [IoCpp, IoDTD, IoJava, IoJavaReverse, IoJavascript,
-                              IoPython, IoXmi, IoXmi_OMG, IoXml, IoXSD, IoGML, IoPdf, IoImage
+                              IoPython, IoXmi, IoXmi_OMG, IoXml, IoXSD, IoGML, IoPdf, IoProjectPdf, IoImage, IoSvg
                               ]
-    TOOL_PLUGINS: List[type] = [ToArrangeLinks, ToAscii, ToCDAutoLayout, ToFastEdit, ToLayout, ToLayoutSave,
-                                ToOrthogonalLayoutV2, ToPython, ToSugiyama, ToTransforms
+    TOOL_PLUGINS: List[type] = [ToArrangeLinks, ToAscii, ToCDAutoLayout, ToFastEdit, ToIncrementalLayout, ToLayout, ToLayoutSave,
+                                ToOrthogonalLayoutV2, ToOrthogonalRouteLinks, ToPython, ToSugiyama, ToTransforms
                                 ]
 
     """
@@ -0,0 +1,290 @@
+
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from concurrent.futures import ThreadPoolExecutor
+
+from os import listdir
+from os import path as osPath
+
+from org.pyut.enums.LinkType import LinkType
+
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutNote import PyutNote
+from org.pyut.model.PyutObject import PyutObject
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import LinkRecord
+
+BoxLines = List[str]
+
+
+@dataclass
+class AsciiBox:
+    """
+    A box placed on the character grid of a diagram
+    """
+    lines:  BoxLines
+    column: int = 0
+    row:    int = 0
+
+    @property
+    def width(self) -> int:
+        return len(self.lines[0])
+
+    @property
+    def height(self) -> int:
+        return len(self.lines)
+
+    @property
+    def right(self) -> int:
+        return self.column + self.width - 1
+
+    @property
+    def bottom(self) -> int:
+        return self.row + self.height - 1
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        return self.column + self.width // 2, self.row + self.height // 2
+
+    def overlaps(self, other: 'AsciiBox') -> bool:
+        """
+        Boxes must keep one free column and one free row between them, for the links
+        """
+        return not (self.right + 1 < other.column or other.right + 1 < self.column or
+                    self.bottom + 1 < other.row or other.bottom + 1 < self.row)
+
+
+class AsciiRenderer:
+    """
+    Formats classes as ASCII boxes.  Each box is built in a single string and
+    written with one call;  The files of a selection are written concurrently.
+
+    A whole diagram is drawn on a character grid:  The shapes keep their relative
+    positions and the links are drawn as horizontal then vertical lines, ended
+    by a marker for the link type.
+
+    Usage::
+        renderer: AsciiRenderer = AsciiRenderer()
+        renderer.writeClasses(pyutClasses, '/tmp/ascii')
+        text: str = renderer.renderDocument(documentModel)
+    """
+    EXTENSION: str = 'acl'
+
+    PIXELS_PER_COLUMN: int = 8
+    PIXELS_PER_ROW:    int = 16
+
+    MAX_WRITERS: int = 8
+
+    LINK_MARKERS: Dict[LinkType, str] = {
+        LinkType.AGGREGATION: 'o',
+        LinkType.COMPOSITION: '*',
+    }
+
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+    def classBox(self, pyutClass: PyutClass) -> BoxLines:
+        """
+        Returns:
+            The box lines:  The centered name and stereotype, then the fields, then the methods
+        """
+        header:  List[str] = [pyutClass.getName()]
+        if pyutClass.getStereotype() is not None:
+            header.append(str(pyutClass.getStereotype()))
+        fields:  List[str] = [str(pyutField) for pyutField in pyutClass.fields]
+        methods: List[str] = [str(pyutMethod) for pyutMethod in pyutClass.methods]
+
+        textWidth: int = max(len(line) for line in header + fields + methods)
+        border:    str = '-' * (textWidth + 4)
+        separator: str = f'|{"-" * (textWidth + 2)}|'
+
+        lines: BoxLines = [border]
+        for line in header:
+            left: int = (textWidth - len(line)) // 2
+            lines.append(f'| {" " * left}{line:<{textWidth - left}} |')
+        lines.append(separator)
+        lines.extend(f'| {line:<{textWidth}} |' for line in fields)
+        lines.append(separator)
+        lines.extend(f'| {line:<{textWidth}} |' for line in methods)
+        lines.append(border)
+
+        return lines
+
+    def objectBox(self, pyutObject: PyutObject) -> BoxLines:
+        """
+        Returns:
+            The class box of a class;  A box around the text of the other shapes
+        """
+        if isinstance(pyutObject, PyutClass):
+            return self.classBox(pyutObject)
+        if isinstance(pyutObject, PyutNote):
+            text: List[str] = pyutObject.content.split('\n')
+        else:
+            text = [pyutObject.getName()]
+
+        textWidth: int = max(len(line) for line in text)
+        border:    str = '-' * (textWidth + 4)
+
+        return [border] + [f'| {line:<{textWidth}} |' for line in text] + [border]
+
+    def renderClass(self, pyutClass: PyutClass) -> str:
+        """
+        Returns:
+            The contents of a class file:  Its box followed by its description
+        """
+        return '\n'.join(self.classBox(pyutClass)) + f'\n\n{pyutClass.description}'
+
+    def writeClasses(self, pyutClasses: List[PyutClass], directory: str) -> List[str]:
+        """
+        Write one file per class;  A file is named after its class and never replaces an existing file
+
+        Args:
+            pyutClasses:    The classes to write
+            directory:      Where to write them
+
+        Returns:
+            The written file names
+        """
+        baseNames: List[str] = self.uniqueNames([pyutClass.getName() for pyutClass in pyutClasses], set(listdir(directory)))
+        fileNames: List[str] = [osPath.join(directory, f'{baseName}.{AsciiRenderer.EXTENSION}') for baseName in baseNames]
+        contents:  List[str] = [self.renderClass(pyutClass) for pyutClass in pyutClasses]
+
+        with ThreadPoolExecutor(max_workers=min(AsciiRenderer.MAX_WRITERS, max(1, len(fileNames)))) as executor:
+            list(executor.map(self._writeFile, fileNames, contents))
+
+        return fileNames
+
+    def uniqueNames(self, names: List[str], takenFileNames: Set[str]) -> List[str]:
+        """
+        Args:
+            names:          The wanted base names
+            takenFileNames: The file names already in the directory
+
+        Returns:
+            The base names;  A number is appended to a name already taken
+        """
+        taken:  Set[str]  = {osPath.splitext(fileName)[0] for fileName in takenFileNames if fileName.endswith(f'.{AsciiRenderer.EXTENSION}')}
+        unique: List[str] = []
+        for name in names:
+            uniqueName: str = name
+            suffix:     int = 2
+            while uniqueName in taken:
+                uniqueName = f'{name}{suffix}'
+                suffix += 1
+            taken.add(uniqueName)
+            unique.append(uniqueName)
+
+        return unique
+
+    def renderDocument(self, documentModel: DocumentModel) -> str:
+        """
+        Draw a whole class or use case diagram
+
+        Args:
+            documentModel:  The shapes and the links
+
+        Returns:
+            The diagram text
+        """
+        boxes: Dict[int, AsciiBox] = self._placeBoxes(documentModel)
+        if len(boxes) == 0:
+            return ''
+
+        columns: int = max(box.right for box in boxes.values()) + 2
+        rows:    int = max(box.bottom for box in boxes.values()) + 2
+        grid:    List[List[str]] = [[' '] * columns for _ in range(rows)]
+
+        for link in documentModel.links:
+            if link.sourceId in boxes and link.destinationId in boxes:
+                self._drawLink(grid, link, boxes[link.sourceId], boxes[link.destinationId])
+        for box in boxes.values():
+            for rowOffset, line in enumerate(box.lines):
+                grid[box.row + rowOffset][box.column:box.column + box.width] = line
+
+        return '\n'.join(''.join(row).rstrip() for row in grid).rstrip('\n') + '\n'
+
+    def writeDocument(self, documentModel: DocumentModel, fileName: str):
+
+        self._writeFile(fileName, self.renderDocument(documentModel))
+
+    def _placeBoxes(self, documentModel: DocumentModel) -> Dict[int, AsciiBox]:
+        """
+        Scale the shape positions to the grid, then move each box down below the boxes it overlaps
+        """
+        boxes: Dict[int, AsciiBox] = {}
+        for shapeId, shape in documentModel.shapes.items():
+            boxes[shapeId] = AsciiBox(lines=self.objectBox(shape.pyutObject),
+                                      column=round(shape.x / AsciiRenderer.PIXELS_PER_COLUMN),
+                                      row=round(shape.y / AsciiRenderer.PIXELS_PER_ROW))
+        if len(boxes) == 0:
+            return boxes
+
+        minColumn: int = min(box.column for box in boxes.values())
+        minRow:    int = min(box.row for box in boxes.values())
+        placed:    List[AsciiBox] = []
+        for box in sorted(boxes.values(), key=lambda aBox: (aBox.row, aBox.column)):
+            box.column -= minColumn
+            box.row    -= minRow
+            blockers: List[AsciiBox] = [other for other in placed if box.overlaps(other)]
+            while len(blockers) > 0:
+                box.row = max(other.bottom for other in blockers) + 2
+                blockers = [other for other in placed if box.overlaps(other)]
+            placed.append(box)
+
+        return boxes
+
+    def _drawLink(self, grid: List[List[str]], link: LinkRecord, source: AsciiBox, destination: AsciiBox):
+        """
+        Horizontally from the source center, then vertically to the destination;  The boxes are drawn over the lines
+        """
+        sourceColumn, sourceRow           = source.center
+        destinationColumn, destinationRow = destination.center
+
+        if destination.row <= sourceRow <= destination.bottom:
+            # Side by side:  A horizontal line to the facing side
+            if destinationColumn > sourceColumn:
+                endColumn, arrow = destination.column - 1, '>'
+            else:
+                endColumn, arrow = destination.right + 1, '<'
+            self._drawHorizontal(grid, sourceRow, sourceColumn, endColumn)
+            endRow: int = sourceRow
+        else:
+            self._drawHorizontal(grid, sourceRow, sourceColumn, destinationColumn)
+            if destinationRow > sourceRow:
+                endRow, arrow = destination.row - 1, 'v'
+            else:
+                endRow, arrow = destination.bottom + 1, '^'
+            self._drawVertical(grid, destinationColumn, sourceRow, endRow)
+            if destinationColumn != sourceColumn:
+                grid[sourceRow][destinationColumn] = '+'
+            endColumn = destinationColumn
+
+        linkType: LinkType = link.pyutLink.getType()
+        if linkType == LinkType.INHERITANCE:
+            grid[endRow][endColumn] = arrow
+        elif linkType in AsciiRenderer.LINK_MARKERS:
+            grid[endRow][endColumn] = AsciiRenderer.LINK_MARKERS[linkType]
+
+    def _drawHorizontal(self, grid: List[List[str]], row: int, fromColumn: int, toColumn: int):
+
+        for column in range(min(fromColumn, toColumn), max(fromColumn, toColumn) + 1):
+            grid[row][column] = '+' if grid[row][column] in '|+' else '-'
+
+    def _drawVertical(self, grid: List[List[str]], column: int, fromRow: int, toRow: int):
+
+        for row in range(min(fromRow, toRow), max(fromRow, toRow) + 1):
+            grid[row][column] = '+' if grid[row][column] in '-+' else '|'
+
+    def _writeFile(self, fileName: str, text: str):
+
+        with open(fileName, 'w') as writer:
+            writer.write(text)
@@ -1,5 +1,8 @@
 
+from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Tuple
 
 from wx import ICON_ERROR
 from wx import MessageDialog
@@ -9,8 +12,19 @@ from org.pyut.general.Mediator import Mediator
 
 from org.pyut.plugins.base.PyutPlugin import PyutPlugin
 
+from org.pyut.ogl.OglLink import OglLink
 from org.pyut.ogl.OglObject import OglObject
 
+from org.pyut.PyutConstants import PyutConstants
+
+from org.pyut.plugins.common.ComponentLayout import ComponentBox
+from org.pyut.plugins.common.ComponentLayout import ComponentLayout
+from org.pyut.plugins.common.ComponentLayout import Components
+from org.pyut.plugins.common.LayoutCache import CacheEdge
+from org.pyut.plugins.common.LayoutCache import CacheNode
+from org.pyut.plugins.common.LayoutCache import CachedLayout
+from org.pyut.plugins.common.LayoutCache import LayoutCache
+
 from org.pyut.ui.UmlFrame import UmlFrame
 
 
@@ -45,6 +59,189 @@ class PyutToPlugin(PyutPlugin):
         booBoo: MessageDialog = MessageDialog(parent=None, message='No UML objects', caption='Try Again!', style=OK | ICON_ERROR)
         booBoo.ShowModal()
 
+    @staticmethod
+    def splitIntoComponents(umlObjects: List[OglObject]) -> Components:
+        """
+        Split the objects into the connected components of the link graph.
+
+        Args:
+            umlObjects:  The ogl objects and links to split
+
+        Returns:  A list of components;  Each one holds its shapes followed by the links between them
+        """
+        oglObjects: List[OglObject] = [umlObject for umlObject in umlObjects if isinstance(umlObject, OglObject)]
+        oglLinks:   List[OglLink]   = [umlObject for umlObject in umlObjects if isinstance(umlObject, OglLink)]
+
+        edges:      List[Tuple[OglObject, OglObject]] = [(oglLink.getSourceShape(), oglLink.getDestinationShape()) for oglLink in oglLinks]
+        components: Components = ComponentLayout.findComponents(oglObjects, edges)
+
+        componentIndex: Dict[int, int] = {}
+        for index, component in enumerate(components):
+            for oglObject in component:
+                componentIndex[id(oglObject)] = index
+        for oglLink in oglLinks:
+            index = componentIndex.get(id(oglLink.getSourceShape()))
+            if index is not None:
+                components[index].append(oglLink)
+
+        return components
+
+    @staticmethod
+    def getComponentBox(component: List[OglObject]) -> ComponentBox:
+        """
+        Args:
+            component:  Shapes and links of a component
+
+        Returns:  The bounding box of the component's shapes
+        """
+        left, top, right, bottom = float('inf'), float('inf'), float('-inf'), float('-inf')
+        for oglObject in component:
+            if isinstance(oglObject, OglObject):
+                x, y = oglObject.GetPosition()
+                w, h = oglObject.GetSize()
+                left, top, right, bottom = min(left, x), min(top, y), max(right, x + w), max(bottom, y + h)
+        if left == float('inf'):
+            return ComponentBox()
+
+        return ComponentBox(left=left, top=top, width=right - left, height=bottom - top)
+
+    @staticmethod
+    def moveComponent(component: List[OglObject], dx: float, dy: float):
+        """
+        Translate the shapes of a component and the bends of its links
+
+        Args:
+            component:  Shapes and links of a component
+            dx:         Horizontal displacement
+            dy:         Vertical displacement
+        """
+        for umlObject in component:
+            if isinstance(umlObject, OglObject):
+                x, y = umlObject.GetPosition()
+                umlObject.SetPosition(x + dx, y + dy)
+            elif isinstance(umlObject, OglLink):
+                for controlPoint in umlObject.GetControlPoints():
+                    x, y = controlPoint.GetPosition()
+                    controlPoint.SetPosition(x + dx, y + dy)
+
+    def packComponents(self, components: Components, originX: float, originY: float):
+        """
+        Pack already laid out components next to each other
+
+        Args:
+            components:  The components
+            originX:     Left of the packed area
+            originY:     Top of the packed area
+        """
+        boxes:     List[ComponentBox] = [self.getComponentBox(component) for component in components]
+        positions: List[Tuple[float, float]] = ComponentLayout.pack(boxes)
+        for component, box, (x, y) in zip(components, boxes, positions):
+            self.moveComponent(component, originX + x - box.left, originY + y - box.top)
+
+    def getLayoutCache(self) -> LayoutCache:
+        """
+        Returns:  The layout cache of the project that owns the plugin's frame
+        """
+        projectFileName: Optional[str] = None
+        fileHandling = self._ctrl.getFileHandling()
+        project = None if fileHandling is None else fileHandling.getProjectFromFrame(self._umlFrame)
+        if project is not None and project.getFilename() not in (None, PyutConstants.DefaultFilename):
+            projectFileName = project.getFilename()
+
+        return LayoutCache.getCache(projectFileName)
+
+    def layoutCacheKey(self, umlObjects: List[OglObject], parameters: str) -> str:
+        """
+        Args:
+            umlObjects:  The shapes and links to lay out
+            parameters:  The layout name and its options
+
+        Returns:  The topology key of the objects
+        """
+        nodes: List[CacheNode] = []
+        edges: List[CacheEdge] = []
+        for umlObject in umlObjects:
+            if isinstance(umlObject, OglObject):
+                w, h = umlObject.GetSize()
+                nodes.append((self._cacheNodeId(umlObject), w, h))
+            elif isinstance(umlObject, OglLink):
+                edges.append(self._cacheEdge(umlObject))
+
+        return LayoutCache.topologyKey(nodes, edges, parameters)
+
+    def captureLayout(self, umlObjects: List[OglObject]) -> CachedLayout:
+        """
+        Args:
+            umlObjects:  The shapes and links that were laid out
+
+        Returns:  Their current positions and link routes
+        """
+        layout: CachedLayout = CachedLayout()
+        for umlObject in umlObjects:
+            if isinstance(umlObject, OglObject):
+                layout.positions[self._cacheNodeId(umlObject)] = umlObject.GetPosition()
+        for linkId, oglLink in self._cacheLinkIds(umlObjects).items():
+            layout.routes[linkId] = oglLink.GetSegments()
+
+        return layout
+
+    def applyCachedLayout(self, umlObjects: List[OglObject], layout: CachedLayout) -> bool:
+        """
+        Move the shapes and route the links as the cached layout says
+
+        Args:
+            umlObjects:  The shapes and links to lay out
+            layout:      A layout found with the topology key of `umlObjects`
+
+        Returns:  `False`, and nothing is moved, if the layout does not cover every object
+        """
+        oglObjects: List[OglObject]    = [umlObject for umlObject in umlObjects if isinstance(umlObject, OglObject)]
+        oglLinks:   Dict[str, OglLink] = self._cacheLinkIds(umlObjects)
+        nodeIds:    List[str]          = [self._cacheNodeId(oglObject) for oglObject in oglObjects]
+        if any(nodeId not in layout.positions for nodeId in nodeIds) or any(linkId not in layout.routes for linkId in oglLinks):
+            return False
+
+        for oglObject, nodeId in zip(oglObjects, nodeIds):
+            x, y = layout.positions[nodeId]
+            oglObject.SetPosition(x, y)
+        for linkId, oglLink in oglLinks.items():
+            points = layout.routes[linkId]
+            oglLink.setRoute(points[0], points[-1], points[1:-1])
+
+        return True
+
+    @staticmethod
+    def _cacheNodeId(oglObject: OglObject) -> str:
+        """
+        Shape ids change from one session to the other;  The model id and name are saved with the project
+        """
+        pyutObject = oglObject.getPyutObject()
+        if pyutObject is None:
+            return f'{type(oglObject).__name__}-{oglObject.GetID()}'
+
+        return f'{type(oglObject).__name__}-{pyutObject.getId()}-{pyutObject.getName()}'
+
+    def _cacheEdge(self, oglLink: OglLink) -> CacheEdge:
+
+        return (self._cacheNodeId(oglLink.getSourceShape()), self._cacheNodeId(oglLink.getDestinationShape()),
+                oglLink.getPyutObject().getType().name)
+
+    def _cacheLinkIds(self, umlObjects: List[OglObject]) -> Dict[str, OglLink]:
+        """
+        Links between the same shapes with the same type are told apart by their rank
+        """
+        linkIds: Dict[str, OglLink] = {}
+        for umlObject in umlObjects:
+            if isinstance(umlObject, OglLink):
+                source, destination, linkType = self._cacheEdge(umlObject)
+                baseId: str = f'{source}>{destination}:{linkType}'
+                rank:   int = 0
+                while f'{baseId}#{rank}' in linkIds:
+                    rank += 1
+                linkIds[f'{baseId}#{rank}'] = umlObject
+
+        return linkIds
+
     def getName(self) -> str:
         """
         Returns: the name of the plugin.
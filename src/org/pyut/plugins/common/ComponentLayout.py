@@ -0,0 +1,148 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from math import sqrt
+
+from os import cpu_count
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from pickle import PicklingError
+
+ComponentPosition  = Tuple[float, float]
+ComponentPositions = List[ComponentPosition]
+Components         = List[List[Hashable]]
+
+
+@dataclass
+class ComponentBox:
+    """
+    The bounding box of a laid out component
+    """
+    left:   float = 0.0
+    top:    float = 0.0
+    width:  float = 0.0
+    height: float = 0.0
+
+
+ComponentBoxes = List[ComponentBox]
+
+
+class ComponentLayout:
+    """
+    Helpers to lay out the connected components of a graph independently:
+    Find the components, run the layout of each one (in a process pool when the
+    graph is big enough to be worth it) and pack the resulting boxes.
+    """
+    PARALLEL_THRESHOLD: int = 200    # Number of nodes from which a process pool is used
+    DEFAULT_GAP:        int = 60     # Space between packed components
+
+    clsLogger: Logger = getLogger(__name__)
+
+    @staticmethod
+    def findComponents(nodes: List[Hashable], edges: Iterable[Tuple[Hashable, Hashable]]) -> Components:
+        """
+        Union-find over the edges.  Edges whose ends are not in `nodes` are ignored
+
+        Args:
+            nodes:  The graph nodes
+            edges:  (source, destination) pairs
+
+        Returns:  The components, in the order their first node appears in `nodes`;  Each
+        component keeps the relative order of its nodes
+        """
+        parents: Dict[Hashable, Hashable] = {node: node for node in nodes}
+
+        def find(node: Hashable) -> Hashable:
+            root: Hashable = node
+            while parents[root] is not root:
+                root = parents[root]
+            while parents[node] is not root:      # path compression
+                parents[node], node = root, parents[node]
+            return root
+
+        for source, destination in edges:
+            if source not in parents or destination not in parents:
+                continue
+            sourceRoot:      Hashable = find(source)
+            destinationRoot: Hashable = find(destination)
+            if sourceRoot is not destinationRoot:
+                parents[destinationRoot] = sourceRoot
+
+        byRoot: Dict[Hashable, List[Hashable]] = {}
+        for node in nodes:
+            byRoot.setdefault(find(node), []).append(node)
+
+        return list(byRoot.values())
+
+    @staticmethod
+    def pack(boxes: ComponentBoxes, gap: int = DEFAULT_GAP) -> ComponentPositions:
+        """
+        Shelf packing:  The boxes are sorted by decreasing height and put left to right on
+        shelves about as wide as the square root of the total area, so the result stays
+        roughly square.
+
+        Args:
+            boxes:  The component boxes
+            gap:    Space left between boxes
+
+        Returns:  The new top left corner of each box, relative to (0, 0), in the order of `boxes`
+        """
+        if len(boxes) == 0:
+            return []
+        totalArea:  float = sum((box.width + gap) * (box.height + gap) for box in boxes)
+        widest:     float = max(box.width for box in boxes)
+        shelfWidth: float = max(widest, sqrt(totalArea))
+
+        positions: ComponentPositions = [(0.0, 0.0)] * len(boxes)
+        x:           float = 0.0
+        y:           float = 0.0
+        shelfHeight: float = 0.0
+        for index in sorted(range(len(boxes)), key=lambda i: -boxes[i].height):
+            box: ComponentBox = boxes[index]
+            if x > 0 and x + box.width > shelfWidth:
+                x = 0.0
+                y += shelfHeight + gap
+                shelfHeight = 0.0
+            positions[index] = (x, y)
+            x += box.width + gap
+            shelfHeight = max(shelfHeight, box.height)
+
+        return positions
+
+    @staticmethod
+    def runLayouts(layoutFunction: Callable, jobs: List[Tuple], jobSizes: List[int], threshold: int = PARALLEL_THRESHOLD) -> List[Any]:
+        """
+        Run `layoutFunction(*job)` for every job.  When there is more than one job and
+        the total size reaches the threshold, the jobs run in a process pool;  The function
+        and its arguments must then be picklable.
+
+        Args:
+            layoutFunction: A module level function or a static method
+            jobs:           The argument tuples
+            jobSizes:       The number of nodes of each job
+            threshold:      Total number of nodes from which a process pool is used
+
+        Returns:  The results in the order of `jobs`
+        """
+        if len(jobs) > 1 and sum(jobSizes) >= threshold:
+            workers: int = min(len(jobs), cpu_count() or 1)
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(layoutFunction, *zip(*jobs)))
+            except (BrokenProcessPool, PicklingError, OSError) as e:
+                ComponentLayout.clsLogger.warning(f'Process pool not usable, laying out sequentially: {e}')
+
+        return [layoutFunction(*job) for job in jobs]
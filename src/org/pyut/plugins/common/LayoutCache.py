@@ -0,0 +1,192 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from hashlib import sha1
+
+from json import JSONDecodeError
+from json import dumps as jsonDumps
+from json import load as jsonLoad
+from json import dump as jsonDump
+
+from os import path as osPath
+from os import replace as osReplace
+
+CachePoint  = Tuple[float, float]
+CachePoints = List[CachePoint]
+
+CacheNode  = Tuple[str, float, float]       # (node id, width, height)
+CacheEdge  = Tuple[str, str, str]           # (source id, destination id, link type)
+
+CachedPositions = Dict[str, CachePoint]
+CachedRoutes    = Dict[str, CachePoints]
+
+
+@dataclass
+class CachedLayout:
+    """
+    A computed layout:  The top left corner of every node and, for every link,
+    its source anchor, bends and destination anchor.
+    """
+    positions: CachedPositions = field(default_factory=dict)
+    routes:    CachedRoutes    = field(default_factory=dict)
+
+
+class LayoutCache:
+    """
+    Layout results keyed by a canonical hash of the graph topology and of the
+    layout parameters.  A cache that has a file name is persisted next to the
+    project file, so reopening an unchanged project reapplies a layout instead
+    of computing it again.
+
+    Caches are shared per file;  Use `getCache()` rather than the constructor.
+    """
+    CACHE_FILE_SUFFIX: str = '.layout.json'
+    CACHE_VERSION:     int = 1
+    MAX_ENTRIES:       int = 32
+
+    clsLogger: Logger = getLogger(__name__)
+
+    _caches: Dict[str, 'LayoutCache'] = {}
+
+    def __init__(self, fileName: str = None, maxEntries: int = MAX_ENTRIES):
+        """
+
+        Args:
+            fileName:   Where the cache is persisted;  `None` keeps it in memory only
+            maxEntries: The least recently used layouts are dropped beyond that number
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._fileName:   str = fileName
+        self._maxEntries: int = maxEntries
+        self._entries:    OrderedDict = OrderedDict()
+
+        if fileName is not None:
+            self._load()
+
+    @classmethod
+    def getCache(cls, projectFileName: Optional[str]) -> 'LayoutCache':
+        """
+        Args:
+            projectFileName:    The project file;  `None` for a project that was never saved
+
+        Returns:  The cache of the project
+        """
+        fileName: Optional[str] = None if projectFileName is None else cls.cacheFileName(projectFileName)
+        cache: LayoutCache = cls._caches.get(fileName)
+        if cache is None:
+            cache = LayoutCache(fileName)
+            cls._caches[fileName] = cache
+
+        return cache
+
+    @classmethod
+    def cacheFileName(cls, projectFileName: str) -> str:
+        """
+        Returns:  The name of the cache file that goes with a project file
+        """
+        return f'{projectFileName}{LayoutCache.CACHE_FILE_SUFFIX}'
+
+    @staticmethod
+    def topologyKey(nodes: Iterable[CacheNode], edges: Iterable[CacheEdge], parameters: str = '') -> str:
+        """
+        Canonical hash of a graph;  The order in which nodes and edges are given does not matter
+
+        Args:
+            nodes:      (node id, width, height) of every node
+            edges:      (source id, destination id, link type) of every link
+            parameters: The layout name and its options
+
+        Returns:  A hexadecimal digest
+        """
+        canonical: str = jsonDumps([
+            parameters,
+            sorted((str(nodeId), round(width, 2), round(height, 2)) for nodeId, width, height in nodes),
+            sorted((str(source), str(destination), str(linkType)) for source, destination, linkType in edges)
+        ])
+        return sha1(canonical.encode('utf-8')).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[CachedLayout]:
+        """
+        Args:
+            key:  A topology key
+
+        Returns:  The cached layout or `None`
+        """
+        layout: CachedLayout = self._entries.get(key)
+        if layout is not None:
+            self._entries.move_to_end(key)
+
+        return layout
+
+    def put(self, key: str, layout: CachedLayout):
+        """
+        Store a layout and write the cache file
+
+        Args:
+            key:    A topology key
+            layout: The computed layout
+        """
+        self._entries[key] = layout
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxEntries:
+            self._entries.popitem(last=False)
+        self.save()
+
+    def clear(self):
+        self._entries.clear()
+
+    def save(self):
+        """
+        Write the cache file, if the cache has one.  A failure only costs a recomputation, so it is logged and ignored
+        """
+        if self._fileName is None:
+            return
+        document: Dict = {
+            'version': LayoutCache.CACHE_VERSION,
+            'layouts': {key: {'positions': layout.positions, 'routes': layout.routes} for key, layout in self._entries.items()}
+        }
+        temporaryName: str = f'{self._fileName}.tmp'
+        try:
+            with open(temporaryName, 'w') as writer:
+                jsonDump(document, writer)
+            osReplace(temporaryName, self._fileName)
+        except OSError as e:
+            self.logger.warning(f'Could not save layout cache {self._fileName}: {e}')
+
+    def _load(self):
+
+        if not osPath.exists(self._fileName):
+            return
+        try:
+            with open(self._fileName) as reader:
+                document: Dict = jsonLoad(reader)
+        except (OSError, JSONDecodeError) as e:
+            self.logger.warning(f'Ignoring unreadable layout cache {self._fileName}: {e}')
+            return
+        if document.get('version') != LayoutCache.CACHE_VERSION:
+            self.logger.info(f'Ignoring layout cache {self._fileName} with version {document.get("version")}')
+            return
+
+        for key, entry in document.get('layouts', {}).items():
+            positions: CachedPositions = {nodeId: (x, y) for nodeId, (x, y) in entry['positions'].items()}
+            routes:    CachedRoutes    = {linkId: [(x, y) for x, y in points] for linkId, points in entry['routes'].items()}
+            self._entries[key] = CachedLayout(positions=positions, routes=routes)
@@ -0,0 +1,239 @@
+
+from logging import Logger
+from logging import getLogger
+
+from io import StringIO
+
+from typing import List
+from typing import Set
+from typing import TextIO
+from typing import Tuple
+
+from org.pyut.general.PyutVersion import PyutVersion
+from org.pyut.general.exceptions.UnsupportedOperation import UnsupportedOperation
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import RecordPoints
+
+GMLPoint  = Tuple[float, float]
+GMLPoints = List[GMLPoint]
+EdgeKey   = Tuple[int, int]
+
+
+class GMLWriter:
+    """
+    Formats nodes and edges as GML.  It knows nothing about the UI;  `GMLExporter`
+    feeds it from OGL objects and `translateDocument()` feeds it from the records of
+    a document read without UI.
+
+    The GML is written in a single pass, one write per node or edge, either to the
+    text stream given to the translate methods or to an in memory buffer read back
+    through `gml`.
+
+    Usage::
+        gmlWriter: GMLWriter = GMLWriter()
+        gmlWriter.compact = True
+        with open('diagram.gml', 'w') as writer:
+            gmlWriter.translateDocument(documentModel, writer=writer)
+    """
+    GRAPH_TOKEN: str = 'graph'
+
+    ID_TOKEN:    str = 'id'
+    LABEL_TOKEN: str = 'label'
+    NODE_TOKEN:  str = 'node'
+    EDGE_TOKEN:  str = 'edge'
+
+    SOURCE_ID_TOKEN: str = 'source'
+    TARGET_ID_TOKEN: str = 'target'
+
+    GRAPHICS_TOKEN: str = 'graphics'
+    START_TOKEN:    str = '['
+    END_TOKEN:      str = ']'
+
+    QUOTE_TOKEN: str = '"'
+
+    LINE_DEFINITION_TOKEN:  str = 'Line'
+    POINT_DEFINITION_TOKEN: str = 'point'
+
+    X_POSITION_TOKEN: str = 'x'
+    Y_POSITION_TOKEN: str = 'y'
+    Z_POSITION_TOKEN: str = 'z'
+    WIDTH_TOKEN:      str = 'w'
+    HEIGHT_TOKEN:     str = 'h'
+    DEPTH_TOKEN:      str = 'd'
+
+    TAB:           str = '\t'
+    INDENT_LEVELS: int = 6
+
+    def __init__(self):
+
+        self.logger:   Logger = getLogger(__name__)
+        self._gml:     str    = ''
+
+        self._prettyPrint: bool = True
+        self._compact:     bool = False
+
+        self._indents:   List[str] = []
+        self._separator: str       = ''
+        self._setIndentation()
+
+    def translateDocument(self, documentModel: DocumentModel, writer: TextIO = None):
+        """
+        Generate the GML of a document read without UI;  Nodes are identified by their data model id
+
+        Args:
+            documentModel:  A class or use case diagram
+            writer:         Where to stream the GML;  If `None` it is kept in `gml`
+        """
+        output: TextIO = self._startOutput(writer)
+
+        self._writeGraphStart(output, graphName=documentModel.title)
+        for shapeId, shape in documentModel.shapes.items():
+            self._writeNode(output, shapeId, shape.pyutObject.getName(), shape.x, shape.y, shape.width, shape.height)
+
+        edgeKeys: Set[EdgeKey] = set()
+        for edgeId, link in enumerate(documentModel.links):
+            edgeKey: EdgeKey = (link.sourceId, link.destinationId)
+            if edgeKey not in edgeKeys:
+                points: RecordPoints = [link.sourceAnchor] + link.controlPoints + [link.destinationAnchor]
+                self._writeEdge(output, edgeId, link.sourceId, link.destinationId, points)
+                edgeKeys.add(edgeKey)
+
+        self._writeGraphTermination(output)
+        self._endOutput(output, writer)
+
+    @property
+    def gml(self):
+        return self._gml
+
+    @gml.setter
+    def gml(self, theNewValue):
+        raise UnsupportedOperation('gml is a read-only property')
+
+    @property
+    def prettyPrint(self):
+        return self._prettyPrint
+
+    @prettyPrint.setter
+    def prettyPrint(self, theNewValue):
+        self._prettyPrint = theNewValue
+        self._setIndentation()
+
+    @property
+    def compact(self) -> bool:
+        """
+        `True` writes every node and edge on a single line without indentation
+        """
+        return self._compact
+
+    @compact.setter
+    def compact(self, theNewValue: bool):
+        self._compact = theNewValue
+        self._setIndentation()
+
+    def write(self, pathToFile: str):
+
+        with open(pathToFile, 'w') as writer:
+            writer.write(self._gml)
+
+    def _setIndentation(self):
+
+        if self._prettyPrint is True and self._compact is False:
+            self._indents = [GMLWriter.TAB * level for level in range(GMLWriter.INDENT_LEVELS)]
+        else:
+            self._indents = [''] * GMLWriter.INDENT_LEVELS
+
+        self._separator = ' ' if self._compact is True else '\n'
+
+    def _startOutput(self, writer: TextIO) -> TextIO:
+
+        if writer is None:
+            return StringIO()
+        return writer
+
+    def _endOutput(self, output: TextIO, writer: TextIO):
+
+        if writer is None:
+            self._gml = output.getvalue()
+        else:
+            self._gml = ''
+
+    def _writeGraphStart(self, output: TextIO, graphName: str = 'DefaultGraphName'):
+
+        ind: List[str] = self._indents
+        sep: str       = self._separator
+        output.write(
+            f'{GMLWriter.GRAPH_TOKEN} {GMLWriter.START_TOKEN}{sep}'
+            f'{ind[1]}directed 1{sep}'
+            f'{ind[1]}version  1.0{sep}'
+            f'{ind[1]}label "GML for {graphName}"{sep}'
+            f'{ind[1]}comment "Generated by Pyut Version {PyutVersion.getPyUtVersion()}"\n'
+        )
+
+    def _writeGraphTermination(self, output: TextIO):
+        output.write(GMLWriter.END_TOKEN)
+
+    def _writeNode(self, output: TextIO, nodeId: int, label: str, x: float, y: float, w: float, h: float):
+
+        ind: List[str] = self._indents
+        sep: str       = self._separator
+        z = 0
+        d = 0
+        output.write(
+            f'{ind[1]}{GMLWriter.NODE_TOKEN} {GMLWriter.START_TOKEN}{sep}'
+            f'{ind[2]}{GMLWriter.ID_TOKEN} {nodeId}{sep}'
+            f'{ind[2]}{GMLWriter.LABEL_TOKEN} "{label}"{sep}'
+
+            f'{ind[2]}{GMLWriter.GRAPHICS_TOKEN} {GMLWriter.START_TOKEN}{sep}'
+            f'{ind[3]}{GMLWriter.X_POSITION_TOKEN} {x}{sep}'
+            f'{ind[3]}{GMLWriter.Y_POSITION_TOKEN} {y}{sep}'
+            f'{ind[3]}{GMLWriter.Z_POSITION_TOKEN} {z}{sep}'
+            f'{ind[3]}{GMLWriter.WIDTH_TOKEN} {w}{sep}'
+            f'{ind[3]}{GMLWriter.HEIGHT_TOKEN} {h}{sep}'
+            f'{ind[3]}{GMLWriter.DEPTH_TOKEN} {d}{sep}'
+            f'{ind[3]}type "rectangle"{sep}'
+            f'{ind[3]}width 0.12{sep}'
+            f'{ind[3]}fill "#ff0000"{sep}'
+            f'{ind[3]}outline "#000000"{sep}'
+            f'{ind[2]}{GMLWriter.END_TOKEN}{sep}'
+
+            f'{ind[1]}{GMLWriter.END_TOKEN}\n'
+        )
+
+    def _writeEdge(self, output: TextIO, edgeId: int, sourceId: int, targetId: int, points: GMLPoints):
+        """
+        Args:
+            output:     Where to write
+            edgeId:     The edge id
+            sourceId:   The source node id
+            targetId:   The target node id
+            points:     The source anchor, the control points and the destination anchor
+        """
+        ind: List[str] = self._indents
+        sep: str       = self._separator
+        z:   float     = 0.0
+
+        pointsGml: str = ''.join(
+            f'{ind[4]}{GMLWriter.POINT_DEFINITION_TOKEN} {GMLWriter.START_TOKEN}{sep}'
+            f'{ind[5]}{GMLWriter.X_POSITION_TOKEN} {point[0]}{sep}'
+            f'{ind[5]}{GMLWriter.Y_POSITION_TOKEN} {point[1]}{sep}'
+            f'{ind[5]}{GMLWriter.Z_POSITION_TOKEN} {z}{sep}'
+            f'{ind[4]}{GMLWriter.END_TOKEN}{sep}'
+            for point in points
+        )
+        output.write(
+            f'{ind[1]}{GMLWriter.EDGE_TOKEN} {GMLWriter.START_TOKEN}{sep}'
+            f'{ind[2]}{GMLWriter.ID_TOKEN} {edgeId}{sep}'
+            f'{ind[2]}{GMLWriter.SOURCE_ID_TOKEN} {sourceId}{sep}'
+            f'{ind[2]}{GMLWriter.TARGET_ID_TOKEN} {targetId}{sep}'
+
+            f'{ind[2]}{GMLWriter.GRAPHICS_TOKEN} {GMLWriter.START_TOKEN}{sep}'
+            f'{ind[3]}type "line"{sep}'
+            f'{ind[3]}arrow "last"{sep}'
+            f'{ind[3]}{GMLWriter.LINE_DEFINITION_TOKEN} {GMLWriter.START_TOKEN}{sep}'
+            f'{pointsGml}'
+            f'{ind[3]}{GMLWriter.END_TOKEN}{sep}'
+            f'{ind[2]}{GMLWriter.END_TOKEN}{sep}'
+
+            f'{ind[1]}{GMLWriter.END_TOKEN}\n'
+        )
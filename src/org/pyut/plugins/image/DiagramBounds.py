@@ -0,0 +1,99 @@
+
+from typing import List
+from typing import Set
+from typing import cast
+
+from org.pyut.MiniOgl.Diagram import Diagram
+from org.pyut.MiniOgl.LinePoint import LinePoint
+from org.pyut.MiniOgl.LineShape import LineShape
+from org.pyut.MiniOgl.Shape import Shape
+
+from org.pyut.plugins.image.TileGrid import Bounds
+from org.pyut.plugins.image.TileGrid import TileGrid
+
+Shapes = List[Shape]
+
+
+class DiagramBounds:
+    """
+    The visible shapes of a diagram, in drawing order, with their bounding boxes.
+    The boxes have a margin for the pens, the arrow heads and the text that
+    overruns its shape.
+    """
+    SHAPE_MARGIN: int = 20         # Diagram units
+
+    def __init__(self, diagram: Diagram, selection: Shapes = None):
+        """
+        Args:
+            diagram:    The diagram to draw
+            selection:  Only keep these shapes, their children and the points of their lines;  All the
+                        shapes when `None`
+        """
+        self._shapes:     Shapes       = []
+        self._boundsList: List[Bounds] = []
+
+        selected: Set[int] = cast(Set[int], None) if selection is None else {id(shape) for shape in selection}
+        for shape in diagram.GetShapes():
+            if shape.IsVisible() and (selected is None or DiagramBounds._isSelected(shape, selected)):
+                self._shapes.append(shape)
+                self._boundsList.append(DiagramBounds.shapeBounds(shape))
+
+        left, top, right, bottom = TileGrid.unionBounds(self._boundsList)
+
+        self._left:   float = left
+        self._top:    float = top
+        self._width:  float = max(1.0, right - left)
+        self._height: float = max(1.0, bottom - top)
+
+    @property
+    def shapes(self) -> Shapes:
+        return self._shapes
+
+    @property
+    def boundsList(self) -> List[Bounds]:
+        return self._boundsList
+
+    @property
+    def left(self) -> float:
+        return self._left
+
+    @property
+    def top(self) -> float:
+        return self._top
+
+    @property
+    def width(self) -> float:
+        return self._width
+
+    @property
+    def height(self) -> float:
+        return self._height
+
+    @classmethod
+    def _isSelected(cls, shape: Shape, selected: Set[int]) -> bool:
+
+        if isinstance(shape, LinePoint) and shape.GetParent() is None:
+            return any(id(line) in selected for line in shape.GetLines())
+        while shape is not None:
+            if id(shape) in selected:
+                return True
+            shape = shape.GetParent()
+        return False
+
+    @classmethod
+    def shapeBounds(cls, shape: Shape) -> Bounds:
+
+        margin: int = DiagramBounds.SHAPE_MARGIN
+        if isinstance(shape, LineShape):
+            points = shape.GetSegments()
+            left   = min(point[0] for point in points)
+            top    = min(point[1] for point in points)
+            right  = max(point[0] for point in points)
+            bottom = max(point[1] for point in points)
+        else:
+            left, top = shape.GetTopLeft()
+            width, height = shape.GetSize()
+            right  = left + width
+            bottom = top + height
+
+        return left - margin, top - margin, right + margin, bottom + margin
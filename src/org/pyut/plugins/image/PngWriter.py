@@ -0,0 +1,106 @@
+
+from logging import Logger
+from logging import getLogger
+
+from struct import pack
+
+from typing import BinaryIO
+
+from zlib import compressobj
+from zlib import crc32
+
+
+class PngWriter:
+    """
+    Writes an RGB PNG a band of scanlines at a time.  Only the scanlines handed to
+    `writeRows()` and the pending compressed bytes are in memory, so the image size
+    does not bound the memory use;  The caller decides how many rows it buffers.
+
+    Usage::
+        with open('diagram.png', 'wb') as stream:
+            with PngWriter(stream, width=width, height=height) as pngWriter:
+                pngWriter.writeRows(rgbBand)
+    """
+    SIGNATURE:        bytes = b'\x89PNG\r\n\x1a\n'
+    BIT_DEPTH:        int   = 8
+    COLOR_TYPE_RGB:   int   = 2
+    BYTES_PER_PIXEL:  int   = 3
+    FILTER_TYPE_NONE: bytes = b'\x00'
+
+    IDAT_CHUNK_SIZE:   int = 64 * 1024
+    COMPRESSION_LEVEL: int = 6
+
+    def __init__(self, stream: BinaryIO, width: int, height: int):
+        """
+        Args:
+            stream: A binary stream opened for writing
+            width:  Image width in pixels
+            height: Image height in pixels
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError(f'Bad PNG size: {width}x{height}')
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._stream:      BinaryIO = stream
+        self._width:       int      = width
+        self._height:      int      = height
+        self._stride:      int      = width * PngWriter.BYTES_PER_PIXEL
+        self._rowsWritten: int      = 0
+        self._pending:     bytes    = b''
+
+        self._compressor = compressobj(PngWriter.COMPRESSION_LEVEL)
+
+        self._stream.write(PngWriter.SIGNATURE)
+        header: bytes = pack('>IIBBBBB', width, height, PngWriter.BIT_DEPTH, PngWriter.COLOR_TYPE_RGB, 0, 0, 0)
+        self._writeChunk(b'IHDR', header)
+
+    def __enter__(self) -> 'PngWriter':
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        if exceptionType is None:
+            self.close()
+
+    @property
+    def rowsWritten(self) -> int:
+        return self._rowsWritten
+
+    def writeRows(self, rgbData: bytes):
+        """
+        Args:
+            rgbData:  Whole scanlines, top to bottom, 3 bytes per pixel
+        """
+        rowCount, remainder = divmod(len(rgbData), self._stride)
+        if remainder != 0:
+            raise ValueError(f'Row data is not a multiple of the scanline size {self._stride}')
+        if self._rowsWritten + rowCount > self._height:
+            raise ValueError(f'Too many rows;  The image is {self._height} rows high')
+
+        stride: int = self._stride
+        filtered: bytes = b''.join(PngWriter.FILTER_TYPE_NONE + rgbData[offset:offset + stride] for offset in range(0, len(rgbData), stride))
+
+        self._pending += self._compressor.compress(filtered)
+        self._rowsWritten += rowCount
+        while len(self._pending) >= PngWriter.IDAT_CHUNK_SIZE:
+            self._writeChunk(b'IDAT', self._pending[:PngWriter.IDAT_CHUNK_SIZE])
+            self._pending = self._pending[PngWriter.IDAT_CHUNK_SIZE:]
+
+    def close(self):
+        """
+        Flush the compressed data and end the image;  Does not close the stream
+        """
+        if self._rowsWritten != self._height:
+            raise ValueError(f'Only {self._rowsWritten} of {self._height} rows were written')
+
+        self._pending += self._compressor.flush()
+        self._writeChunk(b'IDAT', self._pending)
+        self._pending = b''
+        self._writeChunk(b'IEND', b'')
+
+    def _writeChunk(self, chunkType: bytes, data: bytes):
+
+        self._stream.write(pack('>I', len(data)))
+        self._stream.write(chunkType)
+        self._stream.write(data)
+        self._stream.write(pack('>I', crc32(data, crc32(chunkType))))
@@ -0,0 +1,399 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import TextIO
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from math import atan2
+from math import cos
+from math import degrees
+from math import pi
+from math import radians
+from math import sin
+
+from xml.sax.saxutils import escape
+
+SvgPoint     = Tuple[float, float]
+SvgPoints    = List[SvgPoint]
+StyleKey     = Tuple
+TextExtent   = Tuple[int, int]
+TextMeasurer = Callable[[object, str], TextExtent]
+
+
+class SvgDC:
+    """
+    A recording device context;  It offers the subset of the `wx.DC` drawing
+    methods that the MiniOgl and OGL shapes use, so the regular `Shape.Draw()`
+    hierarchy renders straight into SVG.
+
+    Elements are written to the stream as they are drawn.  Pens, brushes and
+    fonts become CSS classes and polygons with the same geometry, like arrow
+    heads, become a single symbol placed with `<use>`;  Both are written once,
+    at the end of the document, by `close()`.
+
+    Text is measured by the `measurer` given to the constructor;  Extents are
+    cached per font and text.
+
+    Usage::
+        svgDC: SvgDC = SvgDC(writer, width=800, height=600, measurer=measurer)
+        svgDC.SetFont(font)
+        shape.Draw(svgDC)
+        svgDC.close()
+    """
+    #
+    # Same values as the wx pen, brush and font constants;  Repeated here so that
+    # the backend does not need a display
+    #
+    STYLE_SOLID:       int = 100
+    STYLE_DOT:         int = 101
+    STYLE_LONG_DASH:   int = 102
+    STYLE_SHORT_DASH:  int = 103
+    STYLE_DOT_DASH:    int = 104
+    STYLE_TRANSPARENT: int = 106
+
+    FONT_STYLE_ITALIC: int = 93
+    FONT_STYLE_SLANT:  int = 94
+    FONT_WEIGHT_BOLD:  int = 92         # Old style weight;  New style weights are numeric
+    FONT_WEIGHT_SEMI_BOLD: int = 600
+
+    FONT_FAMILIES: Dict[int, str] = {
+        71: 'fantasy',
+        72: 'serif',
+        73: 'cursive',
+        74: 'sans-serif',
+        75: 'monospace',
+        76: 'monospace',
+    }
+    DEFAULT_FONT_FAMILY: str = 'sans-serif'
+
+    DASH_ARRAYS: Dict[int, str] = {
+        STYLE_DOT:        '1 3',
+        STYLE_LONG_DASH:  '8 4',
+        STYLE_SHORT_DASH: '4 4',
+        STYLE_DOT_DASH:   '8 3 1 3',
+    }
+
+    TEXT_ASCENT_RATIO: float = 0.8       # Baseline position in the text height;  wx places text by its top
+    SYMBOL_PRECISION:  int   = 2
+
+    def __init__(self, writer: TextIO, width: float, height: float, measurer: TextMeasurer, originX: float = 0.0, originY: float = 0.0):
+        """
+        Args:
+            writer:     Where the SVG is streamed
+            width:      Document width in diagram units
+            height:     Document height in diagram units
+            measurer:   Returns the (width, height) of a text drawn with a font
+            originX:    Diagram x coordinate at the left of the document
+            originY:    Diagram y coordinate at the top of the document
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._writer:   TextIO       = writer
+        self._measurer: TextMeasurer = measurer
+
+        self._pen   = None
+        self._brush = None
+        self._font  = None
+        self._textForeground = None
+        self._textBackground = None
+        self._backgroundMode: int = SvgDC.STYLE_TRANSPARENT
+
+        self._strokeKey: StyleKey = ('none', 1, '')
+        self._fillKey:   str      = 'none'
+        self._fontKey:   StyleKey = (SvgDC.DEFAULT_FONT_FAMILY, '', 10, 'normal', 'normal')
+        self._textColor: str      = '#000000'
+
+        self._shapeClass: str = ''          # Class of the current pen and brush;  Empty when it must be looked up
+        self._lineClass:  str = ''          # Class of the current pen without fill
+        self._textClass:  str = ''
+
+        self._styleClasses: Dict[StyleKey, str]          = {}
+        self._symbols:      Dict[Tuple, str]             = {}
+        self._extents:      Dict[Tuple[StyleKey, str], TextExtent] = {}
+
+        self._clipCount:   int  = 0
+        self._clipOpen:    bool = False
+        self._closed:      bool = False
+
+        writer.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{width:.0f}" height="{height:.0f}" viewBox="{originX:.2f} {originY:.2f} {width:.2f} {height:.2f}">\n'
+        )
+
+    @property
+    def styleCount(self) -> int:
+        return len(self._styleClasses)
+
+    @property
+    def symbolCount(self) -> int:
+        return len(self._symbols)
+
+    def close(self):
+        """
+        Write the style sheet and the symbols, then end the document;  Does not close the stream
+        """
+        if self._closed is True:
+            return
+        self.DestroyClippingRegion()
+
+        writer: TextIO = self._writer
+        writer.write('<defs>\n<style type="text/css">\n')
+        for styleKey, className in self._styleClasses.items():
+            writer.write(f'.{className}{{{self._toCss(styleKey)}}}\n')
+        writer.write('</style>\n')
+        for canonicalPoints, symbolId in self._symbols.items():
+            writer.write(f'<path id="{symbolId}" d="{self._pathData(list(canonicalPoints))} Z"/>\n')
+        writer.write('</defs>\n</svg>\n')
+
+        self._closed = True
+
+    #
+    #  wx.DC state
+    #
+    def SetPen(self, pen):
+
+        if pen is self._pen:
+            return
+        self._pen = pen
+        if pen.GetStyle() == SvgDC.STYLE_TRANSPARENT:
+            self._strokeKey = ('none', 1, '')
+        else:
+            self._strokeKey = (self._toColor(pen.GetColour()), max(1, pen.GetWidth()), SvgDC.DASH_ARRAYS.get(pen.GetStyle(), ''))
+        self._shapeClass = ''
+        self._lineClass  = ''
+
+    def GetPen(self):
+        return self._pen
+
+    def SetBrush(self, brush):
+
+        if brush is self._brush:
+            return
+        self._brush = brush
+        if brush.GetStyle() == SvgDC.STYLE_TRANSPARENT:
+            self._fillKey = 'none'
+        else:
+            self._fillKey = self._toColor(brush.GetColour())
+        self._shapeClass = ''
+
+    def GetBrush(self):
+        return self._brush
+
+    def SetFont(self, font):
+
+        if font is self._font:
+            return
+        self._font = font
+        self._fontKey = self._toFontKey(font)
+        self._textClass = ''
+
+    def GetFont(self):
+        return self._font
+
+    def SetTextForeground(self, colour):
+
+        self._textForeground = colour
+        textColor: str = self._toColor(colour)
+        if textColor != self._textColor:
+            self._textColor = textColor
+            self._textClass = ''
+
+    def SetTextBackground(self, colour):
+        self._textBackground = colour
+
+    def SetBackgroundMode(self, mode: int):
+        self._backgroundMode = mode
+
+    def SetBackground(self, brush):
+        pass
+
+    def Clear(self):
+        pass
+
+    def GetTextExtent(self, text: str) -> TextExtent:
+
+        key = (self._fontKey, text)
+        extent: TextExtent = self._extents.get(key)
+        if extent is None:
+            extent = self._measurer(self._font, text)
+            self._extents[key] = extent
+        return extent
+
+    def GetCharHeight(self) -> int:
+        return self.GetTextExtent('M')[1]
+
+    def SetClippingRegion(self, x: float, y: float, w: float, h: float):
+
+        self.DestroyClippingRegion()
+        clipId: str = f'c{self._clipCount}'
+        self._clipCount += 1
+        self._writer.write(f'<clipPath id="{clipId}"><rect x="{x:.2f}" y="{y:.2f}" width="{w:.2f}" height="{h:.2f}"/></clipPath>'
+                           f'<g clip-path="url(#{clipId})">\n')
+        self._clipOpen = True
+
+    def DestroyClippingRegion(self):
+
+        if self._clipOpen is True:
+            self._writer.write('</g>\n')
+            self._clipOpen = False
+
+    #
+    #  wx.DC drawing
+    #
+    def DrawLine(self, x1: float, y1: float, x2: float, y2: float):
+        self._writer.write(f'<line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" class="{self._currentLineClass()}"/>\n')
+
+    def DrawLines(self, points: SvgPoints, xoffset: float = 0, yoffset: float = 0):
+
+        pointsText: str = ' '.join(f'{point[0] + xoffset:.2f},{point[1] + yoffset:.2f}' for point in points)
+        self._writer.write(f'<polyline points="{pointsText}" class="{self._currentLineClass()}"/>\n')
+
+    def DrawSpline(self, points: SvgPoints):
+        """
+        Same quadratic B-spline as wx:  The curve goes through the middle of the inner segments
+        """
+        if len(points) < 3:
+            self.DrawLines(points)
+            return
+
+        middles: SvgPoints = [((points[i][0] + points[i + 1][0]) / 2, (points[i][1] + points[i + 1][1]) / 2) for i in range(len(points) - 1)]
+        pathData: List[str] = [f'M{points[0][0]:.2f} {points[0][1]:.2f} L{middles[0][0]:.2f} {middles[0][1]:.2f}']
+        for i in range(1, len(points) - 1):
+            pathData.append(f'Q{points[i][0]:.2f} {points[i][1]:.2f} {middles[i][0]:.2f} {middles[i][1]:.2f}')
+        pathData.append(f'L{points[-1][0]:.2f} {points[-1][1]:.2f}')
+
+        self._writer.write(f'<path d="{" ".join(pathData)}" class="{self._currentLineClass()}"/>\n')
+
+    def DrawPolygon(self, points: SvgPoints, xoffset: float = 0, yoffset: float = 0):
+        """
+        Polygons with the same shape (arrow heads, diamonds) share a symbol;  Each one is
+        placed by its first point and rotated by the direction of its first side
+        """
+        if len(points) < 2:
+            return
+        x0: float = points[0][0] + xoffset
+        y0: float = points[0][1] + yoffset
+        angle: float = atan2(points[1][1] + yoffset - y0, points[1][0] + xoffset - x0)
+
+        cosA: float = cos(-angle)
+        sinA: float = sin(-angle)
+        precision: int = SvgDC.SYMBOL_PRECISION
+        canonicalPoints: Tuple = tuple(
+            (round((point[0] + xoffset - x0) * cosA - (point[1] + yoffset - y0) * sinA, precision) + 0.0,
+             round((point[0] + xoffset - x0) * sinA + (point[1] + yoffset - y0) * cosA, precision) + 0.0)
+            for point in points
+        )
+        symbolId: str = self._symbols.get(canonicalPoints)
+        if symbolId is None:
+            symbolId = f'p{len(self._symbols)}'
+            self._symbols[canonicalPoints] = symbolId
+
+        self._writer.write(f'<use xlink:href="#{symbolId}" transform="translate({x0:.2f},{y0:.2f}) rotate({degrees(angle):.2f})" '
+                           f'class="{self._currentShapeClass()}"/>\n')
+
+    def DrawRectangle(self, x: float, y: float, width: float, height: float):
+        self._writer.write(f'<rect x="{x:.2f}" y="{y:.2f}" width="{width:.2f}" height="{height:.2f}" class="{self._currentShapeClass()}"/>\n')
+
+    def DrawEllipse(self, x: float, y: float, width: float, height: float):
+
+        rx: float = width / 2
+        ry: float = height / 2
+        self._writer.write(f'<ellipse cx="{x + rx:.2f}" cy="{y + ry:.2f}" rx="{rx:.2f}" ry="{ry:.2f}" class="{self._currentShapeClass()}"/>\n')
+
+    def DrawCircle(self, x: float, y: float, radius: float):
+        self._writer.write(f'<circle cx="{x:.2f}" cy="{y:.2f}" r="{radius:.2f}" class="{self._currentShapeClass()}"/>\n')
+
+    def DrawArc(self, x1: float, y1: float, x2: float, y2: float, xc: float, yc: float):
+        """
+        Counter-clockwise from (x1, y1) to (x2, y2), filled as a pie like wx does
+        """
+        radius: float = ((x1 - xc) ** 2 + (y1 - yc) ** 2) ** 0.5
+        start:  float = atan2(yc - y1, x1 - xc)
+        end:    float = atan2(yc - y2, x2 - xc)
+        self._writeArc(xc, yc, radius, radius, x1, y1, x2, y2, (end - start) % (2 * pi))
+
+    def DrawEllipticArc(self, x: float, y: float, width: float, height: float, start: float, end: float):
+        """
+        Counter-clockwise from the `start` to the `end` angle, in degrees, 0 at 3 o'clock
+        """
+        rx: float = width / 2
+        ry: float = height / 2
+        cx: float = x + rx
+        cy: float = y + ry
+        x1: float = cx + rx * cos(radians(start))
+        y1: float = cy - ry * sin(radians(start))
+        x2: float = cx + rx * cos(radians(end))
+        y2: float = cy - ry * sin(radians(end))
+        self._writeArc(cx, cy, rx, ry, x1, y1, x2, y2, radians((end - start) % 360))
+
+    def DrawText(self, text: str, x: float, y: float):
+
+        if text == '':
+            return
+        baseline: float = y + self.GetTextExtent(text)[1] * SvgDC.TEXT_ASCENT_RATIO
+        self._writer.write(f'<text x="{x:.2f}" y="{baseline:.2f}" class="{self._currentTextClass()}">{escape(text)}</text>\n')
+
+    def _writeArc(self, cx: float, cy: float, rx: float, ry: float, x1: float, y1: float, x2: float, y2: float, span: float):
+
+        largeArc: int = 1 if span > pi else 0
+        self._writer.write(f'<path d="M{cx:.2f} {cy:.2f} L{x1:.2f} {y1:.2f} A{rx:.2f} {ry:.2f} 0 {largeArc} 0 {x2:.2f} {y2:.2f} Z" '
+                           f'class="{self._currentShapeClass()}"/>\n')
+
+    def _currentShapeClass(self) -> str:
+
+        if self._shapeClass == '':
+            self._shapeClass = self._styleClass(('shape', self._strokeKey, self._fillKey))
+        return self._shapeClass
+
+    def _currentLineClass(self) -> str:
+
+        if self._lineClass == '':
+            self._lineClass = self._styleClass(('shape', self._strokeKey, 'none'))
+        return self._lineClass
+
+    def _currentTextClass(self) -> str:
+
+        if self._textClass == '':
+            self._textClass = self._styleClass(('text', self._fontKey, self._textColor))
+        return self._textClass
+
+    def _styleClass(self, styleKey: StyleKey) -> str:
+
+        className: str = self._styleClasses.get(styleKey)
+        if className is None:
+            className = f'{styleKey[0][0]}{len(self._styleClasses)}'
+            self._styleClasses[styleKey] = className
+        return className
+
+    def _toCss(self, styleKey: StyleKey) -> str:
+
+        if styleKey[0] == 'text':
+            family, faceName, size, weight, style = styleKey[1]
+            fontFamily: str = f"'{faceName}',{family}" if faceName != '' else family
+            return f'font-family:{fontFamily};font-size:{size}pt;font-weight:{weight};font-style:{style};fill:{styleKey[2]};stroke:none'
+
+        stroke, width, dashArray = styleKey[1]
+        css: str = f'stroke:{stroke};stroke-width:{width};fill:{styleKey[2]}'
+        if dashArray != '':
+            css = f'{css};stroke-dasharray:{dashArray}'
+        return css
+
+    def _toColor(self, colour) -> str:
+        return f'#{colour.Red():02x}{colour.Green():02x}{colour.Blue():02x}'
+
+    def _toFontKey(self, font) -> StyleKey:
+
+        family: str = SvgDC.FONT_FAMILIES.get(font.GetFamily(), SvgDC.DEFAULT_FONT_FAMILY)
+        weight: int = font.GetWeight()
+        bold:   bool = weight == SvgDC.FONT_WEIGHT_BOLD or weight >= SvgDC.FONT_WEIGHT_SEMI_BOLD
+        italic: bool = font.GetStyle() in (SvgDC.FONT_STYLE_ITALIC, SvgDC.FONT_STYLE_SLANT)
+
+        return family, escape(font.GetFaceName(), {"'": '', '"': ''}), font.GetPointSize(), 'bold' if bold else 'normal', 'italic' if italic else 'normal'
+
+    def _pathData(self, points: SvgPoints) -> str:
+        return 'M' + ' L'.join(f'{x:g} {y:g}' for x, y in points)
@@ -0,0 +1,75 @@
+
+from typing import TextIO
+
+from logging import Logger
+from logging import getLogger
+
+from time import perf_counter
+
+from wx import BLACK
+from wx import BLACK_PEN
+from wx import WHITE_BRUSH
+
+from wx import Bitmap
+from wx import Font
+from wx import MemoryDC
+
+from org.pyut.MiniOgl.DiagramFrame import DiagramFrame
+
+from org.pyut.plugins.image.DiagramBounds import DiagramBounds
+from org.pyut.plugins.image.DiagramBounds import Shapes
+from org.pyut.plugins.image.SvgDC import SvgDC
+from org.pyut.plugins.image.SvgDC import TextExtent
+
+
+class SvgExporter:
+    """
+    Exports the diagram of a frame as SVG by drawing its shapes on an `SvgDC`;  Every
+    shape type that the frame can display is exported, including notes, use cases and
+    sequence diagrams.
+
+    Usage::
+        with open('diagram.svg', 'w') as writer:
+            SvgExporter(umlFrame).write(writer)
+    """
+    def __init__(self, diagramFrame: DiagramFrame, selection: Shapes = None):
+        """
+        Args:
+            diagramFrame:   The frame whose diagram is exported
+            selection:      The shapes to export;  The whole diagram when `None`
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramFrame: DiagramFrame = diagramFrame
+        self._selection:    Shapes       = selection
+
+        self._measureDC: MemoryDC = MemoryDC()
+        self._measureDC.SelectObject(Bitmap(1, 1))
+
+    def write(self, writer: TextIO):
+        """
+        Args:
+            writer:  Where to stream the SVG
+        """
+        startTime: float = perf_counter()
+
+        diagramBounds: DiagramBounds = DiagramBounds(self._diagramFrame.GetDiagram(), selection=self._selection)
+        svgDC: SvgDC = SvgDC(writer, width=diagramBounds.width, height=diagramBounds.height, measurer=self._measureText,
+                             originX=diagramBounds.left, originY=diagramBounds.top)
+
+        svgDC.SetFont(self._diagramFrame.GetDefaultFont())
+        svgDC.SetPen(BLACK_PEN)
+        svgDC.SetBrush(WHITE_BRUSH)
+        svgDC.SetTextForeground(BLACK)
+
+        for shape in diagramBounds.shapes:
+            shape.Draw(svgDC)
+
+        svgDC.close()
+
+        self.logger.info(f'{len(diagramBounds.shapes)} shapes, {svgDC.styleCount} styles, {svgDC.symbolCount} symbols in {perf_counter() - startTime:.3f} seconds')
+
+    def _measureText(self, font: Font, text: str) -> TextExtent:
+
+        self._measureDC.SetFont(font)
+        return self._measureDC.GetTextExtent(text)
@@ -0,0 +1,125 @@
+
+from math import floor
+
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+from dataclasses import dataclass
+
+Bounds    = Tuple[float, float, float, float]    # left, top, right, bottom
+TileKey   = Tuple[int, int]                      # column, row
+TileIndex = Dict[TileKey, List[int]]
+
+
+@dataclass
+class Tile:
+    """
+    A tile of the output image;  Coordinates are in output pixels
+    """
+    column: int = 0
+    row:    int = 0
+    x:      int = 0
+    y:      int = 0
+    width:  int = 0
+    height: int = 0
+
+
+class TileGrid:
+    """
+    Cuts an image of `width` x `height` pixels into tiles of `tileSize` pixels;  The
+    tiles of the last column and row are clipped to the image.
+
+    The grid also does the viewport culling:  `indexBounds()` assigns each shape
+    bounding box to the tiles it overlaps so that a tile is drawn with only its shapes.
+    """
+    def __init__(self, width: int, height: int, tileSize: int):
+
+        if width <= 0 or height <= 0 or tileSize <= 0:
+            raise ValueError(f'Bad tile grid: {width}x{height} tileSize: {tileSize}')
+
+        self._width:    int = width
+        self._height:   int = height
+        self._tileSize: int = tileSize
+
+        self._columns: int = -(-width  // tileSize)
+        self._rows:    int = -(-height // tileSize)
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def tileSize(self) -> int:
+        return self._tileSize
+
+    @property
+    def columns(self) -> int:
+        return self._columns
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def tile(self, column: int, row: int) -> Tile:
+
+        x: int = column * self._tileSize
+        y: int = row    * self._tileSize
+        return Tile(column=column, row=row, x=x, y=y, width=min(self._tileSize, self._width - x), height=min(self._tileSize, self._height - y))
+
+    def rowTiles(self, row: int) -> Iterator[Tile]:
+        """
+        The tiles of a row, left to right
+        """
+        for column in range(self._columns):
+            yield self.tile(column, row)
+
+    def tiles(self) -> Iterator[Tile]:
+        """
+        All the tiles, row by row
+        """
+        for row in range(self._rows):
+            yield from self.rowTiles(row)
+
+    def indexBounds(self, boundsList: List[Bounds], scale: float = 1.0, originX: float = 0.0, originY: float = 0.0) -> TileIndex:
+        """
+        Args:
+            boundsList: Bounding boxes in diagram coordinates
+            scale:      Output pixels per diagram unit
+            originX:    The diagram x coordinate drawn at the left of the image
+            originY:    The diagram y coordinate drawn at the top of the image
+
+        Returns:
+            The indices in `boundsList` of the boxes overlapping each tile, in their
+            original order so that the drawing order is kept;  Tiles with no shapes
+            are not in the index
+        """
+        tileIndex: TileIndex = {}
+        lastColumn: int = self._columns - 1
+        lastRow:    int = self._rows - 1
+        for idx, (left, top, right, bottom) in enumerate(boundsList):
+            firstColumn: int = max(0,          floor((left   - originX) * scale) // self._tileSize)
+            endColumn:   int = min(lastColumn, floor((right  - originX) * scale) // self._tileSize)
+            firstRow:    int = max(0,          floor((top    - originY) * scale) // self._tileSize)
+            endRow:      int = min(lastRow,    floor((bottom - originY) * scale) // self._tileSize)
+            for row in range(firstRow, endRow + 1):
+                for column in range(firstColumn, endColumn + 1):
+                    tileIndex.setdefault((column, row), []).append(idx)
+
+        return tileIndex
+
+    @classmethod
+    def unionBounds(cls, boundsList: List[Bounds]) -> Bounds:
+        """
+        Returns:
+            The box around all the boxes;  An empty list gives an empty box at the origin
+        """
+        if len(boundsList) == 0:
+            return 0.0, 0.0, 0.0, 0.0
+        return (min(bounds[0] for bounds in boundsList), min(bounds[1] for bounds in boundsList),
+                max(bounds[2] for bounds in boundsList), max(bounds[3] for bounds in boundsList))
@@ -0,0 +1,190 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from json import dump as jsonDump
+
+from os import makedirs
+from os import path as osPath
+
+from wx import WHITE_BRUSH
+
+from wx import Bitmap
+from wx import Image
+from wx import MemoryDC
+from wx import NullBitmap
+
+from org.pyut.MiniOgl.DiagramFrame import DiagramFrame
+
+from org.pyut.plugins.image.DiagramBounds import DiagramBounds
+from org.pyut.plugins.image.DiagramBounds import Shapes
+from org.pyut.plugins.image.PngWriter import PngWriter
+from org.pyut.plugins.image.TileGrid import Tile
+from org.pyut.plugins.image.TileGrid import TileGrid
+from org.pyut.plugins.image.TileGrid import TileIndex
+
+
+class TiledImageRenderer:
+    """
+    Renders a diagram frame to a raster image through the MiniOgl draw path, one
+    fixed size tile at a time.  Each tile is drawn with only the shapes that
+    overlap it, so neither the drawing time nor the memory depend on the size of the
+    whole canvas.
+
+    `writePng()` assembles a row of tiles into a band of scanlines and streams it to
+    the PNG encoder;  The peak memory is one band (image width x tile size pixels).
+    `writePyramid()` writes every tile as its own PNG, at full size and at each
+    half size zoom level, so the peak memory is a single tile.
+    """
+    DEFAULT_TILE_SIZE: int = 512
+    BYTES_PER_PIXEL:   int = 3
+
+    PYRAMID_DESCRIPTOR: str = 'pyramid.json'
+
+    def __init__(self, diagramFrame: DiagramFrame, tileSize: int = DEFAULT_TILE_SIZE, selection: Shapes = None):
+        """
+        Args:
+            diagramFrame:   The frame whose diagram is rendered
+            tileSize:       The tile width and height in pixels
+            selection:      The shapes to render;  The whole diagram when `None`
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramFrame: DiagramFrame = diagramFrame
+        self._tileSize:     int          = tileSize
+
+        self._diagramBounds: DiagramBounds = DiagramBounds(diagramFrame.GetDiagram(), selection=selection)
+        self._originX:       float         = self._diagramBounds.left
+        self._originY:       float         = self._diagramBounds.top
+
+        self._bitmap: Bitmap = Bitmap(tileSize, tileSize)
+
+    @property
+    def diagramSize(self) -> Tuple[float, float]:
+        """
+        The size of the drawn area in diagram units
+        """
+        return self._diagramBounds.width, self._diagramBounds.height
+
+    def fitScale(self, width: int, height: int) -> float:
+        """
+        Args:
+            width:  Largest image width in pixels
+            height: Largest image height in pixels
+
+        Returns:  The scale that fits the drawn area in the image, keeping its aspect ratio
+        """
+        diagramWidth, diagramHeight = self.diagramSize
+        return min(width / diagramWidth, height / diagramHeight)
+
+    def writePng(self, fileName: str, scale: float = 1.0):
+        """
+        Args:
+            fileName:   The PNG file name
+            scale:      Output pixels per diagram unit
+        """
+        tileGrid:  TileGrid  = self._tileGrid(scale)
+        tileIndex: TileIndex = tileGrid.indexBounds(self._diagramBounds.boundsList, scale=scale, originX=self._originX, originY=self._originY)
+        stride:    int       = tileGrid.width * TiledImageRenderer.BYTES_PER_PIXEL
+
+        self.logger.info(f'{fileName}: {tileGrid.width}x{tileGrid.height} pixels in {tileGrid.columns}x{tileGrid.rows} tiles')
+        with open(fileName, 'wb') as stream:
+            with PngWriter(stream, width=tileGrid.width, height=tileGrid.height) as pngWriter:
+                for row in range(tileGrid.rows):
+                    band: bytearray = bytearray()
+                    for tile in tileGrid.rowTiles(row):
+                        tileData: bytes = self._renderTile(tile, tileIndex.get((tile.column, tile.row), []), scale)
+                        if len(band) == 0:
+                            band = bytearray(tile.height * stride)
+                        self._copyToBand(band, stride, tile, tileData)
+                    pngWriter.writeRows(bytes(band))
+
+    def writePyramid(self, directoryName: str) -> int:
+        """
+        Write a zoomable tile pyramid:  `<directoryName>/<level>/<column>_<row>.png`.
+        Level 0 is at full size and each following level is half the size of the
+        previous one, down to the level that fits in a single tile.  The sizes are
+        described in `pyramid.json`.
+
+        Args:
+            directoryName:  Created when it does not exist
+
+        Returns:
+            The number of levels
+        """
+        levels: List[dict] = []
+        scale:  float      = 1.0
+        while True:
+            tileGrid:  TileGrid  = self._tileGrid(scale)
+            tileIndex: TileIndex = tileGrid.indexBounds(self._diagramBounds.boundsList, scale=scale, originX=self._originX, originY=self._originY)
+
+            levelDirectory: str = osPath.join(directoryName, str(len(levels)))
+            makedirs(levelDirectory, exist_ok=True)
+            for tile in tileGrid.tiles():
+                tileData: bytes = self._renderTile(tile, tileIndex.get((tile.column, tile.row), []), scale)
+                self._writeTile(osPath.join(levelDirectory, f'{tile.column}_{tile.row}.png'), tile, tileData)
+
+            levels.append({'scale': scale, 'width': tileGrid.width, 'height': tileGrid.height, 'columns': tileGrid.columns, 'rows': tileGrid.rows})
+            if tileGrid.columns == 1 and tileGrid.rows == 1:
+                break
+            scale = scale / 2
+
+        with open(osPath.join(directoryName, TiledImageRenderer.PYRAMID_DESCRIPTOR), 'w') as descriptor:
+            jsonDump({'tileSize': self._tileSize, 'levels': levels}, descriptor, indent=2)
+
+        self.logger.info(f'{directoryName}: {len(levels)} levels')
+        return len(levels)
+
+    def _tileGrid(self, scale: float) -> TileGrid:
+
+        width:  int = max(1, round(self._diagramBounds.width  * scale))
+        height: int = max(1, round(self._diagramBounds.height * scale))
+
+        return TileGrid(width=width, height=height, tileSize=self._tileSize)
+
+    def _renderTile(self, tile: Tile, shapeIndices: List[int], scale: float) -> bytes:
+        """
+        Draw the shapes overlapping the tile in the tile bitmap
+
+        Returns:
+            The RGB data of the full tile bitmap;  Edge tiles only use their top left part
+        """
+        dc: MemoryDC = MemoryDC()
+        dc.SelectObject(self._bitmap)
+        dc.SetBackground(WHITE_BRUSH)
+        dc.Clear()
+
+        dc.SetUserScale(scale, scale)
+        dc.SetDeviceOrigin(-round(tile.x + self._originX * scale), -round(tile.y + self._originY * scale))
+        dc.SetFont(self._diagramFrame.GetDefaultFont())
+
+        shapes = self._diagramBounds.shapes
+        for idx in shapeIndices:
+            shapes[idx].Draw(dc)
+
+        dc.SelectObject(NullBitmap)
+
+        image: Image = self._bitmap.ConvertToImage()
+        return bytes(image.GetData())
+
+    def _copyToBand(self, band: bytearray, stride: int, tile: Tile, tileData: bytes):
+
+        tileStride: int = self._tileSize   * TiledImageRenderer.BYTES_PER_PIXEL
+        rowLength:  int = tile.width       * TiledImageRenderer.BYTES_PER_PIXEL
+        bandOffset: int = tile.x           * TiledImageRenderer.BYTES_PER_PIXEL
+        for y in range(tile.height):
+            band[y * stride + bandOffset:y * stride + bandOffset + rowLength] = tileData[y * tileStride:y * tileStride + rowLength]
+
+    def _writeTile(self, fileName: str, tile: Tile, tileData: bytes):
+
+        tileStride: int = self._tileSize * TiledImageRenderer.BYTES_PER_PIXEL
+        rowLength:  int = tile.width     * TiledImageRenderer.BYTES_PER_PIXEL
+        with open(fileName, 'wb') as stream:
+            with PngWriter(stream, width=tile.width, height=tile.height) as pngWriter:
+                if rowLength == tileStride:
+                    pngWriter.writeRows(tileData[:tile.height * tileStride])
+                else:
+                    pngWriter.writeRows(b''.join(tileData[y * tileStride:y * tileStride + rowLength] for y in range(tile.height)))
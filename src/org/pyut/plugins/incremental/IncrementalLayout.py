@@ -0,0 +1,204 @@
+
+from typing import Deque
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from collections import deque
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from org.pyut.MiniOgl.SpatialIndex import SpatialIndex
+
+DEFAULT_GAP:       int = 40
+DEFAULT_MAX_RINGS: int = 64
+
+NodePosition  = Tuple[float, float]
+NodePositions = Dict[Hashable, NodePosition]
+
+
+@dataclass
+class IncrementalNode:
+    """
+    A node that the incremental layout has to place
+    """
+    nodeId:     Hashable
+    width:      float
+    height:     float
+    neighbours: List[Hashable] = field(default_factory=list)
+
+
+IncrementalNodes = List[IncrementalNode]
+
+
+class IncrementalLayout:
+    """
+    Places new nodes on a diagram without moving the nodes that are already there.
+
+    Existing nodes are pinned into a spatial index.  Each new node is put as
+    close as possible to the center of its already positioned neighbours, on
+    the first free spot of a spiral search around that point.  Only the cells
+    around the candidate spots are examined, so the cost is proportional to
+    the number of placed nodes and not to the size of the diagram.
+    """
+    def __init__(self, gap: int = DEFAULT_GAP, maxRings: int = DEFAULT_MAX_RINGS):
+        """
+
+        Args:
+            gap:        Minimum free space kept around a placed node
+            maxRings:   How far the spiral search goes before giving up and
+                        putting the node beside the diagram
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._gap:      int = gap
+        self._maxRings: int = maxRings
+
+        self._index:     SpatialIndex  = SpatialIndex()
+        self._positions: NodePositions = {}
+        self._sizes:     Dict[Hashable, Tuple[float, float]] = {}
+
+        self._maxRight: float = 0.0
+        self._minTop:   float = float(gap)
+
+    @property
+    def positions(self) -> NodePositions:
+        """
+        Returns:  The top left position of every pinned or placed node
+        """
+        return self._positions
+
+    def pin(self, nodeId: Hashable, x: float, y: float, width: float, height: float):
+        """
+        Declare a node that must not move
+
+        Args:
+            nodeId: Node identifier
+            x:      Left of the node
+            y:      Top of the node
+            width:  Node width
+            height: Node height
+        """
+        if len(self._index) == 0:
+            self._minTop = y
+        self._occupy(nodeId, x, y, width, height)
+
+    def placeAll(self, nodes: IncrementalNodes) -> NodePositions:
+        """
+        Place the nodes.  Nodes that are linked to a positioned node go first
+        and their unplaced neighbours follow them breadth first, so connected
+        new nodes end up next to each other.
+
+        Args:
+            nodes:  The nodes to place
+
+        Returns:  The new top left position of each node in `nodes`
+        """
+        pending: Dict[Hashable, IncrementalNode] = {node.nodeId: node for node in nodes}
+        ordered: IncrementalNodes = sorted(nodes, key=lambda n: -self._positionedNeighbourCount(n))
+
+        placed: NodePositions = {}
+        for seed in ordered:
+            if seed.nodeId not in pending:
+                continue
+            queue: Deque[IncrementalNode] = deque([pending.pop(seed.nodeId)])
+            while queue:
+                node: IncrementalNode = queue.popleft()
+                placed[node.nodeId] = self.place(node)
+                for neighbourId in node.neighbours:
+                    neighbour: IncrementalNode = pending.pop(neighbourId, None)
+                    if neighbour is not None:
+                        queue.append(neighbour)
+
+        return placed
+
+    def place(self, node: IncrementalNode) -> NodePosition:
+        """
+        Place a single node near its positioned neighbours
+
+        Args:
+            node:   The node to place
+
+        Returns:  The top left position chosen for the node
+        """
+        centerX, centerY = self._target(node)
+        width:  float = node.width
+        height: float = node.height
+
+        stepX: float = (width  + self._gap) / 2
+        stepY: float = (height + self._gap) / 2
+        for ring in range(self._maxRings + 1):
+            for dx, dy in IncrementalLayout._ringOffsets(ring):
+                x: float = centerX + dx * stepX - width / 2
+                y: float = centerY + dy * stepY - height / 2
+                if self._isFree(x, y, width, height):
+                    self._occupy(node.nodeId, x, y, width, height)
+                    return x, y
+
+        x, y = self._maxRight + self._gap, self._minTop
+        self.logger.info(f'No free spot near {node.nodeId}; placing it beside the diagram')
+        self._occupy(node.nodeId, x, y, width, height)
+
+        return x, y
+
+    def _target(self, node: IncrementalNode) -> NodePosition:
+        """
+        The point the node should be centered on:  The center of its positioned
+        neighbours or, when it has none, the first column right of the diagram.
+        """
+        sumX:  float = 0.0
+        sumY:  float = 0.0
+        count: int   = 0
+        for neighbourId in node.neighbours:
+            position: NodePosition = self._positions.get(neighbourId)
+            if position is not None:
+                w, h = self._sizes[neighbourId]
+                sumX += position[0] + w / 2
+                sumY += position[1] + h / 2
+                count += 1
+        if count == 0:
+            return self._maxRight + self._gap + node.width / 2, self._minTop + node.height / 2
+
+        return sumX / count, sumY / count
+
+    def _positionedNeighbourCount(self, node: IncrementalNode) -> int:
+        return sum(1 for neighbourId in node.neighbours if neighbourId in self._positions)
+
+    def _isFree(self, x: float, y: float, width: float, height: float) -> bool:
+        gap: int = self._gap
+        return self._index.isFree(x - gap, y - gap, width + 2 * gap, height + 2 * gap)
+
+    def _occupy(self, nodeId: Hashable, x: float, y: float, width: float, height: float):
+
+        self._index.insert(nodeId, x, y, width, height)
+        self._positions[nodeId] = (x, y)
+        self._sizes[nodeId]     = (width, height)
+        self._maxRight = max(self._maxRight, x + width)
+        self._minTop   = min(self._minTop, y)
+
+    @staticmethod
+    def _ringOffsets(ring: int) -> List[Tuple[int, int]]:
+        """
+        The grid offsets on the square ring at distance `ring`, nearest first
+
+        Args:
+            ring:  Ring number;  0 is the center
+
+        Returns:  A list of (dx, dy) offsets
+        """
+        if ring == 0:
+            return [(0, 0)]
+        offsets: Set[Tuple[int, int]] = set()
+        for i in range(-ring, ring + 1):
+            offsets.add((i, -ring))
+            offsets.add((i, ring))
+            offsets.add((-ring, i))
+            offsets.add((ring, i))
+
+        return sorted(offsets, key=lambda o: (o[0] * o[0] + o[1] * o[1], o[1], o[0]))
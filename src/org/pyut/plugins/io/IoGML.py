@@ -100,13 +100,11 @@ class IoGML(PyutIoPlugin):
         Args:
             oglObjects:     list of exported objects
         """
-        gmlExporter: GMLExporter = GMLExporter()
-
-        gmlExporter.translate(umlObjects=oglObjects)
-
         fqFileName: str = self._askForFileExport()
 
         if fqFileName != '':
-            gmlExporter.write(fqFileName)
+            gmlExporter: GMLExporter = GMLExporter()
+            with open(fqFileName, 'w') as writer:
+                gmlExporter.translate(umlObjects=oglObjects, writer=writer)
         else:
             self.logger.debug('Export Cancelled no file name')
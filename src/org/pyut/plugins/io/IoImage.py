@@ -6,6 +6,8 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
+from os import path as osPath
+
 from wx import OK
 from wx import Yield as wxYield
 
@@ -16,7 +18,10 @@ from org.pyut.ogl.OglClass import OglClass
 from org.pyut.plugins.base.PyutIoPlugin import PyutIoPlugin
 from org.pyut.plugins.base.PyutPlugin import PyutPlugin
 
+from org.pyut.plugins.image.TiledImageRenderer import TiledImageRenderer
+
 from org.pyut.plugins.io.pyumlsupport.DlgImageOptions import DlgImageOptions
+from org.pyut.plugins.io.pyumlsupport.ImageFormat import ImageFormat
 from org.pyut.plugins.io.pyumlsupport.ImageOptions import ImageOptions
 from org.pyut.plugins.io.pyumlsupport.OglToPyUmlDefinition import OglToPyUmlDefinition
 
@@ -27,6 +32,9 @@ from pyumldiagrams import Defaults
 
 class IoImage(PyutIoPlugin):
 
+    PNG_EXTENSION:  str = '.png'
+    PYRAMID_SUFFIX: str = '-tiles'
+
     def __init__(self, oglObjects: List[OglClass], umlFrame: UmlFrame):
         """
         Args:
@@ -118,7 +126,8 @@ class IoImage(PyutIoPlugin):
 
     def write(self, oglObjects: List[OglClass]):
         """
-        Write data
+        Write data;  PNG images are rendered from the diagram frame one tile at a time, the other
+        formats are laid out by pyumldiagrams
 
         Args:
             oglObjects:     list of exported objects
@@ -126,6 +135,10 @@ class IoImage(PyutIoPlugin):
         self.logger.info(f'export file name: {self._imageOptions.outputFileName}')
         wxYield()
 
+        if self._imageOptions.imageFormat == ImageFormat.PNG:
+            self._writeTiled(oglObjects)
+            return
+
         pluginVersion: str = self.getVersion()
         pyutVersion:   str = PyutVersion.getPyUtVersion()
 
@@ -137,3 +150,19 @@ class IoImage(PyutIoPlugin):
         oglToPdf.toClassDefinitions(oglObjects=oglObjects)
         oglToPdf.layoutLines(oglObjects=oglObjects)
         oglToPdf.write()
+
+    def _writeTiled(self, oglObjects: List[OglClass]):
+        """
+        The single image is scaled to fit the image width and height of the options;  The pyramid
+        starts at full size since its levels already zoom out
+        """
+        renderer: TiledImageRenderer = TiledImageRenderer(self._umlFrame, tileSize=self._imageOptions.tileSize, selection=oglObjects)
+
+        fileName: str = self._imageOptions.outputFileName
+        baseName, extension = osPath.splitext(fileName)
+        if self._imageOptions.tilePyramid is True:
+            renderer.writePyramid(f'{baseName}{IoImage.PYRAMID_SUFFIX}')
+        else:
+            if extension.lower() != IoImage.PNG_EXTENSION:
+                fileName = f'{fileName}{IoImage.PNG_EXTENSION}'
+            renderer.writePng(fileName, scale=renderer.fitScale(self._imageOptions.imageWidth, self._imageOptions.imageHeight))
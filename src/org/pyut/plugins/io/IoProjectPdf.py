@@ -0,0 +1,142 @@
+
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import Document
+
+from wx import BeginBusyCursor
+from wx import EndBusyCursor
+
+from org.pyut.ogl.OglClass import OglClass
+
+from org.pyut.plugins.base.PyutPlugin import PyutPlugin
+from org.pyut.plugins.base.PyutIoPlugin import PyutIoPlugin
+
+from org.pyut.batch.ProjectPdfExporter import ProjectPdfExporter
+
+from org.pyut.general.PyutXmfFinder import PyutXmlFinder
+
+from org.pyut.persistence.DocumentModel import ProjectModel
+from org.pyut.persistence.converters.MiniDomToModelV10 import MiniDomToModel
+
+from org.pyut.ui.PyutProject import PyutProject
+from org.pyut.ui.UmlFrame import UmlFrame
+
+
+class IoProjectPdf(PyutIoPlugin):
+    """
+    Exports all the class diagrams of the current project in a single PDF, with a
+    table of contents.  The documents are rendered in worker processes from a
+    snapshot of the saved project.
+    """
+    def __init__(self, oglObjects: List[OglClass], umlFrame: UmlFrame):
+        """
+
+        Args:
+            oglObjects:  list of ogl objects
+            umlFrame:    A Pyut umlFrame
+        """
+        super().__init__(oglObjects, umlFrame)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._outputFileName: str = ''
+
+    def getName(self) -> str:
+        """
+        Returns: the name of the plugin.
+        """
+        return "Output Project PDF"
+
+    def getAuthor(self) -> str:
+        """
+        Returns: The author's name
+        """
+        return "Humberto A. Sanchez II"
+
+    def getVersion(self) -> str:
+        """
+        Returns: The plugin version string
+        """
+        return "1.0"
+
+    def getInputFormat(self) -> PyutPlugin.INPUT_FORMAT_TYPE:
+        """
+        Returns:
+            None, I don't read PDF
+        """
+        return cast(PyutPlugin.INPUT_FORMAT_TYPE, None)
+
+    def getOutputFormat(self) -> Tuple[str, str, str]:
+        """
+        A Tuple with
+
+            * name of the output format
+            * extension of the output format
+            * textual description of the plugin output format
+
+        Returns:
+            Return a specification tuple.
+        """
+        return 'Project PDF', 'pdf', 'Every class diagram of the project in one PDF'
+
+    def setImportOptions(self) -> bool:
+        """
+        Returns:
+            if False, the import will be cancelled.
+        """
+        return False
+
+    def setExportOptions(self) -> bool:
+        """
+        Popup dialog to determine where to write .pdf file
+
+        Returns:
+            if False, the export will be cancelled.
+        """
+        fqFileName: str = self._askForFileExport(defaultFileName='PyutProject')
+
+        if fqFileName == '':
+            self.logger.debug('Export Cancelled no file name')
+            return False
+        else:
+            self._outputFileName = fqFileName
+
+        return True
+
+    def read(self, oglObjects: List[OglClass], umlFrame: UmlFrame):
+        """
+        Read data from filename. Abstract.
+
+        Args:
+            oglObjects: list of imported objects
+            umlFrame:   Pyut's UmlFrame
+        """
+        pass
+
+    def write(self, oglObjects: List[OglClass]):
+        """
+        Write the whole project;  The selected objects are ignored
+
+        Args:
+            oglObjects:     list of exported objects
+        """
+        project: PyutProject = self._ctrl.getFileHandling().getCurrentProject()
+
+        dom: Document = PyutXmlFinder.getPyutXmlClass(theVersion=PyutXmlFinder.getLatestXmlVersion()).save(project)
+        projectModel: ProjectModel = MiniDomToModel().getProject(dom, fileName=project.getFilename(), withContents=False)
+
+        BeginBusyCursor()
+        try:
+            pageCount: int = ProjectPdfExporter().export(projectModel, self._outputFileName, title=osPath.basename(project.getFilename()))
+        finally:
+            EndBusyCursor()
+
+        self.logger.info(f'{self._outputFileName}: {pageCount} pages')
@@ -125,28 +125,8 @@ class IoPython(PyutIoPlugin):
             oglClass:  OglClass  = cast(OglClass, oglClass)
             pyutClass: PyutClass = oglClass.getPyutObject()
 
-            generatedStanza:    str       = self._pyutToPython.generateClassStanza(pyutClass)
-            generatedClassCode: List[str] = [generatedStanza]
-
-            clsMethods: PyutToPython.MethodsCodeType = self._pyutToPython.generateMethodsCode(pyutClass)
-
-            # Add __init__ Method
-            if PyutToPython.SPECIAL_PYTHON_CONSTRUCTOR in clsMethods:
-                methodCode = clsMethods[PyutToPython.SPECIAL_PYTHON_CONSTRUCTOR]
-                generatedClassCode += methodCode
-                del clsMethods[PyutToPython.SPECIAL_PYTHON_CONSTRUCTOR]
-
-            # Add others methods in order
-            for pyutMethod in pyutClass.methods:
-                methodName: str = pyutMethod.getName()
-                if methodName != PyutToPython.SPECIAL_PYTHON_CONSTRUCTOR:
-                    try:
-                        methodCode: List[str] = clsMethods[methodName]
-                        generatedClassCode += methodCode
-                    except (ValueError, Exception, KeyError) as e:
-                        self.logger.warning(f'{e}')
-
-            generatedClassCode.append("\n\n")
+            generatedClassCode: List[str] = self._pyutToPython.generateClassCode(pyutClass)
+
             # Save to classes dictionary
             classes[pyutClass.getName()] = generatedClassCode
 
@@ -0,0 +1,110 @@
+
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from org.pyut.plugins.base.PyutIoPlugin import PyutIoPlugin
+
+from org.pyut.plugins.image.SvgExporter import SvgExporter
+
+from org.pyut.ogl.OglClass import OglClass
+
+from org.pyut.ui.UmlFrame import UmlFrame
+
+
+class IoSvg(PyutIoPlugin):
+    """
+    Exports the current diagram as Scalable Vector Graphics
+    """
+    def __init__(self, oglObjects: List[OglClass], umlFrame: UmlFrame):
+        """
+
+        Args:
+            oglObjects:  list of ogl objects
+            umlFrame:    A Pyut umlFrame
+        """
+        super().__init__(oglObjects, umlFrame)
+
+        self.logger: Logger = getLogger(__name__)
+
+    def getName(self) -> str:
+        """
+        Returns: the name of the plugin.
+        """
+        return "Output SVG"
+
+    def getAuthor(self) -> str:
+        """
+        Returns: The author's name
+        """
+        return "Humberto A. Sanchez II"
+
+    def getVersion(self) -> str:
+        """
+        Returns: The plugin version string
+        """
+        return "1.0"
+
+    def getInputFormat(self) -> Tuple[str, str, str]:
+        """
+        Returns:
+            None, I don't read SVG
+        """
+        return cast(Tuple[str, str, str], None)
+
+    def getOutputFormat(self) -> Tuple[str, str, str]:
+        """
+
+        Returns:
+            Return a specification tuple.
+        """
+        return 'SVG', 'svg', 'Scalable Vector Graphics'
+
+    def setImportOptions(self) -> bool:
+        """
+        Prepare the import.
+        This can be used to ask some questions to the user.
+
+        Returns:
+            if False, the import will be cancelled.
+        """
+        return False
+
+    def setExportOptions(self) -> bool:
+        """
+        Prepare the export.
+        This can be used to ask the user some questions
+
+        Returns:
+            if False, the export will be cancelled.
+        """
+        return True
+
+    def read(self, oglObjects: List[OglClass], umlFrame: UmlFrame):
+        """
+        Read data from filename. Abstract.
+
+        Args:
+            oglObjects: list of imported objects
+            umlFrame:   Pyut's UmlFrame
+        """
+        pass
+
+    def write(self, oglObjects: List[OglClass]):
+        """
+        Write the selected objects
+
+        Args:
+            oglObjects:     list of exported objects
+        """
+        fqFileName: str = self._askForFileExport()
+
+        if fqFileName != '':
+            svgExporter: SvgExporter = SvgExporter(self._umlFrame, selection=oglObjects)
+            with open(fqFileName, 'w', encoding='utf-8') as writer:
+                svgExporter.write(writer)
+        else:
+            self.logger.debug('Export Cancelled no file name')
@@ -1,6 +1,4 @@
 
-from io import StringIO
-
 from wx import CENTRE
 from wx import ICON_QUESTION
 from wx import MessageBox
@@ -123,15 +121,11 @@ class IoXmi(PyutIoPlugin):
         @author Deve Roux <droux@eivd.ch>
         @since 1.0
         """
-        from xml.dom.minidom import parse
-
         # Ask the user which destination file he wants
         filename = self._askForFileImport()
         if filename == "":
             return False
 
-        dom = parse(StringIO(open(filename).read()))
-
         myXmi: PyutXmi = PyutXmi()
-        myXmi.open(dom, umlFrame)
+        myXmi.open(filename, umlFrame)
         return True
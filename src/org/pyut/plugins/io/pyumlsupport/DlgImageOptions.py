@@ -7,6 +7,7 @@ from wx import ALIGN_RIGHT
 from wx import ALL
 from wx import CANCEL
 from wx import EVT_BUTTON
+from wx import EVT_CHECKBOX
 from wx import EVT_CHOICE
 from wx import EVT_CLOSE
 from wx import EVT_MOTION
@@ -24,6 +25,7 @@ from wx import TE_READONLY
 from wx import VERTICAL
 
 from wx import Button
+from wx import CheckBox
 from wx import Choice
 from wx import CommandEvent
 from wx import FileDialog
@@ -60,8 +62,9 @@ class DlgImageOptions(BaseDlgEdit):
         [self.__selectedFileId,
          self.__imageWidthId,    self.__imageHeightId,
          self.__horizontalGapId, self.__verticalGapId,
-         self.__fileSelectBtn,   self.__imageFormatChoiceId
-         ] = PyutUtils.assignID(7)
+         self.__fileSelectBtn,   self.__imageFormatChoiceId,
+         self.__tilePyramidId
+         ] = PyutUtils.assignID(8)
 
         super().__init__(theParent, theTitle='UML Image Generation Options')
 
@@ -106,6 +109,7 @@ class DlgImageOptions(BaseDlgEdit):
         self.Bind(EVT_SPINCTRL, self._onImageSizeChange, id=self.__imageHeightId)
 
         self.Bind(EVT_CHOICE, self._onImageFormatChoice, id=self.__imageFormatChoiceId)
+        self.Bind(EVT_CHECKBOX, self._onTilePyramid,     id=self.__tilePyramidId)
 
         self.Bind(EVT_SPINCTRL, self._onImagePaddingChange, id=self.__horizontalGapId)
         self.Bind(EVT_SPINCTRL, self._onImagePaddingChange, id=self.__verticalGapId)
@@ -175,6 +179,10 @@ class DlgImageOptions(BaseDlgEdit):
         newFormat: ImageFormat = ImageFormat(newValue)
 
         self._imageOptions.imageFormat = newFormat
+        self._tilePyramid.Enable(newFormat == ImageFormat.PNG)
+
+    def _onTilePyramid(self, event: CommandEvent):
+        self._imageOptions.tilePyramid = event.IsChecked()
 
     def __layoutFileSelection(self) -> StaticBoxSizer:
 
@@ -217,7 +225,11 @@ class DlgImageOptions(BaseDlgEdit):
         box:            StaticBox = StaticBox(self, ID_ANY, "Image Format")
         szrImageFormat: StaticBoxSizer = StaticBoxSizer(box, HORIZONTAL)
 
+        self._tilePyramid = CheckBox(self, self.__tilePyramidId, label=_("Zoomable tiles"))
+        self._tilePyramid.SetValue(self._imageOptions.tilePyramid)
+
         szrImageFormat.Add(self._imageFormatChoice, 0, ALL)
+        szrImageFormat.Add(self._tilePyramid, 0, ALL, DlgImageOptions.HORIZONTAL_GAP)
 
         return szrImageFormat
 
@@ -19,4 +19,9 @@ class ImageOptions:
     imageFormat:    ImageFormat = ImageFormat.PNG
     horizontalGap:  int = Defaults.DEFAULT_HORIZONTAL_GAP
     verticalGap:    int = Defaults.DEFAULT_VERTICAL_GAP
+    tilePyramid:    bool = False
+    """
+    PNG only;  Write a directory of zoomable tiles instead of a single image
+    """
+    tileSize:       int = 512
 
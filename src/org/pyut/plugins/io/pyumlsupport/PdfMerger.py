@@ -0,0 +1,150 @@
+
+from typing import BinaryIO
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from io import BytesIO
+
+from fpdf import FPDF
+
+from pypdf import PdfReader
+from pypdf import PdfWriter
+
+from pypdf.annotations import Link
+
+from pypdf.generic import ArrayObject
+from pypdf.generic import NameObject
+
+TitledReader = Tuple[str, PdfReader]
+LinkRect     = Tuple[float, float, float, float]       # left, bottom, right, top in PDF points
+
+
+class PdfMerger:
+    """
+    Merges PDF files into one, after an optional table of contents.  The table of
+    contents lists every merged file with its first page;  The entries link to
+    their page and are repeated as bookmarks (the PDF outline).
+
+    The table of contents is drawn with fpdf and the merge is done by pypdf.
+
+    Usage::
+        pdfMerger: PdfMerger = PdfMerger()
+        pdfMerger.addFile('Vehicles.pdf', title='Vehicles')
+        pdfMerger.addFile('Engines.pdf', title='Engines')
+        with open('Project.pdf', 'wb') as stream:
+            pdfMerger.write(stream, title='Project')
+    """
+    CONTENTS_TITLE:    str   = 'Contents'
+    TOC_PAGE_WIDTH:    float = 841.89       # A4 landscape, in points
+    TOC_PAGE_HEIGHT:   float = 595.28
+    TOC_MARGIN:        int   = 72
+    TOC_FONT:          str   = 'helvetica'
+    TOC_TITLE_SIZE:    int   = 20
+    TOC_ENTRY_SIZE:    int   = 12
+    TOC_LINE_HEIGHT:   int   = 18
+    TOC_PAGE_NUMBER_X: int   = 700
+    TOC_ENTRIES_PER_PAGE: int = int(TOC_PAGE_HEIGHT - 2 * TOC_MARGIN - 2 * TOC_LINE_HEIGHT) // TOC_LINE_HEIGHT
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._sources: List[TitledReader] = []
+
+    @property
+    def pageCount(self) -> int:
+        """
+        The number of merged pages, without the table of contents
+        """
+        return sum(len(reader.pages) for _, reader in self._sources)
+
+    def addFile(self, fileName: str, title: str):
+
+        with open(fileName, 'rb') as pdfFile:
+            self.addBytes(pdfFile.read(), title)
+
+    def addBytes(self, data: bytes, title: str):
+        self._sources.append((title, PdfReader(BytesIO(data))))
+
+    def write(self, stream: BinaryIO, title: str = '', producer: str = '', tableOfContents: bool = True):
+        """
+        Args:
+            stream:             A binary stream opened for writing
+            title:              The document title
+            producer:           Who made the document
+            tableOfContents:    `False` only merges the pages
+        """
+        tocPageCount: int = 0
+        if tableOfContents is True and len(self._sources) > 0:
+            tocPageCount = -(-len(self._sources) // PdfMerger.TOC_ENTRIES_PER_PAGE)
+
+        firstPages: List[int] = []           # Zero based index of the first page of each source
+        pageIndex:  int       = tocPageCount
+        for _, reader in self._sources:
+            firstPages.append(pageIndex)
+            pageIndex += len(reader.pages)
+
+        pdfWriter: PdfWriter = PdfWriter()
+        linkRects: List[LinkRect] = []
+        if tocPageCount > 0:
+            tableOfContentsPdf, linkRects = self._tableOfContents(firstPages)
+            pdfWriter.append(PdfReader(BytesIO(tableOfContentsPdf)))
+
+        for (sourceTitle, reader), firstPage in zip(self._sources, firstPages):
+            pdfWriter.append(reader, import_outline=False)
+            if len(reader.pages) > 0:
+                pdfWriter.add_outline_item(sourceTitle, firstPage)
+
+        for entry, linkRect in enumerate(linkRects):
+            if len(self._sources[entry][1].pages) > 0:
+                link: Link = Link(rect=linkRect, target_page_index=firstPages[entry])
+                link = pdfWriter.add_annotation(page_number=entry // PdfMerger.TOC_ENTRIES_PER_PAGE, annotation=link)
+                # Some pypdf versions leave the page index in the destination;  It must be the page itself
+                link[NameObject('/Dest')] = ArrayObject([pdfWriter.pages[firstPages[entry]].indirect_reference, NameObject('/Fit')])
+
+        pdfWriter.add_metadata({'/Title': title, '/Producer': producer})
+        pdfWriter.page_mode = '/UseOutlines'
+        pdfWriter.write(stream)
+
+        self.logger.info(f'Merged {len(self._sources)} file(s), {pageIndex} pages')
+
+    def _tableOfContents(self, firstPages: List[int]) -> Tuple[bytes, List[LinkRect]]:
+        """
+        Draw the table of contents pages
+
+        Args:
+            firstPages: The page index of each source in the merged document
+
+        Returns:  The PDF and the rectangle of each entry on its page
+        """
+        pdf: FPDF = FPDF(orientation='L', unit='pt', format='A4')
+        pdf.set_auto_page_break(False)
+
+        perPage:   int            = PdfMerger.TOC_ENTRIES_PER_PAGE
+        top:       int            = PdfMerger.TOC_MARGIN
+        linkRects: List[LinkRect] = []
+        for entry, ((sourceTitle, _), firstPage) in enumerate(zip(self._sources, firstPages)):
+            if entry % perPage == 0:
+                pdf.add_page()
+                pdf.set_font(PdfMerger.TOC_FONT, size=PdfMerger.TOC_TITLE_SIZE)
+                pdf.text(PdfMerger.TOC_MARGIN, top, PdfMerger.CONTENTS_TITLE)
+                pdf.set_font(PdfMerger.TOC_FONT, size=PdfMerger.TOC_ENTRY_SIZE)
+
+            y: int = top + (entry % perPage + 2) * PdfMerger.TOC_LINE_HEIGHT
+            pdf.text(PdfMerger.TOC_MARGIN, y, self._latin1(sourceTitle))
+            pdf.text(PdfMerger.TOC_PAGE_NUMBER_X, y, f'{firstPage + 1}')
+
+            baseline: float = PdfMerger.TOC_PAGE_HEIGHT - y
+            linkRects.append((PdfMerger.TOC_MARGIN, baseline - 4,
+                              PdfMerger.TOC_PAGE_WIDTH - PdfMerger.TOC_MARGIN, baseline + PdfMerger.TOC_ENTRY_SIZE))
+
+        return bytes(pdf.output()), linkRects
+
+    def _latin1(self, text: str) -> str:
+        """
+        The core PDF fonts only have the latin-1 characters
+        """
+        return text.encode('latin-1', errors='replace').decode('latin-1')
@@ -0,0 +1,167 @@
+from typing import cast
+from typing import final
+
+from logging import Logger
+from logging import getLogger
+
+from time import localtime
+from time import strftime
+
+from pyumldiagrams.Definitions import ClassDefinition
+from pyumldiagrams.Definitions import ClassDefinitions
+from pyumldiagrams.Definitions import DefinitionType
+from pyumldiagrams.Definitions import MethodDefinition
+from pyumldiagrams.Definitions import Methods
+from pyumldiagrams.Definitions import ParameterDefinition
+from pyumldiagrams.Definitions import Parameters
+from pyumldiagrams.Definitions import Position
+from pyumldiagrams.Definitions import Size
+from pyumldiagrams.Definitions import UmlLineDefinition
+from pyumldiagrams.Definitions import UmlLineDefinitions
+from pyumldiagrams.Definitions import LineType
+from pyumldiagrams.image.ImageDiagram import ImageDiagram
+
+from pyumldiagrams.pdf.PdfDiagram import PdfDiagram
+
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutMethod import PyutMethod
+from org.pyut.model.PyutVisibilityEnum import PyutVisibilityEnum
+
+from org.pyut.enums.LinkType import LinkType
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import RecordPoint
+
+from org.pyut.plugins.io.pyumlsupport.ImageFormat import ImageFormat
+from org.pyut.plugins.io.pyumlsupport.ImageOptions import ImageOptions
+
+
+class PyUmlDefinitionWriter:
+    """
+    Draws classes and lines with pyumldiagrams.  It knows nothing about the UI;
+    `OglToPyUmlDefinition` feeds it from OGL objects and `drawDocument()` feeds it from
+    the records of a document read without UI.
+    """
+    INHERITANCE_DESTINATION_POSITION_NUDGE_FACTOR: final = 1
+
+    def __init__(self, imageOptions: ImageOptions, dpi: int = 0, pyutVersion: str = '', pluginVersion: str = ''):
+        """
+
+        Args:
+            imageOptions: Lots of information on how to draw the diagram
+
+            dpi:  Dots per inch;  Only used in PDF generation;  Image generation is in pixels
+
+            pyutVersion:  Information for header
+
+            pluginVersion:  Information for header
+        """
+
+        self.logger:              Logger             = getLogger(__name__)
+        self._classDefinitions:   ClassDefinitions   = []
+        self._umlLineDefinitions: UmlLineDefinitions = []
+
+        today: str = strftime("%d %b %Y %H:%M:%S", localtime())
+        headerText: str = f'Pyut Version {pyutVersion} Plugin Version {pluginVersion} - {today}'
+
+        fqFileName:  str         = imageOptions.outputFileName
+        imageFormat: ImageFormat = imageOptions.imageFormat
+        if imageFormat == ImageFormat.PDF:
+            self._diagram: PdfDiagram = PdfDiagram(fileName=fqFileName, dpi=dpi, headerText=headerText)
+        else:
+            self._diagram: ImageDiagram = ImageDiagram(fileName=fqFileName,
+                                                       headerText=headerText   # TODO use image size from new method signature
+                                                       )
+
+    def drawDocument(self, documentModel: DocumentModel):
+        """
+        Draw the classes of a document read without UI and the lines between them
+
+        Args:
+            documentModel:  A class diagram
+        """
+        for shape in documentModel.shapes.values():
+            if isinstance(shape.pyutObject, PyutClass):
+                self.drawClass(shape.pyutObject, shape.x, shape.y, shape.width, shape.height)
+
+        for link in documentModel.links:
+            if isinstance(documentModel.shapes[link.sourceId].pyutObject, PyutClass):
+                self.drawLine(link.pyutLink.linkType, link.sourceAnchor, link.destinationAnchor)
+
+    def drawClass(self, pyutClass: PyutClass, x: float, y: float, width: float, height: float) -> ClassDefinition:
+
+        position: Position = Position(x=x, y=y)
+        size:     Size     = Size(width=int(width), height=int(height))
+        classDefinition: ClassDefinition = ClassDefinition(name=pyutClass.name, position=position, size=size)
+        self._addMethods(classDefinition=classDefinition, pyutClass=pyutClass)
+        self._diagram.drawClass(classDefinition=classDefinition)
+        self._classDefinitions.append(classDefinition)
+
+        return classDefinition
+
+    def drawLine(self, umlLinkType: LinkType, source: RecordPoint, destination: RecordPoint) -> UmlLineDefinition:
+
+        lineType: LineType = self._toPyUmlLineType(umlLinkType)
+
+        sourcePosition:      Position = Position(x=source[0], y=source[1])
+        destinationPosition: Position = Position(x=destination[0], y=destination[1])
+        self.logger.info(f'{lineType=} {sourcePosition=} {destinationPosition=}')
+
+        line: UmlLineDefinition = UmlLineDefinition(source=sourcePosition, destination=destinationPosition, lineType=lineType)
+        self._diagram.drawUmlLine(lineDefinition=line)
+        self._umlLineDefinitions.append(line)
+
+        return line
+
+    def write(self):
+        self._diagram.write()
+
+    def _toPyUmlLineType(self, umlLinkType) -> LineType:
+
+        if umlLinkType == LinkType.INHERITANCE:
+            lineType: LineType = LineType.Inheritance
+        elif umlLinkType == LinkType.COMPOSITION:
+            lineType: LineType = LineType.Composition
+        elif umlLinkType == LinkType.AGGREGATION:
+            lineType: LineType = LineType.Aggregation
+        else:
+            lineType: LineType = LineType.Association   # This won't happen yet
+
+        return lineType
+
+    def _addMethods(self, classDefinition: ClassDefinition, pyutClass: PyutClass) -> ClassDefinition:
+
+        methods: Methods = []
+        for pyutMethod in pyutClass.methods:
+
+            pyutMethod: PyutMethod = cast(PyutMethod, pyutMethod)
+
+            methodDef: MethodDefinition = MethodDefinition(name=pyutMethod.name)
+            methodDef.visibility = self.__toDefinitionType(pyutMethod.visibility)
+            methodDef.returnType = pyutMethod.returnType.value
+
+            self.__addParameters(methodDefinition=methodDef, pyutMethod=pyutMethod)
+            methods.append(methodDef)
+
+        classDefinition.methods = methods
+        return classDefinition
+
+    def __addParameters(self, methodDefinition: MethodDefinition, pyutMethod: PyutMethod) -> MethodDefinition:
+
+        parameters: Parameters = []
+        for parameter in pyutMethod.parameters:
+
+            paramDef: ParameterDefinition = ParameterDefinition(name=parameter.name)
+            paramDef.parameterType = parameter.type.value
+            paramDef.defaultValue  = parameter.defaultValue
+
+            parameters.append(paramDef)
+
+        methodDefinition.parameters = parameters
+        self.logger.info(f'{methodDefinition.name=}  {parameters=}')
+        return methodDefinition
+
+    def __toDefinitionType(self, visibility: PyutVisibilityEnum) -> DefinitionType:
+
+        if visibility == PyutVisibilityEnum.PUBLIC:
+            return DefinitionType.Public
@@ -131,6 +131,42 @@ class PyutToPython:
 
         return clsMethods
 
+    def generateClassCode(self, pyutClass: PyutClass) -> List[str]:
+        """
+        Generate the whole code of a class:  The class stanza, `__init__` and then the
+        other methods in their declared order
+
+        Args:
+            pyutClass:  The data model class
+
+        Returns:
+            The class code lines
+        """
+        generatedStanza:    str       = self.generateClassStanza(pyutClass)
+        generatedClassCode: List[str] = [generatedStanza]
+
+        clsMethods: PyutToPython.MethodsCodeType = self.generateMethodsCode(pyutClass)
+
+        # Add __init__ Method
+        if PyutToPython.SPECIAL_PYTHON_CONSTRUCTOR in clsMethods:
+            methodCode = clsMethods[PyutToPython.SPECIAL_PYTHON_CONSTRUCTOR]
+            generatedClassCode += methodCode
+            del clsMethods[PyutToPython.SPECIAL_PYTHON_CONSTRUCTOR]
+
+        # Add others methods in order
+        for pyutMethod in pyutClass.methods:
+            methodName: str = pyutMethod.getName()
+            if methodName != PyutToPython.SPECIAL_PYTHON_CONSTRUCTOR:
+                try:
+                    methodCode: List[str] = clsMethods[methodName]
+                    generatedClassCode += methodCode
+                except (ValueError, Exception, KeyError) as e:
+                    self.logger.warning(f'{e}')
+
+        generatedClassCode.append("\n\n")
+
+        return generatedClassCode
+
     def generateASingleMethodsCode(self, pyutMethod: PyutMethod, writePass: bool = True) -> List[str]:
         """
         Generate the Python code for the input method
@@ -7,11 +7,7 @@ from typing import Tuple
 from logging import Logger
 from logging import getLogger
 
-from tempfile import gettempdir
-
-from os import sep as osSep
-
-from networkx import read_gml
+from networkx import parse_gml
 from networkx import Graph
 
 from orthogonal.mapping.EmbeddedTypes import Position
@@ -61,9 +57,14 @@ class LayoutAreaSize:
 
 
 class OrthogonalAdapter:
-
+    """
+    The GML of the diagram is kept in memory;  It is only written to a file when
+    debugging, so that `layoutGml` can be shipped to another process as is.
+    """
     TEMPORARY_GML_LAYOUT_FILENAME: str = 'toOrthogonalLayoutV2.gml'
 
+    clsLogger: Logger = getLogger(__name__)
+
     def __init__(self, umlObjects: List[OglClass]):
 
         self.logger: Logger      = getLogger(__name__)
@@ -71,41 +72,59 @@ class OrthogonalAdapter:
 
         gmlExporter.translate(umlObjects=umlObjects)
 
+        self._gml: str = gmlExporter.gml
+
         if PyutPreferences().useDebugTempFileLocation is True:
-            self._pathToLayout = f'{OrthogonalAdapter.TEMPORARY_GML_LAYOUT_FILENAME}'
-        else:
-            tempDir: str = gettempdir()
-            self._pathToLayout = f'{tempDir}{osSep}{OrthogonalAdapter.TEMPORARY_GML_LAYOUT_FILENAME}'
+            with open(OrthogonalAdapter.TEMPORARY_GML_LAYOUT_FILENAME, 'w') as writer:
+                writer.write(self._gml)
 
-        with open(self._pathToLayout, 'w') as writer:
-            writer.write(gmlExporter.gml)
+        self._oglCoordinates: OglCoordinates = cast(OglCoordinates, None)
 
-        self._ets:            EmbeddingToScreen = cast(EmbeddingToScreen, None)
-        self._nxGraph:        Graph             = cast(Graph, None)
-        self._oglCoordinates: OglCoordinates    = cast(OglCoordinates, None)
+    @property
+    def gml(self) -> str:
+        return self._gml
 
     @property
     def oglCoordinates(self) -> OglCoordinates:
         return self._oglCoordinates
 
+    @oglCoordinates.setter
+    def oglCoordinates(self, newValue: OglCoordinates):
+        self._oglCoordinates = newValue
+
     def doLayout(self, layoutAreaSize: LayoutAreaSize):
 
-        self._nxGraph = Graph(read_gml(self._pathToLayout))
+        self._oglCoordinates = OrthogonalAdapter.layoutGml(self._gml, layoutAreaSize)
+
+    @staticmethod
+    def layoutGml(gml: str, layoutAreaSize: LayoutAreaSize) -> OglCoordinates:
+        """
+        Lay out a GML graph.  Does not touch any UI object so it can run in a worker process
+
+        Args:
+            gml:            The graph
+            layoutAreaSize: The size of the area the graph is mapped to
 
-        positions: LayoutEngineInput = self._toLayoutEngineInput(self._nxGraph)
+        Returns:  The coordinates of each node, by node label
+        """
+        nxGraph: Graph = Graph(parse_gml(gml))
 
-        self.logger.info(f'Generated positions: {positions}')
+        positions: LayoutEngineInput = OrthogonalAdapter._toLayoutEngineInput(nxGraph)
 
-        compact: Compaction = self._runLayout(nxGraph=self._nxGraph, positions=positions)
+        OrthogonalAdapter.clsLogger.info(f'Generated positions: {positions}')
+
+        compact: Compaction = OrthogonalAdapter._runLayout(nxGraph=nxGraph, positions=positions)
 
         enginePositions: LayoutEngineOutput = compact.pos
-        positions: Positions = self._toEmbeddedPositions(enginePositions)
+        embeddedPositions: Positions = OrthogonalAdapter._toEmbeddedPositions(enginePositions)
 
         screenSize: ScreenSize = ScreenSize(width=layoutAreaSize.width, height=layoutAreaSize.height)
-        self._ets = EmbeddingToScreen(screenSize, positions)
-        self._oglCoordinates = self._toOglCoordinates(nxGraph=self._nxGraph)
+        ets: EmbeddingToScreen = EmbeddingToScreen(screenSize, embeddedPositions)
+
+        return OrthogonalAdapter._toOglCoordinates(nxGraph=nxGraph, ets=ets)
 
-    def _runLayout(self, nxGraph: Graph, positions: Dict[str, Tuple]) -> Compaction:
+    @staticmethod
+    def _runLayout(nxGraph: Graph, positions: Dict[str, Tuple]) -> Compaction:
 
         try:
             planar:     Planarization     = Planarization(nxGraph, positions)
@@ -113,23 +132,25 @@ class OrthogonalAdapter:
             compact:    Compaction        = Compaction(orthogonal)
         except OrthogonalException as oe:
             eMsg: str = f'{oe}'
-            self.logger.error(eMsg)
+            OrthogonalAdapter.clsLogger.error(eMsg)
             raise OrthogonalAdapterException(eMsg)
 
         return compact
 
-    def _toLayoutEngineInput(self, nxGraph: Graph) -> LayoutEngineInput:
+    @staticmethod
+    def _toLayoutEngineInput(nxGraph: Graph) -> LayoutEngineInput:
 
         positions: LayoutEngineInput = {}
         for node in nxGraph:
-            self.logger.debug(f'node: {node}')
+            OrthogonalAdapter.clsLogger.debug(f'node: {node}')
             x: int = nxGraph.nodes[node]['graphics']['x']
             y: int = nxGraph.nodes[node]['graphics']['y']
             positions[node] = (x, y)
 
         return positions
 
-    def _toEmbeddedPositions(self, embeddedPositions: LayoutEngineOutput) -> Positions:
+    @staticmethod
+    def _toEmbeddedPositions(embeddedPositions: LayoutEngineOutput) -> Positions:
 
         positions: Positions = {}
         for nodeName in embeddedPositions.keys():
@@ -140,11 +161,12 @@ class OrthogonalAdapter:
 
         return positions
 
-    def _toOglCoordinates(self, nxGraph: Graph) -> OglCoordinates:
+    @staticmethod
+    def _toOglCoordinates(nxGraph: Graph, ets: EmbeddingToScreen) -> OglCoordinates:
 
         retCoordinates: OglCoordinates = {}
         for node in nxGraph:
-            scrCoordinates: ScreenCoordinates = self._ets.getScreenPosition(node)
+            scrCoordinates: ScreenCoordinates = ets.getScreenPosition(node)
             oglCoordinates: OglCoordinate     = OglCoordinate(scrCoordinates.x, scrCoordinates.y)
 
             retCoordinates[node] = oglCoordinates
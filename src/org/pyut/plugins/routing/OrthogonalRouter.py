@@ -0,0 +1,439 @@
+
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from heapq import heappop
+from heapq import heappush
+
+from bisect import bisect_left
+
+from org.pyut.MiniOgl.SpatialIndex import Bounds
+from org.pyut.MiniOgl.SpatialIndex import SpatialIndex
+
+RoutePoint  = Tuple[float, float]
+RoutePoints = List[RoutePoint]
+
+DEFAULT_MARGIN:         int = 20
+DEFAULT_BEND_PENALTY:   int = 40
+DEFAULT_SEARCH_MARGIN:  int = 300
+DEFAULT_MAX_EXPANSIONS: int = 20000
+
+HORIZONTAL: int = 0
+VERTICAL:   int = 1
+
+NORTH: str = 'N'
+SOUTH: str = 'S'
+EAST:  str = 'E'
+WEST:  str = 'W'
+
+
+@dataclass
+class LinkRoute:
+    """
+    The computed geometry of a link:  Where its two anchors go and the bend
+    points in between
+    """
+    source:      RoutePoint
+    destination: RoutePoint
+    bends:       RoutePoints = field(default_factory=list)
+
+    def points(self) -> RoutePoints:
+        return [self.source] + self.bends + [self.destination]
+
+
+LinkRoutes = Dict[Hashable, LinkRoute]
+
+
+@dataclass
+class _RoutedLink:
+
+    sourceKey:      Hashable
+    destinationKey: Hashable
+    segmentCount:   int = 0
+
+
+class OrthogonalRouter:
+    """
+    Routes links around the shapes of a diagram with horizontal and vertical
+    segments only.
+
+    The shapes are obstacles kept in a spatial index.  For each link a sparse
+    grid is made from the borders (plus a margin) of the obstacles close to the
+    link, and an A* search with a bend penalty finds the path through that grid.
+    The segments of the routed links are kept in a second spatial index so that
+    when a shape moves only the links attached to it, or running through its
+    old or new spot, have to be routed again.
+    """
+    def __init__(self, margin: int = DEFAULT_MARGIN, bendPenalty: int = DEFAULT_BEND_PENALTY,
+                 searchMargin: int = DEFAULT_SEARCH_MARGIN, maxExpansions: int = DEFAULT_MAX_EXPANSIONS):
+        """
+
+        Args:
+            margin:         Distance kept between a link and the shapes
+            bendPenalty:    Cost of a bend, in the same unit as the segment lengths
+            searchMargin:   How far beyond the two end shapes the grid extends
+            maxExpansions:  Upper bound of A* node expansions per link before giving up
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._margin:        int = margin
+        self._bendPenalty:   int = bendPenalty
+        self._searchMargin:  int = searchMargin
+        self._maxExpansions: int = maxExpansions
+
+        self._obstacles: SpatialIndex = SpatialIndex()
+        self._segments:  SpatialIndex = SpatialIndex()
+
+        self._links:       Dict[Hashable, _RoutedLink]  = {}
+        self._shapeLinks:  Dict[Hashable, Set[Hashable]] = {}
+        self._routes:      LinkRoutes = {}
+
+    @property
+    def routes(self) -> LinkRoutes:
+        return self._routes
+
+    @property
+    def obstacleKeys(self) -> List[Hashable]:
+        return self._obstacles.keys()
+
+    @property
+    def linkKeys(self) -> List[Hashable]:
+        return list(self._links.keys())
+
+    def addObstacle(self, key: Hashable, x: float, y: float, width: float, height: float):
+        self._obstacles.insert(key, x, y, width, height)
+
+    def removeObstacle(self, key: Hashable) -> Set[Hashable]:
+        """
+        Remove an obstacle and report the links to route again
+
+        Returns:  The keys of the links attached to the obstacle or running through or around it
+        """
+        affected: Set[Hashable] = self.affectedBy(key)
+        self._obstacles.remove(key)
+
+        return affected
+
+    def obstacleBounds(self, key: Hashable) -> Bounds:
+        """
+        Returns:  The (left, top, right, bottom) of the obstacle or None if it is unknown
+        """
+        return self._obstacles.getBounds(key)
+
+    def addLink(self, linkKey: Hashable, sourceKey: Hashable, destinationKey: Hashable, points: RoutePoints = None):
+        """
+        Declare a link between two obstacles.
+
+        Args:
+            linkKey:        Link identifier
+            sourceKey:      Key of the source obstacle
+            destinationKey: Key of the destination obstacle
+            points:         The current geometry of the link, if any;  Used to find the links
+                            that a moving shape runs into
+        """
+        self._links[linkKey] = _RoutedLink(sourceKey=sourceKey, destinationKey=destinationKey)
+        self._shapeLinks.setdefault(sourceKey, set()).add(linkKey)
+        self._shapeLinks.setdefault(destinationKey, set()).add(linkKey)
+        if points is not None:
+            self._indexSegments(linkKey, points)
+
+    def removeLink(self, linkKey: Hashable):
+        """
+        Forget a link and its route;  Removing an unknown link is not an error
+        """
+        link: _RoutedLink = self._links.pop(linkKey, None)
+        if link is None:
+            return
+        for segment in range(link.segmentCount):
+            self._segments.remove((linkKey, segment))
+        for shapeKey in (link.sourceKey, link.destinationKey):
+            shapeLinks: Set[Hashable] = self._shapeLinks.get(shapeKey)
+            if shapeLinks is not None:
+                shapeLinks.discard(linkKey)
+                if len(shapeLinks) == 0:
+                    del self._shapeLinks[shapeKey]
+        self._routes.pop(linkKey, None)
+
+    def moveObstacle(self, key: Hashable, x: float, y: float, width: float, height: float) -> Set[Hashable]:
+        """
+        Move an obstacle and report the links to route again
+
+        Returns:  The keys of the links attached to the obstacle or running through or around its
+        old or new area
+        """
+        affected: Set[Hashable] = self.affectedBy(key)
+        self._obstacles.update(key, x, y, width, height)
+        affected.update(self.affectedBy(key))
+
+        return affected
+
+    def affectedBy(self, key: Hashable) -> Set[Hashable]:
+        """
+        Args:
+            key:  An obstacle key
+
+        Returns:  The links attached to the obstacle plus the links whose route crosses it or
+        goes around it
+        """
+        affected: Set[Hashable] = set(self._shapeLinks.get(key, ()))
+        bounds:   Bounds        = self._obstacles.getBounds(key)
+        if bounds is not None:
+            left, top, right, bottom = bounds
+            margin: int = self._margin
+            for segmentKey in self._segments.query(left - margin, top - margin, right - left + 2 * margin, bottom - top + 2 * margin):
+                affected.add(segmentKey[0])
+        return affected
+
+    def routeAll(self) -> LinkRoutes:
+        """
+        Route every declared link
+
+        Returns:  The new routes by link key
+        """
+        return self.reroute(list(self._links.keys()))
+
+    def reroute(self, linkKeys: List[Hashable]) -> LinkRoutes:
+        """
+        Route only the given links.  Links that share the side of a shape get
+        their anchors spread along that side.
+
+        Args:
+            linkKeys:  The links to route
+
+        Returns:  The new routes by link key;  Links that could not be routed are omitted
+        """
+        ends:   Dict[Hashable, Tuple[RoutePoint, RoutePoint, str, str]] = self._computeAnchors(linkKeys)
+        routes: LinkRoutes = {}
+        for linkKey in linkKeys:
+            if linkKey not in ends:
+                continue
+            srcAnchor, dstAnchor, srcSide, dstSide = ends[linkKey]
+            route: LinkRoute = self._route(linkKey, srcAnchor, dstAnchor, srcSide, dstSide)
+            if route is None:
+                self.logger.info(f'No orthogonal route found for {linkKey}')
+                continue
+            self._indexSegments(linkKey, route.points())
+            self._routes[linkKey] = route
+            routes[linkKey] = route
+
+        return routes
+
+    def _computeAnchors(self, linkKeys: List[Hashable]) -> Dict[Hashable, Tuple[RoutePoint, RoutePoint, str, str]]:
+        """
+        Pick the facing sides of the two end shapes, then spread the links that use the
+        same side of a shape along it, ordered by the position of their other end.
+        """
+        sides: Dict[Tuple[Hashable, str], List[Tuple[float, Hashable, bool]]] = {}
+        for linkKey in linkKeys:
+            link: _RoutedLink = self._links[linkKey]
+            srcBounds: Bounds = self._obstacles.getBounds(link.sourceKey)
+            dstBounds: Bounds = self._obstacles.getBounds(link.destinationKey)
+            if srcBounds is None or dstBounds is None:
+                continue
+            srcSide, dstSide = OrthogonalRouter._facingSides(srcBounds, dstBounds)
+            srcCenter: RoutePoint = OrthogonalRouter._center(srcBounds)
+            dstCenter: RoutePoint = OrthogonalRouter._center(dstBounds)
+
+            sortKey: int = 0 if srcSide in (NORTH, SOUTH) else 1
+            sides.setdefault((link.sourceKey, srcSide), []).append((dstCenter[sortKey], linkKey, True))
+            sides.setdefault((link.destinationKey, dstSide), []).append((srcCenter[sortKey], linkKey, False))
+
+        anchors: Dict[Hashable, Dict[bool, Tuple[RoutePoint, str]]] = {}
+        for (shapeKey, side), users in sides.items():
+            users.sort(key=lambda u: u[0])
+            left, top, right, bottom = self._obstacles.getBounds(shapeKey)
+            count: int = len(users)
+            for rank, (_, linkKey, isSource) in enumerate(users):
+                fraction: float = (rank + 1) / (count + 1)
+                if side == NORTH:
+                    point: RoutePoint = (left + (right - left) * fraction, top)
+                elif side == SOUTH:
+                    point = (left + (right - left) * fraction, bottom)
+                elif side == WEST:
+                    point = (left, top + (bottom - top) * fraction)
+                else:
+                    point = (right, top + (bottom - top) * fraction)
+                anchors.setdefault(linkKey, {})[isSource] = (point, side)
+
+        ends: Dict[Hashable, Tuple[RoutePoint, RoutePoint, str, str]] = {}
+        for linkKey, linkEnds in anchors.items():
+            srcAnchor, srcSide = linkEnds[True]
+            dstAnchor, dstSide = linkEnds[False]
+            ends[linkKey] = (srcAnchor, dstAnchor, srcSide, dstSide)
+
+        return ends
+
+    def _route(self, linkKey: Hashable, srcAnchor: RoutePoint, dstAnchor: RoutePoint, srcSide: str, dstSide: str) -> LinkRoute:
+
+        srcPort: RoutePoint = self._port(srcAnchor, srcSide)
+        dstPort: RoutePoint = self._port(dstAnchor, dstSide)
+
+        xs, ys = self._buildGrid(srcPort, dstPort)
+        path: RoutePoints = self._search(xs, ys, srcPort, dstPort, OrthogonalRouter._axis(srcSide), OrthogonalRouter._axis(dstSide))
+        if path is None:
+            return None
+        points: RoutePoints = OrthogonalRouter._simplify([srcAnchor] + path + [dstAnchor])
+
+        return LinkRoute(source=srcAnchor, destination=dstAnchor, bends=points[1:-1])
+
+    def _buildGrid(self, srcPort: RoutePoint, dstPort: RoutePoint) -> Tuple[List[float], List[float]]:
+        """
+        The grid lines are the borders of the nearby obstacles pushed out by the margin, the
+        two ports and the limits of the search area
+        """
+        searchMargin: int = self._searchMargin
+        margin:       int = self._margin
+
+        left:   float = min(srcPort[0], dstPort[0]) - searchMargin
+        top:    float = min(srcPort[1], dstPort[1]) - searchMargin
+        right:  float = max(srcPort[0], dstPort[0]) + searchMargin
+        bottom: float = max(srcPort[1], dstPort[1]) + searchMargin
+
+        xs: Set[float] = {left, right, srcPort[0], dstPort[0]}
+        ys: Set[float] = {top, bottom, srcPort[1], dstPort[1]}
+        for key in self._obstacles.query(left, top, right - left, bottom - top):
+            oLeft, oTop, oRight, oBottom = self._obstacles.getBounds(key)
+            xs.update((oLeft - margin, oRight + margin))
+            ys.update((oTop - margin, oBottom + margin))
+
+        return sorted(xs), sorted(ys)
+
+    def _search(self, xs: List[float], ys: List[float], start: RoutePoint, goal: RoutePoint, startAxis: int, goalAxis: int) -> RoutePoints:
+        """
+        A* over the grid.  A state is a grid node plus the axis of the segment that reached it,
+        so that bends can be charged.
+
+        Returns:  The grid points from `start` to `goal` or None
+        """
+        startNode: Tuple[int, int] = (bisect_left(xs, start[0]), bisect_left(ys, start[1]))
+        goalNode:  Tuple[int, int] = (bisect_left(xs, goal[0]),  bisect_left(ys, goal[1]))
+        goalX, goalY = goal
+
+        freeEdges:   Dict[Tuple[int, int, int, int], bool] = {}
+        bestCost:    Dict[Tuple[int, int, int], float]      = {}
+        cameFrom:    Dict[Tuple[int, int, int], Tuple[int, int, int]] = {}
+        openHeap:    List[Tuple[float, float, Tuple[int, int, int]]] = []
+
+        startState: Tuple[int, int, int] = (startNode[0], startNode[1], startAxis)
+        bestCost[startState] = 0.0
+        heappush(openHeap, (0.0, 0.0, startState))
+
+        expansions: int = 0
+        while openHeap:
+            _, cost, state = heappop(openHeap)
+            if cost > bestCost.get(state, float('inf')):
+                continue
+            i, j, axis = state
+            if (i, j) == goalNode:
+                return self._rebuildPath(xs, ys, cameFrom, state)
+            expansions += 1
+            if expansions > self._maxExpansions:
+                return None
+
+            for ni, nj, nAxis in ((i - 1, j, HORIZONTAL), (i + 1, j, HORIZONTAL), (i, j - 1, VERTICAL), (i, j + 1, VERTICAL)):
+                if ni < 0 or nj < 0 or ni >= len(xs) or nj >= len(ys):
+                    continue
+                if not self._isEdgeFree(xs, ys, i, j, ni, nj, freeEdges):
+                    continue
+                newCost: float = cost + abs(xs[ni] - xs[i]) + abs(ys[nj] - ys[j])
+                if nAxis != axis:
+                    newCost += self._bendPenalty
+                if (ni, nj) == goalNode and nAxis != goalAxis:
+                    newCost += self._bendPenalty
+                newState: Tuple[int, int, int] = (ni, nj, nAxis)
+                if newCost < bestCost.get(newState, float('inf')):
+                    bestCost[newState] = newCost
+                    cameFrom[newState] = state
+                    estimate: float = newCost + abs(goalX - xs[ni]) + abs(goalY - ys[nj])
+                    heappush(openHeap, (estimate, newCost, newState))
+
+        return None
+
+    def _isEdgeFree(self, xs: List[float], ys: List[float], i: int, j: int, ni: int, nj: int, cache: Dict) -> bool:
+
+        edgeKey: Tuple[int, int, int, int] = (min(i, ni), min(j, nj), max(i, ni), max(j, nj))
+        free: bool = cache.get(edgeKey)
+        if free is None:
+            x1, y1, x2, y2 = xs[edgeKey[0]], ys[edgeKey[1]], xs[edgeKey[2]], ys[edgeKey[3]]
+            free = self._obstacles.isFree(x1, y1, x2 - x1, y2 - y1)
+            cache[edgeKey] = free
+        return free
+
+    def _rebuildPath(self, xs: List[float], ys: List[float], cameFrom: Dict, state: Tuple[int, int, int]) -> RoutePoints:
+
+        path: RoutePoints = []
+        while state is not None:
+            path.append((xs[state[0]], ys[state[1]]))
+            state = cameFrom.get(state)
+        path.reverse()
+        return path
+
+    def _port(self, anchor: RoutePoint, side: str) -> RoutePoint:
+        """
+        The point just outside a shape from which a link leaves the shape's side
+        """
+        x, y = anchor
+        margin: int = self._margin
+        if side == NORTH:
+            return x, y - margin
+        elif side == SOUTH:
+            return x, y + margin
+        elif side == WEST:
+            return x - margin, y
+        return x + margin, y
+
+    def _indexSegments(self, linkKey: Hashable, points: RoutePoints):
+
+        link: _RoutedLink = self._links[linkKey]
+        for segment in range(link.segmentCount):
+            self._segments.remove((linkKey, segment))
+        for segment in range(len(points) - 1):
+            (x1, y1), (x2, y2) = points[segment], points[segment + 1]
+            self._segments.insert((linkKey, segment), x1, y1, x2 - x1, y2 - y1)
+        link.segmentCount = max(len(points) - 1, 0)
+
+    @staticmethod
+    def _facingSides(srcBounds: Bounds, dstBounds: Bounds) -> Tuple[str, str]:
+
+        srcX, srcY = OrthogonalRouter._center(srcBounds)
+        dstX, dstY = OrthogonalRouter._center(dstBounds)
+        dx: float = dstX - srcX
+        dy: float = dstY - srcY
+        if abs(dx) >= abs(dy):
+            return (EAST, WEST) if dx >= 0 else (WEST, EAST)
+        return (SOUTH, NORTH) if dy >= 0 else (NORTH, SOUTH)
+
+    @staticmethod
+    def _center(bounds: Bounds) -> RoutePoint:
+        left, top, right, bottom = bounds
+        return (left + right) / 2, (top + bottom) / 2
+
+    @staticmethod
+    def _axis(side: str) -> int:
+        return VERTICAL if side in (NORTH, SOUTH) else HORIZONTAL
+
+    @staticmethod
+    def _simplify(points: RoutePoints) -> RoutePoints:
+        """
+        Drop duplicate points and the points in the middle of a straight run
+        """
+        simplified: RoutePoints = []
+        for point in points:
+            if simplified and simplified[-1] == point:
+                continue
+            if len(simplified) >= 2:
+                (x0, y0), (x1, y1) = simplified[-2], simplified[-1]
+                if (x0 == x1 == point[0]) or (y0 == y1 == point[1]):
+                    simplified[-1] = point
+                    continue
+            simplified.append(point)
+        return simplified
@@ -21,6 +21,8 @@ class RealSugiyamaNode(SugiyamaNode):
     :contact: nicdub@gmx.ch
     :version: $Revision: 1.4 $
     """
+    __slots__ = ('__aLayoutNode',)
+
     def __init__(self, oglObject):
         """
         Constructor.
@@ -20,6 +20,8 @@ class SugiyamaNode:
     SugiyamaNode. You have to use RealSugiyamaNode or VirtualSugiyamaNode
     objects.
     """
+    __slots__ = ('__barycenter', '__index', '__level', '__leftNode', '__rightNode', '__parents', '__children', '__links')
+
     def __init__(self):
         """
         """
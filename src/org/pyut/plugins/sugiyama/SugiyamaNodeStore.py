@@ -0,0 +1,301 @@
+
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from array import array
+
+from math import isnan
+
+NO_BARYCENTER: float = float('nan')
+
+NodeIds = List[int]
+
+
+class SugiyamaNodeStore:
+    """
+    Array backed storage of the Sugiyama graph used by the crossing reduction.
+
+    A node is a row number.  Its level, index on the level and barycenter live in
+    typed arrays;  The parent and child relations are kept in compressed sparse rows
+    (an offsets array and a targets array), so a virtual node of a long edge costs a
+    few machine words instead of a Python object with lists of tuples.
+
+    Usage:  `addNode()` for every node, `addEdge()` for every parent/child relation,
+    `build()`, then `reduceCrossings()` and read the new order with `getOrder()`.
+    """
+    MAX_ITERATIONS: int = 20
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._level:      array = array('l')
+        self._index:      array = array('l')
+        self._barycenter: array = array('d')
+
+        self._levels: List[array] = []
+
+        self._edgeParents:  array = array('l')
+        self._edgeChildren: array = array('l')
+
+        self._parentOffsets: array = array('l', [0])
+        self._parents:       array = array('l')
+        self._childOffsets:  array = array('l', [0])
+        self._children:      array = array('l')
+
+    def __len__(self) -> int:
+        return len(self._level)
+
+    @property
+    def levelCount(self) -> int:
+        return len(self._levels)
+
+    def addNode(self, level: int) -> int:
+        """
+        Append a node at the right end of a level
+
+        Args:
+            level:  Level index
+
+        Returns:  The node id
+        """
+        nodeId: int = len(self._level)
+        while len(self._levels) <= level:
+            self._levels.append(array('l'))
+        self._level.append(level)
+        self._index.append(len(self._levels[level]))
+        self._barycenter.append(NO_BARYCENTER)
+        self._levels[level].append(nodeId)
+
+        return nodeId
+
+    def addEdge(self, parentId: int, childId: int):
+        """
+        Declare a hierarchical relation;  The child must be on the level right below the parent
+
+        Args:
+            parentId:   Node id of the parent
+            childId:    Node id of the child
+        """
+        self._edgeParents.append(parentId)
+        self._edgeChildren.append(childId)
+
+    def build(self):
+        """
+        Compress the declared edges into the parent and child adjacency rows
+        """
+        self._parentOffsets, self._parents = self._compress(self._edgeChildren, self._edgeParents)
+        self._childOffsets,  self._children = self._compress(self._edgeParents, self._edgeChildren)
+
+    def getLevel(self, nodeId: int) -> int:
+        return self._level[nodeId]
+
+    def getIndex(self, nodeId: int) -> int:
+        return self._index[nodeId]
+
+    def getBarycenter(self, nodeId: int) -> Optional[float]:
+        """
+        Returns:  The last computed barycenter or `None` if the node has no neighbour on the used side
+        """
+        barycenter: float = self._barycenter[nodeId]
+        return None if isnan(barycenter) else barycenter
+
+    def getOrder(self, level: int) -> NodeIds:
+        """
+        Returns:  The node ids of the level, left to right
+        """
+        return self._levels[level].tolist()
+
+    def getParents(self, nodeId: int) -> NodeIds:
+        return self._parents[self._parentOffsets[nodeId]:self._parentOffsets[nodeId + 1]].tolist()
+
+    def getChildren(self, nodeId: int) -> NodeIds:
+        return self._children[self._childOffsets[nodeId]:self._childOffsets[nodeId + 1]].tolist()
+
+    def upBarycenterLevel(self, level: int):
+        """
+        Barycenter of every node of the level computed on the indices of its parents
+        """
+        self._averageIndices(level, self._parentOffsets, self._parents)
+
+    def downBarycenterLevel(self, level: int):
+        """
+        Barycenter of every node of the level computed on the indices of its children
+        """
+        self._averageIndices(level, self._childOffsets, self._children)
+
+    def countCrossings(self) -> int:
+        """
+        Returns:  The number of hierarchical link crossings of the whole graph
+        """
+        return sum(self.countCrossingsBelow(level) for level in range(len(self._levels) - 1))
+
+    def countCrossingsBelow(self, upperLevel: int) -> int:
+        """
+        Count the crossings between a level and the one below it.  Two links cross when
+        their parents and their children are in opposite orders.  The links are visited in
+        parent order and the children indices already seen are kept in a Fenwick tree, so
+        the count is O(E log V) instead of comparing every pair of links.
+
+        Args:
+            upperLevel: Index of the upper level
+
+        Returns:  The number of crossings
+        """
+        index:        array = self._index
+        childOffsets: array = self._childOffsets
+        children:     array = self._children
+        size:         int   = len(self._levels[upperLevel + 1])
+        tree:         List[int] = [0] * (size + 1)
+        seen:         int   = 0
+        count:        int   = 0
+        for parentId in self._levels[upperLevel]:
+            childIndices: List[int] = sorted(index[childId] for childId in children[childOffsets[parentId]:childOffsets[parentId + 1]])
+            # Links of the same parent never cross each other;  Count them all before adding any
+            for childIndex in childIndices:
+                position: int = childIndex + 1
+                notGreater: int = 0
+                while position > 0:
+                    notGreater += tree[position]
+                    position -= position & -position
+                count += seen - notGreater
+            for childIndex in childIndices:
+                position = childIndex + 1
+                while position <= size:
+                    tree[position] += 1
+                    position += position & -position
+                seen += 1
+
+        return count
+
+    def sortLevel(self, level: int):
+        """
+        Sort the nodes of a level on their barycenter;  Nodes without a barycenter keep their
+        place.  The old order is kept if the new one has more crossings.
+
+        Args:
+            level:  Level index
+        """
+        nodes:      array = self._levels[level]
+        barycenter: array = self._barycenter
+        crossings:  int   = self._countCrossingsAround(level)
+
+        slots:  List[int] = [i for i, nodeId in enumerate(nodes) if not isnan(barycenter[nodeId])]
+        sortedNodes: List[int] = sorted((nodes[i] for i in slots), key=barycenter.__getitem__)
+        newOrder: array = array('l', nodes)
+        for slot, nodeId in zip(slots, sortedNodes):
+            newOrder[slot] = nodeId
+
+        self._setOrder(level, newOrder)
+        if self._countCrossingsAround(level) > crossings:
+            self._setOrder(level, nodes)
+
+    def shiftSameBarycenter(self, level: int):
+        """
+        Left circular shift of every run of nodes that have the same barycenter.  The old
+        order is kept if the new one has more crossings.
+
+        Args:
+            level:  Level index
+        """
+        nodes:      array = self._levels[level]
+        barycenter: array = self._barycenter
+        crossings:  int   = self._countCrossingsAround(level)
+
+        newOrder: array = array('l', nodes)
+        for i in range(len(newOrder) - 1):
+            left:  float = barycenter[newOrder[i]]
+            right: float = barycenter[newOrder[i + 1]]
+            if not isnan(left) and left == right:
+                newOrder[i], newOrder[i + 1] = newOrder[i + 1], newOrder[i]
+
+        self._setOrder(level, newOrder)
+        if self._countCrossingsAround(level) > crossings:
+            self._setOrder(level, nodes)
+
+    def reduceCrossings(self, maxIterations: int = MAX_ITERATIONS) -> int:
+        """
+        Barycenter method:  Alternate downward sweeps, ordering each level on its parents, and
+        upward sweeps, ordering each level on its children, until there are no crossings left
+        or `maxIterations` sweeps were done.
+
+        Args:
+            maxIterations:  Maximum number of down and up sweeps
+
+        Returns:  The number of remaining crossings
+        """
+        levelCount: int = len(self._levels)
+        crossings:  int = self.countCrossings()
+        while crossings > 0 and maxIterations > 0:
+            for level in range(1, levelCount):
+                self.upBarycenterLevel(level)
+                self.sortLevel(level)
+                self.shiftSameBarycenter(level)
+
+            crossings = self.countCrossings()
+            if crossings > 0:
+                for level in range(levelCount - 2, -1, -1):
+                    self.downBarycenterLevel(level)
+                    self.sortLevel(level)
+                    self.shiftSameBarycenter(level)
+                crossings = self.countCrossings()
+                maxIterations -= 1
+
+        self.logger.debug(f'Remaining crossings: {crossings}')
+
+        return crossings
+
+    def _averageIndices(self, level: int, offsets: array, targets: array):
+
+        index:      array = self._index
+        barycenter: array = self._barycenter
+        for nodeId in self._levels[level]:
+            start: int = offsets[nodeId]
+            end:   int = offsets[nodeId + 1]
+            if start == end:
+                barycenter[nodeId] = NO_BARYCENTER
+            else:
+                barycenter[nodeId] = sum(index[target] for target in targets[start:end]) / (end - start)
+
+    def _countCrossingsAround(self, level: int) -> int:
+        """
+        Reordering a level only changes the crossings with the levels above and below it
+        """
+        count: int = 0
+        if level > 0:
+            count += self.countCrossingsBelow(level - 1)
+        if level < len(self._levels) - 1:
+            count += self.countCrossingsBelow(level)
+
+        return count
+
+    def _setOrder(self, level: int, nodes: array):
+
+        index: array = self._index
+        for position, nodeId in enumerate(nodes):
+            index[nodeId] = position
+        self._levels[level] = nodes
+
+    def _compress(self, sources: array, targets: array):
+        """
+        Group the targets by source into compressed sparse rows
+
+        Returns:  (offsets, targets) with the targets of node `n` in `targets[offsets[n]:offsets[n + 1]]`
+        """
+        nodeCount: int   = len(self._level)
+        offsets:   array = array('l', [0]) * (nodeCount + 1)
+        for source in sources:
+            offsets[source + 1] += 1
+        for nodeId in range(nodeCount):
+            offsets[nodeId + 1] += offsets[nodeId]
+
+        rows:   array = array('l', offsets)
+        packed: array = array('l', [0]) * len(targets)
+        for source, target in zip(sources, targets):
+            packed[rows[source]] = target
+            rows[source] += 1
+
+        return offsets, packed
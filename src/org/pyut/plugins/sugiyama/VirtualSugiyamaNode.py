@@ -8,6 +8,8 @@ class VirtualSugiyamaNode(SugiyamaNode):
     will not be visible on the diagram.  It is used to reserve space
     for the links drawing.
     """
+    __slots__ = ('__position', '__size')
+
     def __init__(self):
         """
         Constructor.
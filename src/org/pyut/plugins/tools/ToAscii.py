@@ -1,26 +1,39 @@
 
 from typing import List
 
-from math import floor
-from math import ceil
-
+from os import listdir
 from os import path as osPath
-from os import chdir
-from os import getcwd
+
+from wx import CANCEL
+from wx import CENTRE
+from wx import ICON_QUESTION
+from wx import MessageBox
+from wx import YES
+from wx import YES_NO
 
 from org.pyut.PyutPreferences import PyutPreferences
 from org.pyut.model.PyutClass import PyutClass
 from org.pyut.plugins.base.PyutToPlugin import PyutToPlugin
 
 from org.pyut.ogl.OglClass import OglClass
+from org.pyut.ogl.OglLink import OglLink
+from org.pyut.ogl.OglObject import OglObject
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import LinkRecord
+from org.pyut.persistence.DocumentModel import ShapeRecord
+
+from org.pyut.plugins.ascii.AsciiRenderer import AsciiRenderer
 
 from org.pyut.ui.UmlFrame import UmlFrame
 
 
 class ToAscii(PyutToPlugin):
     """
-    Python code generation/reverse engineering
+    Exports the selected classes as ASCII boxes, one file per class, or the whole diagram as text
     """
+    DIAGRAM_FILE_NAME: str = 'Diagram'
+
     def __init__(self, umlObjects: List[OglClass], umlFrame: UmlFrame):
         """
 
@@ -31,6 +44,8 @@ class ToAscii(PyutToPlugin):
         PyutToPlugin.__init__(self, umlObjects, umlFrame)
         self._umlFrame = umlFrame
 
+        self._wholeDiagram: bool = False
+
     def getName(self) -> str:
         """
         Returns: the name of the plugin.
@@ -62,74 +77,48 @@ class ToAscii(PyutToPlugin):
 
         Returns: if False, the import will be cancelled.
         """
-        return True
+        answer: int = MessageBox("Export the whole diagram in a single file ?", "Export option", style=YES_NO | CANCEL | CENTRE | ICON_QUESTION)
+        self._wholeDiagram = (answer == YES)
+        return answer != CANCEL
 
     def write(self, oglObjects: List[OglClass]):
         """
-        Write the data to a file
+        Write one file per selected class, or the whole diagram in a single file
         Args:
             oglObjects:   The objects to export
         """
-        saveDir:    str             = getcwd()
         prefs:      PyutPreferences = PyutPreferences()
         defaultDir: str             = prefs.userDirectory
 
         selectedDir = self._askForDirectoryExport(preferredDefaultPath=defaultDir)
         if selectedDir == '':
             return
-        print(f'selectedDir: {selectedDir}')
-        chdir(selectedDir)
-
-        for oglObject in oglObjects:
-
-            if not isinstance(oglObject, OglClass):
-                continue
-
-            o: PyutClass = oglObject.getPyutObject()
-
-            suffix = 2
-            filename = o.getName()
-
-            while osPath.exists(filename + ".acl"):
-                print("File exists")
-                filename += str(suffix)
-                suffix += 1
-
-            file = open(filename + ".acl", "w")
-
-            # base = []
-            base = [o.getName()]
-            if o.getStereotype() is not None:
-                base.append(str(o.getStereotype()))
-
-            fields = [str(x) for x in o.fields]
-            methods = [str(x) for x in o.methods]
-
-            lineLength = max([len(x) for x in base + fields + methods]) + 4
-
-            file.write(lineLength * "-" + "\n")
-
-            for line in base:
-                spaces = lineLength - 4 - len(line)
-                file.write("| " + int(floor(spaces / 2.0)) * " " + line + int(ceil(spaces / 2.0)) * " " + " |\n")
-
-            file.write("|" + (lineLength - 2) * "-" + "|\n")
-
-            for line in fields:
-                file.write("| " + line + (lineLength - len(line) - 4) * " " + " |\n")
-
-            file.write("|" + (lineLength - 2) * "-" + "|\n")
-
-            for line in methods:
-                file.write("| " + line + (lineLength - len(line) - 4) * " " + " |\n")
-
-            file.write(lineLength * "-" + "\n\n")
-
-            file.write(o.description)
-
-            file.close()
 
-        chdir(saveDir)
+        asciiRenderer: AsciiRenderer = AsciiRenderer()
+        if self._wholeDiagram is True:
+            baseName: str = asciiRenderer.uniqueNames([ToAscii.DIAGRAM_FILE_NAME], set(listdir(selectedDir)))[0]
+            fileName: str = osPath.join(selectedDir, f'{baseName}.{AsciiRenderer.EXTENSION}')
+            asciiRenderer.writeDocument(self._toDocumentModel(self._umlFrame.getUmlObjects()), fileName)
+        else:
+            pyutClasses: List[PyutClass] = [oglObject.getPyutObject() for oglObject in oglObjects if isinstance(oglObject, OglClass)]
+            asciiRenderer.writeClasses(pyutClasses, selectedDir)
+
+    def _toDocumentModel(self, umlObjects: List[OglObject]) -> DocumentModel:
+        """
+        The shapes and the links of the frame as records
+        """
+        documentModel: DocumentModel = DocumentModel()
+        for umlObject in umlObjects:
+            if isinstance(umlObject, OglLink):
+                documentModel.links.append(LinkRecord(pyutLink=umlObject.getPyutObject(),
+                                                      sourceId=umlObject.getSourceShape().getPyutObject().getId(),
+                                                      destinationId=umlObject.getDestinationShape().getPyutObject().getId()))
+            elif isinstance(umlObject, OglObject):
+                x, y          = umlObject.GetPosition()
+                width, height = umlObject.GetSize()
+                documentModel.shapes[umlObject.getPyutObject().getId()] = ShapeRecord(pyutObject=umlObject.getPyutObject(),
+                                                                                      x=x, y=y, width=width, height=height)
+        return documentModel
 
     def doAction(self, umlObjects: List[OglClass], selectedObjects: List[OglClass], umlFrame: UmlFrame):
         """
@@ -139,7 +128,7 @@ class ToAscii(PyutToPlugin):
             selectedObjects:    list of the selected objects
             umlFrame:           The diagram frame
         """
-        if len(selectedObjects) < 1:
+        if self._wholeDiagram is False and len(selectedObjects) < 1:
             self.displayNothingSelected()
             return
         self.write(selectedObjects)
@@ -92,7 +92,7 @@ class ToCDAutoLayout(PyutToPlugin):
 
         self.logger.debug(f'src: ({srcX},{srcY})')
 
-        for link in srcShape.getLinks():
+        for link in srcShape.getLinkIndex():
             dstShape = link.getDestinationShape()
             if dstShape != srcShape:
                 dstX, dstY = dstShape.GetPosition()
@@ -0,0 +1,133 @@
+
+from typing import List
+from typing import Set
+
+from logging import Logger
+from logging import getLogger
+
+from org.pyut.MiniOgl.SpatialIndex import SpatialIndex
+
+from org.pyut.ogl.OglClass import OglClass
+from org.pyut.ogl.OglObject import OglObject
+
+from org.pyut.plugins.base.PyutToPlugin import PyutToPlugin
+
+from org.pyut.plugins.incremental.IncrementalLayout import IncrementalLayout
+from org.pyut.plugins.incremental.IncrementalLayout import IncrementalNode
+from org.pyut.plugins.incremental.IncrementalLayout import IncrementalNodes
+from org.pyut.plugins.incremental.IncrementalLayout import NodePositions
+
+from org.pyut.ui.UmlFrame import UmlFrame
+
+
+class ToIncrementalLayout(PyutToPlugin):
+    """
+    Incremental layout:  Only the selected classes are moved.  When nothing is
+    selected, the classes that overlap another shape (typically freshly added or
+    imported ones) are placed.  Every other shape keeps its position.
+    """
+    def __init__(self, umlObjects: List[OglClass], umlFrame: UmlFrame):
+        """
+        Args:
+            umlObjects: list of ogl objects
+            umlFrame: PyUt's UML Frame
+        """
+        super().__init__(umlObjects, umlFrame)
+        self.logger: Logger = getLogger(__name__)
+
+    def getName(self) -> str:
+        """
+        Returns: the name of the plugin.
+        """
+        return "Incremental Layout"
+
+    def getAuthor(self) -> str:
+        """
+        Returns: The author's name
+        """
+        return "Humberto A. Sanchez II"
+
+    def getVersion(self) -> str:
+        """
+        Returns: The plugin version string
+        """
+        return "1.0"
+
+    def getMenuTitle(self) -> str:
+        """
+        Returns:  The menu title for this plugin
+        """
+        return "Incremental Layout"
+
+    def doAction(self, umlObjects: List[OglObject], selectedObjects: List[OglObject], umlFrame: UmlFrame):
+        """
+
+        Args:
+            umlObjects:         list of the uml objects of the diagram
+            selectedObjects:    list of the selected objects
+            umlFrame:           The diagram frame
+        """
+        if umlFrame is None:
+            self.displayNoUmlFrame()
+            return
+
+        toPlace: List[OglClass] = [oglObject for oglObject in selectedObjects if isinstance(oglObject, OglClass)]
+        if len(toPlace) == 0:
+            toPlace = self._findUnplacedClasses(umlObjects)
+        if len(toPlace) == 0:
+            self.displayNothingSelected()
+            return
+
+        placing: Set[OglClass]    = set(toPlace)
+        layout:  IncrementalLayout = IncrementalLayout()
+        for oglObject in umlObjects:
+            if isinstance(oglObject, OglObject) and oglObject not in placing:
+                x, y = oglObject.GetPosition()
+                w, h = oglObject.GetSize()
+                layout.pin(oglObject, x, y, w, h)
+
+        nodes:     IncrementalNodes = [self._toIncrementalNode(oglClass) for oglClass in toPlace]
+        positions: NodePositions    = layout.placeAll(nodes)
+
+        for oglClass in toPlace:
+            x, y = positions[oglClass]
+            self.logger.debug(f'{oglClass.getPyutObject().getName()} placed at ({x},{y})')
+            oglClass.SetPosition(x, y)
+
+        umlFrame.Refresh()
+
+    def _findUnplacedClasses(self, umlObjects: List[OglObject]) -> List[OglClass]:
+        """
+        A class is considered unplaced when it overlaps a shape that comes before it
+        in the diagram;  The first shape of an overlapping pile stays where it is.
+
+        Args:
+            umlObjects: list of the uml objects of the diagram
+
+        Returns:  The classes to place
+        """
+        index:     SpatialIndex   = SpatialIndex()
+        unplaced:  List[OglClass] = []
+        for oglObject in umlObjects:
+            if not isinstance(oglObject, OglObject):
+                continue
+            x, y = oglObject.GetPosition()
+            w, h = oglObject.GetSize()
+            if isinstance(oglObject, OglClass) and not index.isFree(x, y, w, h):
+                unplaced.append(oglObject)
+            else:
+                index.insert(oglObject, x, y, w, h)
+
+        return unplaced
+
+    def _toIncrementalNode(self, oglClass: OglClass) -> IncrementalNode:
+
+        w, h = oglClass.GetSize()
+        neighbours: List[OglObject] = []
+        for oglLink in oglClass.getLinkIndex():
+            if oglLink.getSourceShape() is oglClass:
+                neighbours.append(oglLink.getDestinationShape())
+            else:
+                neighbours.append(oglLink.getSourceShape())
+
+        return IncrementalNode(nodeId=oglClass, width=w, height=h, neighbours=neighbours)
@@ -1,5 +1,6 @@
 
 from typing import List
+from typing import Tuple
 from typing import cast
 
 from logging import Logger
@@ -7,6 +8,8 @@ from logging import getLogger
 
 from time import time
 
+from math import sqrt
+
 from wx import ICON_ERROR
 from wx import OK
 
@@ -18,6 +21,14 @@ from org.pyut.MiniOgl.Shape import Shape
 from org.pyut.ogl.OglClass import OglClass
 from org.pyut.ogl.OglLink import OglLink
 from org.pyut.ogl.OglNote import OglNote
+from org.pyut.ogl.OglObject import OglObject
+
+from org.pyut.plugins.common.ComponentLayout import ComponentBox
+from org.pyut.plugins.common.ComponentLayout import ComponentLayout
+from org.pyut.plugins.common.ComponentLayout import Components
+from org.pyut.plugins.common.LayoutCache import CachedLayout
+from org.pyut.plugins.common.LayoutCache import LayoutCache
+
 from org.pyut.plugins.orthogonal.DlgLayoutSize import DlgLayoutSize
 
 from org.pyut.plugins.orthogonal.OrthogonalAdapter import OglCoordinate
@@ -110,18 +121,52 @@ class ToOrthogonalLayoutV2(PyutToPlugin):
             self.displayNoUmlObjects()
             return
 
-        try:
-            orthogonalAdapter: OrthogonalAdapter = OrthogonalAdapter(umlObjects=selectedObjects)
+        components: Components = self.splitIntoComponents(selectedObjects)
+        if len(components) == 0:
+            self.displayNothingSelected()
+            return
 
-            layoutAreaSize: LayoutAreaSize = LayoutAreaSize(self._layoutWidth, self._layoutHeight)
-            orthogonalAdapter.doLayout(layoutAreaSize)
+        layoutCache:  LayoutCache  = self.getLayoutCache()
+        cacheKey:     str          = self.layoutCacheKey(selectedObjects, f'{self.getMenuTitle()}-{self._layoutWidth}x{self._layoutHeight}')
+        cachedLayout: CachedLayout = layoutCache.get(cacheKey)
+        if cachedLayout is not None and self.applyCachedLayout(selectedObjects, cachedLayout):
+            self.logger.info(f'Orthogonal layout reapplied from cache')
+            umlFrame.Refresh()
+            return
+
+        boxes:    List[ComponentBox]      = [self.getComponentBox(component) for component in components]
+        adapters: List[OrthogonalAdapter] = []
+        jobs:     List[Tuple[str, LayoutAreaSize]] = []
+        jobSizes: List[int] = []
+        nodeCount: int = sum(self._countNodes(component) for component in components)
+        for component in components:
+            componentNodes: int   = self._countNodes(component)
+            scale:          float = sqrt(componentNodes / nodeCount) if nodeCount > 0 else 1.0
+            orthogonalAdapter: OrthogonalAdapter = OrthogonalAdapter(umlObjects=component)
+            adapters.append(orthogonalAdapter)
+            jobs.append((orthogonalAdapter.gml, LayoutAreaSize(round(self._layoutWidth * scale), round(self._layoutHeight * scale))))
+            jobSizes.append(componentNodes)
+
+        # Each component is an independent graph;  Big diagrams are laid out in parallel
+        try:
+            results: List[OglCoordinates] = ComponentLayout.runLayouts(OrthogonalAdapter.layoutGml, jobs, jobSizes)
         except OrthogonalAdapterException as oae:
             MessageBox(f'{oae}', 'Error', OK | ICON_ERROR)
             return
 
-        if orthogonalAdapter is not None:
-            self._reLayoutNodes(selectedObjects, umlFrame, orthogonalAdapter.oglCoordinates)
-            self._reLayoutLinks(selectedObjects, umlFrame)
+        for component, orthogonalAdapter, oglCoordinates in zip(components, adapters, results):
+            orthogonalAdapter.oglCoordinates = oglCoordinates
+            self._reLayoutNodes(component, umlFrame, orthogonalAdapter.oglCoordinates)
+
+        if len(components) > 1:
+            originX: float = min(box.left for box in boxes)
+            originY: float = min(box.top for box in boxes)
+            self.packComponents(components, originX, originY)
+        self._reLayoutLinks(selectedObjects, umlFrame)
+        layoutCache.put(cacheKey, self.captureLayout(selectedObjects))
+
+    def _countNodes(self, component: List[OglObject]) -> int:
+        return sum(1 for oglObject in component if isinstance(oglObject, OglClass) or isinstance(oglObject, OglNote))
 
     def _reLayoutNodes(self, umlObjects: List[OglClass], umlFrame: UmlFrame, oglCoordinates: OglCoordinates):
         """
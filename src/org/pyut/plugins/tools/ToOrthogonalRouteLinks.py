@@ -0,0 +1,161 @@
+
+from typing import List
+from typing import Set
+
+from weakref import WeakKeyDictionary
+
+from logging import Logger
+from logging import getLogger
+
+from org.pyut.MiniOgl.SpatialIndex import Bounds
+from org.pyut.MiniOgl.SpatialIndex import SpatialIndex
+
+from org.pyut.ogl.OglLink import OglLink
+from org.pyut.ogl.OglObject import OglObject
+
+from org.pyut.plugins.base.PyutToPlugin import PyutToPlugin
+
+from org.pyut.plugins.routing.OrthogonalRouter import LinkRoute
+from org.pyut.plugins.routing.OrthogonalRouter import LinkRoutes
+from org.pyut.plugins.routing.OrthogonalRouter import OrthogonalRouter
+
+from org.pyut.ui.UmlFrame import UmlFrame
+
+
+class ToOrthogonalRouteLinks(PyutToPlugin):
+    """
+    Routes the links around the other shapes with orthogonal bends.
+
+    With no selection every link of the diagram is routed.  When shapes are
+    selected (typically the ones that were just moved), only the links attached
+    to them or running through or around them are routed again, along with the
+    links affected by the shapes that moved since the previous run.
+
+    Each frame keeps its router between runs;  Its obstacles are moved rather
+    than rebuilt.
+    """
+    clsRouters: WeakKeyDictionary = WeakKeyDictionary()     # UmlFrame -> OrthogonalRouter
+
+    def __init__(self, umlObjects: List[OglObject], umlFrame: UmlFrame):
+        """
+        Args:
+            umlObjects: list of ogl objects
+            umlFrame: PyUt's UML Frame
+        """
+        super().__init__(umlObjects, umlFrame)
+        self.logger: Logger = getLogger(__name__)
+
+    def getName(self) -> str:
+        """
+        Returns: the name of the plugin.
+        """
+        return "Orthogonal Link Router"
+
+    def getAuthor(self) -> str:
+        """
+        Returns: The author's name
+        """
+        return "Humberto A. Sanchez II"
+
+    def getVersion(self) -> str:
+        """
+        Returns: The plugin version string
+        """
+        return "1.0"
+
+    def getMenuTitle(self) -> str:
+        """
+        Returns:  The menu title for this plugin
+        """
+        return "Route Links Around Shapes"
+
+    def doAction(self, umlObjects: List[OglObject], selectedObjects: List[OglObject], umlFrame: UmlFrame):
+        """
+
+        Args:
+            umlObjects:         list of the uml objects of the diagram
+            selectedObjects:    list of the selected objects
+            umlFrame:           The diagram frame
+        """
+        if umlFrame is None:
+            self.displayNoUmlFrame()
+            return
+
+        router:   OrthogonalRouter = ToOrthogonalRouteLinks._routerFor(umlFrame)
+        oglLinks: List[OglLink]    = [oglObject for oglObject in umlObjects if isinstance(oglObject, OglLink)]
+        shapes:   List[OglObject]  = [oglObject for oglObject in umlObjects if isinstance(oglObject, OglObject) and not isinstance(oglObject, OglLink)]
+
+        affected: Set[OglLink] = self._updateLinks(router, oglLinks)
+        affected.update(self._updateObstacles(router, shapes))
+
+        movedShapes: List[OglObject] = [oglObject for oglObject in selectedObjects if isinstance(oglObject, OglObject)]
+        if len(movedShapes) == 0:
+            routes: LinkRoutes = router.routeAll()
+        else:
+            for oglObject in movedShapes:
+                affected.update(router.affectedBy(id(oglObject)))
+            routes = router.reroute([oglLink for oglLink in oglLinks if oglLink in affected])
+
+        self.logger.info(f'Routed {len(routes)} of {len(oglLinks)} links')
+        for oglLink in oglLinks:
+            route: LinkRoute = routes.get(oglLink)
+            if route is not None:
+                oglLink.setRoute(route.source, route.destination, route.bends)
+
+        umlFrame.Refresh()
+
+    @classmethod
+    def _routerFor(cls, umlFrame: UmlFrame) -> OrthogonalRouter:
+        """
+        The router of a frame outlives the plugin instance so that the next run only has
+        to move the obstacles that changed.  The obstacles are keyed by `id()` because the
+        hash of an OglClass changes with its name
+        """
+        router: OrthogonalRouter = cls.clsRouters.get(umlFrame)
+        if router is None:
+            router = OrthogonalRouter()
+            cls.clsRouters[umlFrame] = router
+        return router
+
+    def _updateObstacles(self, router: OrthogonalRouter, shapes: List[OglObject]) -> Set[OglLink]:
+        """
+        Bring the obstacles of the router in line with the shapes of the diagram
+
+        Returns:  The links affected by the shapes that moved, appeared or went away since the last run
+        """
+        affected: Set[OglLink] = set()
+        current:  Set[int]     = {id(oglObject) for oglObject in shapes}
+        for shapeKey in router.obstacleKeys:
+            if shapeKey not in current:
+                affected.update(router.removeObstacle(shapeKey))
+
+        for oglObject in shapes:
+            x, y = oglObject.GetPosition()
+            w, h = oglObject.GetSize()
+            bounds: Bounds = router.obstacleBounds(id(oglObject))
+            if bounds is None:
+                router.addObstacle(id(oglObject), x, y, w, h)
+                affected.update(router.affectedBy(id(oglObject)))
+            elif bounds != SpatialIndex.toBounds(x, y, w, h):
+                affected.update(router.moveObstacle(id(oglObject), x, y, w, h))
+
+        return affected
+
+    def _updateLinks(self, router: OrthogonalRouter, oglLinks: List[OglLink]) -> Set[OglLink]:
+        """
+        Bring the links of the router in line with the links of the diagram
+
+        Returns:  The links that are new since the last run
+        """
+        known:   Set[OglLink] = set(router.linkKeys)
+        current: Set[OglLink] = set(oglLinks)
+        for oglLink in known - current:
+            router.removeLink(oglLink)
+
+        added: Set[OglLink] = set()
+        for oglLink in oglLinks:
+            if oglLink not in known:
+                router.addLink(oglLink, id(oglLink.getSourceShape()), id(oglLink.getDestinationShape()), points=oglLink.GetSegments())
+                added.add(oglLink)
+
+        return added
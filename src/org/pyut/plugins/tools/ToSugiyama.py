@@ -1,16 +1,22 @@
 
+from typing import Dict
 from typing import List
 
 from logging import Logger
 from logging import getLogger
 
 from org.pyut.plugins.sugiyama.RealSugiyamaNode import RealSugiyamaNode
+from org.pyut.plugins.sugiyama.SugiyamaNode import SugiyamaNode
+from org.pyut.plugins.sugiyama.SugiyamaNodeStore import SugiyamaNodeStore
 from org.pyut.plugins.sugiyama.VirtualSugiyamaNode import VirtualSugiyamaNode
 from org.pyut.plugins.sugiyama.SugiyamaLink import SugiyamaLink
 from org.pyut.plugins.sugiyama.SugiyamaGlobals import SugiyamaGlobals
 
 from org.pyut.plugins.base.PyutToPlugin import PyutToPlugin
 
+from org.pyut.plugins.common.LayoutCache import CachedLayout
+from org.pyut.plugins.common.LayoutCache import LayoutCache
+
 from org.pyut.plugins.sugiyama.SugiyamaConstants import UP_MARGIN
 from org.pyut.plugins.sugiyama.SugiyamaConstants import H_SPACE
 from org.pyut.plugins.sugiyama.SugiyamaConstants import V_SPACE
@@ -50,6 +56,12 @@ class ToSugiyama(PyutToPlugin):
 
         self.logger: Logger = getLogger(__name__)
 
+        self.__resetGraph()
+
+    def __resetGraph(self):
+        """
+        Forget the graph of the previous component
+        """
         # Sugiyama nodes and links
         self.__realSugiyamaNodesList = []   # List of all RealSugiyamaNode
         self.__sugiyamaLinksList = []       # List of all SugiyamaLink
@@ -102,22 +114,61 @@ class ToSugiyama(PyutToPlugin):
             self.displayNoUmlFrame()
             return
 
+        layoutCache: LayoutCache = self.getLayoutCache()
+        cacheKey:    str         = self.layoutCacheKey(umlObjects, self.getName())
+        cachedLayout: CachedLayout = layoutCache.get(cacheKey)
+        if cachedLayout is not None and self.applyCachedLayout(umlObjects, cachedLayout):
+            self.logger.info(f'Sugiyama layout reapplied from cache')
+            self._umlFrame.Refresh()
+            return
+
         self.logger.info(f'Begin Sugiyama algorithm')
+
+        # Independent class hierarchies are laid out one at a time and then
+        # packed, rather than as one big graph;  A cycle found in a later
+        # component puts back the ones already laid out
+        originalLayout: CachedLayout = self.captureLayout(umlObjects)
+        components = self.splitIntoComponents(umlObjects)
+        self.logger.info(f'Number of connected components: {len(components)}')
+        for component in components:
+            self.__resetGraph()
+            if not self.__layoutComponent(component):
+                self.logger.error('Error: there is a cycle in hierarchical links. Sugiyama,  algorithm could not be applied')
+                self.applyCachedLayout(umlObjects, originalLayout)
+                self._umlFrame.Refresh()
+                return
+        if len(components) > 1:
+            self.packComponents(components, LEFT_MARGIN, UP_MARGIN)
+        layoutCache.put(cacheKey, self.captureLayout(umlObjects))
+
+        # Redraw frame
+        self._umlFrame.Refresh()
+
+        self.logger.info('End Sugiyama algorithm')
+
+    def __layoutComponent(self, oglObjects) -> bool:
+        """
+        Run the Sugiyama algorithm on a single connected component
+
+        Args:
+            oglObjects:  The shapes and links of the component
+
+        Returns:  `False` if the hierarchical links have a cycle
+        """
         # Create the sub-graph containing the hierarchical relations
-        self.__createInterfaceOglALayout(umlObjects)
+        self.__createInterfaceOglALayout(oglObjects)
 
         # Compute the best level for each nodes
         if not self.__levelFind():
-            self.logger.error('Error: there is a cycle in hierarchical links. Sugiyama,  algorithm could not be applied')
-            return
+            return False
 
         # Add virtual nodes between fathers and sons which are separated by
         # more than one level.
         self.__addVirtualNodes()
 
         # Apply barycenter algorithm to the graph for minimizing crossings
-        self.__barycenter()
-        self.logger.info(f'Number of hierarchical intersections: {self.__getNbIntersectAll()}')
+        crossings: int = self.__barycenter()
+        self.logger.info(f'Number of hierarchical intersections: {crossings}')
 
         # Add non hierarchical nodes to levels
         self.logger.info(f'non hierarchy graph nodes list: {self.__nonHierarchyGraphNodesList}')
@@ -127,10 +178,7 @@ class ToSugiyama(PyutToPlugin):
         # Fix the coordinates xy of the nodes
         self.__fixPositions()
 
-        # Redraw frame
-        self._umlFrame.Refresh()
-
-        self.logger.info('End Sugiyama algorithm')
+        return True
 
     def __createInterfaceOglALayout(self, oglObjects):
         """
@@ -571,160 +619,6 @@ class ToSugiyama(PyutToPlugin):
                 # Add virtual nodes
                 addVirtualNodesOnHierarchicalLink(link)
 
-    def __sortLevel(self, indexLevel):
-        """
-        Sort nodes on a level according to pre-calculated barycenter value.
-        Nodes that don't have a barycenter value keep their place.
-
-        @param indexLevel : index of level in self.__levels to sort
-        @author Nicolas Dubois
-        """
-        level = self.__levels[indexLevel]
-        levelCopy = level[:]
-
-        nbIntersect = self.__getNbIntersectAll()
-
-        # Get list of nodes who have a barycenter value
-        listIndex = []
-        for i in range(len(levelCopy)):
-            if levelCopy[i].getBarycenter() is not None:
-                listIndex.append(i)
-
-        # Create list of nodes to sort
-        listNodes = []
-        for i in listIndex:
-            listNodes.append(levelCopy[i])
-
-        # Sort list of nodes
-        listNodes.sort(key=SugiyamaGlobals.cmpBarycenter)
-
-        # Put sorted list in levelCopy
-        for i in range(len(listNodes)):
-            levelCopy[listIndex[i]] = listNodes[i]
-
-        # Fix indexes
-        for i in range(len(levelCopy)):
-            levelCopy[i].setIndex(i)
-
-        # If there are more intersections than before, keep original order
-        nbIntersect2 = self.__getNbIntersectAll()
-        if nbIntersect < nbIntersect2:
-            # Fix indexes
-            for i in range(len(level)):
-                level[i].setIndex(i)
-        else:
-            # Else set new order
-            self.__levels[indexLevel] = levelCopy
-        # nbIntersect3 = self.__getNbIntersectAll()    NOT USED
-
-    def __shiftSameBarycenter(self, indexLevel):
-        """
-        Do a left circular shifting on nodes with same barycenter on a level.
-
-        For each group of nodes which have the same pre-calculated value, do a
-        left circular shifting of the nodes.
-
-        @param indexLevel : index of level
-        @author Nicolas Dubois
-        """
-        level = self.__levels[indexLevel]
-
-        # Save current level
-        levelSaved = level[:]
-        # Count crossings
-        nbIntersections = self.__getNbIntersectAll()
-
-        # Shift same barycenter
-        for i in range(len(level) - 1):
-            if level[i].getBarycenter() is not None and level[i].getBarycenter() == level[i + 1].getBarycenter():
-
-                level.insert(i, level.pop(i + 1))
-                # Fix index
-                level[i].setIndex(i)
-                level[i + 1].setIndex(i + 1)
-
-        # If new order give more intersections, return to old order
-        if self.__getNbIntersectAll() > nbIntersections:
-            self.__levels[indexLevel] = levelSaved
-            for i in range(len(levelSaved)):
-                levelSaved[i].setIndex(i)
-
-    def __sortSameBarycenter(self, indexLevel):
-        """
-
-        @param indexLevel : index of level
-        @author Nicolas Dubois
-        """
-        level = self.__levels[indexLevel]
-
-        # A group is a list of nodes that have the same barycenter value
-        # groups is a list of all group
-        # groups = [[node, node, ..], [node, ..], ..]
-        groups = [[]]
-
-        # Fix indexes
-        for i in range(len(level)):
-            # noinspection PyUnusedLocal
-            node = level[i].setIndex(i)
-
-        barycenter = level[0].getBarycenter()
-        index = 0
-
-        # Put all nodes in groups
-        for node in level:
-            if node.getBarycenter() == barycenter:
-                groups[index].append(node)
-            else:
-                groups.append([node])
-                index += 1
-                barycenter = node.getBarycenter()
-
-        # Compute new barycenter value = average of parents'down-barycenter
-        # and sons'up-barycenter
-        for node in level:
-            node.barycenterIndex()
-
-        # Sort each group of nodes
-        for group in groups:
-            group.sort(key=SugiyamaGlobals.cmpBarycenter)
-
-        # Fix new positions
-        moved = 0
-        index = 0
-        for group in groups:
-            for node in group:
-                if node.getIndex() != index:
-                    node.setIndex(index)
-                    moved = 1
-                index += 1
-
-        # Sort level on new indexes
-        level.sort(SugiyamaGlobals.cmpIndex)
-
-        return moved
-
-    def __upBarycenterLevel(self, indexLevel):
-        """
-        Compute up barycenter (from parents) for all nodes on level.
-
-        @param indexLevel : index of level
-        @author Nicolas Dubois
-        """
-        level = self.__levels[indexLevel]
-        for node in level:
-            node.upBarycenterIndex()
-
-    def __downBarycenterLevel(self, indexLevel):
-        """
-        Compute down barycenter (from sons) for all nodes on level.
-
-        @param indexLevel : index of level
-        @author Nicolas Dubois
-        """
-        level = self.__levels[indexLevel]
-        for node in level:
-            node.downBarycenterIndex()
-
     def __barycenterLevel(self, indexLevel):
         """
         Compute average of up and down barycenter for all nodes on level.
@@ -736,26 +630,6 @@ class ToSugiyama(PyutToPlugin):
         for node in level:
             node.barycenterIndex()
 
-    def __sortNeeded(self, indexLevel):
-        """
-        Check if nodes have to be re-ordered.
-
-        @param indexLevel : index of level
-        @return boolean : True if nodes have to be sorted
-        @author Nicolas Dubois
-        """
-        level = self.__levels[indexLevel]
-        barycenter = level[0].getBarycenter()
-
-        # Check nodes from left to right
-        for node in level:
-            # If node barycenter < his left neighbor
-            if node.getBarycenter() < barycenter:
-                return 1
-            barycenter = node.getBarycenter()
-
-        return 0
-
     def __fixXCoord(self, indexLevel):
         """
         Fix temporary x coord for each node on the level, packed on the left.
@@ -786,174 +660,36 @@ class ToSugiyama(PyutToPlugin):
                 node.setIndex(i)
                 node.setLevel(lvl)
 
-    def __getNbIntersectAll(self):
-        """
-        Return number of intersections between hierarchy relations.
-
-        @author Nicolas Dubois
-        """
-        count = 0
-        for i in range(len(self.__levels) - 1):
-            count += self.__getNbIntersect2Levels(i)
-
-        return count
-
-    def __getNbIntersect2Levels(self, upperLevel):
-        """
-        Return intersections number of hierarchical links between two levels.
-
-        The two levels index are [upperLevel] and [upperLevel + 1].
-
-        @param upperLevel : index of upper level
-        @author Nicolas Dubois
-        """
-        # Get nodes from the level
-        nodes = self.__levels[upperLevel]
-
-        # Count intersect
-        count = 0
-
-        # For each node of the layer
-        for indFatherL in range(len(nodes) - 1):
-            # For each son of the current node
-            for (sonL, link) in nodes[indFatherL].getChildren():
-
-                # Check intersect with all next parents
-                indFatherR = indFatherL + 1
-                while indFatherR < len(nodes):
-                    for (sonR, rLink) in nodes[indFatherR].getChildren():
-                        # If intersect
-                        if sonL.getIndex() > sonR.getIndex():
-                            count += 1
-                    indFatherR += 1
-
-        return count
-
-    def __barycenter_(self):
-        """
-        Find nodes index for minimizing hierarchical links crossing.
-
-        @author Nicolas Dubois
-        """
-
-        MAX_ITER = 20       # Max number of iterations
-        moved = 1           # There has been a move during a phase
-        shiftOnUpward = 0   # Shift nodes only on ascending phase
-
-        # While classes are moved and MAX_ITER not reached
-        while moved and MAX_ITER:
-
-            # Downward phase
-
-            moved = 0
-            # For each level except the first one
-            for i in range(1, len(self.__levels)):
-
-                # Memorize level state
-                levelState = self.__levels[i][:]
-
-                # Compute parents down-barycenter
-                if i > 0:
-                    self.__downBarycenterLevel(i - 1)
-                # Compute sons up-barycenter
-                if i < len(self.__levels) - 1:
-                    self.__upBarycenterLevel(i + 1)
-
-                # Compute up-barycenter on current level
-                self.__upBarycenterLevel(i)
-                self.__sortLevel(i)
-
-                #
-                if not shiftOnUpward and self.__getNbIntersectAll():
-                    self.__shiftSameBarycenter(i)
-                #
-                else:
-                    self.__sortSameBarycenter(i)
-
-                # Check if order of nodes has been changed
-                if levelState != self.__levels[i]:
-                    moved = 1
-
-            # Upward phase
-
-            # For each level except last
-            for i in range(len(self.__levels) - 2, -1, -1):
-
-                # Memorize level state
-                levelState = self.__levels[i][:]
-
-                # Compute parents down-barycenter
-                if i > 0:
-                    self.__downBarycenterLevel(i - 1)
-                # Compute sons up-barycenter
-                if i < len(self.__levels) - 1:
-                    self.__upBarycenterLevel(i + 1)
-
-                # Compute up-barycenter on current level
-                self.__downBarycenterLevel(i)
-                #  ~ if self.__sortNeeded(i):
-                    #  ~ moved = 1
-                self.__sortLevel(i)
-                if shiftOnUpward and self.__getNbIntersectAll():
-                    self.__shiftSameBarycenter(i)
-                #
-                else:
-                    self.__sortSameBarycenter(i)
-                    #  ~ if self.__sortSameBarycenter(i):
-                        #  ~ moved = 1
-
-                # Check if order of nodes has been changed
-                if levelState != self.__levels[i]:
-                    moved = 1
-
-            MAX_ITER -= 1
-            shiftOnUpward = not shiftOnUpward
-
-    def __barycenter(self):
+    def __barycenter(self) -> int:
         """
         Find nodes index for minimizing hierarchical links crossing.
 
-        This function is not used. It was the first version, created
-        according to the theoretical algorithm.
-        It has been replaced by a new barycenter method.
+        The sweeps run on an array backed copy of the levels;  The resulting
+        order is then copied back to the Sugiyama nodes.
 
-        @author Nicolas Dubois
+        Returns:  The number of remaining crossings
         """
+        store:    SugiyamaNodeStore = SugiyamaNodeStore()
+        nodes:    List[SugiyamaNode] = []
+        storeIds: Dict[int, int]     = {}
+        for indexLevel, level in enumerate(self.__levels):
+            for node in level:
+                storeIds[id(node)] = store.addNode(indexLevel)
+                nodes.append(node)
+        for node in nodes:
+            for (child, link) in node.getChildren():
+                store.addEdge(storeIds[id(node)], storeIds[id(child)])
+        store.build()
 
-        MAX_ITER = 20
-
-        while self.__getNbIntersectAll() > 0 and MAX_ITER > 0:
-
-            # Downward phase
-
-            # For each level except first
-            for i in range(1, len(self.__levels)):
-
-                # Compute parents down-barycenter
-                if i > 0:
-                    self.__downBarycenterLevel(i - 1)
-                # Compute sons up-barycenter
-                if i < len(self.__levels) - 1:
-                    self.__upBarycenterLevel(i + 1)
-
-                # Compute up-barycenter on current level
-                self.__upBarycenterLevel(i)
-                self.__sortLevel(i)
-                self.__shiftSameBarycenter(i)
-
-            # Upward phase
-
-            if self.__getNbIntersectAll() > 0:
-
-                indexList = list(range(len(self.__levels) - 1))
-                indexList.reverse()
-                for i in indexList:
+        crossings: int = store.reduceCrossings()
 
-                    self.__downBarycenterLevel(i)
-                    self.__sortLevel(i)
-                    self.__shiftSameBarycenter(i)
+        for indexLevel in range(len(self.__levels)):
+            level: List[SugiyamaNode] = [nodes[storeId] for storeId in store.getOrder(indexLevel)]
+            for i in range(len(level)):
+                level[i].setIndex(i)
+            self.__levels[indexLevel] = level
 
-                MAX_ITER -= 1
+        return crossings
 
     def __fixPositions(self):
         """
@@ -1,7 +1,4 @@
 
-from typing import Union
-from typing import NewType
-
 from logging import Logger
 from logging import getLogger
 
@@ -9,21 +6,14 @@ from logging import getLogger
 from xml.dom.minidom import Document
 # noinspection PyUnresolvedReferences
 from xml.dom.minidom import Element
-# noinspection PyUnresolvedReferences
-from xml.dom.minicompat import NodeList
 
 from org.pyut.model.PyutClass import PyutClass
-from org.pyut.model.PyutField import PyutField
 from org.pyut.model.PyutLink import PyutLink
-from org.pyut.model.PyutMethod import PyutMethod
-from org.pyut.model.PyutParam import PyutParam
-from org.pyut.model.PyutVisibilityEnum import PyutVisibilityEnum
-
-from org.pyut.enums.LinkType import LinkType
 
-from org.pyut.ogl.OglClass import OglClass
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import ShapeRecord
 
-import wx
+from org.pyut.plugins.xmi.XmiReader import XmiReader
 
 
 class PyutXmi:
@@ -45,19 +35,21 @@ class PyutXmi:
     #        file.write(text)
 
         # open
-        dom = parse(StringIO(open(filename).read()))
-
         myXmi = PyutXmi()
-        myXmi.open(dom, umlFrame)
+        myXmi.open(filename, umlFrame)
 
     :version: $Revision: 1.6 $
     :author: Deve Roux
     :contact: droux@eivd.ch
     @modified C.Dutoit feb 2003 : updated, fixed, improved
     """
+    GAUGE_RANGE: int = 100
+
     def __init__(self):
         self.logger: Logger = getLogger(__name__)
 
+        self._xmlDoc: Document = Document()     # Owner of the elements created while saving
+
     def _PyutLink2xml(self, pyutLink: PyutLink):
         """
         Exporting an PyutLink to an miniDom Element
@@ -74,7 +66,7 @@ class PyutXmi:
             return None
         self.__savedLinks[pyutLink] = 1
 
-        root = Element('Link')
+        root = self._xmlDoc.createElement('Link')
         # link name
         root.setAttribute('name', pyutLink.getName())
 
@@ -106,7 +98,7 @@ class PyutXmi:
         @param pyutParam
         @return Element
         """
-        root = Element('Param')
+        root = self._xmlDoc.createElement('Param')
 
         # param name
         root.setAttribute('name', pyutParam.getName())
@@ -128,7 +120,7 @@ class PyutXmi:
         @param pyutField
         @return Element
         """
-        root = Element('Field')
+        root = self._xmlDoc.createElement('Field')
 
         # adding the parent XML
         # pyutField is a param
@@ -149,7 +141,7 @@ class PyutXmi:
         @param pyutMethod
         @return Element
         """
-        root = Element('Method')
+        root = self._xmlDoc.createElement('Method')
 
         # method name
         root.setAttribute('name', pyutMethod.getName())
@@ -157,18 +149,18 @@ class PyutXmi:
         # method visibility
         visibility = pyutMethod.getVisibility()
         if visibility is not None:
-            root.setAttribute('visibility', str(visibility.getVisibility()))
+            root.setAttribute('visibility', str(visibility))
 
         # for all modifiers
         for i in pyutMethod.getModifiers():
-            modifier = Element('Modifier')
+            modifier = self._xmlDoc.createElement('Modifier')
             modifier.setAttribute('name', i.getName())
             root.appendChild(modifier)
 
         # method return type
         ret = pyutMethod.getReturns()
         if ret is not None:
-            eleRet = Element('Return')
+            eleRet = self._xmlDoc.createElement('Return')
             eleRet.setAttribute('type', str(ret))
             root.appendChild(eleRet)
 
@@ -187,7 +179,7 @@ class PyutXmi:
 
         Returns:  The XML element
         """
-        root = Element('Class')
+        root = self._xmlDoc.createElement('Class')
 
         # class name
         root.setAttribute('name', pyutClass.getName())
@@ -209,7 +201,7 @@ class PyutXmi:
         fathers = pyutClass.getParents()
         if len(fathers) > 0:
             for i in fathers:
-                father = Element('Father')
+                father = self._xmlDoc.createElement('Father')
                 father.setAttribute('name', i.getName())
                 root.appendChild(father)
 
@@ -232,22 +224,39 @@ class PyutXmi:
         @param oglClass
         @return Element
         """
-        root = Element('GraphicClass')
-
         # class definition
         # adding width and height
         w, h = oglClass.GetBoundingBoxMin()
-        root.setAttribute('width', str(int(w)))
-        root.setAttribute('height', str(int(h)))
 
         # calculate the top right corner of the shape
         x = int(oglClass.GetX())
         y = int(oglClass.GetY())
+
+        return self._graphicClass2xml(oglClass.getPyutClass(), x, y, w, h)
+
+    def _graphicClass2xml(self, pyutClass: PyutClass, x: float, y: float, w: float, h: float) -> Element:
+        """
+        Exporting a class and its geometry to an miniDom Element
+
+        Args:
+            pyutClass:  The class data model
+            x:          Left of the shape
+            y:          Top of the shape
+            w:          Width of the shape
+            h:          Height of the shape
+
+        Returns:  A 'GraphicClass' element
+        """
+        root = self._xmlDoc.createElement('GraphicClass')
+
+        root.setAttribute('width', str(int(w)))
+        root.setAttribute('height', str(int(h)))
+
         root.setAttribute('x', str(int(x)))
         root.setAttribute('y', str(int(y)))
 
         # adding the class
-        root.appendChild(self._PyutClass2xml(oglClass.getPyutClass()))
+        root.appendChild(self._PyutClass2xml(pyutClass))
 
         return root
 
@@ -259,8 +268,11 @@ class PyutXmi:
         @since 1.0
         @Deve Roux <droux@eivd.ch>
         """
+        import wx   # Only the interactive save shows progress;  See saveDocument()
+
         root    = Document()
-        top     = Element("Pyut")
+        self._xmlDoc = root
+        top     = self._xmlDoc.createElement("Pyut")
         root.appendChild(top)
 
         self.__savedLinks = {}
@@ -278,389 +290,82 @@ class PyutXmi:
         self.__savedLinks = None
         return root
 
-    def _xmiVisibility2PyutVisibility(self, visibility: str = "private") -> PyutVisibilityEnum:
+    def saveDocument(self, documentModel: DocumentModel) -> Document:
         """
-        Translates Xmi visibility string to a Pyut visibility enumeration
+        Same output as `save()` for the classes of a document read without UI
 
         Args:
-            visibility: the string 'public', 'prviate', or 'protected'
+            documentModel:  A class diagram
 
-        Returns:  The appropriate enumeration value
-        """
-        retEnum: PyutVisibilityEnum = PyutVisibilityEnum.toEnum(visibility)
-        return retEnum
-        # if visibility == "private":
-        #     return "-"
-        # elif visibility == "public":
-        #     return "+"
-        # elif visibility == "protected":
-        #     return "#"
-        #
-        # return ""
-
-    DefaultValueType = NewType('DefaultValueType', Union[PyutField, PyutParam])
-
-    def _getDefaultValue(self, xmiElement: Element, defaultValueModelType: DefaultValueType):
+        Returns:
+            A minidom XML Document
         """
-        Get the default value from xmiParm and update a PyutParam or PyutField object with
-        the default value.
-
-        Args:
-            xmiElement:   An XMI Element
-
-            defaultValueModelType:  PyutField or PyutParam
+        root = Document()
+        self._xmlDoc = root
+        top  = self._xmlDoc.createElement("Pyut")
+        root.appendChild(top)
 
-        Returns: None
-        """
-        # value = xmiParam.getElementsByTagName("Foundation.Data_Types.Expression.body")[0].firstChild
-        bodyElts: NodeList = xmiElement.getElementsByTagName("Foundation.Data_Types.Expression.body")
-        bodyElt:  Element  = bodyElts.item(0)
-        if bodyElt is not None:
-            value = bodyElt.firstChild
-            if value is not None:
-                if value.nodeType == value.TEXT_NODE:
-                    defaultValueModelType.setDefaultValue(value.data)
-
-    def _getType(self, theDom):
-        """
-        Parse dom document for all type ID  and update methods and params
+        self.__savedLinks = {}
+        for shape in documentModel.shapes.values():
+            if isinstance(shape.pyutObject, PyutClass):
+                top.appendChild(self._graphicClass2xml(shape.pyutObject, shape.x, shape.y, shape.width, shape.height))
+        self.__savedLinks = None
 
-        @param   theDom
+        return root
 
-        @since 1.0
-        @author Deve Roux <droux@eivd.ch>
-        """
-        # parse to find type name using tag name
-        def parse(dom, tag):
-            for aType in dom.getElementsByTagName(tag):
-                anId = aType.getAttribute("xmi.id")
-                xmiType = aType.getElementsByTagName("Foundation.Core.ModelElement.name")
-                if len(xmiType) > 0:
-                    typeName = xmiType[0].firstChild.data
-                    # making link with dictionary
-                    if anId in self.dicoType:
-                        self.dicoType[anId].setType(typeName)
-                    if anId in self.dicoReturn:
-                        self.dicoReturn[anId].setReturns(typeName)
-
-        parse(theDom, "Foundation.Core.DataType")
-        parse(theDom, "Foundation.Data_Types.Enumeration")
-
-    TypeIdObject = NewType('TypeIdObject', Union[PyutMethod, PyutParam, PyutField])
-
-    def _getTypeId(self, xmiElement: Element, typeIdObject: TypeIdObject, dico):
+    def open(self, fileName: str, umlFrame):
         """
-        Parse xmiParam and making link in dico between param and xmiParam Id.
+        Read an XMI file and draw its classes on a frame.  The file is streamed
+        by `XmiReader`;  The gauge follows the bytes read.
 
         Args:
-            xmiElement:
-            typeIdObject:
-            dico:       dicoType of dicoReturn
-        """
-        def parse(theXmiParam, localTypedIdObject, inDict, tag):
-            for xmiType in theXmiParam.getElementsByTagName(tag):
-                zId = xmiType.getAttribute("xmi.idref")
-                self.logger.debug(f'xmi.idref: {zId}')
-                inDict[zId] = localTypedIdObject
-
-        self.logger.debug(f'_getTypeId - typeIdObject: {typeIdObject}')
-        parse(xmiElement, typeIdObject, dico, "Foundation.Core.DataType")
-        parse(xmiElement, typeIdObject, dico, "Foundation.Data_Types.Enumeration")
-
-    def _getParam(self, Param, pyutMethod):
-        """
-        Extract param from Xmi file from Class part.
-
-        @param   minidom.Element  : Param
-        @param   pyutMethod for returned type
-        @return  PyutParam
-
-        @since 1.0
-        @author Deve Roux <droux@eivd.ch>
+            fileName:   The XMI file
+            umlFrame:   Where to draw
         """
-        aParam = PyutParam()
+        import wx   # Only the interactive open shows progress
 
-        # param's name
-        name = Param.getElementsByTagName("Foundation.Core.ModelElement.name")[0].firstChild
-        if name.nodeType == name.TEXT_NODE:
-            self.logger.debug(f'Parameter name: {name.data}')
-            if name.data[-6:] == "Return" or name.data[-6:] == "return":
-                self._getTypeId(Param, pyutMethod, self.dicoReturn)
-                return None
-            else:
-                aParam.setName(name.data)
-
-        # default value
-        self._getDefaultValue(Param, aParam)
-
-        # for type
-        self._getTypeId(Param, aParam, self.dicoType)
-
-        return aParam
-
-    def _getMethods(self, Class):
-        """
-        Extract method from Xmi file from Class part.
-
-        @param   minidom.Element  : Class
-        @return  [] with PyutMethod
-
-        @since 1.0
-        @author Deve Roux <droux@eivd.ch>
-        """
-        # class methods for this current class
-        allMethods = []
-
-        for Method in Class.getElementsByTagName("Foundation.Core.Operation"):
-
-            self.logger.debug(f'_getMethods - Method: {Method}')
-            # name = Method.getElementsByTagName("Foundation.Core.ModelElement.name")[0].firstChild
-            methElts: NodeList = Method.getElementsByTagName("Foundation.Core.ModelElement.name")
-
-            self.logger.debug(f'_getMethods - methElts: {methElts} methElts Length: {methElts.length}  type(methElts): {type(methElts)}')
-            if methElts.length == 0:
-                continue
-            elt = methElts.item(0)
-            self.logger.debug(f'_getMethods - elt: {elt}')
-            name = elt.firstChild
-
-            if name.nodeType == name.TEXT_NODE:
-                aMethod = PyutMethod(name.data)
-                self.logger.debug(f'Method name: {name.data}')
-                # method visibility
-                visibility = Method.getElementsByTagName  ("Foundation.Core.ModelElement.visibility")[0]
-                # aMethod.setVisibility(self._xmiVisibility2PyutVisibility (visibility.getAttribute('xmi.value')))
-                visStr: str = visibility.getAttribute('xmi.value')
-                vis:    PyutVisibilityEnum = self._xmiVisibility2PyutVisibility(visStr)
-                self.logger.debug(f'Method visibility: {vis}')
-                aMethod.setVisibility(vis)
-                allParams = []
-                for Param in Method.getElementsByTagName("Foundation.Core.Parameter"):
-                    pyutParam = self._getParam(Param, aMethod)
-                    if pyutParam is not None:
-                        allParams.append(pyutParam)
-
-                aMethod.setParams(allParams)
-
-                # adding this method in all class methods
-                allMethods.append(aMethod)
-
-        return allMethods
-
-    def _getFields(self, Class):
-        """
-        To extract fields from Class.
-
-        @param   minidom.Element  : Class
-        @return  [] with PyutField
-
-        @since 1.0
-        @author Deve Roux <droux@eivd.ch>
-        """
-        allFields = []
-        for Field in Class.getElementsByTagName("Foundation.Core.Attribute"):
-            aField = PyutField()
-            # name = Field.getElementsByTagName("Foundation.Core.ModelElement.name")[0].firstChild
-            fieldElts: NodeList = Field.getElementsByTagName("Foundation.Core.ModelElement.name")
-            self.logger.debug(f'_getFields - fieldElts: {fieldElts}  fieldElts.length: {fieldElts.length}  type(fieldElts): {type(fieldElts)}')
-            fieldElt:  Element = fieldElts.item(0)
-            name = fieldElt.firstChild
-
-            if name.nodeType == name.TEXT_NODE:
-                aField.setName(name.data)
-            # field visibility  --  Be verbose for debugability
-            # visibility = Field.getElementsByTagName ("Foundation.Core.ModelElement.visibility")[0]
-            # aField.setVisibility(self._xmiVisibility2PyutVisibility(visibility.getAttribute('xmi.value')))
-
-            visElts: NodeList = Field.getElementsByTagName("Foundation.Core.ModelElement.visibility")
-            visElt: Element   = visElts.item(0)
-            if visElt is None:
-                visStr: str = 'public'
-            else:
-                visStr: str = visElt.getAttribute('xmi.value')
-            vis:    PyutVisibilityEnum = self._xmiVisibility2PyutVisibility(visStr)
-            aField.setVisibility(vis)
-
-            # default value
-            self._getDefaultValue(Field, aField)
-
-            # for type
-            self._getTypeId(Field, aField, self.dicoType)
-            allFields.append(aField)
-        return allFields
-
-    def _getFathers(self, dom, umlFrame):
-        """
-        To extract fathers form Class.
-
-        @param dom xml.dom.minidom   : dom
-        @param umlFrame UmlFrame umlFrame
-        @since 1.0
-        @author Deve Roux <droux@eivd.ch>
-        """
-        # find id from class in src
-        def parse(src, generalizationType: str):
-            parent = src.getElementsByTagName(generalizationType)
-            if len(parent) > 0:
-                klass = parent[0].getElementsByTagName ("Foundation.Core.Class")[0].getAttribute("xmi.idref")
-                return klass
-
-            return None
-
-        for fathers in dom.getElementsByTagName("Foundation.Core.Generalization"):
-
-            # link id
-            linkId = fathers.getAttribute("xmi.id")
-            if linkId != "":
-                print(linkId)
-
-                father = parse(fathers, "Foundation.Core.Generalization.supertype")
-                son    = parse(fathers, "Foundation.Core.Generalization.subtype")
-
-                # find class with id
-                pyutFather = self.dicoFather[linkId][father]
-                pyutSon    = self.dicoFather[linkId][son]
-
-                # Adding father in pyutClass
-                pyutSon.getPyutObject().addParent(pyutFather)
-
-                # hadding link in uml frame
-                umlFrame.createInheritanceLink(pyutSon, pyutFather)
+        dlg   = wx.Dialog(None, -1, "Loading...", style=wx.STAY_ON_TOP | wx.CAPTION | wx.RESIZE_BORDER, size=wx.Size(207, 70))
+        gauge = wx.Gauge(dlg, -1, PyutXmi.GAUGE_RANGE, pos=wx.Point(2, 5), size=wx.Size(200, 30))
+        dlg.Show(True)
 
-    def _getLinks(self, dom, umlFrame):
-        """
-        To extract links form an OGL object.
+        def progress(bytesRead: int, totalBytes: int):
+            if totalBytes > 0:
+                gauge.SetValue(bytesRead * PyutXmi.GAUGE_RANGE // totalBytes)
+            wx.Yield()
 
-        @param  dom  : xml.dom.minidom
-        @param  umlFrame  UmlFrame
-        @since 1.0
-        @author Deve Roux <droux@eivd.ch>
-        """
-        for association in dom.getElementsByTagName("Foundation.Core.Association"):
-
-            linkId = association.getAttribute("xmi.id")
-            if linkId == "":
-                return
-            print("liinId " + linkId)
-
-            linkName = ""
-            xmiName = association.getElementsByTagName\
-                ("Foundation.Core.ModelElement.name")
-            if len(xmiName) > 0:
-                name = xmiName[0].firstChild
-                if name is not None:
-                    if name.nodeType == name.TEXT_NODE:
-                        linkName = name.data
-            print("link name : "+linkName)
-
-            src = None
-            dest = None
-            for extremite in association.getElementsByTagName("Foundation.Core.AssociationEnd"):
-                classId = extremite.getAttribute("xmi.id")
-                if not src:
-                    src = self.dicoLinks[classId]
-
-                else:
-                    dest = self.dicoLinks[classId]
-
-            linkType: LinkType = LinkType.ASSOCIATION
-            xmiType = association.getElementsByTagName("Foundation.Core.AssociationEnd.aggregation")
-            if xmiType[0].getAttribute("xmi.value") == 'shared':
-                linkType = LinkType.AGGREGATION
-
-            createdLink = umlFrame.createNewLink(src, dest)
-            createdLink.setName(linkName)
-            createdLink.setDestination(src.getPyutObject())
-
-    # noinspection PyUnusedLocal
-    def _getOglClasses(self, xmlOglClasses, dicoOglObjects, umlFrame, oldData):
-        """
-        Parse the XMI elements given and build data layer for PyUT classes.
-        If file is version 1.0, the dictionary given will contain, for key,
-        the name of the OGL object. Otherwise, it will be the ID
-        (multi-same-name support from version 1.1). Everything is fixed
-        later.
-
-        @param Element[] xmlOglClasses : XMI 'GraphicClass' elements
-        @param {id / srcName, OglObject} dicoOglObjects : OGL objects loaded
-        @param UmlFrame umlFrame : Where to draw
-        @param int oldData : If old data (v1.0), 1 else 0
-        @since 2.0
-        @author Philippe Waelti <pwaelti@eivd.ch>
-        """
+        try:
+            documentModel: DocumentModel = XmiReader().read(fileName, progress=progress)
+        finally:
+            dlg.Destroy()
 
-        pyutClass = PyutClass()
-
-        # adding name for this class
-        className = xmlOglClasses.getElementsByTagName("Foundation.Core.ModelElement.name")
-        self.logger.debug(f'Ogl class name: {className}')
-        if len(className) > 0:
-            name = className[0].firstChild
-            if name.nodeType == name.TEXT_NODE:
-                pyutClass.setName(name.data)
-
-            oglClass = OglClass(pyutClass, 50, 50)
-
-            # adding methods for this class
-            pyutClass.setMethods(self._getMethods(xmlOglClasses))
-
-            # adding fields for this class
-            pyutClass.fields = self._getFields(xmlOglClasses)
-
-            # for class id
-            classId = xmlOglClasses.getAttribute("xmi.id")
-            self.logger.debug(f"Class ID: {classId}")
-
-            # for all the classes who are an inheritance link
-            for fathers in xmlOglClasses.getElementsByTagName("Foundation.Core.Generalization"):
-                linkId = fathers.getAttribute("xmi.idref")
-                self.logger.debug(f"parent: {linkId}")
-                if linkId not in self.dicoFather:
-                    self.dicoFather[linkId] = {}
-                self.dicoFather[linkId][classId] = oglClass
-
-            # for all class whos are link
-            for links in xmlOglClasses.getElementsByTagName("Foundation.Core.Classifier.associationEnd"):
-                for link in links.getElementsByTagName("Foundation.Core.AssociationEnd"):
-                    linkId = link.getAttribute("xmi.idref")
-                    self.logger.debug(f"linkId: {linkId}")
-                    if linkId not in self.dicoLinks:
-                        self.dicoLinks[linkId] = oglClass
-            pyutClassId = pyutClass.getId()
-            self.logger.debug(f'pyutClassId: {pyutClassId}')
-            dicoOglObjects[pyutClassId] = oglClass
-
-            umlFrame.addShape(oglClass, 100, 100)
-
-    def open(self, dom, umlFrame):
-        """
-        To open a file and creating diagram.
+        self.drawDocument(documentModel, umlFrame)
 
-        @since 1.0
-        @Deve Roux <droux@eivd.ch>
+    def drawDocument(self, documentModel: DocumentModel, umlFrame):
         """
-        dicoOglObjects = {}     # format {name : oglClass}
-        oldData = 0             # 1 if PyUT v1.0 files
-        self.dicoLinks = {}     # format [name : PyutLink}
-        self.dicoFather = {}    # format {child oglClass : [fathers names]}
-        self.dicoType = {}
-        self.dicoReturn = {}
-
-        # Load OGL Classes
-        for Class in dom.getElementsByTagName("Foundation.Core.Class"):
-            self._getOglClasses(Class, dicoOglObjects, umlFrame, oldData)
-
-        # making link with xmi idType and method return and field
-        self._getType(dom)
+        Place the classes and the links of a document read by `XmiReader` on a frame
 
-        self._getFathers(dom, umlFrame)
-        self._getLinks(dom, umlFrame)
+        Args:
+            documentModel:  The classes and their links
+            umlFrame:       Where to draw
+        """
+        # Keep the module usable without a display
+        from org.pyut.ogl.OglLinkFactory import getOglLinkFactory
+        from org.pyut.persistence.converters.ModelToOglV10 import ModelToOgl
+
+        oglObjects = ModelToOgl().getOglObjects(documentModel.shapes)
+        for pyutId, oglObject in oglObjects.items():
+            shape: ShapeRecord = documentModel.shapes[pyutId]
+            umlFrame.addShape(oglObject, shape.x, shape.y)
+            oglObject.autoResize()
+
+        # The anchors are placed by the links;  The XMI has no geometry
+        umlDiagram = umlFrame.GetDiagram()
+        for link in documentModel.links:
+            src = oglObjects[link.sourceId]
+            dst = oglObjects[link.destinationId]
+            oglLink = getOglLinkFactory().getOglLink(src, link.pyutLink, dst, link.pyutLink.getType())
+            src.addLink(oglLink)
+            dst.addLink(oglLink)
+            umlDiagram.AddShape(oglLink)
 
-        # to draw diagram
         umlFrame.Refresh()
-
-        # cleaning dico
-        self.dicoType.clear()
-        self.dicoReturn.clear()
-        self.dicoFather.clear()
-        self.dicoLinks.clear()
@@ -0,0 +1,392 @@
+
+from typing import BinaryIO
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from os import path as osPath
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import XMLPullParser
+
+from org.pyut.enums.DiagramType import DiagramType
+from org.pyut.enums.LinkType import LinkType
+
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutField import PyutField
+from org.pyut.model.PyutLink import PyutLink
+from org.pyut.model.PyutMethod import PyutMethod
+from org.pyut.model.PyutParam import PyutParam
+from org.pyut.model.PyutType import PyutType
+from org.pyut.model.PyutVisibilityEnum import PyutVisibilityEnum
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import LinkRecord
+from org.pyut.persistence.DocumentModel import ShapeRecord
+
+XmiProgress = Callable[[int, int], None]
+"""
+Called with the number of bytes consumed and the file size
+"""
+
+XMI_ID:    str = 'xmi.id'
+XMI_IDREF: str = 'xmi.idref'
+XMI_VALUE: str = 'xmi.value'
+
+CLASS_TAG:            str = 'Foundation.Core.Class'
+ATTRIBUTE_TAG:        str = 'Foundation.Core.Attribute'
+OPERATION_TAG:        str = 'Foundation.Core.Operation'
+PARAMETER_TAG:        str = 'Foundation.Core.Parameter'
+ASSOCIATION_TAG:      str = 'Foundation.Core.Association'
+ASSOCIATION_END_TAG:  str = 'Foundation.Core.AssociationEnd'
+GENERALIZATION_TAG:   str = 'Foundation.Core.Generalization'
+
+NAME_TAG:             str = 'Foundation.Core.ModelElement.name'
+VISIBILITY_TAG:       str = 'Foundation.Core.ModelElement.visibility'
+IS_ABSTRACT_TAG:      str = 'Foundation.Core.GeneralizableElement.isAbstract'
+BODY_TAG:             str = 'Foundation.Data_Types.Expression.body'
+KIND_TAG:             str = 'Foundation.Core.Parameter.kind'
+AGGREGATION_TAG:      str = 'Foundation.Core.AssociationEnd.aggregation'
+MULTIPLICITY_TAG:     str = 'Foundation.Core.AssociationEnd.multiplicity'
+LOWER_TAG:            str = 'Foundation.Data_Types.MultiplicityRange.lower'
+UPPER_TAG:            str = 'Foundation.Data_Types.MultiplicityRange.upper'
+
+STRUCTURAL_TYPE_TAG:  str = 'Foundation.Core.StructuralFeature.type'
+PARAMETER_TYPE_TAG:   str = 'Foundation.Core.Parameter.type'
+END_TYPE_TAG:         str = 'Foundation.Core.AssociationEnd.type'
+
+GENERALIZATION_CHILD_TAGS:  List[str] = ['Foundation.Core.Generalization.child',  'Foundation.Core.Generalization.subtype']
+GENERALIZATION_PARENT_TAGS: List[str] = ['Foundation.Core.Generalization.parent', 'Foundation.Core.Generalization.supertype']
+
+VALUE_TAGS: Set[str] = {NAME_TAG, VISIBILITY_TAG, IS_ABSTRACT_TAG, BODY_TAG, KIND_TAG, AGGREGATION_TAG, MULTIPLICITY_TAG, LOWER_TAG, UPPER_TAG}
+"""
+The only properties kept;  Tool generated XMI has many more
+"""
+TRANSPARENT_TAGS: Set[str] = {
+    'Foundation.Data_Types.Multiplicity', 'Foundation.Data_Types.MultiplicityRange',
+    'Foundation.Data_Types.Expression', 'Foundation.Data_Types.ProcedureExpression',
+}
+"""
+Elements with an `xmi.id` whose properties belong to the enclosing element;  e.g. the multiplicity of an association end
+"""
+
+
+@dataclass
+class XmiElement:
+    """
+    An XMI element with an `xmi.id`, kept in the id map while the file is read
+    """
+    tag:        str = ''
+    xmiId:      str = ''
+    parentId:   str = ''
+    values:     Dict[str, str] = field(default_factory=dict)        # Property tag to its `xmi.value` or its text
+    references: Dict[str, str] = field(default_factory=dict)        # Property tag to the `xmi.idref` it holds
+    pyutObject: object = None
+
+    @property
+    def name(self) -> str:
+        return self.values.get(NAME_TAG, '')
+
+
+class XmiReader:
+    """
+    Reads UML 1.x XMI in a single streaming pass.  The file is fed to an expat
+    based pull parser in chunks and every element is dropped as soon as it ends,
+    so only the elements with an `xmi.id` are kept, in a single id map.  The
+    `xmi.idref` references are resolved against that map once the file is read.
+
+    It reads the UML 1.x XMI exported by other modelers for both the `IoXmi` and the
+    `IoXmi_OMG` plugins;  Only classes, their features, associations and
+    generalizations are converted.
+
+    Usage::
+        documentModel: DocumentModel = XmiReader().read('model.xmi', progress=lambda count, total: print(count, total))
+    """
+    CHUNK_SIZE: int = 64 * 1024
+
+    COLUMNS:      int   = 10
+    CLASS_WIDTH:  float = 100.0
+    CLASS_HEIGHT: float = 100.0
+    GRID_WIDTH:   float = 200.0
+    GRID_HEIGHT:  float = 200.0
+
+    def __init__(self, chunkSize: int = CHUNK_SIZE):
+        """
+        Args:
+            chunkSize:  The number of bytes fed to the parser between two progress reports
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._chunkSize: int = chunkSize
+
+        self._elements: Dict[str, XmiElement] = {}     # The id map;  In document order
+        self._owners:   List[XmiElement]      = []
+        self._tags:     List[Element]         = []
+
+    def read(self, fileName: str, progress: XmiProgress = None) -> DocumentModel:
+        """
+        Args:
+            fileName:   The XMI file
+            progress:   Reports the bytes read
+
+        Returns:
+            A class diagram;  The classes are laid out on a grid
+        """
+        with open(fileName, 'rb') as stream:
+            documentModel: DocumentModel = self.readStream(stream, totalBytes=osPath.getsize(fileName), progress=progress)
+        documentModel.title = osPath.splitext(osPath.basename(fileName))[0]
+
+        return documentModel
+
+    def readStream(self, stream: BinaryIO, totalBytes: int = 0, progress: XmiProgress = None) -> DocumentModel:
+        """
+        Args:
+            stream:     An XMI byte stream
+            totalBytes: The stream size, given to `progress`
+            progress:   Reports the bytes read after each chunk
+
+        Returns:
+            A class diagram
+        """
+        self._elements.clear()
+        self._owners.clear()
+        self._tags.clear()
+
+        parser:    XMLPullParser = XMLPullParser(events=('start', 'end'))
+        bytesRead: int           = 0
+        chunk:     bytes         = stream.read(self._chunkSize)
+        while len(chunk) > 0:
+            parser.feed(chunk)
+            self._handleEvents(parser)
+            bytesRead += len(chunk)
+            if progress is not None:
+                progress(bytesRead, totalBytes)
+            chunk = stream.read(self._chunkSize)
+        parser.close()
+        self._handleEvents(parser)
+
+        self.logger.info(f'{bytesRead} bytes;  {len(self._elements)} identified elements')
+
+        documentModel: DocumentModel = self._toDocumentModel()
+        self._elements.clear()
+
+        return documentModel
+
+    def _handleEvents(self, parser: XMLPullParser):
+
+        for event, element in parser.read_events():
+            if event == 'start':
+                self._startElement(element)
+            else:
+                self._endElement(element)
+
+    def _startElement(self, element: Element):
+
+        xmiId: str = element.get(XMI_ID)
+        if xmiId is not None and element.tag not in TRANSPARENT_TAGS:
+            parentId:   str        = self._owners[-1].xmiId if len(self._owners) > 0 else ''
+            xmiElement: XmiElement = XmiElement(tag=element.tag, xmiId=xmiId, parentId=parentId)
+            self._elements[xmiId] = xmiElement
+            self._owners.append(xmiElement)
+        elif len(self._owners) > 0 and len(self._tags) > 0:
+            owner:       XmiElement = self._owners[-1]
+            propertyTag: str        = self._tags[-1].tag
+            idRef:       str        = element.get(XMI_IDREF)
+            if idRef is not None:
+                owner.references.setdefault(propertyTag, idRef)
+            value: str = element.get(XMI_VALUE)
+            if value is not None and element.tag in VALUE_TAGS:
+                owner.values.setdefault(element.tag, value)
+
+        self._tags.append(element)
+
+    def _endElement(self, element: Element):
+
+        self._tags.pop()
+        if len(self._owners) > 0:
+            owner: XmiElement = self._owners[-1]
+            if owner.xmiId == element.get(XMI_ID) and owner.tag == element.tag:
+                self._owners.pop()
+            elif element.tag in VALUE_TAGS and element.text is not None and element.text.strip() != '':
+                owner.values.setdefault(element.tag, element.text.strip())
+
+        # The element is complete;  Drop it so that the parser never holds more than the open elements
+        if len(self._tags) > 0:
+            self._tags[-1].remove(element)
+
+    def _toDocumentModel(self) -> DocumentModel:
+
+        documentModel:   DocumentModel                = DocumentModel(diagramType=DiagramType.CLASS_DIAGRAM)
+        associationEnds: Dict[str, List[XmiElement]] = {}
+
+        for xmiElement in self._elements.values():
+            if xmiElement.tag == CLASS_TAG:
+                pyutClass: PyutClass = self._toPyutClass(xmiElement)
+                position:  int       = len(documentModel.shapes)
+                documentModel.shapes[pyutClass.getId()] = ShapeRecord(pyutObject=pyutClass,
+                                                                      x=(position % XmiReader.COLUMNS) * XmiReader.GRID_WIDTH,
+                                                                      y=(position // XmiReader.COLUMNS) * XmiReader.GRID_HEIGHT,
+                                                                      width=XmiReader.CLASS_WIDTH, height=XmiReader.CLASS_HEIGHT)
+            elif xmiElement.tag == ATTRIBUTE_TAG:
+                self._addField(xmiElement)
+            elif xmiElement.tag == OPERATION_TAG:
+                self._addMethod(xmiElement)
+            elif xmiElement.tag == PARAMETER_TAG:
+                self._addParameter(xmiElement)
+            elif xmiElement.tag == ASSOCIATION_END_TAG:
+                associationEnds.setdefault(xmiElement.parentId, []).append(xmiElement)
+
+        for xmiElement in self._elements.values():
+            linkRecord: LinkRecord = None
+            if xmiElement.tag == GENERALIZATION_TAG:
+                linkRecord = self._toInheritance(xmiElement)
+            elif xmiElement.tag == ASSOCIATION_TAG:
+                linkRecord = self._toAssociation(xmiElement, associationEnds.get(xmiElement.xmiId, []))
+            if linkRecord is not None:
+                documentModel.links.append(linkRecord)
+
+        return documentModel
+
+    def _toPyutClass(self, xmiElement: XmiElement) -> PyutClass:
+
+        pyutClass: PyutClass = PyutClass(xmiElement.name)
+        if xmiElement.values.get(IS_ABSTRACT_TAG, 'false').lower() == 'true':
+            pyutClass.setStereotype('Abstract')
+        xmiElement.pyutObject = pyutClass
+
+        return pyutClass
+
+    def _addField(self, xmiElement: XmiElement):
+
+        pyutClass: PyutClass = self._parentObject(xmiElement, PyutClass)
+        if pyutClass is None:
+            return
+        pyutField: PyutField = PyutField(name=xmiElement.name,
+                                         theFieldType=PyutType(self._referencedName(xmiElement, STRUCTURAL_TYPE_TAG)),
+                                         defaultValue=xmiElement.values.get(BODY_TAG),
+                                         visibility=self._visibility(xmiElement, PyutVisibilityEnum.PUBLIC))
+        pyutClass.fields.append(pyutField)
+        xmiElement.pyutObject = pyutField
+
+    def _addMethod(self, xmiElement: XmiElement):
+
+        pyutClass: PyutClass = self._parentObject(xmiElement, PyutClass)
+        if pyutClass is None:
+            return
+        pyutMethod: PyutMethod = PyutMethod(name=xmiElement.name, visibility=self._visibility(xmiElement, PyutVisibilityEnum.PUBLIC))
+        pyutClass.methods.append(pyutMethod)
+        xmiElement.pyutObject = pyutMethod
+
+    def _addParameter(self, xmiElement: XmiElement):
+
+        pyutMethod: PyutMethod = self._parentObject(xmiElement, PyutMethod)
+        if pyutMethod is None:
+            return
+        typeName: str = self._referencedName(xmiElement, PARAMETER_TYPE_TAG)
+        if xmiElement.values.get(KIND_TAG) == 'return' or xmiElement.name.lower().endswith('return'):
+            pyutMethod.setReturns(PyutType(typeName))
+        else:
+            pyutParam: PyutParam = PyutParam(name=xmiElement.name, theParameterType=PyutType(typeName), defaultValue=xmiElement.values.get(BODY_TAG))
+            pyutMethod.addParam(pyutParam)
+            xmiElement.pyutObject = pyutParam
+
+    def _toInheritance(self, xmiElement: XmiElement) -> LinkRecord:
+
+        child:  PyutClass = self._referencedClass(xmiElement, GENERALIZATION_CHILD_TAGS)
+        parent: PyutClass = self._referencedClass(xmiElement, GENERALIZATION_PARENT_TAGS)
+        if child is None or parent is None:
+            self.logger.warning(f'Generalization {xmiElement.xmiId} does not join two classes')
+            return None
+
+        child.addParent(parent)
+        pyutLink: PyutLink = PyutLink(linkType=LinkType.INHERITANCE, source=child, destination=parent)
+
+        return LinkRecord(pyutLink=pyutLink, sourceId=child.getId(), destinationId=parent.getId())
+
+    def _toAssociation(self, xmiElement: XmiElement, associationEnds: List[XmiElement]) -> LinkRecord:
+        """
+        The aggregate end, if any, is the link source
+        """
+        ends: List[Tuple[PyutClass, str, str]] = [
+            (self._referencedClass(end, [END_TYPE_TAG]), self._multiplicity(end), end.values.get(AGGREGATION_TAG, 'none'))
+            for end in associationEnds
+        ]
+        if len(ends) != 2 or ends[0][0] is None or ends[1][0] is None:
+            self.logger.warning(f'Association {xmiElement.xmiId} does not join two classes')
+            return None
+
+        if ends[1][2] != 'none' and ends[0][2] == 'none':
+            ends.reverse()
+        source, sourceCardinality, aggregation = ends[0]
+        destination, destinationCardinality, _ = ends[1]
+
+        linkType: LinkType = LinkType.ASSOCIATION
+        if aggregation == 'composite':
+            linkType = LinkType.COMPOSITION
+        elif aggregation in ['shared', 'aggregate']:
+            linkType = LinkType.AGGREGATION
+
+        pyutLink: PyutLink = PyutLink(name=xmiElement.name, linkType=linkType,
+                                      cardSrc=sourceCardinality, cardDest=destinationCardinality,
+                                      source=source, destination=destination)
+        source.addLink(pyutLink)
+
+        return LinkRecord(pyutLink=pyutLink, sourceId=source.getId(), destinationId=destination.getId())
+
+    def _parentObject(self, xmiElement: XmiElement, expectedType: type):
+        """
+        Returns:
+            The data model object of the enclosing element, `None` if it is not of the expected type
+        """
+        parent: XmiElement = self._elements.get(xmiElement.parentId)
+        if parent is not None and isinstance(parent.pyutObject, expectedType):
+            return parent.pyutObject
+        return None
+
+    def _referencedName(self, xmiElement: XmiElement, propertyTag: str) -> str:
+
+        referenced: XmiElement = self._elements.get(xmiElement.references.get(propertyTag, ''))
+        if referenced is None:
+            return ''
+        return referenced.name
+
+    def _referencedClass(self, xmiElement: XmiElement, propertyTags: List[str]) -> PyutClass:
+
+        for propertyTag in propertyTags:
+            referenced: XmiElement = self._elements.get(xmiElement.references.get(propertyTag, ''))
+            if referenced is not None and isinstance(referenced.pyutObject, PyutClass):
+                return referenced.pyutObject
+        return None
+
+    def _visibility(self, xmiElement: XmiElement, defaultVisibility: PyutVisibilityEnum) -> PyutVisibilityEnum:
+
+        visibility: str = xmiElement.values.get(VISIBILITY_TAG)
+        if visibility is None:
+            return defaultVisibility
+        return PyutVisibilityEnum.toEnum(visibility)
+
+    def _multiplicity(self, xmiElement: XmiElement) -> str:
+        """
+        Either the multiplicity text or its range;  An upper bound of -1 is unlimited
+        """
+        multiplicity: str = xmiElement.values.get(MULTIPLICITY_TAG)
+        if multiplicity is not None:
+            return multiplicity
+
+        lower: str = xmiElement.values.get(LOWER_TAG)
+        upper: str = xmiElement.values.get(UPPER_TAG)
+        if lower is None or upper is None:
+            return ''
+        if upper == '-1':
+            upper = '*'
+        if lower == upper:
+            return lower
+        return f'{lower}..{upper}'
@@ -42,7 +42,6 @@ from wx import Menu
 from wx import FileDialog
 from wx import PrintDialogData
 from wx import PrintDialog
-from wx import ClientDC
 from wx import PreviewFrame
 from wx import PrintPreview
 from wx import Printer
@@ -253,13 +252,15 @@ class AppFrame(Frame):
         self._ctrl.updateTitle()
         cl = self.plugins[event.GetId()]
 
-        obj = cl(self._ctrl.getUmlObjects(), self._ctrl.getUmlFrame())
+        umlFrame = self._ctrl.getUmlFrame()
+        obj = cl(self._ctrl.getUmlObjects(), umlFrame)
 
         # Do plugin functionality
         BeginBusyCursor()
         try:
             wxYield()  # time to process the refresh in newDiagram
-            obj.doImport()
+            with umlFrame.batch():
+                obj.doImport()
         except (ValueError, Exception) as e:
             PyutUtils.displayError(_("An error occurred while executing the selected plugin"), _("Error..."), self)
             self.logger.error(f'{e}')
@@ -292,12 +293,17 @@ class AppFrame(Frame):
         """
         # Create a plugin instance
         cl = self.plugins[event.GetId()]
-        obj = cl(self._ctrl.getUmlObjects(), self._ctrl.getUmlFrame())
+        umlFrame = self._ctrl.getUmlFrame()
+        obj = cl(self._ctrl.getUmlObjects(), umlFrame)
 
         # Do plugin functionality
         BeginBusyCursor()
         try:
-            obj.callDoAction()
+            if umlFrame is None:
+                obj.callDoAction()
+            else:
+                with umlFrame.batch():
+                    obj.callDoAction()
             self.logger.debug(f"After tool plugin do action")
         except (ValueError, Exception) as e:
             PyutUtils.displayError(_("An error occurred while executing the selected plugin"), _("Error..."), self)
@@ -305,7 +311,6 @@ class AppFrame(Frame):
         EndBusyCursor()
 
         # Refresh screen
-        umlFrame = self._ctrl.getUmlFrame()
         if umlFrame is not None:
             umlFrame.Refresh()
 
@@ -330,20 +335,20 @@ class AppFrame(Frame):
         # diagram = self._ctrl.getDiagram()
 
         # put the PyutObjects in the clipboard and remove them from the diagram
-        for obj in selected:
-            # remove the links
-            # for each link
-            # for link in obj.getLinks()[:]:
-            # self._ctrl.removeLink(link)
-            obj.Detach()
+        with canvas.batch():
+            for obj in selected:
+                # remove the links
+                # for each link
+                # for link in obj.getLinks()[:]:
+                # self._ctrl.removeLink(link)
+                obj.Detach()
 
-        for obj in selected:
-            self._clipboard.append(obj.getPyutObject())
-            # self._ctrl.removeClass(obj)
+            for obj in selected:
+                self._clipboard.append(obj.getPyutObject())
+                # self._ctrl.removeClass(obj)
 
-        self._mainFileHandlingUI.setModified(True)
-        self._ctrl.updateTitle()
-        canvas.Refresh()
+            self._mainFileHandlingUI.setModified(True)
+            canvas.Refresh()
 
     def _onActivate(self, event):
         """
@@ -946,33 +951,26 @@ class AppFrame(Frame):
 
         # put the objects in the clipboard and remove them from the diagram
         x, y = 100, 100
-        for obj in self._clipboard:
-            obj = copy(obj)  # this is a PyutObject
-            if isinstance(obj, PyutClass):
-                po = OglClass(obj)
-            elif isinstance(obj, PyutNote):
-                po = OglNote(obj)
-            elif isinstance(obj, PyutActor):
-                po = OglActor(obj)
-            elif isinstance(obj, PyutUseCase):
-                po = OglUseCase(obj)
-            else:
-                self.logger.error("Error when try to paste object")
-                return
-            self._ctrl.getUmlFrame().addShape(po, x, y)
-            x += 20
-            y += 20
-
-        canvas = po.GetDiagram().GetPanel()
-        # the canvas that contain the shape
-        # specify the canvas on which we will paint
-        dc = ClientDC(canvas)
-        canvas.PrepareDC(dc)
-
-        self._mainFileHandlingUI.setModified(True)
-        self._ctrl.updateTitle()
-        canvas.Refresh()
-        # TODO : What are you doing with the dc ?
+        with frame.batch():
+            for obj in self._clipboard:
+                obj = copy(obj)  # this is a PyutObject
+                if isinstance(obj, PyutClass):
+                    po = OglClass(obj)
+                elif isinstance(obj, PyutNote):
+                    po = OglNote(obj)
+                elif isinstance(obj, PyutActor):
+                    po = OglActor(obj)
+                elif isinstance(obj, PyutUseCase):
+                    po = OglUseCase(obj)
+                else:
+                    self.logger.error("Error when try to paste object")
+                    return
+                frame.addShape(po, x, y)
+                x += 20
+                y += 20
+
+            self._mainFileHandlingUI.setModified(True)
+            frame.Refresh()
 
     # noinspection PyUnusedLocal
     def _OnMnuSelectAll(self, event: CommandEvent):
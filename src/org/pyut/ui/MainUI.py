@@ -53,6 +53,9 @@ from org.pyut.dialogs.DlgEditDocument import DlgEditDocument
 
 from org.pyut.general.Globals import _
 
+from org.pyut.general.ModificationBus import ModificationBatch
+from org.pyut.general.ModificationBus import getModificationBus
+
 TreeDataType = TypeVar('TreeDataType', PyutProject, UmlDiagramsFrame)
 DialogType   = TypeVar('DialogType', FileDialog, MessageDialog)
 
@@ -100,6 +103,8 @@ class MainUI:
 
             self._initializeUIElements()
 
+        getModificationBus().subscribe(self._onModifications)
+
     def registerUmlFrame(self, frame):
         """
         Register the current UML Frame
@@ -112,8 +117,25 @@ class MainUI:
 
     def showFrame(self, frame):
         self._frame = frame
+        self.materializeFrame(frame)
         frame.Show()
 
+    def materializeFrame(self, frame: UmlDiagramsFrame):
+        """
+        Render the contents of a document read from a file the first time its frame is shown
+
+        Args:
+            frame:  The frame of a project document
+        """
+        for project in self._projects:
+            for document in project.getDocuments():
+                if document.getFrame() is frame:
+                    try:
+                        document.materialize()
+                    except (ValueError, Exception) as e:
+                        PyutUtils.displayError(_(f"An error occurred while loading the diagram {document.title}: {e}"))
+                    return
+
     def getProjects(self):
         """
 
@@ -176,6 +198,8 @@ class MainUI:
             self._projects.append(project)
             #  self._ctrl.registerCurrentProject(project)
             self._currentProject = project
+            if self._mediator.isInScriptMode():
+                self.__materializeDocuments(project.getDocuments())     # No tab will ever be shown
         except (ValueError, Exception) as e:
             PyutUtils.displayError(_(f"An error occurred while loading the project ! {e}"))
             return False
@@ -218,7 +242,9 @@ class MainUI:
             return False
 
         # ...
-        if not self._mediator.isInScriptMode():
+        if self._mediator.isInScriptMode():
+            self.__materializeDocuments(project.getDocuments()[nbInitialDocuments:])
+        else:
             try:
                 for document in project.getDocuments()[nbInitialDocuments:]:
                     self.__notebook.AddPage(document.getFrame(), document.getFullyQualifiedName())
@@ -431,6 +457,7 @@ class MainUI:
                     dlg.Destroy()
 
         # dereference all
+        getModificationBus().unsubscribe(self._onModifications)
         self.__parent = None
         self._mediator = None
         self.__splitter = None
@@ -444,7 +471,8 @@ class MainUI:
 
     def setModified(self, theNewValue: bool = True):
         """
-        Set the Modified flag of the currently opened diagram
+        Set the Modified flag of the currently opened diagram;  The title is
+        updated once the current event is handled, however many times this is called
 
         Args:
             theNewValue:
@@ -452,7 +480,7 @@ class MainUI:
         """
         if self._currentProject is not None:
             self._currentProject.setModified(theNewValue)
-        self._mediator.updateTitle()
+        getModificationBus().notify(modified=theNewValue)
 
     def closeCurrentProject(self):
         """
@@ -545,6 +573,17 @@ class MainUI:
         self.logger.warning(f'The oglObjects: {oglObjects} appear to not belong to any project')
         return cast(PyutProject, None)
 
+    def _onModifications(self, batch: ModificationBatch):
+        """
+        Called once per batch of modifications
+        """
+        if self._mediator is not None:
+            self._mediator.updateTitle()
+
+    def __materializeDocuments(self, documents: List[PyutDocument]):
+        for document in documents:
+            document.materialize()
+
     def _initializeUIElements(self):
         """
         Instantiate all the UI elements
@@ -584,6 +623,7 @@ class MainUI:
         if self._mediator is not None:      # hasii maybe I got this right from the old pre PEP-8 code
             #  self._ctrl.registerUMLFrame(self._getCurrentFrame())
             self._currentFrame = self._getCurrentFrameFromNotebook()
+            self.materializeFrame(self._currentFrame)
             self.__parent.notifyTitleChanged()
         # self.__projectTree.SelectItem(getID(self.getCurrentFrame()))
         # TODO : how can I do getID ???
@@ -606,6 +646,7 @@ class MainUI:
             frame: UmlDiagramsFrame = pyutData
             self._currentFrame = frame
             self._currentProject = self.getProjectFromFrame(frame)
+            self.materializeFrame(frame)
 
             # Select the frame in the notebook
             for i in range(self.__notebook.GetPageCount()):
@@ -11,6 +11,8 @@ from org.pyut.PyutConstants import DiagramsLabels
 
 from org.pyut.enums.DiagramType import DiagramType
 
+from org.pyut.persistence.DocumentModel import DocumentModel
+
 from org.pyut.ui.UmlClassDiagramsFrame import UmlClassDiagramsFrame
 from org.pyut.ui.UmlDiagramsFrame import UmlDiagramsFrame
 from org.pyut.ui.UmlSequenceDiagramsFrame import UmlSequenceDiagramsFrame
@@ -50,6 +52,10 @@ class PyutDocument:
         """
         Tree I belong to
         """
+        self._documentModel:  DocumentModel = cast(DocumentModel, None)
+        """
+        The header and XML element read from a file, until the frame is first shown
+        """
 
         self.logger.debug(f'Project: {project} PyutDocument using type {docType}')
         if docType == DiagramType.CLASS_DIAGRAM:
@@ -100,6 +106,54 @@ class PyutDocument:
         """
         return self._frame
 
+    def attachModel(self, documentModel: DocumentModel):
+        """
+        Keep the document read from a file;  Its XML element is only converted when the
+        frame is first shown, so documents in background tabs cost nothing until viewed
+
+        Args:
+            documentModel:  The document header and its XML element
+        """
+        self._documentModel = documentModel
+
+    def getDocumentModel(self) -> DocumentModel:
+        """
+
+        Returns:  The document read from a file or `None` once materialized
+        """
+        return self._documentModel
+
+    def isMaterialized(self) -> bool:
+        """
+
+        Returns:  `True` if the frame holds the document contents, `False` if they are still waiting to be rendered
+        """
+        return self._documentModel is None
+
+    def materialize(self):
+        """
+        Convert the document read from a file and render it on the frame.  Does nothing after
+        the first call or for documents created in the UI
+        """
+        if self._documentModel is None:
+            return
+        # Cleared first so that a frame shown while rendering does not render again;  Put back
+        # if the rendering fails so that the document is not left empty for good
+        documentModel: DocumentModel = self._documentModel
+        self._documentModel = cast(DocumentModel, None)
+
+        from org.pyut.persistence.PyutXmlV10 import PyutXml     # Avoid cyclical dependency
+
+        # Placing the shapes is not a user modification
+        wasModified: bool = self._project.getModified()
+        try:
+            with self._frame.batch():
+                PyutXml().renderDocument(documentModel, self._frame)
+                self._project.setModified(wasModified)
+        except (ValueError, Exception):
+            self._documentModel = documentModel
+            raise
+
     def addToTree(self, tree: TreeCtrl, root: TreeItemId):
         """
 
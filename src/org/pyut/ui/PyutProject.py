@@ -19,6 +19,7 @@ from org.pyut.PyutUtils import PyutUtils
 from org.pyut.enums.DiagramType import DiagramType
 
 from org.pyut.general.Mediator import getMediator
+from org.pyut.general.ModificationBus import getModificationBus
 from org.pyut.general.Globals import _
 
 from org.pyut.ui.PyutDocument import PyutDocument
@@ -157,8 +158,9 @@ class PyutProject:
         # Load the file
         self._filename = filename
         try:
-            io.open(filename, self)
-            self._modified = False
+            with getModificationBus().transaction():
+                io.open(filename, self)
+                self._modified = False
         except (ValueError, Exception) as e:
             EndBusyCursor()
             PyutUtils.displayError(_(f"Error loading file: {e}"))
@@ -173,6 +175,7 @@ class PyutProject:
         # self._ctrl.registerUMLFrame(self._documents[0].getFrame())
         # print ">>>PyutProject-loadFromFilename-7"
         if len(self._documents) > 0:
+            self._documents[0].materialize()
             self._ctrl.getFileHandling().showFrame(self._documents[0].getFrame())
             self._documents[0].getFrame().Refresh()
             return True
@@ -195,8 +198,9 @@ class PyutProject:
         io = IoFile.IoFile()
 
         try:
-            io.open(filename, self)
-            self._modified = False
+            with getModificationBus().transaction():
+                io.open(filename, self)
+                self._modified = False
         except (ValueError, Exception) as e:
             PyutUtils.displayError(_(f"Error loading file {e}"))
             EndBusyCursor()
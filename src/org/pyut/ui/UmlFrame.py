@@ -1,7 +1,11 @@
 
+from typing import Dict
+
 from logging import Logger
 from logging import getLogger
 
+from contextlib import contextmanager
+
 from wx import BeginBusyCursor
 from wx import EVT_CHAR
 from wx import EVT_CLOSE
@@ -16,11 +20,14 @@ from org.pyut.ogl.OglObject import OglObject
 from org.pyut.ogl.OglLink import OglLink
 from org.pyut.ogl.sd.OglSDMessage import OglSDMessage
 
+from org.pyut.model.PyutObject import PyutObject
+
 from org.pyut.MiniOgl.Constants import SKIP_EVENT
 from org.pyut.MiniOgl.DiagramFrame import DiagramFrame
 
 from org.pyut.general.Mediator import ACTION_ZOOM_IN
 from org.pyut.general.Mediator import getMediator
+from org.pyut.general.ModificationBus import getModificationBus
 
 from org.pyut.PyutUtils import PyutUtils
 
@@ -44,6 +51,9 @@ class UmlFrame(UmlFrameShapeHandler):
     It provides all the methods to add new classes, notes, links...
     It also routes some click events to the mediator. See the `OnLeftDown`
     method.
+
+    The objects and links are indexed by the id of their Pyut object as
+    they are added and removed, and when an id changes.
     """
     PIXELS_PER_UNIT_X: int = 20
     PIXELS_PER_UNIT_Y: int = 20
@@ -72,6 +82,9 @@ class UmlFrame(UmlFrameShapeHandler):
         self._frame = frame
         self._history = HistoryManager(self)
 
+        self._umlObjectsById: Dict[int, Dict[int, OglObject]] = {}    # pyut id -> id(shape) -> shape, in the order they were added
+        PyutObject.addIdObserver(self._onPyutIdChanged)
+
         # Close event
         self.Bind(EVT_CLOSE, self.evtClose)
         self.Bind(EVT_PAINT, self.OnPaint)
@@ -111,6 +124,7 @@ class UmlFrame(UmlFrameShapeHandler):
         """
         self._ctrl = None
         self._frame = None
+        PyutObject.removeIdObserver(self._onPyutIdChanged)
 
     # noinspection PyUnusedLocal
     def evtClose(self, event):
@@ -137,7 +151,7 @@ class UmlFrame(UmlFrameShapeHandler):
         """
 
         if self._ctrl.actionWaiting():
-            x, y = self.CalcUnscrolledPosition(event.GetX(), event.GetY())
+            x, y = self.getEventPosition(event)
             skip = self._ctrl.doAction(x, y)
 
             if self._ctrl.getCurrentAction() == ACTION_ZOOM_IN:
@@ -174,7 +188,7 @@ class UmlFrame(UmlFrameShapeHandler):
         @since 1.22
         @author L. Burgbacher <lb@alawa.ch>
         """
-        x, y = self.CalcUnscrolledPosition(event.GetX(), event.GetY())
+        x, y = self.getEventPosition(event)
         self._ctrl.editObject(x, y)
         DiagramFrame.OnLeftDClick(self, event)
 
@@ -188,6 +202,20 @@ class UmlFrame(UmlFrameShapeHandler):
         self._diagram.DeleteAllShapes()
         self.Refresh()
 
+    @contextmanager
+    def batch(self):
+        """
+        Bulk edits;  The shape models, the modified flags and the repaints
+        are updated once, when the outermost batch ends
+
+        Sample use:
+            with umlFrame.batch():
+                for oglObject in oglObjects:
+                    oglObject.SetPosition(x, y)
+        """
+        with getModificationBus().transaction(), self._diagram.batch():
+            yield self
+
     def getDiagram(self):
         """
         Return the diagram of this frame.
@@ -234,6 +262,17 @@ class UmlFrame(UmlFrameShapeHandler):
                 umlObjects.append(s)
         return umlObjects
 
+    def getSelectedUmlObjects(self):
+        """
+        Retrieve the selected UML objects;  The diagram keeps its selected shapes,
+        the other shapes are not visited
+        """
+        selectedObjects = []
+        for s in self._diagram.GetSelectedShapes():
+            if isinstance(s, (OglObject, OglLink, OglSDMessage, OglInterface2)):
+                selectedObjects.append(s)
+        return selectedObjects
+
     def getWidth(self):
         """
         Knowing Width.
@@ -290,12 +329,29 @@ class UmlFrame(UmlFrameShapeHandler):
         @return the uml object that has the specified id. If there is no
         matching object, None is returned.
         """
+        shapes: Dict[int, OglObject] = self._umlObjectsById.get(objectId)
+        if shapes is None:
+            return None
+
+        return next(iter(shapes.values()))
 
-        for shape in self.GetDiagram().GetShapes():
-            if isinstance(shape, (OglObject, OglLink)):
-                if shape.getPyutObject().getId() == objectId:
-                    return shape
-        return None
+    def OnShapeAdded(self, shape):
+        """
+        Index the UML objects by id
+
+        Args:
+            shape:  The shape added to the diagram
+        """
+        if isinstance(shape, (OglObject, OglLink)) and shape.getPyutObject() is not None:
+            self._umlObjectsById.setdefault(shape.getPyutObject().getId(), {})[id(shape)] = shape
+
+    def OnShapeRemoved(self, shape):
+        """
+        Args:
+            shape:  The shape removed from the diagram
+        """
+        if isinstance(shape, (OglObject, OglLink)) and shape.getPyutObject() is not None:
+            self._unindex(shape.getPyutObject().getId(), shape)
 
     def getHistory(self):
         """
@@ -303,3 +359,23 @@ class UmlFrame(UmlFrameShapeHandler):
         @return the history associated to this frame
         """
         return self._history
+
+    def _onPyutIdChanged(self, pyutObject: PyutObject, previousId: int):
+        """
+        Move the shapes of a Pyut object whose id changed to the new id
+
+        Args:
+            pyutObject: The object with a new id
+            previousId: Its id until now
+        """
+        shapes: Dict[int, OglObject] = self._umlObjectsById.get(previousId, {})
+        for shape in [shape for shape in shapes.values() if shape.getPyutObject() is pyutObject]:
+            self._unindex(previousId, shape)
+            self._umlObjectsById.setdefault(pyutObject.getId(), {})[id(shape)] = shape
+
+    def _unindex(self, objectId: int, shape):
+
+        shapes: Dict[int, OglObject] = self._umlObjectsById.get(objectId, {})
+        shapes.pop(id(shape), None)
+        if len(shapes) == 0:
+            self._umlObjectsById.pop(objectId, None)
@@ -0,0 +1,127 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from os import listdir
+from os import path as osPath
+
+from tempfile import mkdtemp
+
+from shutil import rmtree
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+from tests.TestBase import TEST_DIRECTORY
+
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutField import PyutField
+from org.pyut.model.PyutMethod import PyutMethod
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import ProjectModel
+from org.pyut.persistence.ProjectReader import ProjectReader
+
+from org.pyut.plugins.ascii.AsciiRenderer import AsciiRenderer
+
+from org.pyut.batch.BatchConverter import BatchConverter
+
+
+class TestAsciiRenderer(TestBase):
+    """
+    """
+    TEST_FILE_NAME: str = osPath.join(TEST_DIRECTORY, 'testdata', 'TwoDiagrams.xml')
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestAsciiRenderer.clsLogger = getLogger(__name__)
+        BatchConverter.setupHeadless()
+
+    def setUp(self):
+        self.logger:    Logger = TestAsciiRenderer.clsLogger
+        self.directory: str    = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def testClassBox(self):
+
+        pyutClass: PyutClass = PyutClass('Car')
+        pyutClass.fields  = [PyutField('speed')]
+        pyutClass.methods = [PyutMethod('drive')]
+        pyutClass.description = 'A car'
+
+        expected: str = (
+            '------------\n'
+            '|   Car    |\n'
+            '|----------|\n'
+            '| -speed   |\n'
+            '|----------|\n'
+            '| +drive() |\n'
+            '------------\n'
+            '\n'
+            'A car'
+        )
+        self.assertEqual(expected, AsciiRenderer().renderClass(pyutClass))
+
+    def testUniqueNames(self):
+
+        names: List[str] = AsciiRenderer().uniqueNames(['Car', 'Car', 'Wheel', 'Engine'], {'Car.acl', 'Car2.acl', 'Wheel.py'})
+
+        self.assertEqual(['Car3', 'Car4', 'Wheel', 'Engine'], names)
+
+    def testWriteClasses(self):
+
+        with open(osPath.join(self.directory, 'Car.acl'), 'w') as existing:
+            existing.write('Keep me')
+
+        pyutClasses: List[PyutClass] = [PyutClass('Car'), PyutClass('Wheel'), PyutClass('Car')]
+        fileNames:   List[str]       = AsciiRenderer().writeClasses(pyutClasses, self.directory)
+
+        self.assertEqual(['Car2.acl', 'Wheel.acl', 'Car3.acl'], [osPath.basename(fileName) for fileName in fileNames])
+        self.assertEqual(4, len(listdir(self.directory)))
+        with open(osPath.join(self.directory, 'Car.acl')) as existing:
+            self.assertEqual('Keep me', existing.read(), 'An existing file is never replaced')
+
+    def testRenderDocument(self):
+
+        projectModel:  ProjectModel  = ProjectReader().read(TestAsciiRenderer.TEST_FILE_NAME)
+        documentModel: DocumentModel = projectModel.documents[0]
+
+        text:  str       = AsciiRenderer().renderDocument(documentModel)
+        lines: List[str] = text.split('\n')
+        self.logger.debug(f'\n{text}')
+
+        for name in ['Vehicle', 'Car', 'Engine', 'Wheels are']:
+            self.assertIn(name, text)
+        self.assertIn('^', text, 'The inheritance arrow points to the parent')
+        self.assertIn('*', text, 'The composition marker')
+        vehicleRow: int = next(idx for idx, line in enumerate(lines) if 'Vehicle ' in line)
+        carRow:     int = next(idx for idx, line in enumerate(lines) if ' Car ' in line)
+        self.assertLess(vehicleRow, carRow, 'The shapes keep their relative positions')
+
+    def testConvertAscii(self):
+
+        BatchConverter.convertFile(TestAsciiRenderer.TEST_FILE_NAME, ['ascii'], self.directory)
+
+        self.assertEqual(['TwoDiagrams-0-Vehicles.acl', 'TwoDiagrams-1-USECASE_DIAGRAM.acl'], sorted(listdir(self.directory)))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestAsciiRenderer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
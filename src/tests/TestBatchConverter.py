@@ -0,0 +1,175 @@
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+
+from tempfile import mkdtemp
+
+from shutil import rmtree
+
+from zlib import compress
+
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import parseString
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+from tests.TestBase import TEST_DIRECTORY
+
+from org.pyut.enums.DiagramType import DiagramType
+from org.pyut.enums.LinkType import LinkType
+
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutNote import PyutNote
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import ProjectModel
+from org.pyut.persistence.ProjectReader import ProjectReader
+from org.pyut.persistence.converters.MiniDomToModelV10 import MiniDomToModel
+
+from org.pyut.batch.BatchConverter import BatchConverter
+from org.pyut.batch.BatchConverter import ConversionResult
+from org.pyut.batch.ProjectPdfExporter import DocumentSnapshots
+from org.pyut.batch.ProjectPdfExporter import ProjectPdfExporter
+
+
+class TestBatchConverter(TestBase):
+    """
+    """
+    TEST_FILE_NAME: str = osPath.join(TEST_DIRECTORY, 'testdata', 'TwoDiagrams.xml')
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestBatchConverter.clsLogger = getLogger(__name__)
+        BatchConverter.setupHeadless()
+
+    def setUp(self):
+        self.logger:    Logger = TestBatchConverter.clsLogger
+        self.directory: str    = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def testReadClassDiagram(self):
+
+        projectModel: ProjectModel  = ProjectReader().read(TestBatchConverter.TEST_FILE_NAME)
+        self.assertEqual(2, len(projectModel.documents), 'Both documents should be read')
+
+        documentModel: DocumentModel = projectModel.documents[0]
+        self.assertEqual(DiagramType.CLASS_DIAGRAM, documentModel.diagramType)
+        self.assertEqual('Vehicles', documentModel.title)
+        self.assertEqual(4, len(documentModel.shapes), 'Three classes and a note')
+        self.assertEqual(3, len(documentModel.links))
+
+        car:     PyutClass = documentModel.shapes[2].pyutObject
+        vehicle: PyutClass = documentModel.shapes[1].pyutObject
+        self.assertIn(vehicle, car.getParents(), 'Inheritance should be rebuilt')
+        self.assertEqual(LinkType.COMPOSITION, documentModel.links[1].pyutLink.linkType)
+        self.assertEqual([(110.0, 160.0)], documentModel.links[0].controlPoints)
+
+        note: PyutNote = documentModel.shapes[4].pyutObject
+        self.assertEqual('Wheels are\nmandatory', note.content)
+
+    def testReadAssociationLabels(self):
+
+        projectModel:  ProjectModel  = ProjectReader().read(TestBatchConverter.TEST_FILE_NAME)
+        documentModel: DocumentModel = projectModel.documents[0]
+
+        expectedLabels = {'LabelCenter': (230.0, 220.0), 'LabelSrc': (170.0, 220.0), 'LabelDst': (290.0, 220.0)}
+        self.assertEqual(expectedLabels, documentModel.links[1].labels, 'Association labels should keep their positions')
+        self.assertEqual({}, documentModel.links[0].labels, 'Inheritance links have no labels')
+
+    def testReadUseCaseDiagramTitle(self):
+
+        projectModel:  ProjectModel  = ProjectReader().read(TestBatchConverter.TEST_FILE_NAME)
+        documentModel: DocumentModel = projectModel.documents[1]
+
+        self.assertEqual(DiagramType.USECASE_DIAGRAM, documentModel.diagramType)
+        self.assertEqual('USECASE_DIAGRAM', documentModel.title, 'An empty title falls back to the diagram type')
+        self.assertEqual(2, len(documentModel.shapes))
+        self.assertEqual(1, len(documentModel.links))
+
+    def testProjectPdfSnapshots(self):
+
+        projectModel: ProjectModel      = ProjectReader().read(TestBatchConverter.TEST_FILE_NAME)
+        snapshots:    DocumentSnapshots = ProjectPdfExporter().snapshots(projectModel)
+        self.assertEqual(1, len(snapshots), 'Only class diagrams are exported')
+        self.assertEqual('Vehicles', snapshots[0].title)
+
+        standAlone: ProjectModel = MiniDomToModel().getProject(parseString(snapshots[0].xml))
+        self.assertEqual(1, len(standAlone.documents), 'A snapshot holds a single document')
+        self.assertEqual(len(projectModel.documents[0].shapes), len(standAlone.documents[0].shapes))
+
+    def testConvertXmlFile(self):
+
+        result: ConversionResult = BatchConverter.convertFile(TestBatchConverter.TEST_FILE_NAME, ['gml', 'xmi', 'python'], self.directory)
+
+        self.assertTrue(result.succeeded, result.message)
+        expectedOutputs = [
+            osPath.join(self.directory, 'TwoDiagrams-0-Vehicles.gml'),
+            osPath.join(self.directory, 'TwoDiagrams-1-USECASE_DIAGRAM.gml'),
+            osPath.join(self.directory, 'TwoDiagrams-0-Vehicles.xmi'),
+        ]
+        for fileName in expectedOutputs:
+            self.assertIn(fileName, result.outputs)
+            self.assertTrue(osPath.exists(fileName), f'{fileName} not written')
+        for className in ['Vehicle', 'Car', 'Engine']:
+            self.assertTrue(osPath.exists(osPath.join(self.directory, 'TwoDiagrams', f'{className}.py')))
+
+        with open(osPath.join(self.directory, 'TwoDiagrams-0-Vehicles.gml')) as gmlFile:
+            gml: str = gmlFile.read()
+        self.assertEqual(4, gml.count('node ['), 'One node per shape')
+        self.assertEqual(3, gml.count('edge ['), 'One edge per link')
+
+    def testConvertCompressedFile(self):
+
+        with open(TestBatchConverter.TEST_FILE_NAME, 'rb') as xmlFile:
+            compressed: bytes = compress(xmlFile.read())
+        fileName: str = osPath.join(self.directory, 'Compressed.put')
+        with open(fileName, 'wb') as putFile:
+            putFile.write(compressed)
+
+        result: ConversionResult = BatchConverter.convertFile(fileName, ['gml'], self.directory)
+
+        self.assertTrue(result.succeeded, result.message)
+        self.assertEqual(2, len(result.outputs))
+
+    def testBadFileReportsFailure(self):
+
+        fileName: str = osPath.join(self.directory, 'Bad.xml')
+        with open(fileName, 'w') as badFile:
+            badFile.write('<PyutProject version="10"><PyutDocument')
+
+        converter: BatchConverter = BatchConverter(formats=['gml'], outputDirectory=self.directory, workers=1)
+        results = converter.convert([fileName, TestBatchConverter.TEST_FILE_NAME])
+
+        self.assertFalse(results[0].succeeded, 'The bad file should fail')
+        self.assertNotEqual('', results[0].message)
+        self.assertTrue(results[1].succeeded, 'One bad file should not stop the others')
+
+        report: str = BatchConverter.report(results)
+        self.assertIn('FAILED', report)
+        self.assertIn('2 file(s), 1 failed', report)
+
+    def testUnknownFormat(self):
+        self.assertRaises(ValueError, lambda: BatchConverter(formats=['doc'], outputDirectory=self.directory))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestBatchConverter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
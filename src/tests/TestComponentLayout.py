@@ -0,0 +1,95 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.plugins.common.ComponentLayout import ComponentBox
+from org.pyut.plugins.common.ComponentLayout import ComponentBoxes
+from org.pyut.plugins.common.ComponentLayout import ComponentLayout
+from org.pyut.plugins.common.ComponentLayout import ComponentPositions
+from org.pyut.plugins.common.ComponentLayout import Components
+
+
+def squareLayout(name: str, size: int) -> str:
+    return f'{name}:{size * size}'
+
+
+class TestComponentLayout(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestComponentLayout.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestComponentLayout.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testFindComponents(self):
+
+        nodes: List[str] = ['a', 'b', 'c', 'd', 'e', 'f']
+        edges = [('a', 'c'), ('d', 'e'), ('c', 'a'), ('e', 'b'), ('a', 'unknown')]
+
+        components: Components = ComponentLayout.findComponents(nodes, edges)
+        self.assertEqual([['a', 'c'], ['b', 'd', 'e'], ['f']], components, 'Wrong components')
+
+    def testFindComponentsNoEdges(self):
+
+        components: Components = ComponentLayout.findComponents(['a', 'b'], [])
+        self.assertEqual([['a'], ['b']], components, 'Each node should be alone')
+
+    def testPackDoesNotOverlap(self):
+
+        gap:   int = 10
+        boxes: ComponentBoxes = [ComponentBox(width=w, height=h) for w, h in [(100, 50), (30, 200), (80, 80), (400, 20), (10, 10)]]
+
+        positions: ComponentPositions = ComponentLayout.pack(boxes, gap=gap)
+        self.assertEqual(len(boxes), len(positions))
+
+        rectangles = [(x, y, x + box.width, y + box.height) for box, (x, y) in zip(boxes, positions)]
+        for i, first in enumerate(rectangles):
+            self.assertGreaterEqual(first[0], 0)
+            self.assertGreaterEqual(first[1], 0)
+            for second in rectangles[i + 1:]:
+                disjoint: bool = first[2] + gap <= second[0] or second[2] + gap <= first[0] or \
+                    first[3] + gap <= second[1] or second[3] + gap <= first[1]
+                self.assertTrue(disjoint, f'{first} overlaps {second}')
+
+    def testPackEmpty(self):
+        self.assertEqual([], ComponentLayout.pack([]))
+
+    def testRunLayoutsSequential(self):
+
+        results = ComponentLayout.runLayouts(squareLayout, [('a', 2), ('b', 3)], [2, 3])
+        self.assertEqual(['a:4', 'b:9'], results, 'Results should keep the job order')
+
+    def testRunLayoutsParallel(self):
+
+        jobs = [(f'n{i}', i) for i in range(4)]
+        results = ComponentLayout.runLayouts(squareLayout, jobs, [1] * len(jobs), threshold=1)
+        self.assertEqual(['n0:0', 'n1:1', 'n2:4', 'n3:9'], results, 'Results should keep the job order')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestComponentLayout))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,172 @@
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import App
+
+from tests.TestBase import TestBase
+
+from org.pyut.MiniOgl.Diagram import Diagram
+from org.pyut.MiniOgl.RectangleShape import RectangleShape
+
+
+class BatchPanel:
+    """
+    Stands in for the diagram frame;  Counts the redraws
+    """
+    def __init__(self):
+        self.diagram: Diagram = Diagram(self)
+        self.redraws: int     = 0
+
+    def Refresh(self):
+        if self.diagram.DeferRefresh():
+            return
+        self.redraws += 1
+
+    def OnShapeAdded(self, shape):
+        pass
+
+    def OnShapeRemoved(self, shape):
+        pass
+
+
+class CountingShape(RectangleShape):
+    """
+    Counts its model updates
+    """
+    def __init__(self, x: float, y: float, width: float, height: float):
+        super().__init__(x, y, width, height)
+        self.modelUpdates: int = 0
+
+    def UpdateModel(self):
+        self.modelUpdates += 1
+        super().UpdateModel()
+
+
+class TestDiagram(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestDiagram.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:  Logger     = TestDiagram.clsLogger
+        self.app:     App        = App()        # Keep it so that it is not garbage collected
+        self.panel:   BatchPanel = BatchPanel()
+        self.diagram: Diagram    = self.panel.diagram
+
+    def testModelUpdatedImmediately(self):
+
+        shape: RectangleShape = self._addShape()
+        shape.SetPosition(110, 220)
+
+        self.assertEqual((110, 220), shape.GetModel().GetPosition(), 'The shape and its model share the diagram coordinates')
+
+    def testModelUpdatedOnceAtEnd(self):
+
+        shape: CountingShape = CountingShape(0, 0, 40, 20)
+        self.diagram.AddShape(shape)
+        shape.modelUpdates = 0
+
+        with self.diagram.batch():
+            for step in range(100):
+                shape.SetPosition(10 + step, 20 + step)
+            self.assertTrue(self.diagram.IsBatching())
+            self.assertEqual(0, shape.modelUpdates, 'Model updated inside the batch')
+
+        self.assertFalse(self.diagram.IsBatching())
+        self.assertEqual((109, 119), shape.GetModel().GetPosition())
+        self.assertEqual(1, shape.modelUpdates, 'One model, updated once')
+
+    def testRefreshOnceAtEnd(self):
+
+        with self.diagram.batch():
+            with self.diagram.batch():
+                self._addShape()
+                self.panel.Refresh()
+            self.panel.Refresh()
+            self.assertEqual(0, self.panel.redraws, 'Redrawn inside the batch')
+
+        self.assertEqual(1, self.panel.redraws)
+
+        with self.diagram.batch():
+            pass
+        self.assertEqual(1, self.panel.redraws, 'Nothing to redraw')
+
+    def testDetachedInsideBatch(self):
+
+        shape: RectangleShape = self._addShape()
+        with self.diagram.batch():
+            shape.SetPosition(300, 300)
+            shape.Detach()
+
+        self.assertEqual(0, len(self.diagram.GetShapes()))
+
+    def testFindShapesInBox(self):
+
+        near: RectangleShape = self._addShape()
+        far:  RectangleShape = self._addShape(2000, 2000)
+
+        self.assertEqual([near], self.diagram.FindShapesInBox(-10, -10, 100, 100))
+
+        near.SetPosition(3000, 3000)
+        found = self.diagram.FindShapesInBox(1990, 1990, 1100, 1100)
+        self.assertIn(near, found, 'Moved shape not indexed again')
+        self.assertIn(far, found)
+        self.assertEqual([], self.diagram.FindShapesInBox(-10, -10, 100, 100), 'Stale position still indexed')
+
+        far.Detach()
+        self.assertEqual([near], self.diagram.FindShapesInBox(1990, 1990, 1100, 1100))
+
+    def testFindShapesWithNegativeSize(self):
+
+        shape: RectangleShape = RectangleShape(1000, 1000, -200, -200)
+        self.diagram.AddShape(shape)
+
+        self.assertEqual([shape], self.diagram.FindShapesInBox(850, 850, 100, 100))
+        self.assertEqual([], self.diagram.FindShapesInBox(600, 600, 10, 10), 'Indexed past its top left corner')
+
+    def testSelectedShapes(self):
+
+        first:  RectangleShape = self._addShape()
+        second: RectangleShape = self._addShape(100, 100)
+        self._addShape(200, 200)
+
+        second.SetSelected(True)
+        first.SetSelected(True)
+        self.assertEqual([second, first], self.diagram.GetSelectedShapes(), 'Kept in selection order')
+
+        second.SetSelected(False)
+        self.assertEqual([first], self.diagram.GetSelectedShapes())
+
+        first.Detach()
+        self.assertEqual([], self.diagram.GetSelectedShapes(), 'Detached shape still selected')
+
+    def _addShape(self, x: float = 0, y: float = 0) -> RectangleShape:
+
+        shape: RectangleShape = RectangleShape(x, y, 40, 20)
+        shape.SetDraggable(True)
+        self.diagram.AddShape(shape)
+
+        return shape
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestDiagram))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
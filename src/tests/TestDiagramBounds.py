@@ -0,0 +1,103 @@
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import App
+
+from tests.TestBase import TestBase
+
+from org.pyut.MiniOgl.AnchorPoint import AnchorPoint
+from org.pyut.MiniOgl.ControlPoint import ControlPoint
+from org.pyut.MiniOgl.Diagram import Diagram
+from org.pyut.MiniOgl.LineShape import LineShape
+from org.pyut.MiniOgl.RectangleShape import RectangleShape
+
+from org.pyut.plugins.image.DiagramBounds import DiagramBounds
+
+
+class DiagramPanel:
+    """
+    Stands in for the diagram frame
+    """
+    def __init__(self):
+        self.diagram: Diagram = Diagram(self)
+
+    def Refresh(self):
+        pass
+
+    def OnShapeAdded(self, shape):
+        pass
+
+    def OnShapeRemoved(self, shape):
+        pass
+
+
+class TestDiagramBounds(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestDiagramBounds.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:  Logger  = TestDiagramBounds.clsLogger
+        self.app:     App     = App()        # Keep it so that it is not garbage collected
+        self.diagram: Diagram = DiagramPanel().diagram
+
+        self.source:      RectangleShape = RectangleShape(0, 0, 100, 60)
+        self.destination: RectangleShape = RectangleShape(400, 300, 100, 60)
+        self.diagram.AddShape(self.source)
+        self.diagram.AddShape(self.destination)
+
+        self.sourceAnchor:      AnchorPoint = self.source.AddAnchor(100, 30)
+        self.destinationAnchor: AnchorPoint = self.destination.AddAnchor(0, 30)
+        self.diagram.AddShape(self.sourceAnchor)
+        self.diagram.AddShape(self.destinationAnchor)
+
+        self.line:    LineShape    = LineShape(self.sourceAnchor, self.destinationAnchor)
+        self.control: ControlPoint = ControlPoint(250, 30)
+        self.diagram.AddShape(self.line)
+        self.line.AddControl(self.control)
+        self.control.SetVisible(True)
+
+    def testWholeDiagram(self):
+
+        diagramBounds: DiagramBounds = DiagramBounds(self.diagram)
+
+        self.assertEqual(len(self.diagram.GetShapes()), len(diagramBounds.shapes))
+        self.assertEqual((-20, -20), (diagramBounds.left, diagramBounds.top))
+        self.assertEqual((540, 400), (diagramBounds.width, diagramBounds.height))
+
+    def testSelection(self):
+
+        diagramBounds: DiagramBounds = DiagramBounds(self.diagram, selection=[self.source])
+
+        self.assertIn(self.source, diagramBounds.shapes)
+        self.assertIn(self.sourceAnchor, diagramBounds.shapes, 'Children are drawn with their parent')
+        self.assertNotIn(self.destination, diagramBounds.shapes)
+        self.assertNotIn(self.line, diagramBounds.shapes)
+        self.assertNotIn(self.control, diagramBounds.shapes)
+        self.assertEqual((140, 100), (diagramBounds.width, diagramBounds.height))
+
+        withLine: DiagramBounds = DiagramBounds(self.diagram, selection=[self.source, self.line])
+        self.assertIn(self.control, withLine.shapes, 'Control points are drawn with their line')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestDiagramBounds))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,98 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import App
+
+from tests.TestBase import TestBase
+
+from org.pyut.MiniOgl.AnchorPoint import AnchorPoint
+from org.pyut.MiniOgl.DragSprite import DragSprite
+from org.pyut.MiniOgl.LineShape import LineShape
+from org.pyut.MiniOgl.RectangleShape import RectangleShape
+from org.pyut.MiniOgl.Shape import Shape
+
+
+class TestDragSprite(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestDragSprite.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestDragSprite.clsLogger
+        self.app:    App    = App()        # Keep it so that it is not garbage collected
+
+        self.moving: RectangleShape = RectangleShape(100, 100, 50, 40)
+        self.still:  RectangleShape = RectangleShape(400, 100, 50, 40)
+        self.other:  RectangleShape = RectangleShape(100, 300, 50, 40)
+
+        self.stretching: LineShape = self._link(self.moving, self.still)
+        self.rigid:      LineShape = self._link(self.moving, self.other)
+
+    def testClassify(self):
+
+        self.moving.SetMoving(True)
+        self.other.SetMoving(True)
+
+        rigidShapes, elasticLines, stillShapes = DragSprite.classify(self._shapes())
+
+        self.assertEqual([self.stretching], elasticLines, 'Only the line with a still end stretches')
+        self.assertIn(self.rigid, rigidShapes, 'Both ends move')
+        self.assertIn(self.moving, rigidShapes)
+        self.assertIn(self.other, rigidShapes)
+        self.assertNotIn(self.still, rigidShapes)
+        self.assertEqual([], stillShapes)
+
+    def testBounds(self):
+
+        self.assertEqual((92, 92, 159, 149), DragSprite.bounds([self.moving], DragSprite.MARGIN))
+        self.assertEqual((100, 100, 451, 341), DragSprite.bounds([self.moving, self.still, self.other], 0))
+        self.assertEqual((0, 0, 0, 0), DragSprite.bounds([], DragSprite.MARGIN))
+
+    def testOffset(self):
+
+        self.moving.SetMoving(True)
+        dragSprite: DragSprite = DragSprite([self.moving], self._shapes(), 10, 20)
+        dragSprite.MoveTo(35, 5)
+
+        self.assertEqual((25, -15), dragSprite.offset)
+        self.assertEqual((100, 100), self.moving.GetPosition(), 'The shapes only move when the drag ends')
+
+    def _link(self, source: RectangleShape, destination: RectangleShape) -> LineShape:
+
+        sourceAnchor:      AnchorPoint = source.AddAnchor(0, 0)
+        destinationAnchor: AnchorPoint = destination.AddAnchor(0, 0)
+
+        return LineShape(sourceAnchor, destinationAnchor)
+
+    def _shapes(self) -> List[Shape]:
+
+        shapes: List[Shape] = [self.moving, self.still, self.other, self.stretching, self.rigid]
+        for shape in (self.moving, self.still, self.other):
+            shapes.extend(shape.GetAnchors())
+
+        return shapes
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestDragSprite))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
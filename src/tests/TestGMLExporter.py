@@ -16,6 +16,7 @@ from org.pyut.model.PyutLink import PyutLink
 
 from org.pyut.ogl.OglClass import OglClass
 from org.pyut.ogl.OglLink import OglLink
+from org.pyut.ogl.OglLinkIndex import OglLinkIndex
 
 from tests.TestBase import TestBase
 
@@ -79,6 +80,7 @@ class TestGMLExporter(TestBase):
         for x in range(nbrToGenerate):
             mockPyutClass: MagicMock = MagicMock(spec=PyutClass)
             mockPyutClass.getName.return_value = f'{TestGMLExporter.MOCK_CLASS_NAME_PREFIX}{x}'
+            mockPyutClass.getId.return_value   = initId
 
             mockOglClass: MagicMock                 = MagicMock(spec=OglClass)
             mockOglClass.GetID.return_value         = initId
@@ -144,8 +146,15 @@ class TestGMLExporter(TestBase):
         # PyutLink object simple enough so create real one
         pyutLink: PyutLink = PyutLink("", linkType=LinkType.INHERITANCE, source=src.getPyutObject(), destination=dest.getPyutObject())
 
+        oglLink.getPyutObject.return_value = pyutLink
+
+        linkIndex: OglLinkIndex = OglLinkIndex()
+        linkIndex.add(oglLink)
+
         src.getLinks.return_value  = [oglLink]
         dest.getLinks.return_value = [oglLink]
+        src.getLinkIndex.return_value  = linkIndex
+        dest.getLinkIndex.return_value = linkIndex
 
         mockPyutClass = src.getPyutObject()
         mockPyutClass.getLinks.return_value = [pyutLink]
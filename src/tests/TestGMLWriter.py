@@ -0,0 +1,157 @@
+
+from logging import Logger
+from logging import getLogger
+
+from io import StringIO
+
+from time import perf_counter
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.enums.DiagramType import DiagramType
+
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutLink import PyutLink
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import LinkRecord
+from org.pyut.persistence.DocumentModel import ShapeRecord
+
+from org.pyut.plugins.gml.GMLWriter import GMLWriter
+
+from org.pyut.batch.BatchConverter import BatchConverter
+
+
+class TestGMLWriter(TestBase):
+    """
+    """
+    BENCHMARK_NODE_COUNT: int = 10000
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestGMLWriter.clsLogger = getLogger(__name__)
+        BatchConverter.setupHeadless()
+
+    def setUp(self):
+        self.logger: Logger = TestGMLWriter.clsLogger
+
+    def testPrettyPrint(self):
+
+        gmlWriter: GMLWriter = GMLWriter()
+        gmlWriter.translateDocument(self._generateDocument(2))
+
+        self.assertIn('\tnode [\n\t\tid 0\n\t\tlabel "Class0"\n', gmlWriter.gml)
+        self.assertTrue(gmlWriter.gml.endswith(']'))
+
+    def testNoPrettyPrint(self):
+
+        gmlWriter: GMLWriter = GMLWriter()
+        gmlWriter.translateDocument(self._generateDocument(2))
+        gmlWriter.prettyPrint = False
+        gmlWriter.translateDocument(self._generateDocument(2))
+
+        self.assertNotIn('\t', gmlWriter.gml, 'A previous pretty printed translation should not leak its indentation')
+
+    def testIndentationIsPerInstance(self):
+
+        compactWriter: GMLWriter = GMLWriter()
+        compactWriter.compact = True
+        prettyWriter: GMLWriter = GMLWriter()
+
+        prettyWriter.translateDocument(self._generateDocument(2))
+        compactWriter.translateDocument(self._generateDocument(2))
+
+        self.assertIn('\t', prettyWriter.gml)
+        self.assertNotIn('\t', compactWriter.gml)
+
+    def testCompact(self):
+
+        gmlWriter: GMLWriter = GMLWriter()
+        gmlWriter.compact = True
+        gmlWriter.translateDocument(self._generateDocument(3))
+
+        lines = gmlWriter.gml.split('\n')
+        self.assertEqual(1 + 3 + 2 + 1, len(lines), 'Header, one line per node and per edge, then the end of graph')
+        self.assertTrue(lines[1].startswith('node [ id 0 label "Class0" graphics [ x 0.0'))
+        self.assertTrue(lines[4].startswith('edge [ id 0 source 0 target 1 graphics'))
+
+    def testStreamToWriter(self):
+
+        documentModel: DocumentModel = self._generateDocument(3)
+
+        gmlWriter: GMLWriter = GMLWriter()
+        gmlWriter.translateDocument(documentModel)
+        expectedGml: str = gmlWriter.gml
+
+        writer: StringIO = StringIO()
+        gmlWriter.translateDocument(documentModel, writer=writer)
+
+        self.assertEqual(expectedGml, writer.getvalue())
+        self.assertEqual('', gmlWriter.gml, 'Streamed GML is not kept')
+
+    def testDuplicateEdges(self):
+
+        documentModel: DocumentModel = self._generateDocument(2)
+        documentModel.links.append(LinkRecord(pyutLink=PyutLink(), sourceId=0, destinationId=1))
+        documentModel.links.append(LinkRecord(pyutLink=PyutLink(), sourceId=1, destinationId=0))
+
+        gmlWriter: GMLWriter = GMLWriter()
+        gmlWriter.translateDocument(documentModel)
+
+        self.assertEqual(2, gmlWriter.gml.count('edge ['), 'Same direction duplicates are dropped;  The reverse edge is kept')
+
+    def testBenchmarkLargeDiagram(self):
+        """
+        Not an assertion on the time;  Logs it
+        """
+
+        documentModel: DocumentModel = self._generateDocument(TestGMLWriter.BENCHMARK_NODE_COUNT)
+
+        for compact in [False, True]:
+            gmlWriter: GMLWriter = GMLWriter()
+            gmlWriter.compact = compact
+            writer:    StringIO  = StringIO()
+
+            startTime: float = perf_counter()
+            gmlWriter.translateDocument(documentModel, writer=writer)
+            seconds: float = perf_counter() - startTime
+
+            gml: str = writer.getvalue()
+            self.logger.info(f'{TestGMLWriter.BENCHMARK_NODE_COUNT} nodes {compact=}: {len(gml)} characters in {seconds:.3f} seconds')
+
+            self.assertEqual(TestGMLWriter.BENCHMARK_NODE_COUNT, gml.count('node ['))
+            self.assertEqual(TestGMLWriter.BENCHMARK_NODE_COUNT - 1, gml.count('edge ['))
+
+    def _generateDocument(self, nodeCount: int) -> DocumentModel:
+        """
+        A chain of classes on a grid;  Each class is linked to the next one
+        """
+        documentModel: DocumentModel = DocumentModel(diagramType=DiagramType.CLASS_DIAGRAM, title='Generated')
+        for nodeId in range(nodeCount):
+            x: float = (nodeId % 100) * 150.0
+            y: float = (nodeId // 100) * 100.0
+            documentModel.shapes[nodeId] = ShapeRecord(pyutObject=PyutClass(f'Class{nodeId}'), x=x, y=y, width=100.0, height=60.0)
+            if nodeId > 0:
+                documentModel.links.append(LinkRecord(pyutLink=PyutLink(), sourceId=nodeId - 1, destinationId=nodeId,
+                                                      sourceAnchor=(x, y), destinationAnchor=(x + 10.0, y + 10.0)))
+        return documentModel
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestGMLWriter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
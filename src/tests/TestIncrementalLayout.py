@@ -0,0 +1,102 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.plugins.incremental.IncrementalLayout import IncrementalLayout
+from org.pyut.plugins.incremental.IncrementalLayout import IncrementalNode
+from org.pyut.plugins.incremental.IncrementalLayout import IncrementalNodes
+from org.pyut.plugins.incremental.IncrementalLayout import NodePositions
+
+
+class TestIncrementalLayout(TestBase):
+    """
+    """
+    GAP:         int = 20
+    NODE_WIDTH:  int = 100
+    NODE_HEIGHT: int = 60
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestIncrementalLayout.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger            = TestIncrementalLayout.clsLogger
+        self.layout: IncrementalLayout = IncrementalLayout(gap=TestIncrementalLayout.GAP)
+
+    def tearDown(self):
+        pass
+
+    def testPinnedNodesDoNotMove(self):
+
+        self.layout.pin('pinned', 100, 100, 100, 60)
+        self.layout.placeAll([self._node('new', ['pinned'])])
+
+        self.assertEqual((100, 100), self.layout.positions['pinned'], 'Pinned node moved')
+
+    def testPlacedNearNeighbour(self):
+
+        self.layout.pin('pinned', 1000, 1000, 100, 60)
+        self.layout.pin('faraway', 0, 0, 100, 60)
+
+        positions: NodePositions = self.layout.placeAll([self._node('new', ['pinned'])])
+        x, y = positions['new']
+
+        self.assertLess(abs(x - 1000), 3 * TestIncrementalLayout.NODE_WIDTH, 'Should be next to its neighbour')
+        self.assertLess(abs(y - 1000), 3 * TestIncrementalLayout.NODE_HEIGHT, 'Should be next to its neighbour')
+
+    def testNoOverlaps(self):
+
+        for i in range(5):
+            self.layout.pin(f'pinned{i}', i * 130, 0, 100, 60)
+
+        nodes: IncrementalNodes = [self._node(f'new{i}', ['pinned2', f'new{i - 1}']) for i in range(20)]
+        self.layout.placeAll(nodes)
+
+        self._assertNoOverlaps(list(self.layout.positions.keys()))
+
+    def testUnconnectedNodesGoBesideDiagram(self):
+
+        self.layout.pin('pinned', 0, 0, 300, 300)
+        positions: NodePositions = self.layout.placeAll([self._node('lonely', [])])
+
+        x, y = positions['lonely']
+        self.assertGreaterEqual(x, 300 + TestIncrementalLayout.GAP, 'Should be right of the diagram')
+
+    def _node(self, nodeId: str, neighbours: List[str]) -> IncrementalNode:
+        return IncrementalNode(nodeId=nodeId, width=TestIncrementalLayout.NODE_WIDTH, height=TestIncrementalLayout.NODE_HEIGHT,
+                               neighbours=neighbours)
+
+    def _assertNoOverlaps(self, nodeIds: List[str]):
+
+        positions: NodePositions = self.layout.positions
+        for i, first in enumerate(nodeIds):
+            for second in nodeIds[i + 1:]:
+                x1, y1 = positions[first]
+                x2, y2 = positions[second]
+                overlap: bool = x1 < x2 + TestIncrementalLayout.NODE_WIDTH and x2 < x1 + TestIncrementalLayout.NODE_WIDTH and \
+                    y1 < y2 + TestIncrementalLayout.NODE_HEIGHT and y2 < y1 + TestIncrementalLayout.NODE_HEIGHT
+                self.assertFalse(overlap, f'{first} overlaps {second}')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestIncrementalLayout))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
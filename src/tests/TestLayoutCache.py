@@ -0,0 +1,105 @@
+
+from logging import Logger
+from logging import getLogger
+
+from os import remove as osRemove
+from os import path as osPath
+
+from tempfile import mkdtemp
+
+from shutil import rmtree
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.plugins.common.LayoutCache import CachedLayout
+from org.pyut.plugins.common.LayoutCache import LayoutCache
+
+
+class TestLayoutCache(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestLayoutCache.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:    Logger = TestLayoutCache.clsLogger
+        self.directory: str    = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def testKeyIgnoresOrder(self):
+
+        first:  str = LayoutCache.topologyKey([('a', 10, 20), ('b', 30, 40)], [('a', 'b', 'INHERITANCE')], 'Sugiyama')
+        second: str = LayoutCache.topologyKey([('b', 30, 40), ('a', 10, 20)], [('a', 'b', 'INHERITANCE')], 'Sugiyama')
+        self.assertEqual(first, second, 'The node order should not matter')
+
+    def testKeyChangesWithTopology(self):
+
+        nodes = [('a', 10, 20), ('b', 30, 40)]
+        base: str = LayoutCache.topologyKey(nodes, [('a', 'b', 'INHERITANCE')], 'Sugiyama')
+
+        self.assertNotEqual(base, LayoutCache.topologyKey(nodes, [('b', 'a', 'INHERITANCE')], 'Sugiyama'), 'Edge direction matters')
+        self.assertNotEqual(base, LayoutCache.topologyKey(nodes, [('a', 'b', 'AGGREGATION')], 'Sugiyama'), 'Link type matters')
+        self.assertNotEqual(base, LayoutCache.topologyKey([('a', 10, 20), ('b', 30, 41)], [('a', 'b', 'INHERITANCE')], 'Sugiyama'), 'Sizes matter')
+        self.assertNotEqual(base, LayoutCache.topologyKey(nodes, [('a', 'b', 'INHERITANCE')], 'Orthogonal'), 'Parameters matter')
+
+    def testPersistence(self):
+
+        fileName: str = osPath.join(self.directory, 'project.put.layout.json')
+        cache: LayoutCache = LayoutCache(fileName)
+        layout: CachedLayout = CachedLayout(positions={'a': (1.0, 2.0)}, routes={'a>b#0': [(0.0, 0.0), (5.0, 0.0), (5.0, 5.0)]})
+        cache.put('key', layout)
+
+        reloaded: LayoutCache = LayoutCache(fileName)
+        self.assertIn('key', reloaded)
+        self.assertEqual(layout, reloaded.get('key'), 'The layout should survive a reload')
+
+    def testCorruptFileIgnored(self):
+
+        fileName: str = osPath.join(self.directory, 'bad.layout.json')
+        with open(fileName, 'w') as writer:
+            writer.write('{not json')
+
+        cache: LayoutCache = LayoutCache(fileName)
+        self.assertEqual(0, len(cache))
+        osRemove(fileName)
+
+    def testLeastRecentlyUsedDropped(self):
+
+        cache: LayoutCache = LayoutCache(maxEntries=2)
+        cache.put('one', CachedLayout())
+        cache.put('two', CachedLayout())
+        cache.get('one')
+        cache.put('three', CachedLayout())
+
+        self.assertIn('one', cache)
+        self.assertNotIn('two', cache, 'The least recently used layout should be dropped')
+        self.assertIn('three', cache)
+
+    def testSharedPerProject(self):
+
+        projectFileName: str = osPath.join(self.directory, 'shared.put')
+        self.assertIs(LayoutCache.getCache(projectFileName), LayoutCache.getCache(projectFileName))
+        self.assertEqual(f'{projectFileName}.layout.json', LayoutCache.cacheFileName(projectFileName))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestLayoutCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,95 @@
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import Document
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import parse
+
+from tests.TestBase import TestBase
+from tests.TestBase import TEST_DIRECTORY
+
+from org.pyut.enums.DiagramType import DiagramType
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+from org.pyut.persistence.DocumentModel import ProjectModel
+
+from org.pyut.persistence.converters.MiniDomToModelV10 import MiniDomToModel
+
+from org.pyut.batch.BatchConverter import BatchConverter
+
+
+class TestMiniDomToModel(TestBase):
+    """
+    """
+    TEST_FILE_NAME: str = osPath.join(TEST_DIRECTORY, 'testdata', 'TwoDiagrams.xml')
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestMiniDomToModel.clsLogger = getLogger(__name__)
+        BatchConverter.setupHeadless()
+
+    def setUp(self):
+        self.logger: Logger   = TestMiniDomToModel.clsLogger
+        self.dom:    Document = parse(TestMiniDomToModel.TEST_FILE_NAME)
+
+    def testHeadersOnly(self):
+
+        projectModel: ProjectModel = MiniDomToModel().getProject(self.dom, withContents=False)
+
+        self.assertEqual(2, len(projectModel.documents))
+        for documentModel in projectModel.documents:
+            self.assertEqual(0, len(documentModel.shapes), 'Unopened documents should not be converted')
+            self.assertEqual(0, len(documentModel.links))
+            self.assertIsNotNone(documentModel.documentNode, 'The XML element is kept for later')
+
+        documentModel: DocumentModel = projectModel.documents[0]
+        self.assertEqual(DiagramType.CLASS_DIAGRAM, documentModel.diagramType)
+        self.assertEqual('Vehicles', documentModel.title)
+        self.assertEqual(2, documentModel.scrollPositionX)
+        self.assertEqual(3, documentModel.scrollPositionY)
+
+    def testReadContentsLater(self):
+
+        toModel:       MiniDomToModel = MiniDomToModel()
+        projectModel:  ProjectModel   = toModel.getProject(self.dom, withContents=False)
+        documentModel: DocumentModel  = projectModel.documents[0]
+
+        toModel.readContents(documentModel)
+
+        self.assertEqual(4, len(documentModel.shapes))
+        self.assertEqual(3, len(documentModel.links))
+        self.assertEqual(0, len(projectModel.documents[1].shapes), 'Other documents stay unconverted')
+
+    def testSameAsEagerRead(self):
+
+        eager: DocumentModel = MiniDomToModel().getProject(self.dom).documents[1]
+        lazy:  DocumentModel = MiniDomToModel().getProject(self.dom, withContents=False).documents[1]
+        MiniDomToModel().readContents(lazy)
+
+        self.assertEqual(sorted(eager.shapes.keys()), sorted(lazy.shapes.keys()))
+        self.assertEqual(len(eager.links), len(lazy.links))
+        self.assertEqual(eager.title, lazy.title)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestMiniDomToModel))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,132 @@
+
+from typing import Callable
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.general.ModificationBus import ModificationBatch
+from org.pyut.general.ModificationBus import ModificationBus
+from org.pyut.general.ModificationBus import getModificationBus
+
+
+class TestModificationBus(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestModificationBus.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:    Logger                  = TestModificationBus.clsLogger
+        self.bus:       ModificationBus         = getModificationBus()
+        self.scheduled: List[Callable[[], None]] = []
+        self.batches:   List[ModificationBatch] = []
+
+        self.bus.setScheduler(self.scheduled.append)
+        self.bus.subscribe(self._onModifications)
+
+    def tearDown(self):
+        self.bus.unsubscribe(self._onModifications)
+        self._runScheduled()
+        self.bus.setScheduler(None)
+
+    def testSingleton(self):
+        self.assertIs(self.bus, ModificationBus(), 'Not a singleton')
+
+    def testCoalescedPerTick(self):
+
+        for x in range(1000):
+            self.bus.notify()
+
+        self.assertEqual(1, len(self.scheduled), 'Scheduled more than once')
+        self.assertEqual(0, len(self.batches), 'Notified before the end of the tick')
+
+        self._runScheduled()
+        self.assertEqual([ModificationBatch(notifications=1000, modified=True)], self.batches)
+
+        self.bus.notify(modified=False)
+        self._runScheduled()
+        self.assertEqual(ModificationBatch(notifications=1, modified=False), self.batches[-1], 'New tick, new batch')
+
+    def testTransaction(self):
+
+        with self.bus.transaction():
+            self.bus.notify(modified=False)
+            with self.bus.transaction():
+                self.bus.notify()
+            self.assertEqual(0, len(self.batches), 'Nested transaction flushed')
+            self.assertEqual(0, len(self.scheduled), 'Scheduled inside a transaction')
+
+        self.assertEqual([ModificationBatch(notifications=2, modified=True)], self.batches)
+
+    def testTransactionSupersedesTick(self):
+
+        self.bus.notify()
+        with self.bus.transaction():
+            self.bus.notify()
+            self._runScheduled()
+            self.assertEqual(0, len(self.batches), 'Tick flushed inside a transaction')
+
+        self.assertEqual(1, len(self.batches))
+        self.assertEqual(2, self.batches[0].notifications)
+
+    def testNothingToFlush(self):
+
+        with self.bus.transaction():
+            pass
+        self.bus.flush()
+
+        self.assertEqual(0, len(self.batches), 'Empty batch sent')
+
+    def testUnsubscribe(self):
+
+        self.bus.unsubscribe(self._onModifications)
+        self.bus.notify()
+        self._runScheduled()
+
+        self.assertEqual(0, len(self.batches), 'Notified after unsubscribing')
+
+    def testFailingSubscriber(self):
+
+        def failingSubscriber(batch: ModificationBatch):
+            raise ValueError(f'{batch}')
+
+        self.bus.subscribe(failingSubscriber)
+        try:
+            self.bus.notify()
+            self._runScheduled()
+        finally:
+            self.bus.unsubscribe(failingSubscriber)
+
+        self.assertEqual(1, len(self.batches), 'A failing subscriber stops the others')
+
+    def _onModifications(self, batch: ModificationBatch):
+        self.batches.append(batch)
+
+    def _runScheduled(self):
+
+        while len(self.scheduled) > 0:
+            self.scheduled.pop(0)()
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestModificationBus))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
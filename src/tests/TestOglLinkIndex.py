@@ -0,0 +1,125 @@
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.enums.LinkType import LinkType
+
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutLink import PyutLink
+
+from org.pyut.ogl.OglLinkIndex import OglLinkIndex
+
+
+class LinkedShape:
+    """
+    Stands in for an Ogl object
+    """
+    def __init__(self, name: str):
+        self._pyutObject: PyutClass = PyutClass(name)
+
+    def getPyutObject(self) -> PyutClass:
+        return self._pyutObject
+
+
+class Link:
+    """
+    Stands in for an Ogl link
+    """
+    def __init__(self, source: LinkedShape, destination: LinkedShape, linkType: LinkType):
+        self._source:      LinkedShape = source
+        self._destination: LinkedShape = destination
+        self._pyutLink:    PyutLink    = PyutLink(linkType=linkType, source=source.getPyutObject(), destination=destination.getPyutObject())
+
+    def getSourceShape(self) -> LinkedShape:
+        return self._source
+
+    def getDestinationShape(self) -> LinkedShape:
+        return self._destination
+
+    def getPyutObject(self) -> PyutLink:
+        return self._pyutLink
+
+
+class TestOglLinkIndex(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestOglLinkIndex.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:    Logger       = TestOglLinkIndex.clsLogger
+        self.linkIndex: OglLinkIndex = OglLinkIndex()
+
+        self.car:    LinkedShape = LinkedShape('Car')
+        self.wheel:  LinkedShape = LinkedShape('Wheel')
+        self.engine: LinkedShape = LinkedShape('Engine')
+
+    def testAddAndRemove(self):
+
+        toWheel:  Link = Link(self.car, self.wheel, LinkType.COMPOSITION)
+        toEngine: Link = Link(self.car, self.engine, LinkType.COMPOSITION)
+        self.linkIndex.add(toWheel)
+        self.linkIndex.add(toEngine)
+        self.linkIndex.add(toWheel)
+
+        self.assertEqual([toWheel, toEngine], self.linkIndex.links(), 'Not in the order they were added')
+        self.assertIn(toWheel, self.linkIndex)
+
+        self.assertTrue(self.linkIndex.remove(toWheel))
+        self.assertFalse(self.linkIndex.remove(toWheel), 'Removed twice')
+        self.assertEqual([toEngine], self.linkIndex.links())
+        self.assertEqual(1, len(self.linkIndex))
+        self.assertEqual([toEngine], list(self.linkIndex), 'Iterates the links')
+
+    def testFind(self):
+
+        first:       Link = Link(self.car, self.wheel, LinkType.AGGREGATION)
+        second:      Link = Link(self.car, self.wheel, LinkType.AGGREGATION)
+        inheritance: Link = Link(self.car, self.wheel, LinkType.INHERITANCE)
+        for link in (first, second, inheritance):
+            self.linkIndex.add(link)
+
+        carId:   int = self.car.getPyutObject().getId()
+        wheelId: int = self.wheel.getPyutObject().getId()
+
+        self.assertEqual([first, second], self.linkIndex.find(carId, wheelId, LinkType.AGGREGATION))
+        self.assertEqual([inheritance], self.linkIndex.find(carId, wheelId, LinkType.INHERITANCE))
+        self.assertEqual([], self.linkIndex.find(wheelId, carId, LinkType.AGGREGATION), 'The direction matters')
+        self.assertEqual([[first, second], [inheritance]], self.linkIndex.groups())
+
+        self.linkIndex.remove(first)
+        self.linkIndex.remove(second)
+        self.assertEqual([], self.linkIndex.find(carId, wheelId, LinkType.AGGREGATION))
+        self.assertEqual([[inheritance]], self.linkIndex.groups(), 'Empty group kept')
+
+    def testRemoveAfterIdChange(self):
+
+        link: Link = Link(self.car, self.wheel, LinkType.ASSOCIATION)
+        self.linkIndex.add(link)
+        self.car.getPyutObject().setId(self.car.getPyutObject().getId() + 1000)
+
+        self.assertTrue(self.linkIndex.remove(link))
+        self.assertEqual([], self.linkIndex.groups())
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestOglLinkIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,114 @@
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.plugins.routing.OrthogonalRouter import LinkRoute
+from org.pyut.plugins.routing.OrthogonalRouter import LinkRoutes
+from org.pyut.plugins.routing.OrthogonalRouter import OrthogonalRouter
+from org.pyut.plugins.routing.OrthogonalRouter import RoutePoints
+
+
+class TestOrthogonalRouter(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestOrthogonalRouter.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger           = TestOrthogonalRouter.clsLogger
+        self.router: OrthogonalRouter = OrthogonalRouter(margin=20)
+
+        self.router.addObstacle('source',      0,   0, 100, 60)
+        self.router.addObstacle('destination', 400, 0, 100, 60)
+
+    def tearDown(self):
+        pass
+
+    def testStraightWhenNothingInTheWay(self):
+
+        self.router.addLink('link', 'source', 'destination')
+        route: LinkRoute = self.router.routeAll()['link']
+
+        self.assertEqual((100, 30), route.source, 'Should leave from the east side')
+        self.assertEqual((400, 30), route.destination, 'Should arrive on the west side')
+        self.assertEqual([], route.bends, 'No bends needed')
+
+    def testGoesAroundObstacle(self):
+
+        self.router.addObstacle('blocker', 200, -50, 100, 160)
+        self.router.addLink('link', 'source', 'destination')
+        route: LinkRoute = self.router.routeAll()['link']
+
+        self.assertNotEqual([], route.bends, 'Must bend around the blocker')
+        self._assertOrthogonal(route.points())
+        self._assertAvoids(route.points(), (200, -50, 300, 110))
+
+    def testSharedSideAnchorsAreSpread(self):
+
+        self.router.addLink('first',  'source', 'destination')
+        self.router.addLink('second', 'source', 'destination')
+        routes: LinkRoutes = self.router.routeAll()
+
+        self.assertNotEqual(routes['first'].source, routes['second'].source, 'Anchors should not be shared')
+
+    def testOnlyAffectedLinksAreRerouted(self):
+
+        self.router.addObstacle('faraway', 0, 1000, 100, 60)
+        self.router.addObstacle('blocker', 200, -50, 100, 160)
+        self.router.addLink('link',  'source', 'destination')
+        self.router.addLink('other', 'faraway', 'source')
+        self.router.routeAll()
+
+        affected = self.router.moveObstacle('blocker', 200, 600, 100, 160)
+        self.assertEqual({'link'}, affected, 'Only the link going around the blocker is affected')
+
+        route: LinkRoute = self.router.reroute(list(affected))['link']
+        self.assertEqual([], route.bends, 'Blocker is gone, the link is straight again')
+
+    def testRemoveObstacleAndLink(self):
+
+        self.router.addObstacle('blocker', 200, -50, 100, 160)
+        self.router.addLink('link',  'source', 'destination')
+        self.router.routeAll()
+
+        self.assertEqual({'link'}, self.router.removeObstacle('blocker'), 'The link went around the blocker')
+        self.assertIsNone(self.router.obstacleBounds('blocker'))
+        self.assertEqual(['source', 'destination'], self.router.obstacleKeys)
+
+        self.router.removeLink('link')
+        self.assertEqual([], self.router.linkKeys)
+        self.assertEqual({}, self.router.routes)
+        self.assertEqual(set(), self.router.affectedBy('source'), 'Removed link still indexed')
+
+    def _assertOrthogonal(self, points: RoutePoints):
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            self.assertTrue(x1 == x2 or y1 == y2, f'Segment ({x1},{y1})-({x2},{y2}) is not orthogonal')
+
+    def _assertAvoids(self, points: RoutePoints, box):
+        left, top, right, bottom = box
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            crosses: bool = min(x1, x2) < right and left < max(x1, x2) and min(y1, y2) < bottom and top < max(y1, y2)
+            self.assertFalse(crosses, f'Segment ({x1},{y1})-({x2},{y2}) crosses the obstacle')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestOrthogonalRouter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,109 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from io import BytesIO
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from fpdf import FPDF
+
+from pypdf import PdfReader
+
+from tests.TestBase import TestBase
+
+from org.pyut.plugins.io.pyumlsupport.PdfMerger import PdfMerger
+
+
+class TestPdfMerger(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPdfMerger.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPdfMerger.clsLogger
+
+    def testMergePageOrder(self):
+
+        pdfMerger: PdfMerger = PdfMerger()
+        pdfMerger.addBytes(self._generatePdf(1, label='First'), title='First')
+        pdfMerger.addBytes(self._generatePdf(2, label='Second'), title='Second')
+        self.assertEqual(3, pdfMerger.pageCount)
+
+        merged: PdfReader = self._mergeAndRead(pdfMerger, tableOfContents=False)
+
+        labels: List[str] = [page.extract_text().strip() for page in merged.pages]
+        self.assertEqual(['First 0', 'Second 0', 'Second 1'], labels)
+
+    def testTableOfContents(self):
+
+        pdfMerger: PdfMerger = PdfMerger()
+        pdfMerger.addBytes(self._generatePdf(1), title='Classes')
+        pdfMerger.addBytes(self._generatePdf(1), title='Élan')
+
+        merged: PdfReader = self._mergeAndRead(pdfMerger, tableOfContents=True, title='Project')
+
+        self.assertEqual(1 + 2, len(merged.pages), 'One table of contents page before the documents')
+        self.assertEqual('Project', merged.metadata.title)
+        self.assertIn('Classes', merged.pages[0].extract_text())
+
+        outline: List[str] = [item.title for item in merged.outline]
+        self.assertEqual(['Classes', 'Élan'], outline)
+        self.assertEqual([1, 2], [merged.get_destination_page_number(item) for item in merged.outline])
+
+        links = [annotation.get_object() for annotation in merged.pages[0]['/Annots']]
+        self.assertEqual(2, len(links), 'One link per entry')
+        self.assertEqual([1, 2], [merged.get_page_number(link['/Dest'][0].get_object()) for link in links])
+
+    def testManyEntries(self):
+
+        entryCount: int       = PdfMerger.TOC_ENTRIES_PER_PAGE + 1
+        pdfMerger:  PdfMerger = PdfMerger()
+        for idx in range(entryCount):
+            pdfMerger.addBytes(self._generatePdf(1), title=f'Diagram {idx}')
+
+        merged: PdfReader = self._mergeAndRead(pdfMerger, tableOfContents=True)
+
+        self.assertEqual(2 + entryCount, len(merged.pages), 'Two table of contents pages')
+        self.assertEqual(1, len(merged.pages[1]['/Annots']), 'The last entry is on the second page')
+
+    def _mergeAndRead(self, pdfMerger: PdfMerger, tableOfContents: bool, title: str = '') -> PdfReader:
+
+        output: BytesIO = BytesIO()
+        pdfMerger.write(output, title=title, tableOfContents=tableOfContents)
+
+        return PdfReader(BytesIO(output.getvalue()))
+
+    def _generatePdf(self, pageCount: int, label: str = 'Page') -> bytes:
+        """
+        Each page shows its label
+        """
+        pdf: FPDF = FPDF(unit='pt')
+        pdf.set_font('helvetica', size=12)
+        for idx in range(pageCount):
+            pdf.add_page()
+            pdf.text(72, 72, f'{label} {idx}')
+
+        return bytes(pdf.output())
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPdfMerger))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,141 @@
+
+from logging import Logger
+from logging import getLogger
+
+from io import BytesIO
+
+from random import Random
+
+from struct import unpack
+
+from typing import List
+from typing import Tuple
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from zlib import crc32
+from zlib import decompress
+
+from tests.TestBase import TestBase
+
+from org.pyut.plugins.image.PngWriter import PngWriter
+
+Chunk = Tuple[bytes, bytes]
+
+
+class TestPngWriter(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPngWriter.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPngWriter.clsLogger
+
+    def testHeader(self):
+
+        stream: BytesIO = BytesIO()
+        with PngWriter(stream, width=3, height=2) as pngWriter:
+            pngWriter.writeRows(bytes(3 * 3 * 2))
+
+        png: bytes = stream.getvalue()
+        self.assertTrue(png.startswith(PngWriter.SIGNATURE))
+
+        chunks: List[Chunk] = self._readChunks(png)
+        self.assertEqual(b'IHDR', chunks[0][0])
+        self.assertEqual((3, 2, 8, 2, 0, 0, 0), unpack('>IIBBBBB', chunks[0][1]))
+        self.assertEqual(b'IEND', chunks[-1][0])
+
+    def testPixelsRoundTrip(self):
+
+        width:  int = 4
+        height: int = 5
+        pixels: bytes = bytes((x * 50 + y) % 256 for y in range(height) for x in range(width * 3))
+
+        stream: BytesIO = BytesIO()
+        with PngWriter(stream, width=width, height=height) as pngWriter:
+            pngWriter.writeRows(pixels[:2 * width * 3])
+            pngWriter.writeRows(pixels[2 * width * 3:])
+
+        self.assertEqual(pixels, self._decodePixels(stream.getvalue(), width, height), 'Bands should be joined in order')
+
+    def testLargeImageUsesSeveralDataChunks(self):
+
+        width:  int = 2000
+        height: int = 500
+
+        noise:  Random  = Random(42)
+        stream: BytesIO = BytesIO()
+        with PngWriter(stream, width=width, height=height) as pngWriter:
+            for band in range(height // 100):
+                pngWriter.writeRows(noise.randbytes(width * 3 * 100))
+
+        chunks: List[Chunk] = self._readChunks(stream.getvalue())
+        dataChunks: List[Chunk] = [chunk for chunk in chunks if chunk[0] == b'IDAT']
+        self.assertGreater(len(dataChunks), 1, 'Compressed data should be flushed as it is produced')
+        for chunk in dataChunks:
+            self.assertLessEqual(len(chunk[1]), PngWriter.IDAT_CHUNK_SIZE)
+
+    def testPartialRowRejected(self):
+
+        pngWriter: PngWriter = PngWriter(BytesIO(), width=2, height=2)
+        self.assertRaises(ValueError, lambda: pngWriter.writeRows(bytes(5)))
+
+    def testTooManyRowsRejected(self):
+
+        pngWriter: PngWriter = PngWriter(BytesIO(), width=2, height=1)
+        self.assertRaises(ValueError, lambda: pngWriter.writeRows(bytes(2 * 3 * 2)))
+
+    def testMissingRowsRejected(self):
+
+        pngWriter: PngWriter = PngWriter(BytesIO(), width=2, height=2)
+        pngWriter.writeRows(bytes(2 * 3))
+        self.assertRaises(ValueError, pngWriter.close)
+
+    def _readChunks(self, png: bytes) -> List[Chunk]:
+
+        chunks: List[Chunk] = []
+        offset: int = len(PngWriter.SIGNATURE)
+        while offset < len(png):
+            length:    int   = unpack('>I', png[offset:offset + 4])[0]
+            chunkType: bytes = png[offset + 4:offset + 8]
+            data:      bytes = png[offset + 8:offset + 8 + length]
+            crc:       int   = unpack('>I', png[offset + 8 + length:offset + 12 + length])[0]
+            self.assertEqual(crc32(data, crc32(chunkType)), crc, f'Bad CRC for {chunkType}')
+            chunks.append((chunkType, data))
+            offset += 12 + length
+
+        return chunks
+
+    def _decodePixels(self, png: bytes, width: int, height: int) -> bytes:
+
+        compressed: bytes = b''.join(data for chunkType, data in self._readChunks(png) if chunkType == b'IDAT')
+        raw:        bytes = decompress(compressed)
+        stride:     int   = width * 3
+
+        self.assertEqual(height * (stride + 1), len(raw))
+        rows: List[bytes] = []
+        for y in range(height):
+            self.assertEqual(0, raw[y * (stride + 1)], 'Rows are not filtered')
+            rows.append(raw[y * (stride + 1) + 1:(y + 1) * (stride + 1)])
+
+        return b''.join(rows)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPngWriter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
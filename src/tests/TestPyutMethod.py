@@ -0,0 +1,114 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from tracemalloc import get_traced_memory
+from tracemalloc import start as startTracing
+from tracemalloc import stop as stopTracing
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.PyutPreferences import PyutPreferences
+
+from org.pyut.model.PyutField import PyutField
+from org.pyut.model.PyutMethod import PyutMethod
+from org.pyut.model.PyutMethod import WITH_PARAMS
+from org.pyut.model.PyutMethod import WITHOUT_PARAMS
+from org.pyut.model.PyutObject import PyutObject
+from org.pyut.model.PyutParam import PyutParam
+from org.pyut.model.PyutType import PyutType
+from org.pyut.model.PyutVisibilityEnum import PyutVisibilityEnum
+
+
+class TestPyutMethod(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    MEMBER_COUNT: int = 10000
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPyutMethod.clsLogger = getLogger(__name__)
+        #
+        # Ugh -- need this called because PyutMethod instantiates the singleton
+        #
+        PyutPreferences.determinePreferencesLocation()
+
+    def setUp(self):
+        self.logger:     Logger = TestPyutMethod.clsLogger
+        self.stringMode: int    = PyutMethod.getStringMode()
+
+        self.method: PyutMethod = PyutMethod('drive', PyutVisibilityEnum.PUBLIC, PyutType('bool'))
+        self.method.addParam(PyutParam('distance', PyutType('float')))
+
+        PyutMethod.setStringMode(WITH_PARAMS)
+
+    def tearDown(self):
+        PyutMethod.setStringMode(self.stringMode)
+
+    def testDisplayStringFollowsChanges(self):
+
+        self.assertEqual('+drive(distance: float): bool', str(self.method))
+
+        self.method.getParams()[0].name = 'miles'
+        self.assertEqual('+drive(miles: float): bool', str(self.method), 'Renamed parameter not shown')
+
+        self.method.addParam(PyutParam('fast', PyutType('bool'), 'True'))
+        self.assertEqual('+drive(miles: float, fast: bool = True): bool', str(self.method), 'Added parameter not shown')
+
+        self.method.setName('ride')
+        self.method.setVisibility(PyutVisibilityEnum.PRIVATE)
+        self.method.returnType = PyutType('')
+        self.assertEqual('-ride(miles: float, fast: bool = True)', str(self.method))
+
+        PyutMethod.setStringMode(WITHOUT_PARAMS)
+        self.assertEqual('-ride()', str(self.method), 'String mode ignored')
+
+    def testSlotted(self):
+
+        for member in (self.method, PyutParam(), PyutField(), PyutType('int')):
+            self.assertFalse(hasattr(member, '__dict__'), f'{member.__class__.__name__} has a dictionary')
+
+        self.assertIs(PyutType('int'), PyutType(value='int'), 'Types not interned')
+
+    def testMemoryPerMember(self):
+        """
+        Not an assertion on the size;  Logs the bytes per member of a reverse engineered
+        model, each class with a field and a method with two parameters
+        """
+        startTracing()
+        members: List[PyutObject] = []
+        for i in range(TestPyutMethod.MEMBER_COUNT):
+            members.append(PyutField(f'field{i}', PyutType('int'), '0', PyutVisibilityEnum.PRIVATE))
+            method: PyutMethod = PyutMethod(f'method{i}', PyutVisibilityEnum.PUBLIC, PyutType('str'))
+            method.addParam(PyutParam(f'first{i}', PyutType('int')))
+            method.addParam(PyutParam(f'second{i}', PyutType('float'), '1.0'))
+            members.append(method)
+        for member in members:
+            str(member)
+        current, peak = get_traced_memory()
+        stopTracing()
+
+        self.logger.info(f'{len(members)} members: {current // len(members)} bytes per member, parameters and display strings included')
+        self.assertEqual(TestPyutMethod.MEMBER_COUNT * 2, len(members))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPyutMethod))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
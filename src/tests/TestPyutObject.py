@@ -1,3 +1,5 @@
+from typing import List
+from typing import Tuple
 
 from logging import Logger
 from logging import getLogger
@@ -10,6 +12,17 @@ from tests.TestBase import TestBase
 from org.pyut.model.PyutObject import PyutObject
 
 
+class IdObserver:
+    """
+    Records the id changes
+    """
+    def __init__(self):
+        self.changes: List[Tuple[PyutObject, int]] = []
+
+    def idChanged(self, pyutObject: PyutObject, previousId: int):
+        self.changes.append((pyutObject, previousId))
+
+
 class TestPyutObject(TestBase):
     """
 
@@ -60,6 +73,30 @@ class TestPyutObject(TestBase):
 
         self.assertEqual(expectedLength, actualLength, 'Our name appears to have NOT been used')
 
+    def testIdObserver(self):
+
+        observer:   IdObserver = IdObserver()
+        pyutObject: PyutObject = PyutObject('Observed')
+        PyutObject.addIdObserver(observer.idChanged)
+
+        previousId: int = pyutObject.getId()
+        pyutObject.setId(previousId + 1000)
+        self.assertEqual([(pyutObject, previousId)], observer.changes)
+
+        PyutObject.removeIdObserver(observer.idChanged)
+        pyutObject.setId(previousId)
+        self.assertEqual(1, len(observer.changes), 'Removed observer still told')
+
+    def testIdObserverNotKeptAlive(self):
+
+        observerCount: int = len(PyutObject.idObservers)
+        PyutObject.addIdObserver(IdObserver().idChanged)
+
+        pyutObject: PyutObject = PyutObject('Observed')
+        pyutObject.setId(pyutObject.getId() + 1000)
+
+        self.assertEqual(observerCount, len(PyutObject.idObservers), 'Collected observer not dropped')
+
 
 def suite() -> TestSuite:
     """You need to change the name of the test class here also."""
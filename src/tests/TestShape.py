@@ -0,0 +1,87 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from tracemalloc import get_traced_memory
+from tracemalloc import start as startTracing
+from tracemalloc import stop as stopTracing
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import App
+
+from tests.TestBase import TestBase
+
+from org.pyut.MiniOgl.AnchorPoint import AnchorPoint
+from org.pyut.MiniOgl.ControlPoint import ControlPoint
+from org.pyut.MiniOgl.RectangleShape import RectangleShape
+from org.pyut.MiniOgl.Shape import Shape
+from org.pyut.MiniOgl.TextShape import TextShape
+
+
+class TestShape(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    CLASS_COUNT: int = 10000
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestShape.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestShape.clsLogger
+        self.app:    App    = App()        # Keep it so that it is not garbage collected
+
+        self.parent: RectangleShape = RectangleShape(100, 100, 50, 40)
+        self.child:  RectangleShape = RectangleShape(10, 20, 5, 5, self.parent)
+        self.anchor: AnchorPoint    = self.child.AddAnchor(1, 2)
+
+    def testAbsolutePosition(self):
+
+        self.assertEqual((110, 120), self.child.GetPosition())
+        self.assertEqual((111, 122), self.anchor.GetPosition())
+
+    def testSlotted(self):
+
+        for shape in (self.parent, self.anchor, ControlPoint(0, 0), TextShape(0, 0, 'Slotted', self.parent)):
+            self.assertFalse(hasattr(shape, '__dict__'), f'{type(shape).__name__} has a __dict__')
+            self.assertFalse(hasattr(shape.GetModel(), '__dict__'), f'{type(shape.GetModel()).__name__} has a __dict__')
+
+    def testMemoryPerShape(self):
+        """
+        Not an assertion on the size;  Logs the bytes per shape of a diagram of classes,
+        each drawn as a rectangle with a name and four anchors
+        """
+        startTracing()
+        shapes: List[Shape] = []
+        for i in range(TestShape.CLASS_COUNT):
+            rectangle: RectangleShape = RectangleShape(i * 10, i * 10, 100, 60)
+            shapes.append(rectangle)
+            shapes.append(TextShape(5, 5, f'Class{i}', rectangle))
+            for x, y in ((50, 0), (100, 30), (50, 60), (0, 30)):
+                shapes.append(rectangle.AddAnchor(x, y))
+        current, peak = get_traced_memory()
+        stopTracing()
+
+        self.logger.info(f'{TestShape.CLASS_COUNT} classes: {len(shapes)} shapes, {current // len(shapes)} bytes per shape')
+        self.assertEqual(TestShape.CLASS_COUNT * 6, len(shapes))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestShape))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,106 @@
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.MiniOgl.SpatialIndex import SpatialIndex
+
+
+class TestSpatialIndex(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestSpatialIndex.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger       = TestSpatialIndex.clsLogger
+        self.index:  SpatialIndex = SpatialIndex(cellSize=50)
+
+    def tearDown(self):
+        pass
+
+    def testQueryFindsIntersecting(self):
+
+        self.index.insert('a', 0, 0, 40, 40)
+        self.index.insert('b', 200, 200, 40, 40)
+        self.index.insert('c', 30, 30, 100, 100)
+
+        found = self.index.query(10, 10, 10, 10)
+        self.assertEqual(['a'], found, 'Only a is under the rectangle')
+
+        found = sorted(self.index.query(35, 35, 10, 10))
+        self.assertEqual(['a', 'c'], found, 'a and c overlap there')
+
+    def testNegativeSize(self):
+
+        self.index.insert('neg', 100, 100, -50, -50)
+        self.assertEqual((50, 50, 100, 100), self.index.getBounds('neg'), 'Bounds should be normalized')
+        self.assertEqual(['neg'], self.index.query(60, 60, 1, 1))
+
+    def testRemove(self):
+
+        self.index.insert('a', 0, 0, 400, 400)
+        self.index.remove('a')
+        self.assertTrue(self.index.isFree(0, 0, 400, 400), 'Nothing should be left')
+        self.assertEqual(0, len(self.index))
+        self.index.remove('a')
+
+    def testUpdateMovesEntry(self):
+
+        self.index.insert('a', 0, 0, 20, 20)
+        self.index.update('a', 500, 500, 20, 20)
+
+        self.assertTrue(self.index.isFree(0, 0, 20, 20), 'Old spot should be free')
+        self.assertFalse(self.index.isFree(505, 505, 5, 5), 'New spot should be occupied')
+
+    def testIsFreeIgnore(self):
+
+        self.index.insert('a', 0, 0, 20, 20)
+        self.assertFalse(self.index.isFree(0, 0, 10, 10))
+        self.assertTrue(self.index.isFree(0, 0, 10, 10, ignore={'a'}))
+
+    def testHugeQueryScansEntries(self):
+
+        self.index.insert('a', 0, 0, 20, 20)
+        self.index.insert('b', 5000, 5000, 20, 20)
+
+        found = sorted(self.index.query(-1e9, -1e9, 2e9, 2e9))
+        self.assertEqual(['a', 'b'], found, 'Should not walk the cells of a huge rectangle')
+        self.assertFalse(self.index.isFree(-1e9, -1e9, 2e9, 2e9, ignore={'a'}))
+
+    def testHugeEntryIsKeptOutOfTheGrid(self):
+
+        self.index.insert('huge', 0, 0, 1e9, 1e9)
+        self.index.insert('a', 100, 100, 20, 20)
+        self.assertEqual(0, sum(1 for cell in self.index._cells.values() if 'huge' in cell), 'Huge entry stored in cells')
+        self.assertEqual(['a', 'huge'], sorted(self.index.query(105, 105, 1, 1)))
+
+        self.index.update('huge', 0, 0, 20, 20)
+        self.assertEqual(['a'], self.index.query(105, 105, 1, 1), 'Shrunk entry should be back in the grid')
+        self.assertEqual(['huge'], self.index.query(5, 5, 1, 1))
+
+        self.index.update('huge', 0, 0, 1e9, 1e9)
+        self.index.remove('huge')
+        self.assertEqual(['a'], self.index.query(105, 105, 1, 1), 'Removed huge entry still found')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestSpatialIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
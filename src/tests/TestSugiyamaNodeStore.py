@@ -0,0 +1,137 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from random import Random
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.plugins.sugiyama.SugiyamaNodeStore import SugiyamaNodeStore
+
+
+class TestSugiyamaNodeStore(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestSugiyamaNodeStore.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestSugiyamaNodeStore.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testAdjacency(self):
+
+        store: SugiyamaNodeStore = SugiyamaNodeStore()
+        top:    int = store.addNode(0)
+        left:   int = store.addNode(1)
+        right:  int = store.addNode(1)
+        bottom: int = store.addNode(2)
+        store.addEdge(top, right)
+        store.addEdge(top, left)
+        store.addEdge(left, bottom)
+        store.addEdge(right, bottom)
+        store.build()
+
+        self.assertEqual([right, left], store.getChildren(top), 'Children should keep the declaration order')
+        self.assertEqual([left, right], store.getParents(bottom))
+        self.assertEqual([], store.getParents(top))
+        self.assertEqual(1, store.getIndex(right))
+        self.assertEqual(3, store.levelCount)
+
+    def testBarycenter(self):
+
+        store: SugiyamaNodeStore = SugiyamaNodeStore()
+        parents:  List[int] = [store.addNode(0) for _ in range(3)]
+        child:    int       = store.addNode(1)
+        orphan:   int       = store.addNode(1)
+        store.addEdge(parents[0], child)
+        store.addEdge(parents[2], child)
+        store.build()
+
+        store.upBarycenterLevel(1)
+        self.assertEqual(1.0, store.getBarycenter(child), 'Average of parent indices 0 and 2')
+        self.assertIsNone(store.getBarycenter(orphan), 'No parents means no barycenter')
+
+    def testCountCrossings(self):
+
+        rng: Random = Random(7)
+        for _ in range(20):
+            store, edges = self._randomTwoLevels(rng, 8, 9, 20)
+            self.assertEqual(self._bruteForceCrossings(store, edges), store.countCrossings(), 'Wrong crossing count')
+
+    def testReduceCrossings(self):
+
+        store: SugiyamaNodeStore = SugiyamaNodeStore()
+        a:  int = store.addNode(0)
+        b:  int = store.addNode(0)
+        aa: int = store.addNode(1)
+        bb: int = store.addNode(1)
+        store.addEdge(a, bb)
+        store.addEdge(b, aa)
+        store.build()
+        self.assertEqual(1, store.countCrossings())
+
+        self.assertEqual(0, store.reduceCrossings(), 'The crossing should be removed')
+        self.assertEqual(0, store.countCrossings())
+
+    def testReduceCrossingsNeverWorse(self):
+
+        rng: Random = Random(11)
+        for _ in range(10):
+            store, edges = self._randomTwoLevels(rng, 10, 10, 25)
+            before: int = store.countCrossings()
+            after:  int = store.reduceCrossings()
+            self.assertLessEqual(after, before, 'Crossing reduction made it worse')
+            self.assertEqual(self._bruteForceCrossings(store, edges), after)
+
+    def _randomTwoLevels(self, rng: Random, upper: int, lower: int, edgeCount: int) -> Tuple[SugiyamaNodeStore, List[Tuple[int, int]]]:
+
+        store: SugiyamaNodeStore = SugiyamaNodeStore()
+        upperIds: List[int] = [store.addNode(0) for _ in range(upper)]
+        lowerIds: List[int] = [store.addNode(1) for _ in range(lower)]
+        edges: List[Tuple[int, int]] = []
+        for _ in range(edgeCount):
+            edge: Tuple[int, int] = (rng.choice(upperIds), rng.choice(lowerIds))
+            edges.append(edge)
+            store.addEdge(*edge)
+        store.build()
+
+        return store, edges
+
+    def _bruteForceCrossings(self, store: SugiyamaNodeStore, edges: List[Tuple[int, int]]) -> int:
+
+        count: int = 0
+        for i, (parentL, childL) in enumerate(edges):
+            for parentR, childR in edges[i + 1:]:
+                parents:  int = store.getIndex(parentL) - store.getIndex(parentR)
+                children: int = store.getIndex(childL) - store.getIndex(childR)
+                if parents * children < 0:
+                    count += 1
+
+        return count
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestSugiyamaNodeStore))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,232 @@
+
+from logging import Logger
+from logging import getLogger
+
+from io import StringIO
+
+from math import cos
+from math import sin
+
+from time import perf_counter
+
+from typing import List
+from typing import Tuple
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import Document
+# noinspection PyUnresolvedReferences
+from xml.dom.minidom import parseString
+
+from tests.TestBase import TestBase
+
+from org.pyut.plugins.image.SvgDC import SvgDC
+
+
+class Colour:
+    """
+    The part of wx.Colour that SvgDC reads
+    """
+    def __init__(self, red: int, green: int, blue: int):
+        self._rgb: Tuple[int, int, int] = (red, green, blue)
+
+    def Red(self) -> int:
+        return self._rgb[0]
+
+    def Green(self) -> int:
+        return self._rgb[1]
+
+    def Blue(self) -> int:
+        return self._rgb[2]
+
+
+class Pen:
+    def __init__(self, colour: Colour, width: int = 1, style: int = SvgDC.STYLE_SOLID):
+        self._colour = colour
+        self._width  = width
+        self._style  = style
+
+    def GetColour(self) -> Colour:
+        return self._colour
+
+    def GetWidth(self) -> int:
+        return self._width
+
+    def GetStyle(self) -> int:
+        return self._style
+
+
+class Brush(Pen):
+    pass
+
+
+class Font:
+    def __init__(self, pointSize: int = 10, weight: int = 90, style: int = 90, family: int = 74, faceName: str = ''):
+        self._pointSize = pointSize
+        self._weight    = weight
+        self._style     = style
+        self._family    = family
+        self._faceName  = faceName
+
+    def GetPointSize(self) -> int:
+        return self._pointSize
+
+    def GetWeight(self) -> int:
+        return self._weight
+
+    def GetStyle(self) -> int:
+        return self._style
+
+    def GetFamily(self) -> int:
+        return self._family
+
+    def GetFaceName(self) -> str:
+        return self._faceName
+
+
+BLACK: Colour = Colour(0, 0, 0)
+WHITE: Colour = Colour(255, 255, 255)
+
+
+class TestSvgDC(TestBase):
+    """
+    """
+    BENCHMARK_SHAPE_COUNT: int   = 5000
+    BENCHMARK_MAX_SECONDS: float = 1.0
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestSvgDC.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:   Logger   = TestSvgDC.clsLogger
+        self.measured: List[str] = []
+        self.writer:   StringIO = StringIO()
+        self.svgDC:    SvgDC    = SvgDC(self.writer, width=400, height=300, measurer=self._measure, originX=-10, originY=-20)
+        self.svgDC.SetFont(Font())
+        self.svgDC.SetPen(Pen(BLACK))
+        self.svgDC.SetBrush(Brush(WHITE))
+
+    def testDocumentIsWellFormed(self):
+
+        self.svgDC.DrawRectangle(0, 0, 100, 50)
+        self.svgDC.SetClippingRegion(0, 0, 100, 50)
+        self.svgDC.DrawText('<<interface>> & more', 5, 5)
+        self.svgDC.DestroyClippingRegion()
+        self.svgDC.DrawSpline([(0, 0), (50, 80), (100, 0)])
+        self.svgDC.DrawEllipticArc(0, 0, 40, 20, 0, 270)
+        self.svgDC.DrawArc(10, 0, 0, 10, 0, 0)
+        self.svgDC.close()
+
+        dom: Document = parseString(self.writer.getvalue())
+        svg = dom.documentElement
+        self.assertEqual('svg', svg.tagName)
+        self.assertEqual('-10.00 -20.00 400.00 300.00', svg.getAttribute('viewBox'))
+        self.assertEqual('<<interface>> & more', dom.getElementsByTagName('text')[0].firstChild.data)
+        self.assertEqual(1, len(dom.getElementsByTagName('clipPath')))
+
+    def testStylesAreShared(self):
+
+        for x in range(10):
+            self.svgDC.DrawRectangle(x * 10, 0, 5, 5)
+            self.svgDC.DrawLine(x * 10, 0, x * 10 + 5, 5)
+            self.svgDC.DrawText(f'Class{x}', x * 10, 10)
+        self.svgDC.SetPen(Pen(BLACK))
+        self.svgDC.DrawRectangle(0, 50, 5, 5)
+        self.svgDC.SetPen(Pen(Colour(255, 0, 0), style=SvgDC.STYLE_LONG_DASH))
+        self.svgDC.DrawRectangle(0, 60, 5, 5)
+        self.svgDC.close()
+
+        self.assertEqual(4, self.svgDC.styleCount, 'Filled shapes, lines, text and the dashed red pen')
+        svg: str = self.writer.getvalue()
+        self.assertIn('stroke:#ff0000;stroke-width:1;fill:#ffffff;stroke-dasharray:8 4', svg)
+        self.assertIn('font-family:sans-serif;font-size:10pt;font-weight:normal;font-style:normal;fill:#000000', svg)
+
+    def testRotatedArrowHeadsShareOneSymbol(self):
+
+        for angle in [0.0, 0.7, 2.1, 3.9]:
+            tipX: float = 100 + 50 * cos(angle)
+            tipY: float = 100 + 50 * sin(angle)
+            self.svgDC.DrawPolygon(self._arrowHead(tipX, tipY, angle))
+        self.svgDC.DrawPolygon([(0, 0), (20, 0), (20, 20)])
+        self.svgDC.close()
+
+        self.assertEqual(2, self.svgDC.symbolCount)
+        dom: Document = parseString(self.writer.getvalue())
+        self.assertEqual(5, len(dom.getElementsByTagName('use')))
+
+    def testTextIsMeasuredOnce(self):
+
+        for _ in range(5):
+            self.assertEqual((42, 12), self.svgDC.GetTextExtent('Vehicle'))
+        self.svgDC.SetFont(Font(pointSize=14))
+        self.svgDC.GetTextExtent('Vehicle')
+
+        self.assertEqual(['Vehicle', 'Vehicle'], self.measured, 'Once per font')
+
+    def testBenchmarkLargeDiagram(self):
+
+        font:       Font  = Font()
+        boldFont:   Font  = Font(weight=SvgDC.FONT_WEIGHT_BOLD)
+        blackPen:   Pen   = Pen(BLACK)
+        whiteBrush: Brush = Brush(WHITE)
+
+        startTime: float = perf_counter()
+        for shapeId in range(TestSvgDC.BENCHMARK_SHAPE_COUNT):
+            x: float = (shapeId % 100) * 150.0
+            y: float = (shapeId // 100) * 100.0
+            self.svgDC.SetPen(blackPen)
+            self.svgDC.SetBrush(whiteBrush)
+            self.svgDC.DrawRectangle(x, y, 100, 60)
+            self.svgDC.SetClippingRegion(x, y, 100, 60)
+            self.svgDC.SetFont(boldFont)
+            self.svgDC.DrawText(f'Class{shapeId}', x + 5, y + 5)
+            self.svgDC.SetFont(font)
+            self.svgDC.DrawLine(x, y + 20, x + 100, y + 20)
+            self.svgDC.DrawText('+ name: str', x + 5, y + 25)
+            self.svgDC.DrawText('+ getName(): str', x + 5, y + 40)
+            self.svgDC.DestroyClippingRegion()
+            self.svgDC.DrawLines([(x + 100, y + 30), (x + 125, y + 30), (x + 150, y + 30)])
+            self.svgDC.DrawPolygon(self._arrowHead(x + 150, y + 30, 0.0))
+        self.svgDC.close()
+        seconds: float = perf_counter() - startTime
+
+        svg: str = self.writer.getvalue()
+        self.logger.info(f'{TestSvgDC.BENCHMARK_SHAPE_COUNT} shapes: {len(svg)} characters in {seconds:.3f} seconds')
+
+        self.assertEqual(TestSvgDC.BENCHMARK_SHAPE_COUNT, svg.count('height="60.00" class='), 'One rectangle per shape')
+        self.assertEqual(1, self.svgDC.symbolCount)
+        self.assertLess(seconds, TestSvgDC.BENCHMARK_MAX_SECONDS)
+
+    def _measure(self, font: Font, text: str) -> Tuple[int, int]:
+
+        self.measured.append(text)
+        return len(text) * 6, font.GetPointSize() + 2
+
+    def _arrowHead(self, tipX: float, tipY: float, angle: float) -> List[Tuple[float, float]]:
+        """
+        Same construction as LineShape.DrawArrow
+        """
+        size:   float = 8.0
+        alpha1: float = angle + 3.14159 - 3.14159 / 6
+        alpha2: float = angle + 3.14159 + 3.14159 / 6
+        return [(tipX + size * cos(alpha1), tipY + size * sin(alpha1)), (tipX, tipY), (tipX + size * cos(alpha2), tipY + size * sin(alpha2))]
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestSvgDC))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
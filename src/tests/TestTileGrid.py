@@ -0,0 +1,91 @@
+
+from logging import Logger
+from logging import getLogger
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.plugins.image.TileGrid import Bounds
+from org.pyut.plugins.image.TileGrid import Tile
+from org.pyut.plugins.image.TileGrid import TileGrid
+from org.pyut.plugins.image.TileGrid import TileIndex
+
+
+class TestTileGrid(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestTileGrid.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestTileGrid.clsLogger
+
+    def testEdgeTilesAreClipped(self):
+
+        tileGrid: TileGrid = TileGrid(width=250, height=120, tileSize=100)
+
+        self.assertEqual(3, tileGrid.columns)
+        self.assertEqual(2, tileGrid.rows)
+
+        tiles: List[Tile] = list(tileGrid.tiles())
+        self.assertEqual(6, len(tiles))
+        self.assertEqual(Tile(column=0, row=0, x=0, y=0, width=100, height=100), tiles[0])
+        self.assertEqual(Tile(column=2, row=1, x=200, y=100, width=50, height=20), tiles[-1])
+        self.assertEqual(250 * 120, sum(tile.width * tile.height for tile in tiles), 'Tiles should cover the image exactly once')
+
+    def testIndexBounds(self):
+
+        tileGrid: TileGrid = TileGrid(width=300, height=300, tileSize=100)
+        boundsList: List[Bounds] = [
+            (10.0,  10.0,  50.0,  50.0),      # Only the first tile
+            (90.0,  10.0, 110.0,  50.0),      # Straddles two columns
+            (150.0, 150.0, 260.0, 260.0),     # Four tiles
+            (500.0, 500.0, 600.0, 600.0),     # Outside of the image
+        ]
+
+        tileIndex: TileIndex = tileGrid.indexBounds(boundsList)
+
+        self.assertEqual([0, 1], tileIndex[(0, 0)])
+        self.assertEqual([1],    tileIndex[(1, 0)])
+        for key in [(1, 1), (2, 1), (1, 2), (2, 2)]:
+            self.assertEqual([2], tileIndex[key])
+        self.assertNotIn((0, 2), tileIndex, 'Empty tiles are not indexed')
+        self.assertNotIn(3, [idx for indices in tileIndex.values() for idx in indices], 'Culled shapes are never drawn')
+
+    def testIndexBoundsScaledAndOffset(self):
+
+        tileGrid: TileGrid = TileGrid(width=100, height=100, tileSize=50)
+
+        tileIndex: TileIndex = tileGrid.indexBounds([(1100.0, 1000.0, 1140.0, 1020.0)], scale=0.5, originX=1000.0, originY=1000.0)
+
+        self.assertEqual({(1, 0): [0]}, tileIndex)
+
+    def testUnionBounds(self):
+
+        self.assertEqual((-5.0, 0.0, 40.0, 30.0), TileGrid.unionBounds([(0.0, 0.0, 10.0, 30.0), (-5.0, 5.0, 40.0, 6.0)]))
+        self.assertEqual((0.0, 0.0, 0.0, 0.0), TileGrid.unionBounds([]))
+
+    def testBadGrid(self):
+        self.assertRaises(ValueError, lambda: TileGrid(width=0, height=10, tileSize=10))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestTileGrid))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
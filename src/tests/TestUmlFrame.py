@@ -157,6 +157,25 @@ class TestUmlFrame(unittest.TestCase):
             self.fail("Can't get OglUseCase position")
         self.assertTrue(x == 10 and y == 50, "Wrong OglUseCase position !")
 
+    def testUmlObjectById(self):
+        """
+        Test the lookup of the UML objects by id
+        """
+        pyutClass = self._umlFrame.createNewClass(10, 10)
+        pyutNote  = self._umlFrame.createNewNote(100, 10)
+
+        oglClass = self._umlFrame.getUmlObjectById(pyutClass.getId())
+        self.assertIs(pyutClass, oglClass.getPyutObject(), "Wrong OglClass")
+        self.assertIs(pyutNote, self._umlFrame.getUmlObjectById(pyutNote.getId()).getPyutObject(), "Wrong OglNote")
+
+        previousId: int = pyutClass.getId()
+        pyutClass.setId(previousId + 1000)
+        self.assertIs(oglClass, self._umlFrame.getUmlObjectById(previousId + 1000), "Id change not followed")
+        self.assertIsNone(self._umlFrame.getUmlObjectById(previousId), "Previous id still indexed")
+
+        oglClass.Detach()
+        self.assertIsNone(self._umlFrame.getUmlObjectById(previousId + 1000), "Removed object still indexed")
+
     # def testInheritanceLinkCreation(self):
     #     """
     #     Test Inheritance link Creation
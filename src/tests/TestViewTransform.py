@@ -0,0 +1,60 @@
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.MiniOgl.ViewTransform import ViewTransform
+
+
+class TestViewTransform(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestViewTransform.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:        Logger        = TestViewTransform.clsLogger
+        self.viewTransform: ViewTransform = ViewTransform()
+
+    def testIdentity(self):
+
+        self.assertEqual((12.5, 40), self.viewTransform.ToVirtual(12.5, 40))
+        self.assertEqual((12.5, 40), self.viewTransform.ToDiagram(12.5, 40))
+
+    def testToVirtual(self):
+
+        self._zoomed()
+        self.assertEqual((110, 220), self.viewTransform.ToVirtual(50, 100))
+
+    def testToDiagram(self):
+
+        self._zoomed()
+        self.assertEqual((50, 100), self.viewTransform.ToDiagram(110, 220))
+
+    def _zoomed(self):
+
+        self.viewTransform.zoom    = 2.0
+        self.viewTransform.xOffset = 10.0
+        self.viewTransform.yOffset = 20.0
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestViewTransform))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,131 @@
+
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import Mock
+
+from tests.TestBase import TestBase
+
+from org.pyut.general.WrapCache import WrapCache
+
+
+class TestWrapCache(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestWrapCache.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:    Logger    = TestWrapCache.clsLogger
+        self.wrapCache: WrapCache = WrapCache()
+        self.mockedDC:  Mock      = Mock()
+        self.font:      Mock      = self._mockFont(pointSize=10)
+
+        self.mockedDC.GetTextExtent = Mock(side_effect=self.mockGetTextExtent)
+        WrapCache.clearWordWidths()
+
+    def tearDown(self):
+        WrapCache.clearWordWidths()
+
+    def testFancySplit(self):
+
+        longLine: str = 'Where oh where do you want to split me along party lines or maybe not'
+
+        lines: List[str] = self.wrapCache.lines(longLine, self.mockedDC, self.font, 50)
+
+        expected: List[str] = ['Where oh', 'where do', 'you want', 'to split', 'me along', 'party', 'lines or', 'maybe not']
+        self.assertEqual(expected, lines, 'Split incorrectly')
+
+    def testKeepsParagraphs(self):
+
+        lines: List[str] = self.wrapCache.lines('one\n\ntwo three', self.mockedDC, self.font, 120)
+
+        self.assertEqual(['one', '', 'two three'], lines, 'Paragraphs lost')
+
+    def testRepaintDoesNotMeasure(self):
+
+        text: str = 'Short line of text'
+        self.wrapCache.lines(text, self.mockedDC, self.font, 40)
+        measured: int = self.mockedDC.GetTextExtent.call_count
+
+        self.wrapCache.lines(text, self.mockedDC, self.font, 40)
+        self.assertEqual(measured, self.mockedDC.GetTextExtent.call_count, 'Measured the same text again')
+
+    def testEditAndResizeWrapAgain(self):
+
+        first: List[str] = self.wrapCache.lines('12345678 12345678', self.mockedDC, self.font, 100)
+        self.assertEqual(['12345678 12345678'], first)
+
+        resized: List[str] = self.wrapCache.lines('12345678 12345678', self.mockedDC, self.font, 45)
+        self.assertEqual(['12345678', '12345678'], resized, 'Resize not seen')
+
+        edited: List[str] = self.wrapCache.lines('12345678 1234', self.mockedDC, self.font, 45)
+        self.assertEqual(['12345678', '1234'], edited, 'Edit not seen')
+        self.assertEqual(2, self.mockedDC.GetTextExtent.call_count, 'Words are measured once per font')
+
+    def testWordWidthsSharedPerFont(self):
+
+        text: str = 'shared words'
+        self.wrapCache.lines(text, self.mockedDC, self.font, 200)
+
+        otherCache: WrapCache = WrapCache()
+        otherCache.lines(text, self.mockedDC, self._mockFont(pointSize=10), 200)
+        self.assertEqual(2, self.mockedDC.GetTextExtent.call_count, 'Word widths not shared')
+
+        otherCache.lines(text, self.mockedDC, self._mockFont(pointSize=12), 200)
+        self.assertEqual(4, self.mockedDC.GetTextExtent.call_count, 'A font change must measure again')
+
+    def testInvalidate(self):
+
+        text: str = 'some text'
+        first: List[str] = self.wrapCache.lines(text, self.mockedDC, self.font, 200)
+        self.wrapCache.invalidate()
+        WrapCache.clearWordWidths()
+
+        second: List[str] = self.wrapCache.lines(text, self.mockedDC, self.font, 200)
+        self.assertEqual(first, second)
+        self.assertEqual(4, self.mockedDC.GetTextExtent.call_count, 'Not wrapped again')
+
+    def mockGetTextExtent(self, textToMeasure: str):
+
+        noSpaces: str = textToMeasure.strip(' ')
+        height:   int = 10
+        width:    int = noSpaces.__len__() * 5
+
+        width += 2  # account for space at end that was stripped
+
+        return width, height
+
+    def _mockFont(self, pointSize: int) -> Mock:
+
+        font: Mock = Mock()
+        font.GetPointSize.return_value = pointSize
+        font.GetFamily.return_value    = 74
+        font.GetStyle.return_value     = 90
+        font.GetWeight.return_value    = 90
+        font.GetFaceName.return_value  = ''
+
+        return font
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestWrapCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,162 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from io import BytesIO
+
+from time import perf_counter
+
+from os import path as osPath
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+from tests.TestBase import TEST_DIRECTORY
+
+from org.pyut.enums.LinkType import LinkType
+
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutLink import PyutLink
+from org.pyut.model.PyutMethod import PyutMethod
+
+from org.pyut.persistence.DocumentModel import DocumentModel
+
+from org.pyut.plugins.xmi.XmiReader import XmiReader
+
+from org.pyut.batch.BatchConverter import BatchConverter
+
+
+class TestXmiReader(TestBase):
+    """
+    """
+    TEST_FILE_NAME: str = osPath.join(TEST_DIRECTORY, 'testdata', 'realxmi.xmi')
+
+    ASSOCIATION_XMI: bytes = (
+        b'<XMI xmi.version="1.1"><XMI.content>'
+        b'<Foundation.Core.Class xmi.id="c1"><Foundation.Core.ModelElement.name>Car</Foundation.Core.ModelElement.name></Foundation.Core.Class>'
+        b'<Foundation.Core.Association xmi.id="a1">'
+        b'<Foundation.Core.ModelElement.name>wheels</Foundation.Core.ModelElement.name>'
+        b'<Foundation.Core.Association.connection>'
+        b'<Foundation.Core.AssociationEnd xmi.id="e1">'
+        b'<Foundation.Core.AssociationEnd.aggregation xmi.value="none"/>'
+        b'<Foundation.Core.AssociationEnd.multiplicity>4</Foundation.Core.AssociationEnd.multiplicity>'
+        b'<Foundation.Core.AssociationEnd.type><Foundation.Core.Classifier xmi.idref="c2"/></Foundation.Core.AssociationEnd.type>'
+        b'</Foundation.Core.AssociationEnd>'
+        b'<Foundation.Core.AssociationEnd xmi.id="e2">'
+        b'<Foundation.Core.AssociationEnd.aggregation xmi.value="composite"/>'
+        b'<Foundation.Core.AssociationEnd.multiplicity>1</Foundation.Core.AssociationEnd.multiplicity>'
+        b'<Foundation.Core.AssociationEnd.type><Foundation.Core.Classifier xmi.idref="c1"/></Foundation.Core.AssociationEnd.type>'
+        b'</Foundation.Core.AssociationEnd>'
+        b'</Foundation.Core.Association.connection>'
+        b'</Foundation.Core.Association>'
+        b'<Foundation.Core.Generalization xmi.id="g1">'
+        b'<Foundation.Core.Generalization.child><Foundation.Core.GeneralizableElement xmi.idref="c3"/></Foundation.Core.Generalization.child>'
+        b'<Foundation.Core.Generalization.parent><Foundation.Core.GeneralizableElement xmi.idref="c1"/></Foundation.Core.Generalization.parent>'
+        b'</Foundation.Core.Generalization>'
+        b'<Foundation.Core.Class xmi.id="c2"><Foundation.Core.ModelElement.name>Wheel</Foundation.Core.ModelElement.name></Foundation.Core.Class>'
+        b'<Foundation.Core.Class xmi.id="c3"><Foundation.Core.ModelElement.name>SportsCar</Foundation.Core.ModelElement.name>'
+        b'<Foundation.Core.GeneralizableElement.isAbstract xmi.value="true"/></Foundation.Core.Class>'
+        b'</XMI.content></XMI>'
+    )
+
+    BENCHMARK_CLASS_COUNT: int   = 20000
+    BENCHMARK_MAX_SECONDS: float = 5.0
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestXmiReader.clsLogger = getLogger(__name__)
+        BatchConverter.setupHeadless()
+
+    def setUp(self):
+        self.logger: Logger = TestXmiReader.clsLogger
+
+    def testReadClassFeatures(self):
+
+        documentModel: DocumentModel = XmiReader().read(TestXmiReader.TEST_FILE_NAME)
+        self.assertEqual('realxmi', documentModel.title)
+
+        classes: List[PyutClass] = [shape.pyutObject for shape in documentModel.shapes.values()]
+        self.assertEqual(['String', 'box', 'dimension'], [pyutClass.getName() for pyutClass in classes])
+
+        box: PyutClass = classes[1]
+        self.assertEqual(['name', 'size'], [pyutField.getName() for pyutField in box.fields])
+        self.assertEqual('dimension', str(box.fields[1].getType()), 'The type is resolved from a class declared after the field')
+
+        getName: PyutMethod = box.methods[1]
+        self.assertEqual('getName', getName.getName())
+        self.assertEqual('String', str(getName.getReturns()))
+        self.assertEqual(0, len(getName.getParams()), 'The return parameter is not a parameter')
+
+    def testProgressByBytes(self):
+
+        progress: List[Tuple[int, int]] = []
+        reader:   XmiReader             = XmiReader(chunkSize=4096)
+        reader.read(TestXmiReader.TEST_FILE_NAME, progress=lambda bytesRead, totalBytes: progress.append((bytesRead, totalBytes)))
+
+        fileSize: int = osPath.getsize(TestXmiReader.TEST_FILE_NAME)
+        self.assertEqual((fileSize + 4095) // 4096, len(progress))
+        self.assertEqual((fileSize, fileSize), progress[-1])
+        self.assertEqual(sorted(progress), progress)
+
+    def testForwardReferences(self):
+
+        documentModel: DocumentModel = XmiReader().readStream(BytesIO(TestXmiReader.ASSOCIATION_XMI))
+
+        self.assertEqual(3, len(documentModel.shapes))
+        self.assertEqual(2, len(documentModel.links))
+
+        association: PyutLink = documentModel.links[0].pyutLink
+        self.assertEqual(LinkType.COMPOSITION, association.getType())
+        self.assertEqual('Car',   association.getSource().getName(), 'The composite end is the source')
+        self.assertEqual('Wheel', association.getDestination().getName())
+        self.assertEqual('1', association.sourceCardinality)
+        self.assertEqual('4', association.destinationCardinality)
+
+        inheritance: PyutLink = documentModel.links[1].pyutLink
+        sportsCar:   PyutClass = inheritance.getSource()
+        self.assertEqual(LinkType.INHERITANCE, inheritance.getType())
+        self.assertEqual(['Car'], [parent.getName() for parent in sportsCar.getParents()])
+        self.assertEqual('Abstract', sportsCar.getStereotype().getStereotype())
+
+    def testBenchmarkLargeFile(self):
+
+        xmi: bytes = b''.join(
+            b'<Foundation.Core.Class xmi.id="c%d"><Foundation.Core.ModelElement.name>Class%d</Foundation.Core.ModelElement.name>'
+            b'<Foundation.Core.Classifier.feature><Foundation.Core.Attribute xmi.id="f%d">'
+            b'<Foundation.Core.ModelElement.name>next</Foundation.Core.ModelElement.name>'
+            b'<Foundation.Core.StructuralFeature.type><Foundation.Core.Classifier xmi.idref="c%d"/></Foundation.Core.StructuralFeature.type>'
+            b'</Foundation.Core.Attribute></Foundation.Core.Classifier.feature></Foundation.Core.Class>' % (idx, idx, idx, idx + 1)
+            for idx in range(TestXmiReader.BENCHMARK_CLASS_COUNT)
+        )
+        stream: BytesIO = BytesIO(b'<XMI><XMI.content>' + xmi + b'</XMI.content></XMI>')
+
+        startTime:     float         = perf_counter()
+        documentModel: DocumentModel = XmiReader().readStream(stream, totalBytes=len(stream.getvalue()))
+        seconds:       float         = perf_counter() - startTime
+        self.logger.info(f'{TestXmiReader.BENCHMARK_CLASS_COUNT} classes, {len(stream.getvalue())} bytes in {seconds:.3f} seconds')
+
+        classes: List[PyutClass] = [shape.pyutObject for shape in documentModel.shapes.values()]
+        self.assertEqual(TestXmiReader.BENCHMARK_CLASS_COUNT, len(classes))
+        self.assertEqual('Class1', str(classes[0].fields[0].getType()))
+        self.assertLess(seconds, TestXmiReader.BENCHMARK_MAX_SECONDS)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestXmiReader))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()